@@ -180,12 +180,128 @@ document.addEventListener('DOMContentLoaded', function() {
 
         if (dom.packSearch) {
             dom.packSearch.addEventListener('input', function() {
-                renderGroups(this.value.toLowerCase());
+                var query = this.value.toLowerCase();
+                renderGroups(query);
+                if (searchTerms(query).length === 0) return;
+                // Packs whose questions match are added once the shards are in
+                searchQuestions(query).then(function(matches) {
+                    if (dom.packSearch.value.toLowerCase() !== query) return;
+                    renderGroups(query, matches);
+                }).catch(function(e) {
+                    console.warn('Question search unavailable:', e);
+                });
             });
         }
     }
 
-    function renderGroups(searchTerm) {
+    // Cross-pack question search. search_index/ (built by pack_index.py) is a
+    // manifest plus one shard per first character, mapping each normalised
+    // term to question numbers, delta-coded; numbers run through the packs in
+    // index order, starting at starts[pack]. A query fetches the shards of its
+    // own words only.
+    var SEARCH_INDEX_DIR = 'search_index/';
+    var SEARCH_STOPWORDS = ['a', 'an', 'and', 'are', 'as', 'at', 'be', 'been', 'by', 'did', 'do', 'does',
+        'for', 'from', 'her', 'his', 'how', 'in', 'is', 'it', 'its', 'of', 'on', 'or', 'that', 'the', 'their',
+        'these', 'this', 'those', 'to', 'was', 'were', 'what', 'when', 'where', 'which', 'who', 'whom', 'whose',
+        'why', 'with'];
+    var searchManifest = null; // Promise of { packs, starts, shards }
+    var searchShards = {}; // first character -> Promise of { terms, keys (sorted) }
+    var hasOwn = Object.prototype.hasOwnProperty;
+
+    // Must match terms() in pack_index.py
+    function searchTerms(text) {
+        var words = String(text || '').normalize('NFKD').replace(/[^\x00-\x7f]/g, '')
+            .toLowerCase().match(/[a-z0-9]+/g) || [];
+        return words.filter(function(w) {
+            return SEARCH_STOPWORDS.indexOf(w) === -1;
+        }).map(function(w) {
+            return w.length > 3 && w.slice(-1) === 's' && w.slice(-2) !== 'ss' ? w.slice(0, -1) : w;
+        });
+    }
+
+    function loadSearchManifest() {
+        if (!searchManifest) {
+            searchManifest = fetchJSON(SEARCH_INDEX_DIR + 'manifest.json').catch(function(e) {
+                searchManifest = null;
+                throw e;
+            });
+        }
+        return searchManifest;
+    }
+
+    function loadSearchShard(manifest, term) {
+        var first = term.charAt(0);
+        if (manifest.shards.indexOf(first) === -1) return Promise.resolve({ terms: {}, keys: [] });
+        if (!searchShards[first]) {
+            searchShards[first] = fetchJSON(SEARCH_INDEX_DIR + first + '.json').then(function(shard) {
+                // Sorted once, so prefix lookups can binary-search
+                return { terms: shard.terms, keys: Object.keys(shard.terms).sort() };
+            }).catch(function(e) {
+                delete searchShards[first];
+                throw e;
+            });
+        }
+        return searchShards[first];
+    }
+
+    function prefixKeys(keys, prefix) {
+        // The run of sorted keys starting with prefix
+        var lo = 0;
+        var hi = keys.length;
+        while (lo < hi) {
+            var mid = (lo + hi) >> 1;
+            if (keys[mid] < prefix) lo = mid + 1;
+            else hi = mid;
+        }
+        var end = lo;
+        while (end < keys.length && keys[end].indexOf(prefix) === 0) end++;
+        return keys.slice(lo, end);
+    }
+
+    function questionNumbers(shard, term, prefix) {
+        // Question numbers for a term; the word still being typed matches
+        // every term it starts
+        var found = {};
+        var keys = prefix ? prefixKeys(shard.keys, term) : (hasOwn.call(shard.terms, term) ? [term] : []);
+        keys.forEach(function(t) {
+            var n = 0;
+            shard.terms[t].forEach(function(gap) {
+                n += gap;
+                found[n] = true;
+            });
+        });
+        return found;
+    }
+
+    function searchQuestions(query) {
+        // -> Promise of { pack path: number of questions matching every term }
+        var terms = searchTerms(query);
+        var typing = /[a-z0-9]$/.test(query);
+        return loadSearchManifest().then(function(manifest) {
+            return Promise.all(terms.map(function(term) {
+                return loadSearchShard(manifest, term);
+            })).then(function(shards) {
+                var matches = null;
+                terms.forEach(function(term, i) {
+                    var found = questionNumbers(shards[i], term, typing && i === terms.length - 1);
+                    matches = matches === null ? found : Object.keys(matches).reduce(function(both, n) {
+                        if (found[n]) both[n] = true;
+                        return both;
+                    }, {});
+                });
+                var counts = {};
+                Object.keys(matches || {}).forEach(function(n) {
+                    n = Number(n);
+                    var p = manifest.starts.length - 1;
+                    while (p > 0 && manifest.starts[p] > n) p--;
+                    counts[manifest.packs[p]] = (counts[manifest.packs[p]] || 0) + 1;
+                });
+                return counts;
+            });
+        });
+    }
+
+    function renderGroups(searchTerm, questionMatches) {
         if (!dom.packGrid) return;
         dom.packGrid.innerHTML = '';
 
@@ -203,7 +319,8 @@ document.addEventListener('DOMContentLoaded', function() {
             if (searchTerm) {
                 groupPacks = groupPacks.filter(function(p) {
                     return p.title.toLowerCase().indexOf(searchTerm) !== -1 ||
-                           (p.category && p.category.toLowerCase().indexOf(searchTerm) !== -1);
+                           (p.category && p.category.toLowerCase().indexOf(searchTerm) !== -1) ||
+                           (questionMatches && questionMatches[p.path]);
                 });
             }
 
@@ -229,6 +346,8 @@ document.addEventListener('DOMContentLoaded', function() {
 
                 var best = ScoreManager.getHighScore(pack.id);
                 var bestHtml = best > 0 ? `<div class="pack-best">Best: ${best}</div>` : '';
+                var matched = questionMatches && questionMatches[pack.path];
+                var matchHtml = matched ? '<span class="pack-matches">' + matched + ' match' + (matched > 1 ? 'es' : '') + '</span>' : '';
 
                 card.innerHTML =
                     '<div class="pack-icon">' + (pack.icon || '\u2753') + '</div>' +
@@ -237,6 +356,7 @@ document.addEventListener('DOMContentLoaded', function() {
                         '<div class="pack-meta">' +
                             '<span class="pack-category">' + (group.title || 'General') + '</span>' +
                             '<span class="pack-count">' + (pack.count || '?') + ' Q</span>' +
+                            matchHtml +
                         '</div>' +
                     '</div>' + bestHtml;
 
@@ -465,13 +585,92 @@ document.addEventListener('DOMContentLoaded', function() {
         }
     }
 
+    // --- Pack loading ---
+    // update_manifest.py splits every pack into a header (meta + question ids)
+    // and chunks of questions in a fixed shuffled order, listed under
+    // pack.bundle in the manifest. A round fetches the header and random
+    // chunks holding CHUNK_DRAW times the questions it needs, and the engine
+    // draws the round from all of them. Headers come from the group bundles
+    // (sw.js precaches those); chunks are cached by sw.js as they are
+    // fetched. The whole pack file is only the fallback for a pack without a
+    // bundle or a bundle that fails to load.
+    var CHUNK_DRAW = 2; // with a single chunk a pack only had as many rounds as chunks
+    var packHeaders = {}; // pack path -> Promise of { meta, ids }
+    var groupBundles = {}; // group id -> Promise of { pack path: header }
+
+    function fetchJSON(url) {
+        return fetch(url).then(function(response) {
+            if (!response.ok) throw new Error('Failed to load ' + url);
+            return response.json();
+        });
+    }
+
+    function loadGroupBundle(groupId) {
+        // One request for the headers of every pack in a group
+        if (!groupBundles[groupId]) {
+            var group = MANIFEST.groups.find(g => g.id === groupId);
+            if (!group || !group.bundle) return null;
+            groupBundles[groupId] = fetchJSON(group.bundle.path).then(function(bundle) { return bundle.packs; });
+            groupBundles[groupId].catch(function() { delete groupBundles[groupId]; });
+        }
+        return groupBundles[groupId];
+    }
+
+    function loadPackHeader(pack) {
+        if (!packHeaders[pack.path]) {
+            var group = loadGroupBundle(pack.groupId);
+            packHeaders[pack.path] = group
+                ? group.then(function(headers) { return headers[pack.path] || fetchJSON(pack.bundle.dir + 'header.json'); })
+                : fetchJSON(pack.bundle.dir + 'header.json');
+            packHeaders[pack.path].catch(function() { delete packHeaders[pack.path]; });
+        }
+        return packHeaders[pack.path];
+    }
+
+    function pickChunks(chunks, needed) {
+        // Random chunks until they hold CHUNK_DRAW x `needed` questions, so
+        // every round is a fresh sample from a random combination of chunks
+        var order = chunks.map(function(c, i) { return i; });
+        for (var j = order.length - 1; j > 0; j--) {
+            var r = Math.floor(Math.random() * (j + 1));
+            var t = order[j]; order[j] = order[r]; order[r] = t;
+        }
+        var picked = [];
+        var total = 0;
+        for (var i = 0; i < order.length && total < needed * CHUNK_DRAW; i++) {
+            picked.push(order[i]);
+            total += chunks[order[i]][1];
+        }
+        return picked;
+    }
+
+    function loadPackQuestions(pack, needed) {
+        // Resolves to { meta, questions } with at least CHUNK_DRAW x `needed`
+        // questions (or the whole pack)
+        if (!pack.bundle) return fetchJSON(pack.path);
+        var chunks = pickChunks(pack.bundle.chunks, needed).map(function(n) {
+            return fetchJSON(pack.bundle.dir + n + '.json');
+        });
+        return Promise.all([loadPackHeader(pack)].concat(chunks))
+            .then(function(parts) {
+                return { meta: parts[0].meta, questions: [].concat.apply([], parts.slice(1)) };
+            })
+            .catch(function(e) {
+                console.warn('Pack bundle unavailable, loading the whole pack:', e);
+                return fetchJSON(pack.path);
+            });
+    }
+
+    var loadRound = null; // Promise-returning loader for the current game's questions
+
     function startSinglePackGame() {
         if (!currentPackFile) return;
-        fetch(currentPackFile)
-            .then(function(response) {
-                if (!response.ok) throw new Error('Failed to load pack');
-                return response.json();
-            })
+        var pack = MANIFEST.packs.find(p => p.path === currentPackFile);
+        var packFile = currentPackFile;
+        loadRound = function() {
+            return pack ? loadPackQuestions(pack, gameSettings.limit) : fetchJSON(packFile);
+        };
+        loadRound()
             .then(function(data) {
                 currentPackData = data;
                 initGameUI("single");
@@ -491,19 +690,32 @@ document.addEventListener('DOMContentLoaded', function() {
         if (packLimit < selectedPaths.length) {
             selectedPaths = selectedPaths.sort(() => 0.5 - Math.random()).slice(0, packLimit);
         }
-        var promises = selectedPaths.map(path => fetch(path).then(r => r.json()));
-        Promise.all(promises).then(function(packs) {
-            var allQuestions = [];
-            packs.forEach(function(p) {
-                if (p.questions) allQuestions = allQuestions.concat(p.questions);
+        var selectedPacks = selectedPaths.map(path => MANIFEST.packs.find(p => p.path === path) || { path: path });
+        // Each pack contributes an equal share of the round
+        var perPack = Math.ceil(gameSettings.limit / selectedPacks.length);
+        loadRound = function() {
+            selectedPacks.forEach(function(pack) {
+                if (pack.bundle) loadGroupBundle(pack.groupId);
             });
-            currentPackData = {
-                meta: {
-                    id: 'custom_mix',
-                    title: 'Custom Mix'
-                },
-                questions: allQuestions
-            };
+            var promises = selectedPacks.map(function(pack) {
+                return pack.bundle ? loadPackQuestions(pack, perPack) : fetchJSON(pack.path);
+            });
+            return Promise.all(promises).then(function(packs) {
+                var allQuestions = [];
+                packs.forEach(function(p) {
+                    if (p.questions) allQuestions = allQuestions.concat(p.questions);
+                });
+                return {
+                    meta: {
+                        id: 'custom_mix',
+                        title: 'Custom Mix'
+                    },
+                    questions: allQuestions
+                };
+            });
+        };
+        loadRound().then(function(data) {
+            currentPackData = data;
             initGameUI("custom");
         }).catch(handleLoadError);
     }
@@ -639,8 +851,16 @@ document.addEventListener('DOMContentLoaded', function() {
 
         dom.restartBtn.addEventListener('click', function() {
             dom.endScreen.classList.add('hidden');
-            engine.loadPack(currentPackData);
-            engine.startRound();
+            // A bundled round only holds the chunks it drew; draw again
+            var next = loadRound ? loadRound() : Promise.resolve(currentPackData);
+            next.catch(function(e) {
+                console.warn(e);
+                return currentPackData;
+            }).then(function(data) {
+                currentPackData = data;
+                engine.loadPack(currentPackData);
+                engine.startRound();
+            });
         });
 
         if (dom.changePack) {
@@ -2,7 +2,7 @@
  * Service Worker for J: Speed Quiz
  */
 
-var CACHE_NAME = 'j-quiz-v6';
+var CACHE_NAME = 'j-quiz-v9';
 var urlsToCache = [
   './index.html',
   './css/style.css',
@@ -10,55 +10,17 @@ var urlsToCache = [
   './js/app.js',
   './manifest.json', // PWA Manifest
   './packs/manifest.json', // Packs Manifest
+  './search_index/manifest.json', // Question search (pack_index.py); shards are cached as searches fetch them
   '../../favicon.svg',
-  // Packs
-  './packs/sprunki_v1.json',
-  './packs/technology_v1.json',
-  './packs/sports_v1.json',
-  './packs/animals_v1.json',
-  './packs/literature_v1.json',
-  './packs/geography_v1.json',
-  './packs/videogames_v1.json',
-  './packs/history_v1.json',
-  './packs/music_v1.json',
-  './packs/language_v1.json',
-  './packs/space_v1.json',
-  './packs/pmi_pm.json',
-  './packs/ops_logistics.json',
-  './packs/mythology_v1.json',
-  './packs/food_v1.json',
-  './packs/andrew_ramdayal.json',
-  './packs/science_v1.json',
-  './packs/popculture_v1.json',
-  './packs/movies_v1.json',
-  './packs/math_v1.json',
-  './packs/xanadu_v1.json',
-  './packs/music_60s.json',
-  './packs/music_70s.json',
-  './packs/music_80s.json',
-  './packs/music_90s.json',
-  './packs/public_domain.json',
-  // New Niche Packs
-  './packs/brands_logos.json',
-  './packs/true_crime.json',
-  './packs/agile_scrum.json',
-  './packs/american_muscle.json',
-  './packs/anime_manga.json',
-  './packs/automotive.json',
-  './packs/candy_60s.json',
-  './packs/cartoons_60s.json',
-  './packs/cost_of_living.json',
-  './packs/cryptids.json',
-  './packs/cybersecurity.json',
-  './packs/flags_quiz.json',
-  './packs/human_body.json',
-  './packs/internet_culture.json',
-  './packs/logo_quiz.json',
-  './packs/modern_history.json',
-  './packs/ohio_space.json',
-  './packs/ohio_sports.json',
-  './packs/rust_belt_rock.json',
-  './packs/vietnam_era.json'
+  // Pack headers, one bundle per group (update_manifest.py). Question
+  // chunks are not precached: they are cached below as rounds fetch them
+  './packs/bundles/group_buckeye_years.json',
+  './packs/bundles/group_geek_culture.json',
+  './packs/bundles/group_golden_era.json',
+  './packs/bundles/group_niche.json',
+  './packs/bundles/group_professional.json',
+  './packs/bundles/group_pub_trivia.json',
+  './packs/bundles/group_visual.json'
 ];
 
 self.addEventListener('install', function(event) {
@@ -86,6 +48,10 @@ self.addEventListener('activate', function(event) {
   );
 });
 
+// Pack files (bundle headers and chunks, or a whole pack as the fallback)
+// and search index shards are cached the first time they are fetched
+var RUNTIME_CACHE_RE = /\/(packs|search_index)\/.+\.json$/;
+
 self.addEventListener('fetch', function(event) {
   event.respondWith(
     caches.match(event.request)
@@ -93,7 +59,16 @@ self.addEventListener('fetch', function(event) {
         if (response) {
           return response;
         }
-        return fetch(event.request);
+        return fetch(event.request).then(function(response) {
+          if (response.ok && event.request.method === 'GET' &&
+              RUNTIME_CACHE_RE.test(new URL(event.request.url).pathname)) {
+            var copy = response.clone();
+            caches.open(CACHE_NAME).then(function(cache) {
+              cache.put(event.request, copy);
+            });
+          }
+          return response;
+        });
       })
       .catch(function() {
         // Fallback or offline page logic here if needed
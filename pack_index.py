@@ -0,0 +1,308 @@
+import os
+import re
+import sys
+import json
+import math
+import hashlib
+import argparse
+import unicodedata
+from itertools import combinations
+
+# Sibling module (pack order and bundle split); also when run by
+# scripts/watch.py, which does not put this directory on sys.path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from update_manifest import MANIFEST_FILE, NOT_PACKS, PACKS_DIR, compact, split_pack, write_if_changed
+
+# Cross-pack duplicate-question report and search index for the J packs.
+#
+#   python pack_index.py                        # report duplicates, write the search index
+#   python pack_index.py --report dupes.json    # also write the clusters as JSON
+#   python pack_index.py --strict               # exit 1 if any duplicates are found
+#
+# Every question is normalised (accents folded, lowercased, stopwords dropped,
+# plurals singularised) into a term set, plus the text of its correct option.
+# Identical normalised questions share a fingerprint and are grouped directly.
+# Near duplicates are only compared when they share a rare term (one used by
+# at most MAX_DF questions) or the same answer, so the work grows with the
+# number of questions rather than with every pair of them. Candidates are
+# scored by IDF-weighted Jaccard similarity of their terms: a pair with the
+# same (non-generic) answer is a duplicate from SAME_ANSWER_THRESHOLD, any
+# other pair from TEXT_THRESHOLD. Sharing an answer is weak evidence on its
+# own ("largest planet" and "rotates fastest" are both Jupiter), so such a
+# pair must also share a subject term: one used by at most SUBJECT_MAX_DF
+# questions ("pulp", "wolverine"), not just "planet" or "season". Duplicate
+# pairs are merged into clusters. KNOWN_DISTINCT and KNOWN_DUPLICATES pin
+# pairs that were misjudged or must keep being found; a run that gets one
+# wrong exits 1.
+#
+# games/j/search_index/ lets the game find questions by keyword without
+# loading any pack:
+#   manifest.json  version;
+#                  packs: pack paths in manifest order, as in manifest.json;
+#                  starts: number of the first question of each pack;
+#                  questions are numbered in bundle order, so question n of
+#                  a pack sits in chunk n // size;
+#                  shards: the first characters that have a shard
+#   <c>.json       terms: term -> question numbers, delta-coded (first
+#                  number, then gaps), for the terms starting with c
+# Every term a typed word can prefix-match shares its first character, so a
+# query fetches one small shard per word. Terms come from the question text
+# and its correct answer, normalised as above (app.js's searchTerms() must
+# match terms() here).
+
+OUTPUT_DIR = "games/j/search_index"
+INDEX_VERSION = 2
+MAX_DF = 40
+SAME_ANSWER_THRESHOLD = 0.6
+SUBJECT_MAX_DF = 4
+TEXT_THRESHOLD = 0.85
+
+# (pack, question id) pairs that share an answer but ask different things
+KNOWN_DISTINCT = [
+    (("packs/space_v1.json", "q062"), ("packs/space_v1.json", "q002")),  # Jupiter: rotates fastest / largest
+    (("packs/sports_v1.json", "q077"), ("packs/sports_v1.json", "q038")),  # Wimbledon: oldest / only on grass
+    (("packs/classic_movies.json", "q034"), ("packs/classic_movies.json", "q016")),  # Wings: last silent / first
+    (("packs/anime_manga.json", "am_14"), ("packs/anime_manga.json", "am_05")),  # Death Note: the notebook / the anime
+    (("packs/hercules_tv.json", "q014"), ("packs/xena_tv.json", "q008")),  # six seasons: Hercules / Xena
+]
+# Pairs that are the same question and must stay in one cluster
+KNOWN_DUPLICATES = [
+    (("packs/cryptids.json", "cry_07"), ("packs/mythology_v1.json", "q002")),  # Thor's hammer
+    (("packs/science_v1.json", "q016"), ("packs/human_body.json", "hb_09")),  # heart chambers, "4" / "four"
+    (("packs/popculture_v1.json", "q047"), ("packs/movies_v1.json", "q014")),  # Pulp Fiction director
+    (("packs/popculture_v1.json", "q016"), ("packs/movies_v1.json", "q019")),  # Let It Go
+]
+
+WORD_RE = re.compile(r"[a-z0-9]+")
+STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "been", "by", "did", "do", "does", "for", "from",
+    "her", "his", "how", "in", "is", "it", "its", "of", "on", "or", "that", "the", "their",
+    "these", "this", "those", "to", "was", "were", "what", "when", "where", "which", "who",
+    "whom", "whose", "why", "with"
+}
+# Answers shared by unrelated questions ("All of the above", "Both A and B")
+GENERIC_ANSWER_RE = re.compile(r"^(all|both|none|neither)\b.*\b(above|these|a|b)$")
+
+
+def words(text):
+    text = unicodedata.normalize("NFKD", str(text or "")).encode("ascii", "ignore").decode("ascii")
+    return WORD_RE.findall(text.lower())
+
+
+def singular(word):
+    if word.endswith("s") and not word.endswith("ss") and len(word) > 3:
+        return word[:-1]
+    return word
+
+
+def terms(text):
+    return [singular(w) for w in words(text) if w not in STOPWORDS]
+
+
+def answer_text(question):
+    options = question.get("options") or {}
+    return " ".join(words(options.get(question.get("correct"), "")))
+
+
+def load_packs(packs_dir):
+    # -> [(manifest path, questions in bundle order)], in manifest order with
+    # packs the manifest does not list yet at the end
+    try:
+        with open(os.path.join(packs_dir, MANIFEST_FILE), "r", encoding="utf-8") as f:
+            listed = [p["path"].split("/")[-1] for p in json.load(f).get("packs", [])]
+    except (OSError, ValueError):
+        listed = []
+    names = sorted(n for n in os.listdir(packs_dir) if n.endswith(".json") and n not in NOT_PACKS)
+    packs = []
+    for name in [n for n in listed if n in names] + [n for n in names if n not in listed]:
+        with open(os.path.join(packs_dir, name), "r", encoding="utf-8") as f:
+            data = json.load(f)
+        _, chunks = split_pack(data, len(data["questions"]) or 1)
+        packs.append(("packs/" + name, chunks[0] if chunks else []))
+    return packs
+
+
+class Questions:
+    def __init__(self, packs):
+        self.refs = []  # question number -> (pack path, question id)
+        self.texts = []
+        self.terms = []  # question number -> term set
+        self.answers = []
+        for path, questions in packs:
+            for q in questions:
+                self.refs.append((path, q.get("id")))
+                self.texts.append(str(q.get("text") or ""))
+                self.terms.append(frozenset(terms(q.get("text"))))
+                self.answers.append(answer_text(q))
+        self.df = {}
+        for term_set in self.terms:
+            for term in term_set:
+                self.df[term] = self.df.get(term, 0) + 1
+        n = len(self.terms)
+        self.idf = {term: math.log(n / count) for term, count in self.df.items()}
+
+    def fingerprint(self, i):
+        key = " ".join(sorted(self.terms[i])) + "=" + self.answers[i]
+        return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+    def same_answer(self, i, j):
+        return bool(self.answers[i]) and self.answers[i] == self.answers[j] \
+            and not GENERIC_ANSWER_RE.match(self.answers[i])
+
+    def shares_subject(self, i, j, max_df):
+        return any(self.df[t] <= max_df for t in self.terms[i] & self.terms[j])
+
+    def similarity(self, i, j):
+        a, b = self.terms[i], self.terms[j]
+        union = sum(self.idf[t] for t in a | b)
+        return sum(self.idf[t] for t in a & b) / union if union else 0.0
+
+    def candidates(self, max_df):
+        # Pairs sharing a rare term or an answer; common terms ("name",
+        # "year") and big answer blocks ("1", "true") are not worth pairing on
+        blocks = {}
+        for i, term_set in enumerate(self.terms):
+            for term in term_set:
+                if self.df[term] <= max_df:
+                    blocks.setdefault(("t", term), []).append(i)
+            if self.answers[i] and not GENERIC_ANSWER_RE.match(self.answers[i]):
+                blocks.setdefault(("a", self.answers[i]), []).append(i)
+        pairs = set()
+        for members in blocks.values():
+            if 1 < len(members) <= max_df:
+                pairs.update(combinations(members, 2))
+        return pairs
+
+
+def find_duplicates(questions, max_df=MAX_DF, same_answer=SAME_ANSWER_THRESHOLD, text_only=TEXT_THRESHOLD,
+                    subject_max_df=SUBJECT_MAX_DF):
+    # -> (clusters of question numbers, {(i, j): similarity})
+    parent = list(range(len(questions.refs)))
+
+    def root(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    scores = {}
+    exact = {}
+    for i in range(len(questions.refs)):
+        first = exact.setdefault(questions.fingerprint(i), i)
+        if first != i:
+            scores[(first, i)] = 1.0
+    for i, j in questions.candidates(max_df):
+        if (i, j) in scores:
+            continue
+        score = questions.similarity(i, j)
+        if score >= text_only or (score >= same_answer and questions.same_answer(i, j)
+                                  and questions.shares_subject(i, j, subject_max_df)):
+            scores[(i, j)] = score
+    for i, j in scores:
+        parent[root(i)] = root(j)
+
+    clusters = {}
+    for i, j in scores:
+        clusters.setdefault(root(i), set()).update((i, j))
+    return sorted((sorted(c) for c in clusters.values()), key=lambda c: (-len(c), c)), scores
+
+
+def check_known_pairs(questions, clusters):
+    # -> messages for KNOWN_DISTINCT pairs that were clustered and
+    # KNOWN_DUPLICATES pairs that were not; pairs whose questions are gone
+    # (an edited or removed pack) are skipped
+    number = {ref: i for i, ref in enumerate(questions.refs)}
+    cluster_of = {i: n for n, cluster in enumerate(clusters) for i in cluster}
+    problems = []
+    for pairs, want, wrong in ((KNOWN_DISTINCT, False, "reported as duplicates"),
+                               (KNOWN_DUPLICATES, True, "no longer reported as duplicates")):
+        for a, b in pairs:
+            if a not in number or b not in number:
+                continue
+            i, j = number[a], number[b]
+            if (i in cluster_of and cluster_of.get(i) == cluster_of.get(j)) != want:
+                problems.append(f"{a[0]} {a[1]} and {b[0]} {b[1]} {wrong}")
+    return problems
+
+
+def build_search_index(packs, questions):
+    starts = []
+    count = 0
+    for _, pack_questions in packs:
+        starts.append(count)
+        count += len(pack_questions)
+    postings = {}
+    for i, text in enumerate(questions.texts):
+        for term in set(terms(text)) | set(terms(questions.answers[i])):
+            postings.setdefault(term, []).append(i)
+    shards = {}
+    for term in sorted(postings):
+        numbers = postings[term]
+        shards.setdefault(term[0], {})[term] = [numbers[0]] + [b - a for a, b in zip(numbers, numbers[1:])]
+    manifest = {"version": INDEX_VERSION, "packs": [path for path, _ in packs], "starts": starts,
+                "shards": "".join(shards)}
+    return manifest, shards
+
+
+def write_search_index(output_dir, manifest, shards):
+    # -> (files written, total bytes)
+    os.makedirs(output_dir, exist_ok=True)
+    names = {"manifest.json"}
+    written = write_if_changed(os.path.join(output_dir, "manifest.json"), compact(manifest) + "\n")
+    total = 0
+    for first, terms in shards.items():
+        names.add(first + ".json")
+        content = compact({"terms": terms}) + "\n"
+        written += write_if_changed(os.path.join(output_dir, first + ".json"), content)
+        total += len(content)
+    # Shards for first characters no term starts with any more
+    for name in os.listdir(output_dir):
+        if name.endswith(".json") and name not in names:
+            os.remove(os.path.join(output_dir, name))
+    return written, total
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Report duplicate J questions across packs and build the search index.")
+    parser.add_argument("--packs-dir", default=PACKS_DIR)
+    parser.add_argument("--output", default=OUTPUT_DIR, help="search index directory")
+    parser.add_argument("--report", metavar="PATH", help="write the duplicate clusters as JSON")
+    parser.add_argument("--strict", action="store_true", help="exit 1 if any duplicate questions are found")
+    parser.add_argument("--same-answer-threshold", type=float, default=SAME_ANSWER_THRESHOLD,
+                        help="similarity at which questions with the same answer are duplicates")
+    parser.add_argument("--text-threshold", type=float, default=TEXT_THRESHOLD,
+                        help="similarity at which questions with different answers are duplicates")
+    args = parser.parse_args(argv)
+
+    packs = load_packs(args.packs_dir)
+    questions = Questions(packs)
+    clusters, scores = find_duplicates(questions, same_answer=args.same_answer_threshold,
+                                       text_only=args.text_threshold)
+    problems = check_known_pairs(questions, clusters)
+
+    report = []
+    for cluster in clusters:
+        pairs = [[i, j, round(s, 3)] for (i, j), s in scores.items() if i in cluster]
+        report.append({
+            "questions": [{"pack": questions.refs[i][0], "id": questions.refs[i][1], "text": questions.texts[i],
+                           "answer": questions.answers[i]} for i in cluster],
+            "similarity": min(s for _, _, s in pairs)
+        })
+        print(f"{len(cluster)} questions, similarity >= {report[-1]['similarity']}:")
+        for q in report[-1]["questions"]:
+            print(f"  {q['pack']} {q['id']}: {q['text']}  [{q['answer']}]")
+    print(f"{len(clusters)} duplicate clusters in {len(questions.refs)} questions from {len(packs)} packs")
+    if args.report:
+        write_if_changed(args.report, json.dumps(report, indent=2, ensure_ascii=False) + "\n")
+
+    manifest, shards = build_search_index(packs, questions)
+    written, total = write_search_index(args.output, manifest, shards)
+    print(f"Search index {args.output}: {sum(len(t) for t in shards.values())} terms in {len(shards)} shards, "
+          f"{total} bytes ({written} files written)")
+    for problem in problems:
+        print(f"Known pair check failed: {problem}")
+    return 1 if problems or (args.strict and clusters) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -17,7 +17,25 @@ document.addEventListener('DOMContentLoaded', () => {
         controls.appendChild(closeBtn);
     }
 
+    // Search Box (results come from data/search_index.json, built by generate_content.py)
+    const searchWrap = document.createElement('div');
+    searchWrap.className = 'search-box';
+    const searchInput = document.createElement('input');
+    searchInput.type = 'search';
+    searchInput.placeholder = 'Search...';
+    searchInput.setAttribute('aria-label', 'Search the encyclopedia');
+    const searchResults = document.createElement('ul');
+    searchResults.className = 'search-results';
+    searchWrap.appendChild(searchInput);
+    searchWrap.appendChild(searchResults);
+    if (controls) {
+        controls.appendChild(searchWrap);
+    }
+
     // State
+    const ITEMS_PER_RANGE = 8;
+    const MAX_SEARCH_RESULTS = 8;
+    let searchIndex = null;
     let contentData = [];
     let pages = [];
     let currentPageIndex = -1; // -1 means closed (no pages flipped)
@@ -50,9 +68,88 @@ document.addEventListener('DOMContentLoaded', () => {
         })
         .catch(err => console.error('Failed to load content:', err));
 
+    fetch('data/search_index.json')
+        .then(response => response.json())
+        .then(index => {
+            searchIndex = index;
+        })
+        .catch(err => console.warn('Search index unavailable:', err));
+
+    // --- Search ---
+    // All columns in the index are pre-sorted, so lookups are binary searches:
+    // no lowercasing or tokenizing of entries happens in the browser.
+    function lowerBound(keys, value) {
+        let lo = 0;
+        let hi = keys.length;
+        while (lo < hi) {
+            const mid = (lo + hi) >> 1;
+            if (keys[mid] < value) lo = mid + 1;
+            else hi = mid;
+        }
+        return lo;
+    }
+
+    function prefixIds(keys, ids, prefix) {
+        // ids of every key starting with prefix; ids may be lists (token postings)
+        const found = [];
+        for (let i = lowerBound(keys, prefix); i < keys.length && keys[i].startsWith(prefix); i++) {
+            found.push(...[].concat(ids[i]));
+        }
+        return found;
+    }
+
+    function exactIds(keys, ids, key) {
+        const i = lowerBound(keys, key);
+        return keys[i] === key ? ids[i] : [];
+    }
+
+    function searchEntries(query) {
+        const q = query.trim().toLowerCase();
+        // An index built for a different content.json would point at the wrong entries
+        if (!q || !searchIndex || searchIndex.count !== contentData.length) return [];
+
+        // 1. Terms starting with the query (autocomplete)
+        const results = prefixIds(searchIndex.termKeys, searchIndex.termIds, q);
+
+        // 2. Entries whose text contains every query word (the last may be partial)
+        const words = q.match(/[a-z0-9]+/g) || [];
+        if (words.length) {
+            let matches = null;
+            words.forEach((word, i) => {
+                const ids = (i === words.length - 1)
+                    ? prefixIds(searchIndex.tokenKeys, searchIndex.tokenIds, word)
+                    : exactIds(searchIndex.tokenKeys, searchIndex.tokenIds, word);
+                const set = new Set(ids);
+                matches = matches ? matches.filter(id => set.has(id)) : Array.from(set);
+            });
+            matches.forEach(id => {
+                if (!results.includes(id)) results.push(id);
+            });
+        }
+        return results.slice(0, MAX_SEARCH_RESULTS);
+    }
+
+    function openEntry(id) {
+        const rangeIndex = Math.floor(id / ITEMS_PER_RANGE);
+        flipToPage(1 + rangeIndex);
+        showContent(2 + rangeIndex, contentData[id]);
+    }
+
+    searchInput.addEventListener('input', () => {
+        searchResults.innerHTML = '';
+        searchEntries(searchInput.value).forEach(id => {
+            const li = document.createElement('li');
+            li.textContent = contentData[id].term;
+            li.onclick = () => {
+                openEntry(id);
+                searchResults.innerHTML = '';
+            };
+            searchResults.appendChild(li);
+        });
+    });
+
     function initBook() {
         // Group content
-        const ITEMS_PER_RANGE = 8;
         const ranges = [];
         for (let i = 0; i < contentData.length; i += ITEMS_PER_RANGE) {
             ranges.push(contentData.slice(i, i + ITEMS_PER_RANGE));
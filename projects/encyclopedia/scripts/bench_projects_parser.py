@@ -0,0 +1,104 @@
+import os
+import re
+import sys
+import time
+import random
+import argparse
+
+import generate_content
+
+# Benchmark: legacy nested-regex scan vs. the single-pass JS literal reader.
+#
+#   python projects/encyclopedia/scripts/bench_projects_parser.py --projects 10000
+#
+# Builds a synthetic registry shaped like js/projects.js (comments, multi-tag
+# entries, trailing code after the array) and times both extractors on it.
+
+CATEGORIES = ["cards", "puzzle", "retro", "arcade", "board", "project"]
+TAGS = ["Retro", "Classic", "New", "Engine", "Music", "Quiz", "Utility", "Dev Tool"]
+
+
+def legacy_parse(content):
+    # The pre-tokenizer implementation of parse_projects_js, kept for comparison
+    match = re.search(r'var projects = \[(.*?)\];', content, re.DOTALL)
+    if not match:
+        return []
+    entries = []
+    for obj_str in re.compile(r'\{([^\}]+)\}').findall(match.group(1)):
+        entry = {}
+        name_match = re.search(r'name:\s*"([^"]+)"', obj_str)
+        if name_match:
+            entry['term'] = name_match.group(1)
+        desc_match = re.search(r'description:\s*"([^"]+)"', obj_str)
+        if desc_match:
+            entry['definition'] = desc_match.group(1)
+        if re.search(r'category:\s*"([^"]+)"', obj_str):
+            entry['category'] = "Project"
+        tags_match = re.search(r'tags:\s*\["([^"]+)"\]', obj_str)
+        if tags_match:
+            entry['tags'] = [tags_match.group(1)]
+        if 'term' in entry:
+            entries.append(entry)
+    return entries
+
+
+def tokenizer_parse(content):
+    projects = generate_content.parse_js_var(content, 'projects')
+    return [p for p in projects if isinstance(p, dict) and p.get('name')]
+
+
+def synthetic_registry(count, seed):
+    rng = random.Random(seed)
+    lines = ["var projects = ["]
+    for i in range(count):
+        if i % 25 == 0:
+            lines.append(f"    // Section {i // 25}")
+        tags = ", ".join(f'"{t}"' for t in rng.sample(TAGS, rng.randint(1, 3)))
+        lines.append(
+            f'    {{ name: "Project {i}", path: "games/p{i}/index.html", '
+            f'category: "{rng.choice(CATEGORIES)}", icon: "*", tags: [{tags}], '
+            f'description: "Synthetic entry number {i} with a reasonably long description." }},'
+        )
+    lines.append("];")
+    lines.append("")
+    lines.append("function init() { renderProjects('all'); }")
+    return "\n".join(lines)
+
+
+def best_of(fn, content, repeat):
+    best = None
+    result = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = fn(content)
+        elapsed = time.perf_counter() - t0
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark js/projects.js extraction.")
+    parser.add_argument("--projects", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    content = synthetic_registry(args.projects, args.seed)
+    print(f"Synthetic registry: {args.projects} projects, {len(content) / 1024:.0f} KB")
+
+    legacy_s, legacy = best_of(legacy_parse, content, args.repeat)
+    new_s, new = best_of(tokenizer_parse, content, args.repeat)
+    if len(legacy) != len(new):
+        print(f"Entry count mismatch: legacy {len(legacy)}, tokenizer {len(new)}")
+        return 1
+
+    multi = sum(1 for p in new if len(p.get('tags', [])) > 1)
+    print(f"legacy regex  {legacy_s * 1000:8.1f} ms")
+    print(f"tokenizer     {new_s * 1000:8.1f} ms  ({new_s / legacy_s:.2f}x the legacy time, "
+          f"{new_s / args.projects * 1e6:.1f} us/project)")
+    print(f"{multi} entries have several tags; the legacy scan keeps none of them")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,23 @@
 import json
 import re
 import os
+import sys
+import time
+import inspect
+import hashlib
+import argparse
+import traceback
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+OUTPUT_FILE = 'projects/encyclopedia/data/content.json'
+# Prebuilt lookup structures so js/script.js never tokenizes the corpus
+SEARCH_INDEX_FILE = 'projects/encyclopedia/data/search_index.json'
+SEARCH_TOKEN_RE = re.compile(r'[a-z0-9]+')
+# Per-parser output cache, keyed by input content hash + parser source hash
+CACHE_FILE = 'projects/encyclopedia/scripts/.parser_cache.json'
+# Bump to invalidate every cached fragment after changing a shared helper
+# (clean_text, the JS literal reader); parser bodies are hashed automatically
+CACHE_VERSION = 2
 
 # --- Helper Functions ---
 def clean_text(text):
@@ -8,256 +25,482 @@ def clean_text(text):
         return ""
     return text.strip().replace('`', '')
 
+# --- JS Object Literal Reader ---
+# js/projects.js declares `var projects = [ { name: "...", tags: [...] }, ... ];`.
+# The JS literal is rewritten into JSON and the C JSON decoder builds the
+# values, so every field of every object comes out of one pass and nested
+# objects/arrays are fine. The rewrite never runs Python code per token:
+#   1. the source is split on double quotes (str.split, no regex), which
+#      alternates code runs and string bodies as long as no comment or
+#      single-quoted string in between holds a quote of its own;
+#   2. the few code runs that do hold a comment or a single-quoted string
+#      are re-split with the full tokenizer; if one of them opens something
+#      it does not close, step 1 was wrong and the whole source goes through
+#      the tokenizer instead;
+#   3. bare keys, trailing commas and `undefined` are fixed with template
+#      substitutions on each *distinct* code run; a registry has only a
+#      handful of those (`, name: `, `, tags: [` ...), and the substitutions
+#      can never touch the inside of a string;
+#   4. strings are put back as they are. A source with a backslash anywhere
+#      goes through the tokenizer, which re-encodes the strings whose
+#      escapes JSON reads differently (and cannot mistake `\"` for a quote).
+# Identifiers other than true/false/null/undefined are left untouched, so a
+# non-literal value (a call, a variable) makes the decode fail loudly.
+
+# Strings are unrolled ("normal* (escape normal*)*"), not a per-character alternation
+JS_SPLIT_RE = re.compile(r"""("[^"\\\n]*(?:\\.[^"\\\n]*)*"|'[^'\\\n]*(?:\\.[^'\\\n]*)*'|//[^\n]*|/\*.*?\*/)""",
+                         re.DOTALL)
+JS_KEY_RE = re.compile(r'([A-Za-z_$][\w$]*)(\s*:)')
+JS_TRAILING_COMMA_RE = re.compile(r',(\s*[\]}])')
+JS_UNDEFINED_RE = re.compile(r'(?<![\w$])undefined(?![\w$])')
+# Joins the tokens for the substring checks in js_literal_to_json
+TOKEN_SEP = '\x00'
+
+JS_ESCAPE_RE = re.compile(r"\\(u[0-9a-fA-F]{4}|x[0-9a-fA-F]{2}|.)", re.DOTALL)
+JS_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', 'b': '\b', 'f': '\f', 'v': '\v', '0': '\0'}
+# Escapes that mean the same thing in JSON; anything else needs re-encoding
+JSON_SAFE_ESCAPE_RE = re.compile(r'\\(?:["\\/bfnrt]|u[0-9a-fA-F]{4})')
+JSON_DECODER = json.JSONDecoder()
+
+def js_unescape(body):
+    def replace(m):
+        esc = m.group(1)
+        if esc[0] in 'ux' and len(esc) > 1:
+            return chr(int(esc[1:], 16))
+        return JS_ESCAPES.get(esc, esc)
+    return JS_ESCAPE_RE.sub(replace, body)
+
+def js_string_to_json(text):
+    if text[0] == '"' and ('\\' not in text or not JSON_SAFE_ESCAPE_RE.sub('', text).count('\\')):
+        return text
+    return json.dumps(js_unescape(text[1:-1]), ensure_ascii=False)
+
+def js_code_to_json(code):
+    code = JS_KEY_RE.sub(r'"\1"\2', code)
+    code = JS_TRAILING_COMMA_RE.sub(r'\1', code)
+    return JS_UNDEFINED_RE.sub('null', code) if 'undefined' in code else code
+
+def token_indices(joined, needle, first=False):
+    # Indices of the tokens in TOKEN_SEP + TOKEN_SEP.join(tokens) that contain
+    # `needle` (with first=True: start with it), found with C string searches
+    # rather than a loop over every token
+    indices = []
+    seps = last = 0
+    pos = joined.find(needle)
+    while pos != -1:
+        if not first or joined[pos - 1] == TOKEN_SEP:
+            seps += joined.count(TOKEN_SEP, last, pos + 1)
+            last = pos + 1
+            if not indices or indices[-1] != seps - 1:
+                indices.append(seps - 1)
+        pos = joined.find(needle, pos + 1)
+    return indices
+
+def tokens_to_json(parts):
+    # JSON for the output of JS_SPLIT_RE.split: code runs at even indices,
+    # strings and comments at odd ones
+    code = parts[0::2]
+    tokens = parts[1::2]
+    joined = TOKEN_SEP + TOKEN_SEP.join(tokens)
+    comments = sorted(token_indices(joined, '//', first=True) + token_indices(joined, '/*', first=True))
+    if comments:
+        # Drop the comments, merging the code runs on either side
+        merged, kept, start = [], [], 0
+        for i in comments:
+            merged.extend(code[start:i])
+            kept.extend(tokens[start:i])
+            code[i + 1] = code[i] + ' ' + code[i + 1]
+            start = i + 1
+        code = merged + code[start:]
+        tokens = kept + tokens[start:]
+        joined = TOKEN_SEP + TOKEN_SEP.join(tokens)
+    # Only single-quoted strings and strings with escapes need re-encoding
+    for i in set(token_indices(joined, "'", first=True) + token_indices(joined, '\\')):
+        tokens[i] = js_string_to_json(tokens[i])
+    translated = {run: js_code_to_json(run) for run in set(code)}
+    out = [None] * (len(code) + len(tokens))
+    out[0::2] = map(translated.__getitem__, code)
+    out[1::2] = tokens
+    return ''.join(out)
+
+def closed_tokens(run, last):
+    # JS_SPLIT_RE.split of a code run from the double-quote split, or None if
+    # the run leaves a string or comment open (its closing quote, or the end of
+    # its line, lies past a double quote)
+    parts = JS_SPLIT_RE.split(run)
+    for i in range(0, len(parts), 2):
+        if "'" in parts[i] or '/*' in parts[i]:
+            return None
+        if i and parts[i - 1].startswith('//') and not parts[i].startswith('\n') and not (last and i == len(parts) - 1):
+            return None
+    return parts
+
+def js_literal_to_json(source):
+    parts = source.split('"')
+    code = parts[0::2]
+    if len(parts) % 2 == 0 or '\\' in source:
+        # An unpaired quote, or escapes that could hide one
+        return tokens_to_json(JS_SPLIT_RE.split(source))
+    joined = TOKEN_SEP + TOKEN_SEP.join(code)
+    hazards = set(token_indices(joined, "'") + token_indices(joined, '/'))
+    special = {}
+    for i in hazards:
+        split = closed_tokens(code[i], i == len(code) - 1)
+        if split is None:
+            return tokens_to_json(JS_SPLIT_RE.split(source))
+        special[i] = tokens_to_json(split)
+    translated = {run: js_code_to_json(run) for run in set(code)}
+    code = list(map(translated.__getitem__, code))
+    for i, text in special.items():
+        code[i] = text
+    parts[0::2] = code
+    return '"'.join(parts)
+
+def parse_js_var(content, name):
+    # Value assigned by the first `var <name> = <literal>`, or None
+    match = re.search(r'\bvar\s+' + re.escape(name) + r'\s*=\s*', content)
+    if not match:
+        return None
+    # raw_decode stops after the first complete value, ignoring the rest of the file
+    value, _ = JSON_DECODER.raw_decode(js_literal_to_json(content[match.end():]))
+    return value
+
 # --- Parsers ---
 
 def parse_projects_js():
-    try:
-        with open('js/projects.js', 'r') as f:
-            content = f.read()
-
-        match = re.search(r'var projects = \[(.*?)\];', content, re.DOTALL)
-        if not match:
-            return []
-
-        projects_str = match.group(1)
-        object_pattern = re.compile(r'\{([^\}]+)\}')
-        objects = object_pattern.findall(projects_str)
-
-        entries = []
-        for obj_str in objects:
-            entry = {}
-            name_match = re.search(r'name:\s*"([^"]+)"', obj_str)
-            if name_match:
-                entry['term'] = name_match.group(1)
-
-            desc_match = re.search(r'description:\s*"([^"]+)"', obj_str)
-            if desc_match:
-                entry['definition'] = desc_match.group(1)
-
-            cat_match = re.search(r'category:\s*"([^"]+)"', obj_str)
-            if cat_match:
-                entry['category'] = "Project"
-
-            tags_match = re.search(r'tags:\s*\["([^"]+)"\]', obj_str)
-            if tags_match:
-                entry['tags'] = [tags_match.group(1)]
-
-            if 'term' in entry:
-                entries.append(entry)
-        return entries
-    except Exception as e:
-        print(f"Error parsing projects.js: {e}")
+    with open('js/projects.js', 'r') as f:
+        content = f.read()
+
+    projects = parse_js_var(content, 'projects')
+    if not isinstance(projects, list):
         return []
 
-def parse_agents_md():
     entries = []
-    try:
-        if not os.path.exists('AGENTS.md'): return []
-        with open('AGENTS.md', 'r') as f:
-            lines = f.readlines()
-
-        for line in lines:
-            if "| **" in line and "** |" in line:
-                parts = [p.strip() for p in line.split('|')]
-                if len(parts) > 3:
-                    name_raw = parts[1].replace('**', '')
-                    role = parts[3]
-                    desc = parts[4] if len(parts) > 4 else ""
-                    entries.append({
-                        "term": name_raw,
-                        "definition": f"{role}. Key strengths: {desc}.",
-                        "category": "Agent"
-                    })
+    for obj in projects:
+        if not isinstance(obj, dict) or not obj.get('name'):
+            continue
+        entry = {'term': obj['name']}
+        if obj.get('description'):
+            entry['definition'] = obj['description']
+        if obj.get('category'):
+            entry['category'] = "Project"
+        tags = [t for t in obj.get('tags') or [] if isinstance(t, str) and t]
+        if tags:
+            entry['tags'] = tags
+        entries.append(entry)
+    return entries
+
+def parse_team_md():
+    # The agent roster: `### Claude (C) - Senior Developer ...` headings,
+    # each followed by a `**Role:** ...` line
+    entries = []
+    with open('dev/TEAM_COORDINATION.md', 'r') as f:
+        content = f.read()
 
+    for m in re.finditer(r'^### (\w+) \((\w)\) - (.+)\n\*\*Role:\*\* (.+)$', content, re.MULTILINE):
+        name, _, title, role = (g.strip() for g in m.groups())
         entries.append({
-            "term": "F.O.N.G.",
-            "definition": "The foundational architecture for the family digital archive. Stands for 'Founding & Forging' (Legacy) or 'Fong Family Arcade' (Modern).",
-            "category": "Protocol"
+            "term": name,
+            "definition": f"{title}. Role: {role}.",
+            "category": "Agent"
         })
-        entries.append({
-            "term": "The Conjugators",
-            "definition": "The collective name for the three AI agents (Claude, Gemini, Jules) that co-maintain the repository.",
-            "category": "Protocol"
-        })
-        return entries
-    except Exception as e:
-        print(f"Error parsing AGENTS.md: {e}")
-        return []
+
+    entries.append({
+        "term": "F.O.N.G.",
+        "definition": "The foundational architecture for the family digital archive. Stands for 'Founding & Forging' (Legacy) or 'Fong Family Arcade' (Modern).",
+        "category": "Protocol"
+    })
+    entries.append({
+        "term": "The Conjugators",
+        "definition": "The collective name for the three AI agents (Claude, Gemini, Jules) that co-maintain the repository.",
+        "category": "Protocol"
+    })
+    return entries
+
+def parse_legal_md():
+    # | **Project** | Data Policy | Legal / Liability | Status |
+    entries = []
+    with open('legal/README.md', 'r') as f:
+        lines = f.readlines()
+
+    for line in lines:
+        if line.startswith('| **'):
+            parts = [p.strip() for p in line.split('|')]
+            if len(parts) >= 6:
+                entries.append({
+                    "term": parts[1].replace('**', ''),
+                    "definition": f"Project covered by the legal policies. Data policy: {parts[2]}.",
+                    "category": "Legal",
+                    "description": f"Legal / liability: {parts[3]}. Status: {parts[4]}."
+                })
+    return entries
 
 def parse_readme_md():
     entries = []
-    try:
-        if not os.path.exists('README.md'): return []
-        with open('README.md', 'r') as f:
-            content = f.read()
-
-        if "## 🚀 Technology Stack" in content:
-            tech_section = content.split("## 🚀 Technology Stack")[1].split("##")[0]
-            for line in tech_section.split('\n'):
-                line = line.strip()
-                if line.startswith('- **'):
-                    parts = line.split('**')
-                    if len(parts) >= 3:
-                        term = parts[1]
-                        defin = parts[2].strip().lstrip(':').strip()
-                        entries.append({
-                            "term": term,
-                            "definition": defin,
-                            "category": "Technology"
-                        })
-        return entries
-    except Exception as e:
-        print(f"Error parsing README.md: {e}")
-        return []
+    with open('README.md', 'r') as f:
+        content = f.read()
+
+    if "## 🚀 Technology Stack" in content:
+        tech_section = content.split("## 🚀 Technology Stack")[1].split("##")[0]
+        for line in tech_section.split('\n'):
+            line = line.strip()
+            if line.startswith('- **'):
+                parts = line.split('**')
+                if len(parts) >= 3:
+                    term = parts[1]
+                    defin = parts[2].strip().lstrip(':').strip()
+                    entries.append({
+                        "term": term,
+                        "definition": defin,
+                        "category": "Technology"
+                    })
+    return entries
 
 def parse_projects_md():
     # Enrich project entries with Dates and Types
     entries = []
-    try:
-        if not os.path.exists('PROJECTS.md'): return []
-        with open('PROJECTS.md', 'r') as f:
-            lines = f.readlines()
-
-        for line in lines:
-            if "| **" in line:
-                # | **Name** | `Path` | Type | Summary | Date |
-                parts = [p.strip() for p in line.split('|')]
-                if len(parts) >= 6:
-                    name = parts[1].replace('**', '')
-                    path = clean_text(parts[2])
-                    ptype = parts[3]
-                    summary = parts[4]
-                    date = parts[5]
+    with open('PROJECTS.md', 'r') as f:
+        lines = f.readlines()
+
+    for line in lines:
+        if "| **" in line:
+            # | **Name** | `Path` | Type | Summary | Date |
+            parts = [p.strip() for p in line.split('|')]
+            if len(parts) >= 6:
+                name = parts[1].replace('**', '')
+                path = clean_text(parts[2])
+                ptype = parts[3]
+                summary = parts[4]
+                date = parts[5]
+
+                entries.append({
+                    "term": name,
+                    "definition": summary,
+                    "category": "Project",
+                    "description": f"Type: {ptype}. Created: {date}. Path: {path}"
+                })
+    return entries
+
+def parse_dependency_policy_md():
+    # The root INFO.md no longer carries the library registry; the policy
+    # that defines it does
+    entries = []
+    with open('admin/DEPENDENCY_POLICY.md', 'r') as f:
+        content = f.read()
 
-                    entries.append({
-                        "term": name,
-                        "definition": summary,
-                        "category": "Project",
-                        "description": f"Type: {ptype}. Created: {date}. Path: {path}"
-                    })
-        return entries
-    except Exception as e:
-        print(f"Error parsing PROJECTS.md: {e}")
-        return []
+    # Registry Version
+    reg_ver = re.search(r'\*\*Version:\*\* ([\d\.]+)', content)
+    if reg_ver:
+        entries.append({
+            "term": "F.O.N.G. Registry",
+            "definition": f"Central project registry (v{reg_ver.group(1)}) maintained by Root Claude.",
+            "category": "Protocol"
+        })
+
+    # Update Policy
+    if "Semantic Versioning" in content and "Opt-In Upgrades" in content:
+        entries.append({
+            "term": "Update Policy",
+            "definition": "The repository uses Semantic Versioning with opt-in upgrades for shared libraries.",
+            "category": "Policy"
+        })
+    return entries
 
-def parse_info_md():
+def parse_library_info_md():
+    # The shared card engine's own INFO.md holds its current version
     entries = []
-    try:
-        if not os.path.exists('INFO.md'): return []
-        with open('INFO.md', 'r') as f:
-            content = f.read()
-
-        # Registry Version
-        reg_ver = re.search(r'Registry Version:\*\* ([\d\.]+)', content)
-        if reg_ver:
-            entries.append({
-                "term": "F.O.N.G. Registry",
-                "definition": f"Central project registry (v{reg_ver.group(1)}) maintained by Root Claude.",
-                "category": "Protocol"
-            })
-
-        # Update Policy
-        if "## Update Policy" in content:
-            entries.append({
-                "term": "Update Policy",
-                "definition": "The repository uses Semantic Versioning with opt-in upgrades for shared libraries.",
-                "category": "Policy"
-            })
-
-        # Parse Library Registry
-        if "## Library Registry" in content:
-            lib_section = content.split("## Library Registry")[1].split("##")[0]
-            for line in lib_section.split('\n'):
-                if "|" in line and "`" in line and "---" not in line:
-                    parts = [p.strip() for p in line.split('|')]
-                    if len(parts) > 2:
-                        lib = clean_text(parts[1])
-                        ver = clean_text(parts[2].replace('**', ''))
-                        entries.append({
-                            "term": f"Library: {lib}",
-                            "definition": f"Shared library currently at version {ver}.",
-                            "category": "Technology"
-                        })
-
-        return entries
-    except Exception as e:
-        print(f"Error parsing INFO.md: {e}")
-        return []
+    with open('games/cards/shared/INFO.md', 'r') as f:
+        content = f.read()
+
+    # `## Current Version: v1.0.1`; the `**Version:**` header line lags behind
+    ver = re.search(r'^## Current Version: (\S+)', content, re.MULTILINE)
+    lib = re.search(r'\*\*Directory:\*\* `([^`]+)`', content)
+    if ver and lib:
+        entries.append({
+            "term": f"Library: {lib.group(1).rstrip('/')}",
+            "definition": f"Shared library currently at version {ver.group(1)}.",
+            "category": "Technology"
+        })
+    return entries
 
 def parse_url_parameters_md():
     entries = []
-    try:
-        if not os.path.exists('URL_PARAMETERS.md'): return []
-        with open('URL_PARAMETERS.md', 'r') as f:
-            content = f.read()
+    with open('URL_PARAMETERS.md', 'r') as f:
+        content = f.read()
+
+    entries.append({
+        "term": "URL Parameters",
+        "definition": "System for deep linking to specific content in F.O.N.G. games (e.g., specific letters or words).",
+        "category": "Technology",
+        "description": "Supports `pack`, `letter`, `word`, `id`, and `game` parameters."
+    })
 
+    if "## Letter Tracing" in content:
         entries.append({
-            "term": "URL Parameters",
-            "definition": "System for deep linking to specific content in F.O.N.G. games (e.g., specific letters or words).",
-            "category": "Technology",
-            "description": "Supports `pack`, `letter`, `word`, `id`, and `game` parameters."
+            "term": "Letter Tracing URLs",
+            "definition": "Deep linking for the Tracing game.",
+            "category": "Feature",
+            "description": "Example: `index.html?pack=lowercase&letter=e` loads the lowercase pack and selects 'e'."
         })
 
-        if "## Letter Tracing" in content:
-            entries.append({
-                "term": "Letter Tracing URLs",
-                "definition": "Deep linking for the Tracing game.",
-                "category": "Feature",
-                "description": "Example: `index.html?pack=lowercase&letter=e` loads the lowercase pack and selects 'e'."
-            })
-
-        if "## Words Game" in content:
-            entries.append({
-                "term": "Words Game URLs",
-                "definition": "Deep linking for the Words game.",
-                "category": "Feature",
-                "description": "Supports predefined words (`?word=Mom`) and custom ad-hoc words (`?id=custom&word=Test`)."
-            })
-
-        return entries
-    except Exception as e:
-        print(f"Error parsing URL_PARAMETERS.md: {e}")
-        return []
+    if "## Words Game" in content:
+        entries.append({
+            "term": "Words Game URLs",
+            "definition": "Deep linking for the Words game.",
+            "category": "Feature",
+            "description": "Supports predefined words (`?word=Mom`) and custom ad-hoc words (`?id=custom&word=Test`)."
+        })
+
+    return entries
 
 def parse_license_audit_md():
     entries = []
+    with open('LICENSE_AUDIT.md', 'r') as f:
+        lines = f.readlines()
+
+    for line in lines:
+        # | `path` | **Name** | License | ...
+        if "| `games/" in line or "| `projects/" in line:
+            parts = [p.strip() for p in line.split('|')]
+            if len(parts) >= 4:
+                name = parts[2].replace('**', '')
+                license = parts[3]
+                entries.append({
+                    "term": f"Lib: {name}",
+                    "definition": f"Third-party library used in the repository.",
+                    "category": "Legal",
+                    "description": f"License: {license}."
+                })
+
+    entries.append({
+        "term": "MIT License",
+        "definition": "The primary open-source license for the F.O.N.G. repository.",
+        "category": "Legal"
+    })
+
+    return entries
+
+# --- Build ---
+
+# (cache key, source file, parser) in merge order
+PARSERS = [
+    ("projects_js", "js/projects.js", parse_projects_js),
+    ("projects_md", "PROJECTS.md", parse_projects_md),
+    ("team_md", "dev/TEAM_COORDINATION.md", parse_team_md),
+    ("legal_md", "legal/README.md", parse_legal_md),
+    ("readme_md", "README.md", parse_readme_md),
+    ("dependency_policy_md", "admin/DEPENDENCY_POLICY.md", parse_dependency_policy_md),
+    ("library_info_md", "games/cards/shared/INFO.md", parse_library_info_md),
+    ("url_parameters_md", "URL_PARAMETERS.md", parse_url_parameters_md),
+    ("license_audit_md", "LICENSE_AUDIT.md", parse_license_audit_md),
+]
+
+def fragment_key(source, parser):
+    h = hashlib.sha256()
+    h.update(f"v{CACHE_VERSION}\n".encode())
+    h.update(inspect.getsource(parser).encode())
+    # A missing source raises: the stage fails instead of contributing nothing
+    with open(source, 'rb') as f:
+        h.update(f.read())
+    return h.hexdigest()
+
+def load_cache():
     try:
-        if not os.path.exists('LICENSE_AUDIT.md'): return []
-        with open('LICENSE_AUDIT.md', 'r') as f:
-            lines = f.readlines()
-
-        for line in lines:
-            # | `path` | **Name** | License | ...
-            if "| `games/" in line or "| `projects/" in line:
-                parts = [p.strip() for p in line.split('|')]
-                if len(parts) >= 4:
-                    name = parts[2].replace('**', '')
-                    license = parts[3]
-                    entries.append({
-                        "term": f"Lib: {name}",
-                        "definition": f"Third-party library used in the repository.",
-                        "category": "Legal",
-                        "description": f"License: {license}."
-                    })
-
-        entries.append({
-            "term": "MIT License",
-            "definition": "The primary open-source license for the F.O.N.G. repository.",
-            "category": "Legal"
-        })
-
-        return entries
+        with open(CACHE_FILE, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_cache(cache):
+    tmp_path = CACHE_FILE + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(cache, f, separators=(',', ':'))
+    os.replace(tmp_path, CACHE_FILE)
+
+def run_stage(name, source, parser, cached):
+    # Runs on a worker thread and never raises: failures come back in the
+    # record so the caller can stop the build before anything is written.
+    t0 = time.perf_counter()
+    record = {
+        "parser": name,
+        "source": source,
+        "input_bytes": os.path.getsize(source) if os.path.exists(source) else 0,
+        "entries": 0,
+        "cached": False,
+        "wall_ms": 0.0,
+        "error": None
+    }
+    key = entries = None
+    try:
+        key = fragment_key(source, parser)
+        if cached and cached['key'] == key:
+            entries = cached['entries']
+            record['cached'] = True
+        else:
+            entries = parser()
+        record['entries'] = len(entries)
     except Exception as e:
-        print(f"Error parsing LICENSE_AUDIT.md: {e}")
-        return []
-
-def main():
+        record['error'] = f"{type(e).__name__}: {e}"
+        record['traceback'] = traceback.format_exc()
+    record['wall_ms'] = round((time.perf_counter() - t0) * 1000, 3)
+    return key, entries, record
+
+def run_parsers(cache, jobs=None):
+    # Returns ({name: entries}, [per-parser records in PARSERS order]).
+    # Parsers are independent, so they run concurrently; only the ones whose
+    # source or code changed actually parse. The first failure cancels the
+    # parsers that have not started yet and leaves the cache untouched.
+    fragments = {}
+    records = {}
+    with ThreadPoolExecutor(max_workers=jobs or len(PARSERS)) as pool:
+        futures = {
+            pool.submit(run_stage, name, source, parser, cache.get(name)): name
+            for name, source, parser in PARSERS
+        }
+        for future in as_completed(futures):
+            if future.cancelled():
+                continue
+            name = futures[future]
+            key, entries, record = future.result()
+            records[name] = record
+            if record['error']:
+                for f in futures:
+                    f.cancel()
+                continue
+            fragments[name] = entries
+            if not record['cached']:
+                cache[name] = {'key': key, 'entries': entries}
+    return fragments, [records[name] for name, _, _ in PARSERS if name in records]
+
+def write_profile(path, records, timings):
+    # Parsers sorted slowest first so the dominant one is the first row
+    stages = sorted(records, key=lambda r: r['wall_ms'], reverse=True)
+    report = {
+        "parsers": [{k: v for k, v in r.items() if k != 'traceback'} for r in stages],
+        "parser_wall_ms": round(sum(r['wall_ms'] for r in records), 3),
+        **{k: round(v, 3) for k, v in timings.items()}
+    }
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(report, f, indent=2)
+        f.write('\n')
+    os.replace(tmp_path, path)
+
+def print_profile(records):
+    total = sum(r['wall_ms'] for r in records) or 1
+    print(f"{'parser':<18} {'bytes':>9} {'entries':>8} {'ms':>9} {'share':>6}")
+    for r in sorted(records, key=lambda r: r['wall_ms'], reverse=True):
+        status = " (cached)" if r['cached'] else (" FAILED" if r['error'] else "")
+        print(f"{r['parser']:<18} {r['input_bytes']:>9} {r['entries']:>8} "
+              f"{r['wall_ms']:>9.2f} {r['wall_ms'] / total:>6.0%}{status}")
+
+def merge_fragments(fragments):
     all_entries = []
 
     # 1. Projects (Base)
-    projects = parse_projects_js()
+    projects = [dict(p) for p in fragments['projects_js']]
     # 2. Projects Metadata (Enrichment)
-    projects_meta = parse_projects_md()
+    projects_meta = fragments['projects_md']
 
     # Merge Project Metadata into Projects
     # Create a map of normalized term -> entry
@@ -277,20 +520,10 @@ def main():
 
     all_entries.extend(projects)
 
-    # 3. Agents
-    all_entries.extend(parse_agents_md())
-
-    # 4. Tech Stack
-    all_entries.extend(parse_readme_md())
-
-    # 5. Registry/Info
-    all_entries.extend(parse_info_md())
-
-    # 6. URL Params
-    all_entries.extend(parse_url_parameters_md())
-
-    # 7. Licenses
-    all_entries.extend(parse_license_audit_md())
+    # 3. Agents, 4. Legal, 5. Tech Stack, 6. Registry/Libraries, 7. URL Params, 8. Licenses
+    for name in ("team_md", "legal_md", "readme_md", "dependency_policy_md", "library_info_md",
+                 "url_parameters_md", "license_audit_md"):
+        all_entries.extend(fragments[name])
 
     # Sort
     all_entries.sort(key=lambda x: x['term'].lower())
@@ -303,18 +536,109 @@ def main():
             unique_entries.append(e)
             seen.add(e['term'])
 
-    output = {
+    return {
         "title": "F.O.N.G. Encyclopedia",
         "description": "A comprehensive guide to the repository, its projects, and its maintainers.",
         "entries": unique_entries
     }
 
-    os.makedirs('projects/encyclopedia/data', exist_ok=True)
-
-    with open('projects/encyclopedia/data/content.json', 'w') as f:
-        json.dump(output, f, indent=2)
+# --- Search Index ---
+# Ids are positions in content.json's entries. Every column is sorted so the
+# client can binary-search it (JSON object key order is not reliable in JS:
+# numeric-looking keys such as "2026" get reordered).
+
+def search_tokens(text):
+    return {t for t in SEARCH_TOKEN_RE.findall(text.lower()) if len(t) >= 2}
+
+def build_search_index(entries):
+    # Autocomplete: lowercased terms, sorted, with the entry each belongs to
+    prefix = sorted((e['term'].lower(), i) for i, e in enumerate(entries))
+
+    # Full text: token -> ids over term, definition, description and tags
+    postings = {}
+    categories = {}
+    for i, e in enumerate(entries):
+        text = ' '.join([e['term'], e.get('definition', ''), e.get('description', '')] + e.get('tags', []))
+        for token in search_tokens(text):
+            postings.setdefault(token, []).append(i)
+        categories.setdefault(e.get('category') or 'General', []).append(i)
+
+    tokens = sorted(postings)
+    return {
+        "version": 1,
+        "count": len(entries),
+        "termKeys": [key for key, _ in prefix],
+        "termIds": [i for _, i in prefix],
+        "tokenKeys": tokens,
+        "tokenIds": [postings[t] for t in tokens],
+        "categories": {c: categories[c] for c in sorted(categories)}
+    }
 
-    print(f"Generated {len(unique_entries)} entries.")
+def write_if_changed(path, content):
+    # Returns True when the file actually changed
+    try:
+        with open(path, 'r') as f:
+            if f.read() == content:
+                return False
+    except OSError:
+        pass
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    with open(path, 'w') as f:
+        f.write(content)
+    return True
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate the encyclopedia content.json.")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="ignore cached parser output and reparse every source")
+    parser.add_argument('--jobs', type=int, default=None,
+                        help="parser worker threads (default: one per parser)")
+    parser.add_argument('--profile', metavar='PATH',
+                        help="write per-parser bytes/entries/timings to a JSON report")
+    args = parser.parse_args(argv)
+
+    t0 = time.perf_counter()
+    cache = {} if args.no_cache else load_cache()
+    fragments, records = run_parsers(cache, args.jobs)
+    timings = {"parse_ms": (time.perf_counter() - t0) * 1000}
+
+    failed = [r for r in records if r['error']]
+    if failed:
+        for r in failed:
+            print(f"Error parsing {r['source']}: {r['error']}")
+            print(r['traceback'], end='')
+        if args.profile:
+            write_profile(args.profile, records, timings)
+        print(f"Aborted: {OUTPUT_FILE} was not written")
+        return 1
+    save_cache(cache)
+
+    t1 = time.perf_counter()
+    output = merge_fragments(fragments)
+    search_index = build_search_index(output['entries'])
+    timings["merge_ms"] = (time.perf_counter() - t1) * 1000
+
+    t1 = time.perf_counter()
+    changed = write_if_changed(OUTPUT_FILE, json.dumps(output, indent=2))
+    index_changed = write_if_changed(SEARCH_INDEX_FILE, json.dumps(search_index, separators=(',', ':')))
+    timings["write_ms"] = (time.perf_counter() - t1) * 1000
+    timings["total_ms"] = (time.perf_counter() - t0) * 1000
+
+    reparsed = [r['parser'] for r in records if not r['cached']]
+    print(f"Reparsed {len(reparsed)}/{len(PARSERS)} sources" + (f" ({', '.join(reparsed)})" if reparsed else ""))
+    if changed:
+        print(f"Generated {len(output['entries'])} entries.")
+    else:
+        print(f"Unchanged ({len(output['entries'])} entries), skipped writing {OUTPUT_FILE}")
+    if index_changed:
+        print(f"Wrote {SEARCH_INDEX_FILE} ({len(search_index['tokenKeys'])} tokens)")
+    if args.profile:
+        print_profile(records)
+        write_profile(args.profile, records, timings)
+        print(f"Profile written to {args.profile}")
+    return 0
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -1,54 +1,94 @@
-const CACHE_NAME = 'encyclopedia-v1';
-const ASSETS_TO_CACHE = [
-    './',
-    './index.html',
-    './css/style.css',
-    './js/script.js',
-    './data/content.json',
-    '../../favicon.svg'
+/**
+ * Service Worker for the F.O.N.G. Encyclopedia
+ *
+ * The precache list below is regenerated from precache.json by
+ * `python -m scripts.revision_manifest projects/encyclopedia`.
+ * Each asset is cached under its content revision, so a new deploy only
+ * downloads the files whose hash changed; the rest are copied over from the
+ * previous cache.
+ */
+
+var CACHE_PREFIX = 'encyclopedia-';
+
+// <precache-manifest>
+// Generated by scripts/revision_manifest.py from precache.json. Do not edit by hand.
+var CACHE_NAME = 'encyclopedia-3c42f5958141';
+var PRECACHE_MANIFEST = [
+    { url: '../../favicon.svg', revision: '297fbff9313a' },
+    { url: './', revision: '732341221eb9' },
+    { url: './css/style.css', revision: '0bf6f0331431' },
+    { url: './data/content.json', revision: '170e100085c2' },
+    { url: './data/search_index.json', revision: '13d30373dfd7' },
+    { url: './index.html', revision: '732341221eb9' },
+    { url: './js/script.js', revision: '489c26c8ecd5' }
 ];
+// </precache-manifest>
+
+var REVISION_PARAM = '__rev';
+
+function revisionedUrl(entry) {
+    var url = new URL(entry.url, self.location.href);
+    url.searchParams.set(REVISION_PARAM, entry.revision);
+    return url.href;
+}
+
+// Absolute request URL -> cache key carrying the asset's revision
+var PRECACHE_KEYS = {};
+PRECACHE_MANIFEST.forEach(function(entry) {
+    PRECACHE_KEYS[new URL(entry.url, self.location.href).href] = revisionedUrl(entry);
+});
 
-self.addEventListener('install', (event) => {
+self.addEventListener('install', function(event) {
     event.waitUntil(
-        caches.open(CACHE_NAME)
-            .then((cache) => {
-                return cache.addAll(ASSETS_TO_CACHE);
-            })
+        caches.open(CACHE_NAME).then(function(cache) {
+            return Promise.all(PRECACHE_MANIFEST.map(function(entry) {
+                var key = revisionedUrl(entry);
+                // caches.match searches every cache, including the previous
+                // deploy's, so unchanged revisions are reused without a fetch
+                return caches.match(key).then(function(cached) {
+                    if (cached) {
+                        return cache.put(key, cached);
+                    }
+                    return fetch(entry.url, { cache: 'reload' }).then(function(response) {
+                        if (!response.ok) {
+                            throw new Error('Precache failed for ' + entry.url + ': ' + response.status);
+                        }
+                        return cache.put(key, response);
+                    });
+                });
+            }));
+        })
     );
 });
 
-self.addEventListener('fetch', (event) => {
+self.addEventListener('fetch', function(event) {
+    var key = PRECACHE_KEYS[event.request.url.split('#')[0]];
     event.respondWith(
-        caches.match(event.request)
-            .then((response) => {
+        caches.open(CACHE_NAME).then(function(cache) {
+            return cache.match(key || event.request).then(function(response) {
                 if (response) {
                     return response;
                 }
-                return fetch(event.request).then((response) => {
+                return fetch(event.request).then(function(response) {
                     // Cache new requests (especially for fonts if we add them)
                     // But filter out things that shouldn't be cached aggressively
                     if (!response || response.status !== 200 || response.type !== 'basic') {
                         return response;
                     }
-
-                    const responseToCache = response.clone();
-                    caches.open(CACHE_NAME)
-                        .then((cache) => {
-                            cache.put(event.request, responseToCache);
-                        });
-
+                    cache.put(event.request, response.clone());
                     return response;
                 });
-            })
+            });
+        })
     );
 });
 
-self.addEventListener('activate', (event) => {
+self.addEventListener('activate', function(event) {
     event.waitUntil(
-        caches.keys().then((cacheNames) => {
+        caches.keys().then(function(cacheNames) {
             return Promise.all(
-                cacheNames.map((cacheName) => {
-                    if (cacheName !== CACHE_NAME) {
+                cacheNames.map(function(cacheName) {
+                    if (cacheName.indexOf(CACHE_PREFIX) === 0 && cacheName !== CACHE_NAME) {
                         return caches.delete(cacheName);
                     }
                 })
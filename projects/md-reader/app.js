@@ -107,6 +107,33 @@ var FILES = [
     { category: "Texas Hold'em", name: "Technical", path: "../../games/cards/poker/holdem/TECHNICAL.md" },
 ];
 
+// build_index.py --compact ships the columnar REPO_INDEX instead of REPO_FILES
+if (typeof REPO_FILES === 'undefined' && typeof REPO_INDEX !== 'undefined') {
+    window.REPO_FILES = decodeRepoIndex(REPO_INDEX);
+}
+
+function decodeRepoIndex(index) {
+    // Inverse of encode_compact() in build_index.py: one row per directory run
+    // (front-coded path, file count, category) plus per-file name/type columns.
+    var files = [];
+    var dir = '';
+    var f = 0;
+    for (var d = 0; d < index.dirCount.length; d++) {
+        dir = dir.slice(0, index.dirPrefix[d]) + index.dirSuffix[d];
+        var base = index.root + (dir ? dir + '/' : '');
+        var category = index.categories[index.dirCategory[d]];
+        for (var end = f + index.dirCount[d]; f < end; f++) {
+            files.push({
+                name: index.names[f],
+                path: base + index.names[f],
+                category: category,
+                type: index.types[index.fileTypes[f]]
+            });
+        }
+    }
+    return files;
+}
+
 // Imported files storage (session-based)
 var importedFiles = {};
 var currentFilePath = null;
@@ -463,10 +490,116 @@ function setupSearch() {
     if (searchInput) {
         searchInput.addEventListener('input', function(e) {
             renderSidebar(e.target.value);
+            scheduleContentSearch(e.target.value);
         });
     }
 }
 
+// --- Content Search ---
+// search_index/ is written by build_index.py: a manifest plus shards of
+// term -> delta-encoded REPO_FILES indices, bucketed by the first letters of
+// each term. A query only fetches the shards its own words fall into.
+var SEARCH_INDEX_DIR = 'search_index/';
+var searchManifest = null; // Promise resolving to the manifest, or null if unusable
+var searchShards = {}; // shard number -> Promise of { term: deltas }
+var contentMatches = null; // { term: searchTerm, ids: { fileIndex: true } }
+var contentSearchTimer = null;
+
+function searchHash(text) {
+    // Must match string_hash() in build_index.py
+    var h = 0;
+    for (var i = 0; i < text.length; i++) {
+        h = ((h << 5) - h + text.charCodeAt(i)) | 0;
+    }
+    return h >>> 0;
+}
+
+function searchTokens(text) {
+    // Must match tokenize() in build_index.py
+    var words = text.toLowerCase().match(/[a-z0-9]+/g) || [];
+    return words.filter(function(w) {
+        return w.length >= 2 && w.length <= 24;
+    });
+}
+
+function loadSearchManifest() {
+    if (!searchManifest) {
+        searchManifest = fetch(SEARCH_INDEX_DIR + 'manifest.json')
+            .then(function(res) { return res.ok ? res.json() : null; })
+            .then(function(manifest) {
+                if (!manifest || typeof REPO_FILES === 'undefined') return null;
+                // Shards built against a different REPO_FILES would point at the wrong files
+                var paths = REPO_FILES.map(function(f) { return f.path; }).join('\n');
+                if (manifest.files !== REPO_FILES.length || manifest.checksum !== searchHash(paths)) {
+                    console.warn('Content search disabled: search_index is out of date, re-run build_index.py');
+                    return null;
+                }
+                return manifest;
+            })
+            .catch(function() { return null; });
+    }
+    return searchManifest;
+}
+
+function loadSearchShard(manifest, word) {
+    var n = searchHash(word.slice(0, manifest.prefix)) % manifest.shards;
+    if (!searchShards[n]) {
+        var name = 'shard_' + ('00' + n).slice(-3) + '.json';
+        searchShards[n] = fetch(SEARCH_INDEX_DIR + name)
+            .then(function(res) { return res.json(); })
+            .then(function(shard) { return shard.terms; });
+    }
+    return searchShards[n];
+}
+
+function findContentMatches(searchTerm) {
+    var words = searchTokens(searchTerm);
+    if (words.length === 0) return Promise.resolve(null);
+
+    return loadSearchManifest().then(function(manifest) {
+        if (!manifest) return null;
+        return Promise.all(words.map(function(word) {
+            return loadSearchShard(manifest, word).then(function(terms) {
+                // Prefix match so results follow along while typing
+                var ids = {};
+                Object.keys(terms).forEach(function(term) {
+                    if (term.indexOf(word) !== 0) return;
+                    var id = 0;
+                    terms[term].forEach(function(delta) {
+                        id += delta;
+                        ids[id] = true;
+                    });
+                });
+                return ids;
+            });
+        })).then(function(idSets) {
+            // Every word must appear in the file
+            var result = idSets[0];
+            idSets.slice(1).forEach(function(ids) {
+                Object.keys(result).forEach(function(id) {
+                    if (!ids[id]) delete result[id];
+                });
+            });
+            return result;
+        });
+    });
+}
+
+function scheduleContentSearch(searchTerm) {
+    clearTimeout(contentSearchTimer);
+    contentSearchTimer = setTimeout(function() {
+        findContentMatches(searchTerm).then(function(ids) {
+            var searchInput = document.getElementById('searchInput');
+            // Drop results for a query the user has already moved past
+            if (!ids || !searchInput || searchInput.value !== searchTerm) return;
+            contentMatches = { term: searchTerm.toLowerCase(), ids: ids };
+            renderSidebar(searchTerm);
+        }).catch(function(err) {
+            console.warn('Content search failed:', err);
+        });
+    }, 200);
+}
+
 function setupExpandCollapse() {
     var expandAll = document.getElementById('expandAllBtn');
     var collapseAll = document.getElementById('collapseAllBtn');
@@ -627,10 +760,15 @@ function renderSidebar(searchTerm) {
     // Sort logic: If searching, flat list might be better, but grouping still works if categorized well.
     // Let's stick to grouping for now as REPO_FILES has categories.
 
-    var filteredFiles = sourceFiles.filter(function(file) {
+    // Content hits are REPO_FILES indices, only valid while searching REPO_FILES
+    var contentIds = (searchTerm && sourceFiles !== FILES && contentMatches &&
+                      contentMatches.term === searchTerm) ? contentMatches.ids : null;
+
+    var filteredFiles = sourceFiles.filter(function(file, index) {
         if (!searchTerm) return true;
         return file.name.toLowerCase().includes(searchTerm) ||
-               file.path.toLowerCase().includes(searchTerm);
+               file.path.toLowerCase().includes(searchTerm) ||
+               !!(contentIds && contentIds[index]);
     });
 
     // Group by category
@@ -1288,6 +1426,99 @@ function togglePantryItem(item, isChecked) {
     localStorage.setItem('pantry', JSON.stringify(pantry));
 }
 
+// --- Recipe index (build_recipe_index.py) ---
+var RECIPE_INDEX_URL = 'recipe_index.json';
+var recipeIndex = null; // Promise resolving to the decoded index, or null if unavailable
+
+function loadRecipeIndex() {
+    if (!recipeIndex) {
+        recipeIndex = fetch(RECIPE_INDEX_URL)
+            .then(function(res) { return res.ok ? res.json() : null; })
+            .then(function(data) { return data && data.version === 2 ? decodeRecipeIndex(data) : null; })
+            .catch(function() { return null; });
+    }
+    return recipeIndex;
+}
+
+function decodeRecipeIndex(data) {
+    // Rows become objects keyed by column; ingredient lines
+    // [id, item, qty, unit, qty_max?, notes?] become { item, qty, unit, qty_max,
+    // notes } like front matter ingredients. item is the recipe's own text
+    // ("Chicken Breasts"); key is the normalised name it is indexed under.
+    var recipes = data.recipes.map(function(row, id) {
+        var recipe = { id: id };
+        data.columns.forEach(function(column, i) { recipe[column] = row[i]; });
+        recipe.ingredients = recipe.ingredients.map(function(line) {
+            var ing = { item: line[1], key: data.ingredients[line[0]], qty: line[2], unit: line[3] };
+            if (line[4] != null) ing.qty_max = line[4];
+            if (line[5]) ing.notes = line[5];
+            return ing;
+        });
+        return recipe;
+    });
+    var byPath = {};
+    recipes.forEach(function(recipe) { byPath[recipe.path] = recipe; });
+    return {
+        recipes: recipes,
+        byPath: byPath,
+        ingredients: data.ingredients,
+        byIngredient: data.by_ingredient,
+        tags: data.tags,
+        time: data.time
+    };
+}
+
+function findRecipes(index, filters) {
+    // filters: { ingredient, maxTime, tag }; mirrors find() in build_recipe_index.py.
+    // findRecipes(index, { ingredient: 'chicken', maxTime: 30 })
+    var ids = index.recipes.map(function(r) { return r.id; });
+    if (filters.ingredient) {
+        var words = filters.ingredient.toLowerCase().match(/[a-z0-9]+/g) || [];
+        var matched = {};
+        index.ingredients.forEach(function(name, iid) {
+            var nameWords = name.split(' ');
+            if (words.every(function(w) { return nameWords.some(function(n) { return n === w || n === w.replace(/s$/, ''); }); })) {
+                index.byIngredient[iid].forEach(function(id) { matched[id] = true; });
+            }
+        });
+        ids = ids.filter(function(id) { return matched[id]; });
+    }
+    if (filters.tag) {
+        var tagged = index.tags[filters.tag.toLowerCase()] || [];
+        ids = ids.filter(function(id) { return tagged.indexOf(id) !== -1; });
+    }
+    if (filters.maxTime != null) {
+        ids = ids.filter(function(id) {
+            var total = index.recipes[id].total;
+            return total != null && total <= filters.maxTime;
+        });
+    }
+    return ids.map(function(id) { return index.recipes[id]; });
+}
+
+function normalizePath(path) {
+    // Collapses "./" and "dir/../" so menu links match index paths
+    var out = [];
+    path.split('/').forEach(function(part) {
+        if (part === '.' || part === '') return;
+        if (part === '..' && out.length && out[out.length - 1] !== '..') out.pop();
+        else out.push(part);
+    });
+    return out.join('/');
+}
+
+function parseRecipeFrontmatter(text) {
+    if (!text.trim().startsWith('---') || typeof jsyaml === 'undefined') return null;
+    var parts = text.split('---');
+    if (parts.length < 3) return null;
+    try {
+        return jsyaml.load(parts[1]);
+    } catch(e) {
+        console.error(e);
+        return null;
+    }
+}
+
 function renderRecipeMenu(text, path) {
     var container = document.getElementById('markdownContent');
     container.innerHTML = '<h1>Recipe Menu</h1><div id="menu-loading">Loading recipes...</div>';
@@ -1305,62 +1536,59 @@ function renderRecipeMenu(text, path) {
     // Resolve relative paths
     var basePath = path.substring(0, path.lastIndexOf('/') + 1);
 
-    // Fetch all recipes
-    var promises = links.map(function(link) {
-        var url = link.url;
-        if (!url.startsWith('http') && !url.startsWith('/')) {
-            url = basePath + url;
-        }
-        return fetch(url).then(res => res.text()).then(txt => {
-            return { name: link.name, text: txt, url: url };
-        });
-    });
-
-    Promise.all(promises).then(function(results) {
+    // Recipes in recipe_index.json come from the index; only the others are fetched
+    loadRecipeIndex().then(function(index) {
+        return Promise.all(links.map(function(link) {
+            var url = link.url;
+            if (!url.startsWith('http') && !url.startsWith('/')) {
+                url = basePath + url;
+            }
+            var row = index && index.byPath[normalizePath(url)];
+            if (row) {
+                return { name: link.name, fm: row, url: url };
+            }
+            return fetch(url).then(res => res.text()).then(txt => {
+                return { name: link.name, fm: parseRecipeFrontmatter(txt), url: url };
+            });
+        }));
+    }).then(function(results) {
         var menuContainer = document.createElement('div');
         menuContainer.className = 'menu-container';
 
         var aggregatedIngredients = {};
 
         results.forEach(function(res) {
-            // Parse Frontmatter
-             if (res.text.trim().startsWith('---')) {
-                var parts = res.text.split('---');
-                if (parts.length >= 3 && typeof jsyaml !== 'undefined') {
-                    try {
-                        var fm = jsyaml.load(parts[1]);
-
-                        // Render Recipe Card
-                        var card = document.createElement('div');
-                        card.className = 'menu-card';
-                        card.innerHTML = '<h3>' + (fm.title || res.name) + '</h3>';
-                        if (fm.image) {
-                            // Fix relative path for image
-                            var imgUrl = fm.image;
-                             if (!imgUrl.startsWith('http') && !imgUrl.startsWith('/') && res.url.includes('/')) {
-                                 var rLastSlash = res.url.lastIndexOf('/');
-                                 imgUrl = res.url.substring(0, rLastSlash + 1) + imgUrl;
-                             }
-                             card.innerHTML += '<img src="' + imgUrl + '" style="max-width:100%; height:100px; object-fit:cover;">';
-                        }
-                        card.addEventListener('click', function() {
-                            loadFile(res.url);
-                        });
-                        menuContainer.appendChild(card);
-
-                        // Aggregate Ingredients
-                        if (fm.ingredients) {
-                            fm.ingredients.forEach(function(ing) {
-                                var key = ing.item.toLowerCase().trim();
-                                if (!aggregatedIngredients[key]) {
-                                    aggregatedIngredients[key] = { ...ing, qty: 0 };
-                                }
-                                aggregatedIngredients[key].qty += (ing.qty || 0);
-                            });
-                        }
-                    } catch(e) { console.error(e); }
-                }
-             }
+            var fm = res.fm;
+            if (!fm) return;
+
+            // Render Recipe Card
+            var card = document.createElement('div');
+            card.className = 'menu-card';
+            card.innerHTML = '<h3>' + (fm.title || res.name) + '</h3>';
+            if (fm.image) {
+                // Fix relative path for image (index rows already carry a resolved one)
+                var imgUrl = fm.image;
+                 if (!imgUrl.startsWith('http') && !imgUrl.startsWith('/') && !imgUrl.startsWith('../') && res.url.includes('/')) {
+                     var rLastSlash = res.url.lastIndexOf('/');
+                     imgUrl = res.url.substring(0, rLastSlash + 1) + imgUrl;
+                 }
+                 card.innerHTML += '<img src="' + imgUrl + '" style="max-width:100%; height:100px; object-fit:cover;">';
+            }
+            card.addEventListener('click', function() {
+                loadFile(res.url);
+            });
+            menuContainer.appendChild(card);
+
+            // Aggregate Ingredients
+            if (fm.ingredients) {
+                fm.ingredients.forEach(function(ing) {
+                    var key = ing.key || ing.item.toLowerCase().trim();
+                    if (!aggregatedIngredients[key]) {
+                        aggregatedIngredients[key] = { ...ing, qty: 0 };
+                    }
+                    aggregatedIngredients[key].qty += (ing.qty || 0);
+                });
+            }
         });
 
         container.innerHTML = '<h1>Menu: ' + path.split('/').pop().replace('.menu.md','') + '</h1>';
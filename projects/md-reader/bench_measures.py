@@ -0,0 +1,111 @@
+import re
+import sys
+import time
+import random
+import argparse
+
+import measures
+
+# Benchmark: ingredient measure parsing over a synthetic batch.
+#
+#   python projects/md-reader/bench_measures.py --lines 100000
+#
+# Measure strings are drawn from a skewed pool shaped like TheMealDB data (a
+# few hundred distinct strings covering most lines, plus a long tail of
+# unique ones) and parsed four ways:
+#   legacy    the old split(' ', 1) heuristic + save_recipe's qty conversion
+#   uncached  measures.parse_measure without its LRU cache
+#   cached    measures.parse_measure
+#   batch     measures.normalize_ingredients, building the ingredient dicts
+
+AMOUNTS = ["1", "2", "3", "4", "1/2", "1/4", "3/4", "1 1/2", "½", "1½", "¼", "2-3", "1 to 2", "0.5", "250", "400", "100"]
+UNITS = ["tbsp", "tablespoon", "tsp", "teaspoons", "cup", "cups", "g", "ml", "kg", "l", "oz", "lb",
+         "cloves", "pinch", "large", "can", "T", "fl oz", "handful", "sprigs"]
+BARE = ["Pinch", "to taste", "Handful", "Dash", "Garnish"]
+
+
+def legacy_normalize_unit(unit):
+    if not unit: return ""
+    unit = unit.lower().strip()
+    if unit in ["tablespoon", "tablespoons", "T"]:
+        return "tbsp"
+    if unit in ["teaspoon", "teaspoons", "t"]:
+        return "tsp"
+    return unit
+
+
+def legacy_parse(measure):
+    # fetch_themealdb's split heuristic followed by save_recipe's conversion
+    unit = measure.strip()
+    parts = unit.split(' ', 1)
+    if len(parts) == 2 and parts[0].replace('.', '', 1).isdigit():
+        qty, unit = parts[0], legacy_normalize_unit(parts[1])
+    elif len(parts) == 2 and '/' in parts[0]:
+        qty, unit = parts[0], legacy_normalize_unit(parts[1])
+    else:
+        qty, unit = 0, legacy_normalize_unit(unit)
+    if isinstance(qty, str):
+        try:
+            if '/' in qty:
+                n, d = qty.split('/')
+                qty = float(n) / float(d)
+            else:
+                qty = float(re.findall(r"[\d\.]+", qty)[0]) if re.findall(r"[\d\.]+", qty) else 0
+        except Exception:
+            qty = 0
+    return qty, unit
+
+
+def synthetic_measures(count, seed):
+    rng = random.Random(seed)
+    common = [f"{a} {u}" for a in AMOUNTS for u in UNITS] + [f"{a}{u}" for a in AMOUNTS[-3:] for u in ("g", "ml")]
+    common += BARE
+    rng.shuffle(common)
+    lines = []
+    for i in range(count):
+        if rng.random() < 0.03:
+            # Long tail: one-off strings the cache cannot help with
+            lines.append(f"{rng.randint(1, 999)} {rng.choice(UNITS)} {rng.choice(['chopped', 'diced', 'sliced'])} #{i}")
+        else:
+            # Zipf-like skew towards the first strings of the pool
+            lines.append(common[min(int(rng.paretovariate(1.2)) - 1, len(common) - 1)])
+    return lines
+
+
+def timed(fn):
+    t0 = time.perf_counter()
+    result = fn()
+    return time.perf_counter() - t0, result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark ingredient measure parsing.")
+    parser.add_argument("--lines", type=int, default=100000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    lines = synthetic_measures(args.lines, args.seed)
+    batch = [{"item": "x", "measure": m} for m in lines]
+    print(f"{len(lines)} ingredient lines, {len(set(lines))} distinct measure strings")
+
+    legacy_s, legacy = timed(lambda: [legacy_parse(m) for m in lines])
+    uncached_s, _ = timed(lambda: [measures.parse_measure.__wrapped__(m) for m in lines])
+    measures.parse_measure.cache_clear()
+    cached_s, _ = timed(lambda: [measures.parse_measure(m) for m in lines])
+    info = measures.parse_measure.cache_info()
+    measures.parse_measure.cache_clear()
+    measures.measure_fields.cache_clear()
+    batch_s, parsed = timed(lambda: measures.normalize_ingredients(batch))
+
+    for label, seconds in (("legacy", legacy_s), ("uncached", uncached_s),
+                           ("cached", cached_s), ("batch", batch_s)):
+        print(f"{label:<9} {seconds * 1000:8.1f} ms  {len(lines) / seconds / 1000:8.0f}k lines/s")
+    print(f"cache: {info.hits} hits, {info.misses} misses ({info.hits / max(1, info.hits + info.misses):.1%} hit rate)")
+    zero_legacy = sum(1 for qty, _ in legacy if not qty)
+    zero_new = sum(1 for ing in parsed if not ing["qty"])
+    print(f"lines left without a quantity: legacy {zero_legacy}, new {zero_new}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
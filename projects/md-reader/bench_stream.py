@@ -0,0 +1,113 @@
+import os
+import sys
+import json
+import time
+import random
+import resource
+import argparse
+import tempfile
+import subprocess
+
+# Memory / throughput benchmark: whole-document json.loads vs. jsonstream.
+#
+#   python projects/md-reader/bench_stream.py --mb 200
+#
+# Writes a synthetic Forkgasm-shaped feed ({"recipe": [...]}) of roughly the
+# requested size, then ingests it in a fresh interpreter per mode (so peak RSS
+# is not shared) and maps every record through sources.forkgasm_recipe:
+#   loads   read() + decode() + json.loads(), as fetch_forkgasm used to
+#   stream  jsonstream.iter_items over 64 KB chunks
+
+WORDS = ["onion", "garlic", "butter", "flour", "salt", "pepper", "thyme", "stock",
+         "tomato", "basil", "cream", "lemon", "rice", "chicken", "beans", "cumin"]
+UNITS = ["g", "ml", "tsp", "tablespoons", "cups", ""]
+
+
+def synthetic_recipe(rng, i):
+    return {
+        "name": f"Recipe {i} " + " ".join(rng.sample(WORDS, 2)).title(),
+        "description": " ".join(rng.choice(WORDS) for _ in range(40)),
+        "tag": rng.sample(WORDS, 3),
+        "yield": rng.randint(1, 8),
+        "ingredient": [
+            {"name": rng.choice(WORDS), "quantity": rng.randint(1, 500), "unit": rng.choice(UNITS)}
+            for _ in range(rng.randint(4, 14))
+        ],
+        "instructions": [" ".join(rng.choice(WORDS) for _ in range(25)) for _ in range(6)]
+    }
+
+
+def write_feed(path, megabytes, seed):
+    rng = random.Random(seed)
+    limit = megabytes * 1024 * 1024
+    count = 0
+    with open(path, "w") as f:
+        f.write('{"source": "synthetic", "recipe": [\n')
+        size = 0
+        while size < limit:
+            line = ("," if count else "") + json.dumps(synthetic_recipe(rng, count)) + "\n"
+            f.write(line)
+            size += len(line)
+            count += 1
+        f.write("]}\n")
+    return count
+
+
+def ingest(path, mode):
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    import sources
+    import jsonstream
+
+    t0 = time.perf_counter()
+    count = 0
+    if mode == "loads":
+        with open(path, "rb") as f:
+            data = json.loads(f.read().decode())
+        records = data["recipe"]
+    else:
+        def chunks():
+            with open(path, "rb") as f:
+                yield from iter(lambda: f.read(64 * 1024), b"")
+        records = jsonstream.iter_items(chunks(), key="recipe")
+    for r in records:
+        sources.forkgasm_recipe(r)
+        count += 1
+    elapsed = time.perf_counter() - t0
+    # ru_maxrss is in KiB on Linux
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    print(json.dumps({"mode": mode, "seconds": elapsed, "records": count, "peak_rss": peak}))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark streaming vs. whole-document feed ingestion.")
+    parser.add_argument("--mb", type=int, default=100, help="approximate feed size in MB")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--ingest", nargs=2, metavar=("PATH", "MODE"), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.ingest:
+        ingest(*args.ingest)
+        return 0
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "feed.json")
+        count = write_feed(path, args.mb, args.seed)
+        size = os.path.getsize(path)
+        print(f"Synthetic feed: {count} recipes, {size / 1e6:.0f} MB")
+        results = []
+        for mode in ("loads", "stream"):
+            out = subprocess.run([sys.executable, os.path.abspath(__file__), "--ingest", path, mode],
+                                 capture_output=True, text=True, check=True)
+            results.append(json.loads(out.stdout.strip().splitlines()[-1]))
+
+    for r in results:
+        if r["records"] != count:
+            print(f"{r['mode']}: read {r['records']} records, expected {count}")
+            return 1
+        print(f"{r['mode']:<7} {r['seconds']:7.2f} s  {size / 1e6 / r['seconds']:7.1f} MB/s  "
+              f"peak RSS {r['peak_rss'] / 1e6:8.1f} MB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
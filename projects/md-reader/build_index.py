@@ -1,9 +1,24 @@
 import os
+import re
+import sys
 import json
+import math
+import time
+import argparse
+
+# Shared build helpers live in <repo>/scripts
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..")))
+from scripts.fswalk import walk, list_dir as scan_dir
 
 # Configuration
 ROOT_DIR = "../../" # Relative to projects/md-reader/
 OUTPUT_FILE = "projects/md-reader/repo_index.js"
+# Stat snapshot used by --incremental (kept next to the output, not committed)
+SNAPSHOT_FILE = "projects/md-reader/.repo_index.snapshot"
+SNAPSHOT_VERSION = 3
+# Directories modified this close to the scan are rescanned next time, since a
+# change landing in the same mtime tick as our read would otherwise be missed.
+RACY_WINDOW_NS = 2 * 1000 * 1000 * 1000
 ALLOWED_EXTENSIONS = {
     '.md', '.markdown', '.txt',
     '.csv', '.json', '.xml',
@@ -12,8 +27,82 @@ ALLOWED_EXTENSIONS = {
 }
 SKIP_DIRS = {
     '.git', 'node_modules', '__pycache__',
-    '.DS_Store', 'dist', 'build', 'coverage'
+    '.DS_Store', 'dist', 'build', 'coverage',
+    'search_index', 'bundles'
 }
+# Gitignored build caches; listing them would make the committed index depend
+# on which generators happened to run in the tree it was built from
+SKIP_FILES = {'.parser_cache.json'}
+
+# Full-text search index (see build_search_index below)
+SEARCH_INDEX_DIR = "projects/md-reader/search_index"
+SEARCH_CACHE_FILE = "projects/md-reader/.search_index.cache"
+SEARCH_INDEX_VERSION = 1
+SEARCH_SHARD_BYTES = 32 * 1024
+SEARCH_PREFIX_LEN = 2
+MAX_CONTENT_BYTES = 1024 * 1024
+MIN_TOKEN_LEN = 2
+MAX_TOKEN_LEN = 24
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+# The index itself lists every filename, so tokenizing it would match everything;
+# recipe_index.json repeats every recipe's ingredients (the J search index, which
+# repeats every word of every pack, sits in a SKIP_DIRS directory)
+CONTENT_SKIP = {OUTPUT_FILE, "projects/md-reader/recipe_index.json"}
+
+def make_entry(root, file):
+    name, ext = os.path.splitext(file)
+    path = os.path.join(root, file)
+
+    # Normalize path for web (forward slashes)
+    web_path = path.replace("\\", "/")
+
+    # Create relative path for the MD Reader which sits in projects/md-reader/
+    # The MD Reader needs "../../" to get to root.
+    # If web_path is "./foo.md", relative from md-reader is "../../foo.md"
+    # If web_path is "games/foo.md", relative is "../../games/foo.md"
+
+    if web_path.startswith("./"):
+        relative_path = "../../" + web_path[2:]
+    else:
+        relative_path = "../../" + web_path
+
+    # Determine Category based on first directory
+    parts = web_path.split("/")
+    category = "Root"
+    if len(parts) > 1 and parts[0] == ".":
+         if len(parts) > 2:
+             category = parts[1].capitalize()
+    elif len(parts) > 1:
+        category = parts[0].capitalize()
+
+    # Special casing for known directories for better grouping
+    if "games" in web_path:
+        category = "Games"
+        # Try to get subcategory (Game Name)
+        # ./games/snake/... -> Game: Snake
+        try:
+            idx = parts.index("games")
+            if idx + 1 < len(parts):
+                game_name = parts[idx+1].replace("_", " ").title()
+                category = f"Games ({game_name})"
+        except:
+            pass
+
+    elif "docs" in web_path:
+        category = "Documentation"
+    elif "projects" in web_path:
+        category = "Projects"
+
+    return {
+        "name": file,
+        "path": relative_path,
+        "category": category,
+        "type": ext.lower().replace(".", "")
+    }
+
+def is_indexed(file):
+    name, ext = os.path.splitext(file)
+    return ext.lower() in ALLOWED_EXTENSIONS and file not in SKIP_FILES
 
 def scan_repo():
     file_list = []
@@ -24,70 +113,322 @@ def scan_repo():
 
     start_dir = "."
 
-    for root, dirs, files in os.walk(start_dir):
-        # Filter directories in place
-        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+    # Directories are listed concurrently and yielded sorted by name, so the
+    # output order is stable; SKIP_DIRS are pruned before descending.
+    for root, dirs, files in walk(start_dir, skip_dirs=SKIP_DIRS):
+        for entry in files:
+            if is_indexed(entry.name):
+                file_list.append(make_entry(root, entry.name))
+
+    return file_list
+
+# --- Incremental Mode ---
+# The snapshot maps every walked directory to its (mtime, inode), the indexed
+# files it held (name, mtime, size, inode) and its child directories. A
+# directory's mtime only changes when entries are added, removed or renamed in
+# it, so an unchanged directory can reuse its cached listing without a readdir.
+# Child directories are still stat'ed, because changes deeper in the tree do
+# not bubble up to the parent's mtime.
+
+def config_key():
+    return [SNAPSHOT_VERSION, sorted(ALLOWED_EXTENSIONS), sorted(SKIP_DIRS), sorted(SKIP_FILES)]
+
+def load_snapshot():
+    try:
+        with open(SNAPSHOT_FILE, "r") as f:
+            snapshot = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if snapshot.get("config") != config_key():
+        # Extensions or skip rules changed; every cached listing is suspect
+        return {}
+    return snapshot.get("dirs", {})
+
+def save_snapshot(dirs):
+    tmp_path = SNAPSHOT_FILE + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump({"config": config_key(), "dirs": dirs}, f, separators=(",", ":"))
+    os.replace(tmp_path, SNAPSHOT_FILE)
+
+def list_dir(root):
+    dirs, entries = scan_dir(root, SKIP_DIRS)
+    # Symlinked dirs are listed but never descended, same as the full walk
+    subdirs = [d.name for d in dirs if not d.is_symlink()]
+    files = []
+    for entry in entries:
+        if is_indexed(entry.name):
+            st = entry.stat()
+            files.append([entry.name, st.st_mtime_ns, st.st_size, st.st_ino])
+    return files, subdirs
+
+def scan_repo_incremental(old_dirs, stats):
+    file_list = []
+    new_dirs = {}
+    racy_limit = time.time_ns() - RACY_WINDOW_NS
+
+    def visit(root):
+        try:
+            st = os.stat(root)
+        except OSError:
+            return
+        cached = old_dirs.get(root)
+        if cached and cached["mtime"] == st.st_mtime_ns and cached["ino"] == st.st_ino:
+            files, subdirs = cached["files"], cached["dirs"]
+            stats["reused"] += 1
+        else:
+            try:
+                files, subdirs = list_dir(root)
+            except OSError:
+                return
+            stats["rescanned"] += 1
+
+        new_dirs[root] = {
+            # A zero mtime never matches, forcing a rescan on the next run
+            "mtime": st.st_mtime_ns if st.st_mtime_ns < racy_limit else 0,
+            "ino": st.st_ino,
+            "files": files,
+            "dirs": subdirs
+        }
 
         for file in files:
-            name, ext = os.path.splitext(file)
-            if ext.lower() in ALLOWED_EXTENSIONS:
-                path = os.path.join(root, file)
-
-                # Normalize path for web (forward slashes)
-                web_path = path.replace("\\", "/")
-
-                # Create relative path for the MD Reader which sits in projects/md-reader/
-                # The MD Reader needs "../../" to get to root.
-                # If web_path is "./foo.md", relative from md-reader is "../../foo.md"
-                # If web_path is "games/foo.md", relative is "../../games/foo.md"
-
-                if web_path.startswith("./"):
-                    relative_path = "../../" + web_path[2:]
-                else:
-                    relative_path = "../../" + web_path
-
-                # Determine Category based on first directory
-                parts = web_path.split("/")
-                category = "Root"
-                if len(parts) > 1 and parts[0] == ".":
-                     if len(parts) > 2:
-                         category = parts[1].capitalize()
-                elif len(parts) > 1:
-                    category = parts[0].capitalize()
-
-                # Special casing for known directories for better grouping
-                if "games" in web_path:
-                    category = "Games"
-                    # Try to get subcategory (Game Name)
-                    # ./games/snake/... -> Game: Snake
-                    try:
-                        idx = parts.index("games")
-                        if idx + 1 < len(parts):
-                            game_name = parts[idx+1].replace("_", " ").title()
-                            category = f"Games ({game_name})"
-                    except:
-                        pass
-
-                elif "docs" in web_path:
-                    category = "Documentation"
-                elif "projects" in web_path:
-                    category = "Projects"
-
-                file_list.append({
-                    "name": file,
-                    "path": relative_path,
-                    "category": category,
-                    "type": ext.lower().replace(".", "")
-                })
+            file_list.append(make_entry(root, file[0]))
+        for d in subdirs:
+            visit(os.path.join(root, d))
 
-    return file_list
+    visit(".")
+    return file_list, new_dirs
 
-def write_index(file_list):
-    content = f"// Auto-generated repository index\nvar REPO_FILES = {json.dumps(file_list, indent=2)};"
-    with open(OUTPUT_FILE, "w") as f:
+# --- Content Search Index ---
+# Every listed file is tokenized into lowercase ASCII words, and each word maps
+# to a delta-encoded posting list of REPO_FILES indices. Terms are bucketed into
+# shards by a hash of their first SEARCH_PREFIX_LEN characters, so every term a
+# query word could prefix-match lives in the same shard: a two-word search costs
+# at most two small fetches. app.js mirrors tokenize() and string_hash().
+
+def string_hash(text):
+    # Java-style 31 hash, reproducible with 32-bit integer math in ES5
+    h = 0
+    for ch in text:
+        h = (h * 31 + ord(ch)) & 0xFFFFFFFF
+    return h
+
+def tokenize(text):
+    return {t for t in TOKEN_RE.findall(text.lower()) if MIN_TOKEN_LEN <= len(t) <= MAX_TOKEN_LEN}
+
+def repo_path(entry):
+    # REPO_FILES paths are relative to projects/md-reader/
+    return entry["path"][len(ROOT_DIR):]
+
+def file_terms(path, cache, new_cache):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return set()
+    key = [st.st_mtime_ns, st.st_size, st.st_ino]
+    cached = cache.get(path)
+    if cached and cached[0] == key:
+        terms = cached[1]
+    else:
+        terms = []
+        if st.st_size <= MAX_CONTENT_BYTES and path not in CONTENT_SKIP:
+            try:
+                with open(path, "r", encoding="utf-8", errors="ignore") as f:
+                    terms = sorted(tokenize(f.read()))
+            except OSError:
+                pass
+    new_cache[path] = [key, terms]
+    return terms
+
+def build_search_index(file_list, cache):
+    postings = {}
+    new_cache = {}
+    for file_id, entry in enumerate(file_list):
+        for term in file_terms(repo_path(entry), cache, new_cache):
+            postings.setdefault(term, []).append(file_id)
+
+    # Ids were appended in ascending order; store gaps instead of absolute ids
+    encoded = {}
+    total = 0
+    for term, ids in postings.items():
+        deltas = [ids[0]] + [b - a for a, b in zip(ids, ids[1:])]
+        encoded[term] = deltas
+        total += len(term) + 4 + len(",".join(map(str, deltas)))
+
+    shard_count = max(1, math.ceil(total / SEARCH_SHARD_BYTES))
+    shards = [{} for _ in range(shard_count)]
+    for term, deltas in encoded.items():
+        shards[string_hash(term[:SEARCH_PREFIX_LEN]) % shard_count][term] = deltas
+
+    manifest = {
+        "version": SEARCH_INDEX_VERSION,
+        "files": len(file_list),
+        # Lets the reader detect shards built for a different REPO_FILES
+        "checksum": string_hash("\n".join(e["path"] for e in file_list)),
+        "shards": shard_count,
+        "prefix": SEARCH_PREFIX_LEN,
+        "terms": len(encoded)
+    }
+    return manifest, shards, new_cache
+
+def load_search_cache():
+    try:
+        with open(SEARCH_CACHE_FILE, "r") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if cache.get("version") != [SEARCH_INDEX_VERSION, MAX_CONTENT_BYTES, MIN_TOKEN_LEN, MAX_TOKEN_LEN]:
+        return {}
+    return cache.get("files", {})
+
+def save_search_cache(files):
+    tmp_path = SEARCH_CACHE_FILE + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump({
+            "version": [SEARCH_INDEX_VERSION, MAX_CONTENT_BYTES, MIN_TOKEN_LEN, MAX_TOKEN_LEN],
+            "files": files
+        }, f, separators=(",", ":"))
+    os.replace(tmp_path, SEARCH_CACHE_FILE)
+
+def write_if_changed(path, content):
+    try:
+        with open(path, "r") as f:
+            if f.read() == content:
+                return False
+    except OSError:
+        pass
+    with open(path, "w") as f:
         f.write(content)
+    return True
+
+def write_search_index(manifest, shards):
+    os.makedirs(SEARCH_INDEX_DIR, exist_ok=True)
+    names = set()
+    written = 0
+    for i, terms in enumerate(shards):
+        name = f"shard_{i:03d}.json"
+        names.add(name)
+        content = json.dumps({"terms": terms}, separators=(",", ":"), sort_keys=True)
+        written += write_if_changed(os.path.join(SEARCH_INDEX_DIR, name), content)
+    # Shards left over from a build with a higher shard count
+    for name in os.listdir(SEARCH_INDEX_DIR):
+        if name.startswith("shard_") and name not in names:
+            os.remove(os.path.join(SEARCH_INDEX_DIR, name))
+    manifest_json = json.dumps(manifest, indent=2, sort_keys=True)
+    written += write_if_changed(os.path.join(SEARCH_INDEX_DIR, "manifest.json"), manifest_json)
+    print(f"Search index: {manifest['terms']} terms in {len(shards)} shards ({written} files written)")
+
+# --- Compact Encoding ---
+# REPO_FILES rows repeat the same "../../" root, directory, category and type
+# strings over and over. The compact layout stores one row per directory run
+# (front-coded against the previous directory, with its file count and
+# interned category) and two per-file columns (name, interned type).
+# decodeRepoIndex() in app.js rebuilds the identical REPO_FILES array.
+
+def encode_compact(file_list):
+    categories, category_ids = [], {}
+    types, type_ids = [], {}
+    dir_prefix, dir_suffix, dir_count, dir_category = [], [], [], []
+    names, file_types = [], []
+
+    def intern(value, table, ids):
+        if value not in ids:
+            ids[value] = len(table)
+            table.append(value)
+        return ids[value]
+
+    prev_key = None
+    prev_dir = ""
+    for entry in file_list:
+        rel = repo_path(entry)
+        directory, _, name = rel.rpartition("/")
+        if not entry["path"].startswith(ROOT_DIR) or name != entry["name"]:
+            raise ValueError(f"Cannot compact entry with unexpected path: {entry['path']}")
+        key = (directory, entry["category"])
+        if key != prev_key:
+            shared = len(os.path.commonprefix([prev_dir, directory]))
+            dir_prefix.append(shared)
+            dir_suffix.append(directory[shared:])
+            dir_count.append(0)
+            dir_category.append(intern(entry["category"], categories, category_ids))
+            prev_key, prev_dir = key, directory
+        dir_count[-1] += 1
+        names.append(name)
+        file_types.append(intern(entry["type"], types, type_ids))
+
+    return {
+        "v": 1,
+        "root": ROOT_DIR,
+        "categories": categories,
+        "types": types,
+        "dirPrefix": dir_prefix,
+        "dirSuffix": dir_suffix,
+        "dirCount": dir_count,
+        "dirCategory": dir_category,
+        "names": names,
+        "fileTypes": file_types
+    }
+
+def decode_compact(index):
+    # Python twin of decodeRepoIndex() in app.js
+    files = []
+    directory = ""
+    f = 0
+    for d, count in enumerate(index["dirCount"]):
+        directory = directory[:index["dirPrefix"][d]] + index["dirSuffix"][d]
+        base = index["root"] + (directory + "/" if directory else "")
+        category = index["categories"][index["dirCategory"][d]]
+        for name, type_id in zip(index["names"][f:f + count], index["fileTypes"][f:f + count]):
+            files.append({
+                "name": name,
+                "path": base + name,
+                "category": category,
+                "type": index["types"][type_id]
+            })
+        f += count
+    return files
+
+def render_index(file_list, compact=False):
+    if compact:
+        data = json.dumps(encode_compact(file_list), separators=(",", ":"), ensure_ascii=False)
+        return f"// Auto-generated repository index (compact, decoded by app.js)\nvar REPO_INDEX={data};"
+    return f"// Auto-generated repository index\nvar REPO_FILES = {json.dumps(file_list, indent=2)};"
+
+def write_index(file_list, compact=False):
+    if not write_if_changed(OUTPUT_FILE, render_index(file_list, compact)):
+        print(f"Index unchanged ({len(file_list)} files), skipped writing {OUTPUT_FILE}")
+        return False
     print(f"Indexed {len(file_list)} files to {OUTPUT_FILE}")
+    return True
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Regenerate the MD Reader repository index.")
+    parser.add_argument("--incremental", action="store_true",
+                        help=f"reuse the stat snapshot in {SNAPSHOT_FILE} and only rescan changed directories")
+    parser.add_argument("--compact", action="store_true",
+                        help="write the dictionary-encoded columnar REPO_INDEX instead of indented REPO_FILES")
+    parser.add_argument("--no-search-index", action="store_true",
+                        help=f"skip rebuilding the full-text index in {SEARCH_INDEX_DIR}")
+    args = parser.parse_args(argv)
+
+    if not args.incremental:
+        files = scan_repo()
+        write_index(files, args.compact)
+        if not args.no_search_index:
+            manifest, shards, _ = build_search_index(files, {})
+            write_search_index(manifest, shards)
+        return 0
+
+    stats = {"reused": 0, "rescanned": 0}
+    files, dirs = scan_repo_incremental(load_snapshot(), stats)
+    write_index(files, args.compact)
+    save_snapshot(dirs)
+    if not args.no_search_index:
+        # Only files whose (mtime, size, inode) changed are re-tokenized
+        manifest, shards, cache = build_search_index(files, load_search_cache())
+        write_search_index(manifest, shards)
+        save_search_cache(cache)
+    print(f"Directories: {stats['rescanned']} rescanned, {stats['reused']} reused from snapshot")
+    return 0
 
 if __name__ == "__main__":
-    files = scan_repo()
-    write_index(files)
+    sys.exit(main())
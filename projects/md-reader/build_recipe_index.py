@@ -0,0 +1,323 @@
+import os
+import re
+import sys
+import json
+import argparse
+
+# Sibling modules (dedup's ingredient normalisation); also when run by
+# scripts/watch.py, which does not put this directory on sys.path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from dedup import IGNORED_WORDS, WORD_RE, singular
+from measures import FRACTION_TABLE, amount, amount_pattern
+
+# Compiles the front matter of every cookbook recipe into one index.
+#
+#   python projects/md-reader/build_recipe_index.py
+#   python projects/md-reader/build_recipe_index.py --find chicken --max-time 30
+#
+# recipe_index.json holds, in one small fetch:
+#   recipes        one summary row per recipe (columns listed in "columns"),
+#                  including its ingredient lines as [ingredient id, item,
+#                  qty, unit, qty_max?, notes?] so shopping lists can be
+#                  summed without opening the files (item and notes are the
+#                  front matter text, for display)
+#   ingredients    normalised ingredient names ("chicken breast"); a row's
+#                  ingredient ids index this list
+#   by_ingredient  ingredient id -> ids of the recipes using it
+#   tags           tag -> recipe ids
+#   time           total-time bucket ("15", "30", "60", "120", "more",
+#                  "unknown") -> recipe ids
+#
+# Only the front matter block is read, with a small parser for the YAML
+# subset recipes use (nested mappings, block and flow lists, scalars).
+
+RECIPES_DIR = "projects/md-reader/recipes"
+OUTPUT_FILE = "projects/md-reader/recipe_index.json"
+INDEX_VERSION = 2
+COLUMNS = ["path", "title", "tags", "servings", "prep", "cook", "total", "source", "image", "ingredients"]
+TIME_BUCKETS = [15, 30, 60, 120]
+
+NUMBER_RE = re.compile(r"^-?(\d+\.?\d*|\.\d+)$")
+# Leading amount of a quantity or time: "2", "1.5", "1/2", "1 1/2", "1½ cups"
+AMOUNT_RE = re.compile(rf"^\s*(?:{amount_pattern('')})")
+
+
+# --- Front matter ---
+
+def front_matter(path):
+    # The text between the leading '---' and the next '---' line, or None
+    with open(path, "r", encoding="utf-8", errors="replace") as f:
+        if f.readline().strip() != "---":
+            return None
+        lines = []
+        for line in f:
+            if line.strip() == "---":
+                return lines
+            lines.append(line.rstrip("\n"))
+    return None
+
+
+def split_flow(text):
+    # "a, "b, c", 'd'" -> items, respecting quotes
+    items, current, quote = [], "", None
+    for c in text:
+        if quote:
+            current += c
+            if c == quote and not current.endswith("\\" + quote):
+                quote = None
+        elif c in "\"'":
+            quote = c
+            current += c
+        elif c == ",":
+            items.append(current)
+            current = ""
+        else:
+            current += c
+    if current.strip():
+        items.append(current)
+    return items
+
+
+def scalar(text):
+    text = text.strip()
+    if not text:
+        return None
+    if text[0] == '"' and text.endswith('"') and len(text) > 1:
+        return text[1:-1].replace('\\"', '"').replace("\\\\", "\\")
+    if text[0] == "'" and text.endswith("'") and len(text) > 1:
+        return text[1:-1].replace("''", "'")
+    if text[0] == "[" and text.endswith("]"):
+        return [scalar(item) for item in split_flow(text[1:-1])]
+    # Trailing comments ("image: ./photo.jpg  # Optional")
+    text = re.sub(r"\s+#.*$", "", text)
+    if NUMBER_RE.match(text):
+        return float(text) if "." in text else int(text)
+    lowered = text.lower()
+    if lowered in ("true", "false"):
+        return lowered == "true"
+    if lowered in ("null", "~"):
+        return None
+    return text
+
+
+def parse_block(lines, i, indent):
+    # Parses the mapping or list starting at lines[i] (indented by `indent`);
+    # returns (value, index of the first line after it)
+    if lines[i][1].startswith("- "):
+        items = []
+        while i < len(lines) and lines[i][0] == indent and lines[i][1].startswith("- "):
+            rest = lines[i][1][2:]
+            if re.match(r"^[\w-]+:(\s|$)", rest):
+                # "- key: value" opens a mapping whose other keys sit under `key`
+                lines[i] = (indent + 2, rest)
+                value, i = parse_block(lines, i, indent + 2)
+            else:
+                value, i = scalar(rest), i + 1
+            items.append(value)
+        return items, i
+    mapping = {}
+    while i < len(lines) and lines[i][0] == indent:
+        key, _, rest = lines[i][1].partition(":")
+        i += 1
+        if rest.strip():
+            mapping[key.strip()] = scalar(rest)
+        elif i < len(lines) and lines[i][0] > indent:
+            mapping[key.strip()], i = parse_block(lines, i, lines[i][0])
+        elif i < len(lines) and lines[i][0] == indent and lines[i][1].startswith("- "):
+            # Block list at the key's own indentation
+            mapping[key.strip()], i = parse_block(lines, i, indent)
+        else:
+            mapping[key.strip()] = None
+    return mapping, i
+
+
+def parse_front_matter(raw):
+    lines = []
+    for line in raw:
+        stripped = line.strip()
+        if stripped and not stripped.startswith("#"):
+            lines.append((len(line) - len(line.lstrip(" ")), stripped))
+    if not lines:
+        return {}
+    value, _ = parse_block(lines, 0, lines[0][0])
+    return value if isinstance(value, dict) else {}
+
+
+# --- Index ---
+
+def ingredient_key(item):
+    words = [singular(w) for w in WORD_RE.findall(str(item or "").lower()) if w not in IGNORED_WORDS]
+    return " ".join(words)
+
+
+def number(value):
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return value
+    if isinstance(value, str):
+        m = AMOUNT_RE.match(value.translate(FRACTION_TABLE))
+        value = amount(m, "") if m else None
+        if value is not None:
+            return int(value) if value.is_integer() else value
+    return None
+
+
+def minutes(fm):
+    # (prep, cook, total); 0 means unknown (the scraper writes 0 when a
+    # source has no times). Accepts time: {prep, cook, total} or the flat
+    # prep_time / cook_time / total_time keys from COOKBOOK.md.
+    times = fm.get("time") if isinstance(fm.get("time"), dict) else {}
+    prep = number(times.get("prep", fm.get("prep_time"))) or None
+    cook = number(times.get("cook", fm.get("cook_time"))) or None
+    total = number(times.get("total", fm.get("total_time"))) or None
+    if total is None and (prep or cook):
+        total = (prep or 0) + (cook or 0)
+    return prep, cook, total
+
+
+def time_bucket(total):
+    if total is None:
+        return "unknown"
+    for limit in TIME_BUCKETS:
+        if total <= limit:
+            return str(limit)
+    return "more"
+
+
+def web_path(path):
+    # Same form as REPO_FILES paths, so app.js can loadFile() it directly
+    return "../../" + os.path.relpath(path).replace("\\", "/")
+
+
+def image_path(path, image):
+    # Front matter images are relative to the recipe file
+    if not image or not isinstance(image, str):
+        return None
+    if image.startswith(("http:", "https:", "/")):
+        return image
+    return web_path(os.path.normpath(os.path.join(os.path.dirname(path), image)))
+
+
+def load_recipe(path):
+    raw = front_matter(path)
+    if raw is None:
+        return None
+    fm = parse_front_matter(raw)
+    if not isinstance(fm.get("ingredients"), list) and fm.get("type") != "recipe":
+        return None
+    return fm
+
+
+def build_index(paths):
+    ingredient_ids = {}
+    rows = []
+    by_ingredient = []
+    tags = {}
+    time = {}
+    for path in paths:
+        fm = load_recipe(path)
+        if fm is None:
+            continue
+        rid = len(rows)
+        lines = []
+        for ing in fm.get("ingredients") or []:
+            if not isinstance(ing, dict):
+                ing = {"item": ing}
+            key = ingredient_key(ing.get("item"))
+            if not key:
+                continue
+            if key not in ingredient_ids:
+                ingredient_ids[key] = len(ingredient_ids)
+                by_ingredient.append([])
+            iid = ingredient_ids[key]
+            if not by_ingredient[iid] or by_ingredient[iid][-1] != rid:
+                by_ingredient[iid].append(rid)
+            line = [iid, str(ing.get("item")).strip(), number(ing.get("qty")) or 0, str(ing.get("unit") or "")]
+            notes = str(ing.get("notes") or "").strip()
+            if number(ing.get("qty_max")) or notes:
+                line.append(number(ing.get("qty_max")) or None)
+            if notes:
+                line.append(notes)
+            lines.append(line)
+        recipe_tags = [str(t).strip() for t in (fm.get("tags") or []) if str(t or "").strip()]
+        for tag in dict.fromkeys(t.lower() for t in recipe_tags):
+            tags.setdefault(tag, []).append(rid)
+        prep, cook, total = minutes(fm)
+        time.setdefault(time_bucket(total), []).append(rid)
+        title = fm.get("title") or os.path.splitext(os.path.basename(path))[0]
+        rows.append([web_path(path), str(title), recipe_tags, number(fm.get("servings")),
+                     prep, cook, total, fm.get("source"), image_path(path, fm.get("image")), lines])
+
+    return {
+        "version": INDEX_VERSION,
+        "columns": COLUMNS,
+        "recipes": rows,
+        "ingredients": list(ingredient_ids),
+        "by_ingredient": by_ingredient,
+        "tags": dict(sorted(tags.items())),
+        "time": {b: time[b] for b in [str(t) for t in TIME_BUCKETS] + ["more", "unknown"] if b in time}
+    }
+
+
+def find(index, ingredient=None, max_time=None, tag=None):
+    # Recipe rows matching every given filter. An ingredient matches any
+    # indexed name containing all of its words ("chicken" -> "chicken thigh").
+    ids = set(range(len(index["recipes"])))
+    if ingredient:
+        words = ingredient_key(ingredient).split()
+        matched = set()
+        for iid, name in enumerate(index["ingredients"]):
+            if all(w in name.split() for w in words):
+                matched.update(index["by_ingredient"][iid])
+        ids &= matched
+    if tag:
+        ids &= set(index["tags"].get(tag.lower(), []))
+    if max_time is not None:
+        total = COLUMNS.index("total")
+        ids = {i for i in ids if index["recipes"][i][total] is not None and index["recipes"][i][total] <= max_time}
+    return [index["recipes"][i] for i in sorted(ids)]
+
+
+def write_if_changed(path, content):
+    try:
+        with open(path, "r") as f:
+            if f.read() == content:
+                return False
+    except OSError:
+        pass
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+    return True
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compile cookbook recipe front matter into recipe_index.json.")
+    parser.add_argument("--recipes-dir", default=RECIPES_DIR)
+    parser.add_argument("--output", default=OUTPUT_FILE)
+    parser.add_argument("--find", metavar="INGREDIENT", help="list recipes using an ingredient instead of writing")
+    parser.add_argument("--max-time", type=int, help="with --find/--tag: only recipes ready within N minutes")
+    parser.add_argument("--tag", help="with --find/--max-time: only recipes with this tag")
+    args = parser.parse_args(argv)
+
+    paths = sorted(os.path.join(args.recipes_dir, name) for name in os.listdir(args.recipes_dir)
+                   if name.endswith(".md") and not name.startswith("."))
+    index = build_index(paths)
+
+    if args.find or args.tag or args.max_time is not None:
+        for row in find(index, args.find, args.max_time, args.tag):
+            total = row[COLUMNS.index("total")]
+            print(f"{row[1]}  ({total if total is not None else '?'} min)  {row[0]}")
+        return 0
+
+    content = json.dumps(index, separators=(",", ":"), ensure_ascii=False) + "\n"
+    changed = write_if_changed(args.output, content)
+    print(f"{'Wrote' if changed else 'Unchanged'} {args.output}: {len(index['recipes'])} recipes, "
+          f"{len(index['ingredients'])} ingredients, {len(content)} bytes")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
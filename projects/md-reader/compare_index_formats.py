@@ -0,0 +1,117 @@
+import os
+import sys
+import gzip
+import json
+import time
+import shutil
+import argparse
+import subprocess
+
+import build_index
+
+# Size / parse-time comparison of the two repo_index.js layouts.
+#
+#   python projects/md-reader/compare_index_formats.py
+#
+# Scans the repo once, renders both the indented REPO_FILES and the compact
+# REPO_INDEX, checks that the compact form decodes to the same array, then
+# reports raw and gzip bytes plus parse (and decode) times. Browser-side
+# timings are measured with node when it is on PATH.
+
+NODE_TIMER = r"""
+var fs = require('fs');
+var vm = require('vm');
+var src = fs.readFileSync(process.argv[1], 'utf8');
+var appSrc = fs.readFileSync(process.argv[2], 'utf8');
+var start = appSrc.indexOf('function decodeRepoIndex');
+var end = appSrc.indexOf('\n}\n', start) + 3;
+var decoder = appSrc.slice(start, end);
+var runs = parseInt(process.argv[3], 10);
+var best = Infinity;
+var count = 0;
+for (var i = 0; i < runs; i++) {
+    var ctx = {};
+    vm.createContext(ctx);
+    var t0 = process.hrtime.bigint();
+    vm.runInContext(src + '\n' + decoder +
+        '\nif (typeof REPO_FILES === "undefined") REPO_FILES = decodeRepoIndex(REPO_INDEX);', ctx);
+    var ms = Number(process.hrtime.bigint() - t0) / 1e6;
+    if (ms < best) best = ms;
+    count = ctx.REPO_FILES.length;
+}
+console.log(JSON.stringify({ ms: best, files: count }));
+"""
+
+
+def time_python(content, runs):
+    payload = content[content.index("=") + 1:].strip().rstrip(";")
+    best = None
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        data = json.loads(payload)
+        if isinstance(data, dict):
+            data = build_index.decode_compact(data)
+        elapsed = time.perf_counter() - t0
+        best = elapsed if best is None else min(best, elapsed)
+    return best * 1000, data
+
+
+def time_node(path, runs):
+    node = shutil.which("node")
+    if not node:
+        return None
+    app_js = os.path.join(os.path.dirname(build_index.OUTPUT_FILE), "app.js")
+    out = subprocess.run([node, "-e", NODE_TIMER, path, app_js, str(runs)],
+                         capture_output=True, text=True, check=True)
+    return json.loads(out.stdout)["ms"]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare repo_index.js output formats.")
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--json", action="store_true", help="print a machine-readable summary")
+    args = parser.parse_args(argv)
+
+    files = build_index.scan_repo()
+    results = {}
+    tmp_dir = os.path.dirname(build_index.SNAPSHOT_FILE)
+    for label, compact in (("indented", False), ("compact", True)):
+        content = build_index.render_index(files, compact)
+        raw = content.encode("utf-8")
+        py_ms, decoded = time_python(content, args.runs)
+        if decoded != files:
+            print(f"{label}: decoded REPO_FILES differs from the scan!")
+            return 1
+
+        tmp_path = os.path.join(tmp_dir, f".repo_index.{label}.tmp.js")
+        with open(tmp_path, "w") as f:
+            f.write(content)
+        try:
+            node_ms = time_node(tmp_path, args.runs)
+        finally:
+            os.remove(tmp_path)
+
+        results[label] = {
+            "bytes": len(raw),
+            "gzip_bytes": len(gzip.compress(raw, 9)),
+            "python_parse_ms": round(py_ms, 3),
+            "node_parse_ms": round(node_ms, 3) if node_ms is not None else None
+        }
+
+    if args.json:
+        print(json.dumps({"files": len(files), "formats": results}, indent=2))
+        return 0
+
+    print(f"{len(files)} files")
+    print(f"{'format':<10} {'bytes':>9} {'gzip':>8} {'py parse':>10} {'node parse':>11}")
+    for label, r in results.items():
+        node_ms = f"{r['node_parse_ms']:.2f} ms" if r["node_parse_ms"] is not None else "n/a"
+        print(f"{label:<10} {r['bytes']:>9} {r['gzip_bytes']:>8} {r['python_parse_ms']:>7.2f} ms {node_ms:>11}")
+    base, small = results["indented"], results["compact"]
+    print(f"compact is {small['bytes'] / base['bytes']:.0%} of the raw size, "
+          f"{small['gzip_bytes'] / base['gzip_bytes']:.0%} gzipped")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
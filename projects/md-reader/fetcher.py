@@ -0,0 +1,520 @@
+import os
+import ssl
+import io
+import json
+import time
+import zlib
+import random
+import asyncio
+import hashlib
+import tempfile
+import urllib.parse
+
+# Small asyncio HTTP/1.1 client used by scraper.py.
+#
+#   async with FetchEngine(per_host=4, timeout=15) as engine:
+#       pages = await engine.fetch_many([url_a, url_b, url_c])
+#
+# Standard library only (no aiohttp). Each host gets a pool of keep-alive
+# connections capped at `per_host` concurrent requests; every request has a
+# timeout, and connection errors, timeouts, 429 and 5xx responses are retried
+# with exponential backoff (honouring Retry-After). Plain http:// URLs work, so
+# the scraper can be pointed at a local fixture server.
+#
+# With an HttpCache attached, 200 responses are stored on disk with their
+# ETag / Last-Modified and later requests are sent conditionally; a 304 (or
+# an entry younger than the TTL, which needs no network at all) is answered
+# from the cache. Cached bodies are only read when a caller asks for them.
+#
+# fetch(url, spool=True) decompresses the body into an anonymous temporary
+# file chunk by chunk instead of memory; response.iter_chunks() then feeds it
+# to a streaming parser (see jsonstream.py), so arbitrarily large feeds are
+# ingested in bounded memory.
+
+DEFAULT_USER_AGENT = "fong-md-reader-scraper/1.0"
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+MAX_REDIRECTS = 5
+MAX_HEADER_BYTES = 64 * 1024
+CHUNK_SIZE = 64 * 1024
+
+
+class FetchError(Exception):
+    def __init__(self, url, message, status=None):
+        super().__init__(f"{url}: {message}")
+        self.url = url
+        self.status = status
+
+
+class Response:
+    # The body lives in memory, in a spooled temporary file (body_file) or in
+    # the cache (body_path); `body` loads it whole, iter_chunks() streams it.
+    def __init__(self, url, status, headers, body, cache_status=None, digest=None,
+                 body_path=None, body_file=None, size=None):
+        self.url = url
+        self.status = status
+        self.headers = headers  # lowercased names
+        self._body = body
+        self.body_path = body_path
+        self.body_file = body_file
+        # None (no cache), "miss", "hit" (fresh, no request) or "revalidated" (304)
+        self.cache_status = cache_status
+        self.digest = digest or (hashlib.sha256(body).hexdigest() if body is not None else None)
+        self.size = size if size is not None else (len(body) if body is not None else None)
+        self.derived = None
+
+    @property
+    def body(self):
+        if self._body is None:
+            self._body = b"".join(self.iter_chunks())
+        return self._body
+
+    def iter_chunks(self, size=CHUNK_SIZE):
+        if self._body is not None:
+            for i in range(0, len(self._body), size):
+                yield self._body[i:i + size]
+            return
+        if self.body_file is not None:
+            self.body_file.seek(0)
+            yield from iter(lambda: self.body_file.read(size), b"")
+            return
+        with open(self.body_path, "rb") as f:
+            yield from iter(lambda: f.read(size), b"")
+
+    def close(self):
+        # Removes a spooled body's temporary file; the response is done with
+        if self.body_file is not None:
+            self.body_file.close()
+            self.body_file = None
+
+    @property
+    def not_modified(self):
+        # True when the body is the one already in the cache
+        return self.cache_status in ("hit", "revalidated")
+
+    def json(self):
+        return json.loads(self.body)
+
+
+class HttpCache:
+    # On-disk response cache keyed by URL: <directory>/index (JSON metadata)
+    # plus one body file per URL. Entries younger than `ttl` seconds are
+    # served without a request; older ones are revalidated. Once the bodies
+    # exceed `max_bytes`, the least recently used entries are evicted.
+    INDEX = "index"
+    VERSION = 1
+
+    def __init__(self, directory, ttl=0, max_bytes=50 * 1024 * 1024):
+        self.directory = directory
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.entries = self.load()
+
+    def load(self):
+        try:
+            with open(os.path.join(self.directory, self.INDEX), "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if data.get("version") != self.VERSION:
+            return {}
+        # Drop entries whose body file went missing
+        return {url: e for url, e in data.get("entries", {}).items()
+                if os.path.exists(self.body_path(url))}
+
+    def save(self):
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, self.INDEX)
+        with open(path + ".tmp", "w") as f:
+            json.dump({"version": self.VERSION, "entries": self.entries}, f, indent=1)
+        os.replace(path + ".tmp", path)
+
+    def body_path(self, url):
+        return os.path.join(self.directory, hashlib.sha256(url.encode("utf-8")).hexdigest()[:32] + ".body")
+
+    def lookup(self, url):
+        return self.entries.get(url)
+
+    def is_fresh(self, entry):
+        return self.ttl > 0 and time.time() - entry["validated"] < self.ttl
+
+    def validators(self, entry):
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def response(self, url, entry, cache_status):
+        entry["accessed"] = time.time()
+        response = Response(url, 200, dict(entry["headers"]), None, cache_status,
+                            entry["digest"], self.body_path(url))
+        response.derived = entry.get("derived")
+        return response
+
+    def annotate(self, url, derived):
+        # Caller data tied to this exact body (e.g. which files were generated
+        # from it); replaced along with the entry when the body changes.
+        if url in self.entries:
+            self.entries[url]["derived"] = derived
+            self.save()
+
+    def revalidated(self, url, entry, headers):
+        # A 304 may carry updated validators
+        entry["validated"] = time.time()
+        if "etag" in headers:
+            entry["etag"] = headers["etag"]
+        if "last-modified" in headers:
+            entry["last_modified"] = headers["last-modified"]
+        self.save()
+        return self.response(url, entry, "revalidated")
+
+    def store(self, url, response):
+        cache_control = response.headers.get("cache-control", "").lower()
+        if response.status != 200 or "no-store" in cache_control:
+            return
+        etag = response.headers.get("etag")
+        last_modified = response.headers.get("last-modified")
+        if not etag and not last_modified and self.ttl <= 0:
+            # Nothing to revalidate with and never fresh: caching can't help
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.body_path(url)
+        with open(path + ".tmp", "wb") as f:
+            for chunk in response.iter_chunks():
+                f.write(chunk)
+        os.replace(path + ".tmp", path)
+        now = time.time()
+        kept = {k: v for k, v in response.headers.items()
+                if k in ("content-type", "etag", "last-modified")}
+        self.entries[url] = {
+            "etag": etag,
+            "last_modified": last_modified,
+            "digest": response.digest,
+            "size": response.size,
+            "headers": kept,
+            "validated": now,
+            "accessed": now
+        }
+        response.cache_status = "miss"
+        self.evict(keep=url)
+        self.save()
+
+    def evict(self, keep=None):
+        total = sum(e["size"] for e in self.entries.values())
+        for url in sorted(self.entries, key=lambda u: self.entries[u]["accessed"]):
+            if total <= self.max_bytes:
+                break
+            if url == keep:
+                continue
+            total -= self.entries.pop(url)["size"]
+            try:
+                os.remove(self.body_path(url))
+            except FileNotFoundError:
+                pass
+
+
+class Connection:
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+
+    def close(self):
+        self.writer.close()
+
+
+class HostPool:
+    # Idle keep-alive connections for one (scheme, host, port), plus the
+    # semaphore bounding how many requests may be in flight to it.
+    def __init__(self, scheme, host, port, limit, ssl_context):
+        self.scheme = scheme
+        self.host = host
+        self.port = port
+        self.ssl_context = ssl_context
+        self.semaphore = asyncio.Semaphore(limit)
+        self.idle = []
+
+    async def acquire(self, timeout):
+        while self.idle:
+            conn = self.idle.pop()
+            # The server may have closed an idle connection in the meantime
+            if not conn.reader.at_eof() and not conn.writer.is_closing():
+                return conn, True
+            conn.close()
+        ssl_arg = self.ssl_context if self.scheme == "https" else None
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(self.host, self.port, ssl=ssl_arg,
+                                    server_hostname=self.host if ssl_arg else None),
+            timeout)
+        return Connection(reader, writer), False
+
+    def release(self, conn, reusable):
+        if reusable:
+            self.idle.append(conn)
+        else:
+            conn.close()
+
+    def close(self):
+        for conn in self.idle:
+            conn.close()
+        self.idle = []
+
+
+def default_ssl_context():
+    # Matches the scraper's historical behaviour: some of the environments it
+    # runs in lack an up-to-date CA bundle.
+    ctx = ssl.create_default_context()
+    ctx.check_hostname = False
+    ctx.verify_mode = ssl.CERT_NONE
+    return ctx
+
+
+async def read_headers(reader):
+    raw = await reader.readuntil(b"\r\n\r\n")
+    if len(raw) > MAX_HEADER_BYTES:
+        raise ValueError("response headers too large")
+    lines = raw.decode("iso-8859-1").split("\r\n")
+    parts = lines[0].split(" ", 2)
+    if len(parts) < 2 or not parts[0].startswith("HTTP/"):
+        raise ValueError(f"malformed status line: {lines[0]!r}")
+    headers = {}
+    for line in lines[1:]:
+        if ":" in line:
+            name, value = line.split(":", 1)
+            name = name.strip().lower()
+            value = value.strip()
+            headers[name] = f"{headers[name]}, {value}" if name in headers else value
+    return parts[0], int(parts[1]), headers
+
+
+class BodySink:
+    # Receives the raw body, undoes Content-Encoding incrementally and keeps
+    # the result in memory or, when spooling, in an anonymous temporary file.
+    def __init__(self, encoding, spool):
+        self.file = tempfile.TemporaryFile() if spool else io.BytesIO()
+        self.hash = hashlib.sha256()
+        self.size = 0
+        if encoding == "gzip":
+            self.decoder = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        elif encoding == "deflate":
+            self.decoder = zlib.decompressobj()
+        else:
+            self.decoder = None
+
+    def write(self, data):
+        self.put(self.decoder.decompress(data) if self.decoder else data)
+
+    def put(self, data):
+        if data:
+            self.file.write(data)
+            self.hash.update(data)
+            self.size += len(data)
+
+    def finish(self):
+        if self.decoder:
+            self.put(self.decoder.flush())
+        self.file.seek(0)
+
+
+class FetchEngine:
+    def __init__(self, per_host=4, timeout=15.0, retries=3, backoff=0.5,
+                 ssl_context=None, user_agent=DEFAULT_USER_AGENT, cache=None):
+        self.per_host = per_host
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.ssl_context = ssl_context or default_ssl_context()
+        self.user_agent = user_agent
+        self.pools = {}
+        self.cache = cache
+        self.stats = {"requests": 0, "retries": 0, "connections": 0, "reused": 0,
+                      "cache_hits": 0, "revalidated": 0}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        self.close()
+
+    def close(self):
+        for pool in self.pools.values():
+            pool.close()
+        self.pools = {}
+        if self.cache:
+            # Persist access times for LRU eviction; also applies a max_bytes
+            # lowered since the last run
+            self.cache.evict()
+            self.cache.save()
+
+    def pool_for(self, parts):
+        port = parts.port or (443 if parts.scheme == "https" else 80)
+        key = (parts.scheme, parts.hostname, port)
+        if key not in self.pools:
+            self.pools[key] = HostPool(parts.scheme, parts.hostname, port,
+                                       self.per_host, self.ssl_context)
+        return self.pools[key]
+
+    async def fetch(self, url, headers=None, spool=False):
+        # Follows redirects; raises FetchError once retries are exhausted or
+        # on a non-retryable error status. Check response.not_modified to
+        # skip work when the body is the cached one.
+        entry = self.cache.lookup(url) if self.cache else None
+        if entry and self.cache.is_fresh(entry):
+            self.stats["cache_hits"] += 1
+            return self.cache.response(url, entry, "hit")
+        request_headers = dict(headers or {})
+        if entry:
+            request_headers.update(self.cache.validators(entry))
+        response = await self.fetch_uncached(url, request_headers, spool)
+        if response.status == 304 and entry:
+            response.close()
+            self.stats["revalidated"] += 1
+            return self.cache.revalidated(url, entry, response.headers)
+        if self.cache:
+            self.cache.store(url, response)
+        return response
+
+    async def fetch_uncached(self, url, headers, spool):
+        for _ in range(MAX_REDIRECTS + 1):
+            response = await self.fetch_with_retries(url, headers, spool)
+            if response.status in REDIRECT_STATUSES and "location" in response.headers:
+                response.close()
+                url = urllib.parse.urljoin(url, response.headers["location"])
+                continue
+            if response.status >= 400:
+                response.close()
+                raise FetchError(url, f"HTTP {response.status}", response.status)
+            return response
+        raise FetchError(url, "too many redirects")
+
+    async def fetch_many(self, urls, headers=None):
+        # Results in input order; failures are returned as FetchError objects
+        # so one bad page does not discard the rest.
+        async def one(url):
+            try:
+                return await self.fetch(url, headers)
+            except FetchError as e:
+                return e
+        return await asyncio.gather(*(one(u) for u in urls))
+
+    async def fetch_with_retries(self, url, headers, spool):
+        attempt = 0
+        while True:
+            try:
+                response = await self.request(url, headers, spool)
+                if response.status not in RETRY_STATUSES or attempt >= self.retries:
+                    return response
+                response.close()
+                delay = self.retry_delay(attempt, response.headers.get("retry-after"))
+            # LimitOverrunError: a header block or chunk-size line longer than
+            # the stream limit, which readuntil() refuses to buffer
+            except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, asyncio.LimitOverrunError,
+                    ValueError, zlib.error) as e:
+                if attempt >= self.retries:
+                    raise FetchError(url, f"{type(e).__name__}: {e}") from e
+                delay = self.retry_delay(attempt, None)
+            attempt += 1
+            self.stats["retries"] += 1
+            await asyncio.sleep(delay)
+
+    def retry_delay(self, attempt, retry_after):
+        if retry_after and retry_after.isdigit():
+            return min(float(retry_after), 60.0)
+        # Full jitter keeps concurrent retries against one host from aligning
+        return random.uniform(0, self.backoff * (2 ** attempt))
+
+    async def request(self, url, headers, spool):
+        parts = urllib.parse.urlsplit(url)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            raise FetchError(url, "unsupported URL")
+        pool = self.pool_for(parts)
+        target = parts.path or "/"
+        if parts.query:
+            target += "?" + parts.query
+        host = parts.hostname if not parts.port else f"{parts.hostname}:{parts.port}"
+        lines = [
+            f"GET {target} HTTP/1.1",
+            f"Host: {host}",
+            f"User-Agent: {self.user_agent}",
+            "Accept-Encoding: gzip, deflate",
+            "Connection: keep-alive"
+        ]
+        for name, value in (headers or {}).items():
+            lines.append(f"{name}: {value}")
+        payload = ("\r\n".join(lines) + "\r\n\r\n").encode("iso-8859-1")
+
+        async with pool.semaphore:
+            self.stats["requests"] += 1
+            while True:
+                conn, reused = await pool.acquire(self.timeout)
+                self.stats["reused" if reused else "connections"] += 1
+                try:
+                    response, keep_alive = await self.exchange(conn, payload, url, spool)
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    conn.close()
+                    # A pooled connection the server already dropped; try a
+                    # fresh one without spending a retry
+                    if reused:
+                        continue
+                    raise
+                except BaseException:
+                    conn.close()
+                    raise
+                pool.release(conn, keep_alive)
+                return response
+
+    def timed(self, awaitable):
+        # The timeout bounds each network wait, not the whole download, so a
+        # large body that keeps arriving is never cut off
+        return asyncio.wait_for(awaitable, self.timeout)
+
+    async def exchange(self, conn, payload, url, spool):
+        conn.writer.write(payload)
+        await self.timed(conn.writer.drain())
+        version, status, headers = await self.timed(read_headers(conn.reader))
+        keep_alive = version == "HTTP/1.1" and "close" not in headers.get("connection", "").lower()
+
+        sink = BodySink(headers.get("content-encoding", "").lower(), spool)
+        if status in (204, 304) or 100 <= status < 200:
+            pass
+        elif "chunked" in headers.get("transfer-encoding", "").lower():
+            await self.read_chunked(conn.reader, sink)
+        elif "content-length" in headers:
+            await self.read_exactly(conn.reader, int(headers["content-length"]), sink)
+        else:
+            while True:
+                data = await self.timed(conn.reader.read(CHUNK_SIZE))
+                if not data:
+                    break
+                sink.write(data)
+            keep_alive = False
+        sink.finish()
+
+        if spool:
+            response = Response(url, status, headers, None, digest=sink.hash.hexdigest(),
+                                body_file=sink.file, size=sink.size)
+        else:
+            response = Response(url, status, headers, sink.file.getvalue(), digest=sink.hash.hexdigest())
+        return response, keep_alive
+
+    async def read_exactly(self, reader, length, sink):
+        remaining = length
+        while remaining:
+            data = await self.timed(reader.read(min(CHUNK_SIZE, remaining)))
+            if not data:
+                raise asyncio.IncompleteReadError(b"", remaining)
+            sink.write(data)
+            remaining -= len(data)
+
+    async def read_chunked(self, reader, sink):
+        while True:
+            size_line = await self.timed(reader.readuntil(b"\r\n"))
+            size = int(size_line.split(b";", 1)[0].strip(), 16)
+            if size == 0:
+                # Trailers, terminated by an empty line
+                while (await self.timed(reader.readuntil(b"\r\n"))) != b"\r\n":
+                    pass
+                return
+            await self.read_exactly(reader, size, sink)
+            await self.timed(reader.readexactly(2))
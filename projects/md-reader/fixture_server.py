@@ -0,0 +1,133 @@
+import sys
+import json
+import hashlib
+import argparse
+import threading
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Local stand-in for the scraper's recipe sources (standard library only).
+#
+#   python projects/md-reader/fixture_server.py --port 8000
+#   python projects/md-reader/scraper.py --themealdb-url http://127.0.0.1:8000/mealdb \
+#       --forkgasm-url http://127.0.0.1:8000/recipes.json \
+#       --culinary-heritage-url http://127.0.0.1:8000/missing.json --output-dir /tmp/recipes
+#
+# Serves a few TheMealDB search pages and a Forkgasm feed from FIXTURES over
+# keep-alive HTTP/1.1. Every body carries an ETag and answers a matching
+# If-None-Match with 304, so a second scraper run exercises the cache path.
+# /huge-header answers with a header longer than the client's stream limit.
+
+MEALS = {
+    "a": [
+        {"idMeal": "1", "strMeal": "Apple Crumble", "strTags": "Dessert,Baking",
+         "strInstructions": "<p>Rub the butter into the flour.</p> Bake until golden.",
+         "strIngredient1": "Apples", "strMeasure1": "4",
+         "strIngredient2": "Flour", "strMeasure2": "200g",
+         "strIngredient3": "Butter", "strMeasure3": "100g"},
+        {"idMeal": "2", "strMeal": "Arroz con Pollo", "strTags": None,
+         "strInstructions": "Brown the chicken, add the rice and stock, simmer.",
+         "strIngredient1": "Chicken Thighs", "strMeasure1": "6",
+         "strIngredient2": "Rice", "strMeasure2": "1 1/2 cups",
+         "strIngredient3": "Chicken Stock", "strMeasure3": "750ml"}
+    ],
+    "b": [
+        {"idMeal": "3", "strMeal": "Banana Bread", "strTags": "Baking",
+         "strInstructions": "Mash the bananas, fold in the batter, bake for an hour.",
+         "strIngredient1": "Bananas", "strMeasure1": "3",
+         "strIngredient2": "Sugar", "strMeasure2": "1/2 cup",
+         "strIngredient3": "Baking Soda", "strMeasure3": "1 tsp"}
+    ]
+}
+
+FORKGASM = [
+    {"name": "Lentil Soup", "description": "Simmer everything until the lentils fall apart.",
+     "tag": ["soup"], "yield": 6,
+     "ingredient": [{"name": "red lentils", "quantity": 250, "unit": "g"},
+                    {"name": "onion", "quantity": 1, "unit": ""}]},
+    {"name": "Garlic Bread", "description": "Spread, wrap in foil, bake.",
+     "ingredientGroup": [{"ingredient": [{"name": "baguette", "quantity": 1, "unit": ""},
+                                         {"name": "garlic", "quantity": 3, "unit": "cloves"}]}]}
+]
+
+
+def search_page(query):
+    letter = urllib.parse.parse_qs(query).get("f", [""])[0]
+    # TheMealDB answers null, not an empty list, for letters with no dishes
+    return {"meals": MEALS.get(letter)}
+
+
+# path -> callable(query string) -> JSON-serialisable body
+FIXTURES = {
+    "/mealdb/search.php": search_page,
+    "/recipes.json": lambda query: FORKGASM
+}
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        parts = urllib.parse.urlsplit(self.path)
+        self.server.requests.append(self.path)
+        if parts.path == "/huge-header":
+            self.send_response(200)
+            self.send_header("X-Padding", "x" * (128 * 1024))
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        handler = FIXTURES.get(parts.path)
+        if handler is None:
+            self.send_error(404)
+            return
+        body = json.dumps(handler(parts.query)).encode("utf-8")
+        etag = '"' + hashlib.sha256(body).hexdigest()[:16] + '"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+def start(port=0, verbose=False):
+    # -> (server, base URL); serves from a daemon thread until server.shutdown(),
+    # then server.server_close() releases the port
+    server = ThreadingHTTPServer(("127.0.0.1", port), FixtureHandler)
+    server.daemon_threads = True
+    server.requests = []
+    server.verbose = verbose
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve fixture recipe sources for scraper.py.")
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args(argv)
+
+    server, base_url = start(args.port, verbose=True)
+    print(f"Serving fixtures on {base_url} (Ctrl+C to stop)")
+    print(f"  --themealdb-url {base_url}/mealdb --forkgasm-url {base_url}/recipes.json "
+          f"--culinary-heritage-url {base_url}/missing.json")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
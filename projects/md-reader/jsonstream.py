@@ -0,0 +1,155 @@
+import re
+import json
+import codecs
+
+# Incremental reader for large JSON recipe feeds.
+#
+#   for recipe in iter_items(response.iter_chunks(), key="recipe"):
+#       ...
+#
+# Yields the elements of the top-level array (or of the array stored under
+# `key` in a top-level object) one at a time from an iterable of byte chunks,
+# so memory is bounded by the largest single element, not the feed. Each
+# element is decoded by the C JSON decoder; only the bytes in front of the
+# target array go through the (slower) Python structural scanner.
+
+STRUCTURAL_RE = re.compile(r'[\[\]{},"]')
+STRING_END_RE = re.compile(r'["\\]')
+WHITESPACE_RE = re.compile(r'[ \t\n\r]*')
+# Refuse to buffer a single element beyond this; a feed that needs more is
+# almost certainly malformed (an unterminated string swallowing the rest)
+MAX_ITEM_CHARS = 64 * 1024 * 1024
+
+_decoder = json.JSONDecoder()
+
+
+class ArrayNotFound(ValueError):
+    pass
+
+
+def iter_text(chunks):
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    for chunk in chunks:
+        text = decoder.decode(chunk)
+        if text:
+            yield text
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        yield tail
+
+
+def find_array(texts, key):
+    # Scans up to the opening bracket of the target array and returns the
+    # text after it. Tracks nesting and strings so brackets inside strings or
+    # nested values are not mistaken for the target.
+    buf = ""
+    pos = 0
+    depth = 0
+    in_string = False
+    string_start = 0
+    last_string = None
+    for text in texts:
+        buf += text
+        while True:
+            if in_string:
+                m = STRING_END_RE.search(buf, pos)
+                if not m:
+                    pos = len(buf)
+                    break
+                if m.group() == "\\":
+                    if m.end() >= len(buf):
+                        pos = m.start()  # the escaped character is in the next chunk
+                        break
+                    pos = m.end() + 1
+                    continue
+                in_string = False
+                pos = m.end()
+                if depth == 1:
+                    last_string = buf[string_start + 1:m.start()]
+                continue
+            m = STRUCTURAL_RE.search(buf, pos)
+            if not m:
+                pos = len(buf)
+                break
+            c = m.group()
+            pos = m.end()
+            if c == '"':
+                in_string = True
+                string_start = m.start()
+            elif c in "[{":
+                depth += 1
+                # A top-level array, or the value following "<key>": at depth 1
+                if c == "[" and (depth == 1 or (depth == 2 and key is not None and last_string == key)):
+                    return buf[pos:]
+            elif c in "]}":
+                depth -= 1
+        keep = string_start if in_string else pos
+        buf = buf[keep:]
+        pos -= keep
+        string_start -= keep
+    raise ArrayNotFound("no array found" + (f" under {key!r}" if key else ""))
+
+
+def iter_items(chunks, key=None):
+    texts = iter_text(chunks)
+    buf = find_array(texts, key)
+    pos = 0
+    exhausted = False
+    expect_value = True  # after "[" or ","
+    count = 0
+
+    def more():
+        nonlocal buf, pos, exhausted
+        text = next(texts, None)
+        if text is None:
+            exhausted = True
+            return False
+        buf = buf[pos:] + text
+        pos = 0
+        return True
+
+    while True:
+        pos = WHITESPACE_RE.match(buf, pos).end()
+        if pos >= len(buf):
+            if not more():
+                raise ValueError("unexpected end of feed inside the array")
+            continue
+        c = buf[pos]
+        if c == "]":
+            if expect_value and count:
+                raise ValueError("trailing ',' in array")
+            return
+        if not expect_value:
+            if c != ",":
+                raise ValueError(f"expected ',' or ']' in array, found {c!r}")
+            pos += 1
+            expect_value = True
+            continue
+
+        try:
+            value, end = _decoder.raw_decode(buf, pos)
+            # A bare number cut by a chunk boundary ("2" of "2.5") decodes
+            # fine; only trust a value once its delimiter is in the buffer
+            after = WHITESPACE_RE.match(buf, end).end()
+            complete = after < len(buf) and buf[after] in ",]"
+        except json.JSONDecodeError:
+            if exhausted:
+                raise
+            complete = False
+        if not complete:
+            if len(buf) - pos > MAX_ITEM_CHARS:
+                raise ValueError(f"array element exceeds {MAX_ITEM_CHARS} characters")
+            # Grow the pending text by at least its own size before decoding
+            # again, so one large element costs O(n) rather than O(n^2)
+            target = 2 * (len(buf) - pos)
+            while len(buf) - pos < target and more():
+                pass
+            if exhausted and len(buf) - pos < target:
+                # Final attempt with everything there is; errors surface now
+                value, end = _decoder.raw_decode(buf, pos)
+            else:
+                continue
+        yield value
+        count += 1
+        pos = end
+        expect_value = False
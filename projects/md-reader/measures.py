@@ -0,0 +1,184 @@
+import re
+from functools import lru_cache
+from collections import namedtuple
+
+# Ingredient measure parsing for the recipe scraper.
+#
+#   parse_measure("1 ½ tbsp")        -> Measure(qty=1.5, qty_max=None, unit="tbsp", note="")
+#   parse_measure("2-3 cloves minced") -> Measure(2.0, 3.0, "clove", "minced")
+#   normalize_ingredients([{"item": "Salt", "measure": "400g"}, ...])
+#
+# One precompiled grammar covers integers, decimals, ASCII and unicode
+# fractions, mixed numbers ("1 1/2", "1½") and ranges ("2-3", "2 to 3").
+# Units are canonicalised through a single alias table. Source feeds repeat
+# the same few hundred measure strings endlessly, so parses are memoised.
+
+Measure = namedtuple("Measure", "qty qty_max unit note")
+
+UNICODE_FRACTIONS = {
+    "½": "1/2", "⅓": "1/3", "⅔": "2/3", "¼": "1/4", "¾": "3/4",
+    "⅕": "1/5", "⅖": "2/5", "⅗": "3/5", "⅘": "4/5", "⅙": "1/6",
+    "⅚": "5/6", "⅐": "1/7", "⅛": "1/8", "⅜": "3/8", "⅝": "5/8",
+    "⅞": "7/8", "⅑": "1/9", "⅒": "1/10"
+}
+# "1½" -> "1 1/2", "½" -> " 1/2"; the fraction slash counts as "/"
+FRACTION_TABLE = str.maketrans({**{k: f" {v}" for k, v in UNICODE_FRACTIONS.items()}, "⁄": "/"})
+
+
+def amount_pattern(p):
+    # Mixed number | fraction | decimal, with groups prefixed by `p`
+    return (rf"(?:(?P<{p}whole>\d+)\s+)?(?P<{p}num>\d+)\s*/\s*(?P<{p}den>\d+)"
+            rf"|(?P<{p}dec>\d*\.\d+|\d+)")
+
+
+MEASURE_RE = re.compile(
+    rf"^\s*(?P<lo>{amount_pattern('lo_')})"
+    rf"(?:\s*(?:-|–|—|to|or)\s*(?P<hi>{amount_pattern('hi_')}))?"
+    r"\s*(?P<rest>.*?)\s*$",
+    re.IGNORECASE | re.DOTALL
+)
+
+UNIT_ALIASES = {
+    "tsp": ["t", "tsp", "tsps", "tsp.", "teaspoon", "teaspoons", "teasp"],
+    "tbsp": ["T", "tbsp", "tbsps", "tbsp.", "tbs", "tbl", "tbls", "tablespoon", "tablespoons"],
+    "cup": ["c", "cup", "cups"],
+    "ml": ["ml", "mls", "millilitre", "millilitres", "milliliter", "milliliters"],
+    "cl": ["cl", "centilitre", "centilitres"],
+    "dl": ["dl", "decilitre", "decilitres"],
+    "l": ["l", "litre", "litres", "liter", "liters", "ltr"],
+    "g": ["g", "gr", "grs", "gram", "grams", "gramme", "grammes"],
+    "kg": ["kg", "kgs", "kilo", "kilos", "kilogram", "kilograms"],
+    "mg": ["mg", "milligram", "milligrams"],
+    "oz": ["oz", "oz.", "ounce", "ounces"],
+    "fl oz": ["fl oz", "fl. oz", "fl.oz", "floz", "fluid ounce", "fluid ounces"],
+    "lb": ["lb", "lbs", "lb.", "pound", "pounds"],
+    "pint": ["pt", "pint", "pints"],
+    "quart": ["qt", "quart", "quarts"],
+    "gallon": ["gal", "gallon", "gallons"],
+    "pinch": ["pinch", "pinches"],
+    "dash": ["dash", "dashes"],
+    "clove": ["clove", "cloves"],
+    "can": ["can", "cans", "tin", "tins"],
+    "slice": ["slice", "slices"],
+    "handful": ["handful", "handfuls", "handfull"],
+    "bunch": ["bunch", "bunches"],
+    "sprig": ["sprig", "sprigs"],
+    "stick": ["stick", "sticks"],
+    "piece": ["piece", "pieces", "pc", "pcs"]
+}
+# Single letters are case-sensitive (T = tablespoon, t = teaspoon); every
+# other alias is matched lowercased
+CASED_UNITS = {a: unit for unit, aliases in UNIT_ALIASES.items() for a in aliases if len(a) == 1}
+UNITS = {a.lower(): unit for unit, aliases in UNIT_ALIASES.items() for a in aliases if len(a) > 1}
+UNITS.update({a: unit for a, unit in CASED_UNITS.items() if a.islower()})
+CACHE_SIZE = 4096
+
+
+def amount(m, p):
+    if m.group(f"{p}dec") is not None:
+        return float(m.group(f"{p}dec"))
+    den = int(m.group(f"{p}den"))
+    if den == 0:
+        return None
+    value = int(m.group(f"{p}num")) / den
+    whole = m.group(f"{p}whole")
+    return value + int(whole) if whole else value
+
+
+def lookup_unit(word):
+    if word in CASED_UNITS:
+        return CASED_UNITS[word]
+    return UNITS.get(word.lower())
+
+
+def split_unit(text):
+    # -> (canonical unit or None, remaining text); two-word units ("fl oz")
+    # take precedence over their first word
+    words = text.split(None, 2)
+    if len(words) >= 2:
+        unit = lookup_unit(f"{words[0]} {words[1]}")
+        if unit:
+            return unit, " ".join(words[2:])
+    if words:
+        unit = lookup_unit(words[0]) or lookup_unit(words[0].rstrip("."))
+        if unit:
+            return unit, text[len(words[0]):].strip()
+    return None, text
+
+
+def normalize_unit(unit):
+    if not unit:
+        return ""
+    unit = unit.strip()
+    return lookup_unit(unit) or lookup_unit(unit.rstrip(".")) or unit.lower()
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_measure(text):
+    if not text:
+        return Measure(0.0, None, "", "")
+    text = text.translate(FRACTION_TABLE).strip()
+    m = MEASURE_RE.match(text)
+    if not m:
+        # No leading amount: "Pinch", "to taste", "Handful of ..."
+        unit, note = split_unit(text)
+        if unit:
+            return Measure(1.0, None, unit, note)
+        return Measure(0.0, None, text.lower(), "")
+    qty = amount(m, "lo_")
+    qty_max = amount(m, "hi_") if m.group("hi") else None
+    if qty is None:
+        return Measure(0.0, None, text.lower(), "")
+    unit, note = split_unit(m.group("rest"))
+    if unit is None:
+        # Unknown unit ("2 large", "1 cup-ish"): keep the text as the unit
+        return Measure(qty, qty_max, m.group("rest").lower(), "")
+    return Measure(qty, qty_max, unit, note)
+
+
+def parse_quantity(value):
+    # A bare quantity field (number, "1/2", "1 ½", "2-3") -> (qty, qty_max)
+    if value is None or value == "":
+        return 0.0, None
+    if isinstance(value, bool):
+        return 0.0, None
+    if isinstance(value, (int, float)):
+        return float(value), None
+    m = parse_measure(str(value))
+    return m.qty, m.qty_max
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def measure_fields(text):
+    # The ingredient fields a measure string expands to, built once per string
+    qty, qty_max, unit, note = parse_measure(text.strip())
+    fields = {"qty": qty}
+    if qty_max is not None:
+        fields["qty_max"] = qty_max
+    fields["unit"] = unit
+    if note:
+        fields["notes"] = note
+    return fields
+
+
+def normalize_ingredients(ingredients):
+    # Batch API: each ingredient is {"item", "measure"} (free text, as in
+    # TheMealDB) or {"item", "qty", "unit"} (structured feeds). Returns new
+    # dicts with a float qty, optional qty_max and notes, and a canonical unit.
+    normalized = []
+    append = normalized.append
+    for ing in ingredients:
+        out = {"item": (ing.get("item") or "").strip()}
+        if "measure" in ing:
+            out.update(measure_fields(ing["measure"] or ""))
+        else:
+            qty, qty_max = parse_quantity(ing.get("qty"))
+            out["qty"] = qty
+            if qty_max is not None:
+                out["qty_max"] = qty_max
+            out["unit"] = normalize_unit(ing.get("unit") or "")
+        category = ing.get("category")
+        if category:
+            out["category"] = category
+        append(out)
+    return normalized
@@ -1,130 +1,136 @@
 // Auto-generated repository index
 var REPO_FILES = [
   {
-    "name": "WIKI-PLAN.md",
-    "path": "../../WIKI-PLAN.md",
+    "name": "AGENT.md",
+    "path": "../../AGENT.md",
     "category": "Root",
     "type": "md"
   },
   {
-    "name": "cloudflare-worker-g-proposed.js",
-    "path": "../../cloudflare-worker-g-proposed.js",
+    "name": "AI_FEEDBACK.md",
+    "path": "../../AI_FEEDBACK.md",
     "category": "Root",
-    "type": "js"
+    "type": "md"
   },
   {
-    "name": "index.html",
-    "path": "../../index.html",
+    "name": "ARCHITECTURE.md",
+    "path": "../../ARCHITECTURE.md",
     "category": "Root",
-    "type": "html"
+    "type": "md"
   },
   {
-    "name": "TODO.md",
-    "path": "../../TODO.md",
+    "name": "CHANGELOG.md",
+    "path": "../../CHANGELOG.md",
     "category": "Root",
     "type": "md"
   },
   {
-    "name": "IDEAS_020426.md",
-    "path": "../../IDEAS_020426.md",
+    "name": "CLAUDE_AGENT.md",
+    "path": "../../CLAUDE_AGENT.md",
     "category": "Root",
     "type": "md"
   },
   {
-    "name": "AI_FEEDBACK.md",
-    "path": "../../AI_FEEDBACK.md",
+    "name": "CLAUDE_ASSESSMENT.md",
+    "path": "../../CLAUDE_ASSESSMENT.md",
     "category": "Root",
     "type": "md"
   },
   {
-    "name": "RETROSPECTIVE_AND_FEEDBACK.md",
-    "path": "../../RETROSPECTIVE_AND_FEEDBACK.md",
+    "name": "CLOUDFLARE_WORKER_SETUP.md",
+    "path": "../../CLOUDFLARE_WORKER_SETUP.md",
     "category": "Root",
     "type": "md"
   },
   {
-    "name": "README.md",
-    "path": "../../README.md",
+    "name": "COMPENDIUM.md",
+    "path": "../../COMPENDIUM.md",
     "category": "Root",
     "type": "md"
   },
   {
-    "name": "GEMINI.md",
-    "path": "../../GEMINI.md",
+    "name": "CONTINUATION_NOTES.md",
+    "path": "../../CONTINUATION_NOTES.md",
     "category": "Root",
     "type": "md"
   },
   {
-    "name": "CONTINUATION_NOTES.md",
-    "path": "../../CONTINUATION_NOTES.md",
+    "name": "DOCUMENTATION_AUDIT.md",
+    "path": "../../DOCUMENTATION_AUDIT.md",
     "category": "Root",
     "type": "md"
   },
   {
-    "name": "URL_PARAMETERS.md",
-    "path": "../../URL_PARAMETERS.md",
+    "name": "DOCUMENTATION_STANDARD.md",
+    "path": "../../DOCUMENTATION_STANDARD.md",
     "category": "Root",
     "type": "md"
   },
   {
-    "name": "CHANGELOG.md",
-    "path": "../../CHANGELOG.md",
+    "name": "FOR_GEMINI_WAR_FIXES.md",
+    "path": "../../FOR_GEMINI_WAR_FIXES.md",
     "category": "Root",
     "type": "md"
   },
   {
-    "name": "AGENTS.md",
-    "path": "../../AGENTS.md",
+    "name": "GAME_INVENTORY.md",
+    "path": "../../GAME_INVENTORY.md",
     "category": "Root",
     "type": "md"
   },
   {
-    "name": "LICENSE_AUDIT.md",
-    "path": "../../LICENSE_AUDIT.md",
+    "name": "GEMINI.md",
+    "path": "../../GEMINI.md",
     "category": "Root",
     "type": "md"
   },
   {
-    "name": "CLAUDE_ASSESSMENT.md",
-    "path": "../../CLAUDE_ASSESSMENT.md",
+    "name": "GROUND_RULES.md",
+    "path": "../../GROUND_RULES.md",
     "category": "Root",
     "type": "md"
   },
   {
-    "name": "project_notes_v0101.md",
-    "path": "../../project_notes_v0101.md",
+    "name": "HANDOFF_INDEX.md",
+    "path": "../../HANDOFF_INDEX.md",
     "category": "Root",
     "type": "md"
   },
   {
-    "name": "cloudflare-worker.js",
-    "path": "../../cloudflare-worker.js",
+    "name": "HANDOFF_JULES.md",
+    "path": "../../HANDOFF_JULES.md",
     "category": "Root",
-    "type": "js"
+    "type": "md"
   },
   {
-    "name": "notes_from_c_to_j_overhaul_phase1.md",
-    "path": "../../notes_from_c_to_j_overhaul_phase1.md",
+    "name": "HANDOFF_NEXT_LLM.md",
+    "path": "../../HANDOFF_NEXT_LLM.md",
     "category": "Root",
     "type": "md"
   },
   {
-    "name": "JULES.md",
-    "path": "../../JULES.md",
+    "name": "HUB_PLATFORM_PLAN.md",
+    "path": "../../HUB_PLATFORM_PLAN.md",
     "category": "Root",
     "type": "md"
   },
   {
-    "name": "QUESTIONS.md",
-    "path": "../../QUESTIONS.md",
+    "name": "IDEAS_020426.md",
+    "path": "../../IDEAS_020426.md",
     "category": "Root",
     "type": "md"
   },
   {
-    "name": "about.html",
-    "path": "../../about.html",
+    "name": "IMPLEMENTATION_SUMMARY.md",
+    "path": "../../IMPLEMENTATION_SUMMARY.md",
     "category": "Root",
-    "type": "html"
+    "type": "md"
+  },
+  {
+    "name": "INCIDENT-2026-03-22.md",
+    "path": "../../INCIDENT-2026-03-22.md",
+    "category": "Root",
+    "type": "md"
   },
   {
     "name": "INFO.md",
@@ -133,26 +139,26 @@ var REPO_FILES = [
     "type": "md"
   },
   {
-    "name": "CLOUDFLARE_WORKER_SETUP.md",
-    "path": "../../CLOUDFLARE_WORKER_SETUP.md",
+    "name": "JULES.md",
+    "path": "../../JULES.md",
     "category": "Root",
     "type": "md"
   },
   {
-    "name": "ROADMAP.md",
-    "path": "../../ROADMAP.md",
+    "name": "LICENSE_AUDIT.md",
+    "path": "../../LICENSE_AUDIT.md",
     "category": "Root",
     "type": "md"
   },
   {
-    "name": "WAR_BATTLE_HISTORY_PLAN.md",
-    "path": "../../WAR_BATTLE_HISTORY_PLAN.md",
+    "name": "NEGEN_IDEAS_C.md",
+    "path": "../../NEGEN_IDEAS_C.md",
     "category": "Root",
     "type": "md"
   },
   {
-    "name": "CLAUDE_AGENT.md",
-    "path": "../../CLAUDE_AGENT.md",
+    "name": "ONBOARDING.md",
+    "path": "../../ONBOARDING.md",
     "category": "Root",
     "type": "md"
   },
@@ -163,250 +169,2338 @@ var REPO_FILES = [
     "type": "md"
   },
   {
-    "name": "FOR_GEMINI_WAR_FIXES.md",
-    "path": "../../FOR_GEMINI_WAR_FIXES.md",
+    "name": "QUESTIONS.md",
+    "path": "../../QUESTIONS.md",
     "category": "Root",
     "type": "md"
   },
   {
-    "name": "ONBOARDING.md",
-    "path": "../../ONBOARDING.md",
+    "name": "README.md",
+    "path": "../../README.md",
     "category": "Root",
     "type": "md"
   },
   {
-    "name": "outputdoc.md",
-    "path": "../../outputdoc.md",
+    "name": "RETROSPECTIVE_AND_FEEDBACK.md",
+    "path": "../../RETROSPECTIVE_AND_FEEDBACK.md",
     "category": "Root",
     "type": "md"
   },
   {
-    "name": "NEGEN_IDEAS_C.md",
-    "path": "../../NEGEN_IDEAS_C.md",
+    "name": "REVAMP_MASTER_STRATEGY.md",
+    "path": "../../REVAMP_MASTER_STRATEGY.md",
     "category": "Root",
     "type": "md"
   },
   {
-    "name": "CLAUDE.md",
-    "path": "../../CLAUDE.md",
+    "name": "ROADMAP.md",
+    "path": "../../ROADMAP.md",
     "category": "Root",
     "type": "md"
   },
   {
-    "name": "WAR_ISSUES.md",
-    "path": "../../WAR_ISSUES.md",
+    "name": "SESSION_SUMMARY.md",
+    "path": "../../SESSION_SUMMARY.md",
     "category": "Root",
     "type": "md"
   },
   {
-    "name": "verify_projects.py",
-    "path": "../../verification/verify_projects.py",
-    "category": "Projects",
-    "type": "py"
+    "name": "SESSION_SUMMARY_2.md",
+    "path": "../../SESSION_SUMMARY_2.md",
+    "category": "Root",
+    "type": "md"
   },
   {
-    "name": "README.md",
-    "path": "../../music/README.md",
-    "category": "Music",
+    "name": "SPLIT_HANDS_IMPLEMENTATION_PLAN.md",
+    "path": "../../SPLIT_HANDS_IMPLEMENTATION_PLAN.md",
+    "category": "Root",
     "type": "md"
   },
   {
-    "name": "L10N_STRATEGY.md",
-    "path": "../../docs/L10N_STRATEGY.md",
-    "category": "Documentation",
+    "name": "TODO.md",
+    "path": "../../TODO.md",
+    "category": "Root",
     "type": "md"
   },
   {
-    "name": "MASTER_MANUAL.md",
-    "path": "../../docs/MASTER_MANUAL.md",
-    "category": "Documentation",
+    "name": "URL_PARAMETERS.md",
+    "path": "../../URL_PARAMETERS.md",
+    "category": "Root",
     "type": "md"
   },
   {
-    "name": "README.md",
-    "path": "../../docs/README.md",
-    "category": "Documentation",
+    "name": "VISUAL_IDENTITY.md",
+    "path": "../../VISUAL_IDENTITY.md",
+    "category": "Root",
     "type": "md"
   },
   {
-    "name": "REQUIRED_ROOT_FILES.md",
-    "path": "../../docs/REQUIRED_ROOT_FILES.md",
-    "category": "Documentation",
+    "name": "WAR_BATTLE_HISTORY_PLAN.md",
+    "path": "../../WAR_BATTLE_HISTORY_PLAN.md",
+    "category": "Root",
     "type": "md"
   },
   {
-    "name": "USER_MANUAL.md",
-    "path": "../../docs/negen/USER_MANUAL.md",
-    "category": "Documentation",
+    "name": "WAR_ISSUES.md",
+    "path": "../../WAR_ISSUES.md",
+    "category": "Root",
     "type": "md"
   },
   {
-    "name": "HISTORY.md",
-    "path": "../../docs/negen/HISTORY.md",
-    "category": "Documentation",
+    "name": "WIKI-PLAN.md",
+    "path": "../../WIKI-PLAN.md",
+    "category": "Root",
     "type": "md"
   },
   {
-    "name": "TECHNICAL_REFERENCE.md",
-    "path": "../../docs/negen/TECHNICAL_REFERENCE.md",
-    "category": "Documentation",
-    "type": "md"
+    "name": "about.html",
+    "path": "../../about.html",
+    "category": "Root",
+    "type": "html"
   },
   {
-    "name": "SNAKE.md",
-    "path": "../../docs/projects/SNAKE.md",
-    "category": "Documentation",
-    "type": "md"
+    "name": "cloudflare-worker-g-proposed.js",
+    "path": "../../cloudflare-worker-g-proposed.js",
+    "category": "Root",
+    "type": "js"
   },
   {
-    "name": "SLOTS.md",
-    "path": "../../docs/projects/SLOTS.md",
-    "category": "Documentation",
-    "type": "md"
+    "name": "cloudflare-worker.js",
+    "path": "../../cloudflare-worker.js",
+    "category": "Root",
+    "type": "js"
   },
   {
-    "name": "SHARED.md",
-    "path": "../../docs/projects/SHARED.md",
-    "category": "Documentation",
-    "type": "md"
+    "name": "index.html",
+    "path": "../../index.html",
+    "category": "Root",
+    "type": "html"
   },
   {
-    "name": "XTC_BALL.md",
-    "path": "../../docs/projects/XTC_BALL.md",
-    "category": "Documentation",
+    "name": "neverhaveiever.md",
+    "path": "../../neverhaveiever.md",
+    "category": "Root",
     "type": "md"
   },
   {
-    "name": "SPRUNKI.md",
-    "path": "../../docs/projects/SPRUNKI.md",
-    "category": "Documentation",
+    "name": "notes_from_c_to_j_overhaul_phase1.md",
+    "path": "../../notes_from_c_to_j_overhaul_phase1.md",
+    "category": "Root",
     "type": "md"
   },
   {
-    "name": "CARDS.md",
-    "path": "../../docs/projects/CARDS.md",
-    "category": "Documentation",
+    "name": "outputdoc.md",
+    "path": "../../outputdoc.md",
+    "category": "Root",
     "type": "md"
   },
   {
-    "name": "FLOW.md",
-    "path": "../../docs/projects/FLOW.md",
-    "category": "Documentation",
-    "type": "md"
+    "name": "pack_index.py",
+    "path": "../../pack_index.py",
+    "category": "Root",
+    "type": "py"
   },
   {
-    "name": "README.md",
-    "path": "../../games/README.md",
-    "category": "Games (Readme.Md)",
+    "name": "project_notes_v0101.md",
+    "path": "../../project_notes_v0101.md",
+    "category": "Root",
     "type": "md"
   },
   {
-    "name": "SkyScene.js",
-    "path": "../../games/sky_breakers/SkyScene.js",
-    "category": "Games (Sky Breakers)",
+    "name": "test_charms.js",
+    "path": "../../test_charms.js",
+    "category": "Root",
     "type": "js"
   },
   {
-    "name": "index.html",
-    "path": "../../games/sky_breakers/index.html",
-    "category": "Games (Sky Breakers)",
-    "type": "html"
+    "name": "update_manifest.py",
+    "path": "../../update_manifest.py",
+    "category": "Root",
+    "type": "py"
   },
   {
-    "name": "main.js",
-    "path": "../../games/sky_breakers/main.js",
-    "category": "Games (Sky Breakers)",
-    "type": "js"
+    "name": "deploy-preview.yml",
+    "path": "../../.github/workflows/deploy-preview.yml",
+    "category": ".github",
+    "type": "yml"
   },
   {
-    "name": "TECHNICAL.md",
-    "path": "../../games/sky_breakers/TECHNICAL.md",
-    "category": "Games (Sky Breakers)",
+    "name": "verify-beta.yml",
+    "path": "../../.github/workflows/verify-beta.yml",
+    "category": ".github",
+    "type": "yml"
+  },
+  {
+    "name": "README.md",
+    "path": "../../.pytest_cache/README.md",
+    "category": ".pytest_cache",
     "type": "md"
   },
   {
-    "name": "MANUAL.md",
-    "path": "../../games/sky_breakers/MANUAL.md",
-    "category": "Games (Sky Breakers)",
+    "name": "LL_CARD_ENGINE.md",
+    "path": "../../LL/LL_CARD_ENGINE.md",
+    "category": "Ll",
     "type": "md"
   },
   {
-    "name": "index.html",
-    "path": "../../games/sprunki/index.html",
-    "category": "Games (Sprunki)",
-    "type": "html"
+    "name": "LL_COLLABORATION.md",
+    "path": "../../LL/LL_COLLABORATION.md",
+    "category": "Ll",
+    "type": "md"
   },
   {
-    "name": "config.json",
-    "path": "../../games/sprunki/config.json",
-    "category": "Games (Sprunki)",
-    "type": "json"
+    "name": "LL_ES5_SAFARI.md",
+    "path": "../../LL/LL_ES5_SAFARI.md",
+    "category": "Ll",
+    "type": "md"
   },
   {
-    "name": "README.md",
-    "path": "../../games/sprunki/README.md",
-    "category": "Games (Sprunki)",
+    "name": "LL_PHASE_1_SUMMARY.md",
+    "path": "../../LL/LL_PHASE_1_SUMMARY.md",
+    "category": "Ll",
     "type": "md"
   },
   {
-    "name": "start_server.bat",
-    "path": "../../games/sprunki/start_server.bat",
-    "category": "Games (Sprunki)",
-    "type": "bat"
+    "name": "README.md",
+    "path": "../../LL/README.md",
+    "category": "Ll",
+    "type": "md"
+  },
+  {
+    "name": "COMPLIANCE_FIXES.md",
+    "path": "../../admin/COMPLIANCE_FIXES.md",
+    "category": "Admin",
+    "type": "md"
+  },
+  {
+    "name": "DEPENDENCY_POLICY.md",
+    "path": "../../admin/DEPENDENCY_POLICY.md",
+    "category": "Admin",
+    "type": "md"
+  },
+  {
+    "name": "GROUND_RULES_CHECKLIST.md",
+    "path": "../../admin/GROUND_RULES_CHECKLIST.md",
+    "category": "Admin",
+    "type": "md"
+  },
+  {
+    "name": "UPGRADE_CHECKLIST.md",
+    "path": "../../admin/UPGRADE_CHECKLIST.md",
+    "category": "Admin",
+    "type": "md"
+  },
+  {
+    "name": "AGENT_TEMPLATE.md",
+    "path": "../../admin/DOC_TEMPLATES/AGENT_TEMPLATE.md",
+    "category": "Admin",
+    "type": "md"
+  },
+  {
+    "name": "ARCHITECTURE_TEMPLATE.md",
+    "path": "../../admin/DOC_TEMPLATES/ARCHITECTURE_TEMPLATE.md",
+    "category": "Admin",
+    "type": "md"
+  },
+  {
+    "name": "CHANGELOG_TEMPLATE.md",
+    "path": "../../admin/DOC_TEMPLATES/CHANGELOG_TEMPLATE.md",
+    "category": "Admin",
+    "type": "md"
+  },
+  {
+    "name": "CLAUDE_TEMPLATE.md",
+    "path": "../../admin/DOC_TEMPLATES/CLAUDE_TEMPLATE.md",
+    "category": "Admin",
+    "type": "md"
+  },
+  {
+    "name": "INFO_TEMPLATE.md",
+    "path": "../../admin/DOC_TEMPLATES/INFO_TEMPLATE.md",
+    "category": "Admin",
+    "type": "md"
+  },
+  {
+    "name": "README_TEMPLATE.md",
+    "path": "../../admin/DOC_TEMPLATES/README_TEMPLATE.md",
+    "category": "Admin",
+    "type": "md"
+  },
+  {
+    "name": "TODO_TEMPLATE.md",
+    "path": "../../admin/DOC_TEMPLATES/TODO_TEMPLATE.md",
+    "category": "Admin",
+    "type": "md"
+  },
+  {
+    "name": "shared-v2-sample.md",
+    "path": "../../admin/migrations/shared-v2-sample.md",
+    "category": "Admin",
+    "type": "md"
+  },
+  {
+    "name": "GAME_INFO_TEMPLATE.md",
+    "path": "../../admin/templates/GAME_INFO_TEMPLATE.md",
+    "category": "Admin",
+    "type": "md"
+  },
+  {
+    "name": "LIBRARY_INFO_TEMPLATE.md",
+    "path": "../../admin/templates/LIBRARY_INFO_TEMPLATE.md",
+    "category": "Admin",
+    "type": "md"
+  },
+  {
+    "name": "MIGRATION_PLAN_TEMPLATE.md",
+    "path": "../../admin/templates/MIGRATION_PLAN_TEMPLATE.md",
+    "category": "Admin",
+    "type": "md"
+  },
+  {
+    "name": "index.html",
+    "path": "../../arcade/index.html",
+    "category": "Arcade",
+    "type": "html"
+  },
+  {
+    "name": "260204_KICKOFF.md",
+    "path": "../../archive/260204_KICKOFF.md",
+    "category": "Archive",
+    "type": "md"
+  },
+  {
+    "name": "CLAUDE_OLD.md",
+    "path": "../../archive/CLAUDE_OLD.md",
+    "category": "Archive",
+    "type": "md"
+  },
+  {
+    "name": "CLAUDE_OLD2.md",
+    "path": "../../archive/CLAUDE_OLD2.md",
+    "category": "Archive",
+    "type": "md"
+  },
+  {
+    "name": "index_v1.4.html",
+    "path": "../../archive/index_v1.4.html",
+    "category": "Archive",
+    "type": "html"
+  },
+  {
+    "name": "test-mobile.html",
+    "path": "../../archive/test-mobile.html",
+    "category": "Archive",
+    "type": "html"
+  },
+  {
+    "name": "card.css",
+    "path": "../../css/components/card.css",
+    "category": "Css",
+    "type": "css"
+  },
+  {
+    "name": "global.css",
+    "path": "../../css/components/global.css",
+    "category": "Css",
+    "type": "css"
+  },
+  {
+    "name": "IDEAS.md",
+    "path": "../../daily/IDEAS.md",
+    "category": "Daily",
+    "type": "md"
+  },
+  {
+    "name": "daily-feed.json",
+    "path": "../../daily/daily-feed.json",
+    "category": "Daily",
+    "type": "json"
+  },
+  {
+    "name": "index.html",
+    "path": "../../daily/index.html",
+    "category": "Daily",
+    "type": "html"
+  },
+  {
+    "name": "style.css",
+    "path": "../../daily/css/style.css",
+    "category": "Daily",
+    "type": "css"
+  },
+  {
+    "name": "TEAM_COORDINATION.md",
+    "path": "../../dev/TEAM_COORDINATION.md",
+    "category": "Dev",
+    "type": "md"
+  },
+  {
+    "name": "DESIGN_SPECS_PHASE_2.md",
+    "path": "../../docs/DESIGN_SPECS_PHASE_2.md",
+    "category": "Documentation",
+    "type": "md"
+  },
+  {
+    "name": "INCIDENT-2026-03-22c.md",
+    "path": "../../docs/INCIDENT-2026-03-22c.md",
+    "category": "Documentation",
+    "type": "md"
+  },
+  {
+    "name": "L10N_STRATEGY.md",
+    "path": "../../docs/L10N_STRATEGY.md",
+    "category": "Documentation",
+    "type": "md"
+  },
+  {
+    "name": "MASTER_MANUAL.md",
+    "path": "../../docs/MASTER_MANUAL.md",
+    "category": "Documentation",
+    "type": "md"
+  },
+  {
+    "name": "README.md",
+    "path": "../../docs/README.md",
+    "category": "Documentation",
+    "type": "md"
+  },
+  {
+    "name": "REQUIRED_ROOT_FILES.md",
+    "path": "../../docs/REQUIRED_ROOT_FILES.md",
+    "category": "Documentation",
+    "type": "md"
+  },
+  {
+    "name": "SITEMAP.md",
+    "path": "../../docs/SITEMAP.md",
+    "category": "Documentation",
+    "type": "md"
+  },
+  {
+    "name": "HISTORY.md",
+    "path": "../../docs/negen/HISTORY.md",
+    "category": "Documentation",
+    "type": "md"
+  },
+  {
+    "name": "TECHNICAL_REFERENCE.md",
+    "path": "../../docs/negen/TECHNICAL_REFERENCE.md",
+    "category": "Documentation",
+    "type": "md"
+  },
+  {
+    "name": "USER_MANUAL.md",
+    "path": "../../docs/negen/USER_MANUAL.md",
+    "category": "Documentation",
+    "type": "md"
+  },
+  {
+    "name": "CARDS.md",
+    "path": "../../docs/projects/CARDS.md",
+    "category": "Documentation",
+    "type": "md"
+  },
+  {
+    "name": "FLOW.md",
+    "path": "../../docs/projects/FLOW.md",
+    "category": "Documentation",
+    "type": "md"
+  },
+  {
+    "name": "SHARED.md",
+    "path": "../../docs/projects/SHARED.md",
+    "category": "Documentation",
+    "type": "md"
+  },
+  {
+    "name": "SLOTS.md",
+    "path": "../../docs/projects/SLOTS.md",
+    "category": "Documentation",
+    "type": "md"
+  },
+  {
+    "name": "SNAKE.md",
+    "path": "../../docs/projects/SNAKE.md",
+    "category": "Documentation",
+    "type": "md"
+  },
+  {
+    "name": "SPRUNKI.md",
+    "path": "../../docs/projects/SPRUNKI.md",
+    "category": "Documentation",
+    "type": "md"
+  },
+  {
+    "name": "XTC_BALL.md",
+    "path": "../../docs/projects/XTC_BALL.md",
+    "category": "Documentation",
+    "type": "md"
+  },
+  {
+    "name": "README.md",
+    "path": "../../games/README.md",
+    "category": "Games (Readme.Md)",
+    "type": "md"
+  },
+  {
+    "name": "AGENT.md",
+    "path": "../../games/animal_stack/AGENT.md",
+    "category": "Games (Animal Stack)",
+    "type": "md"
+  },
+  {
+    "name": "MANUAL.md",
+    "path": "../../games/animal_stack/MANUAL.md",
+    "category": "Games (Animal Stack)",
+    "type": "md"
+  },
+  {
+    "name": "README.md",
+    "path": "../../games/animal_stack/README.md",
+    "category": "Games (Animal Stack)",
+    "type": "md"
+  },
+  {
+    "name": "TECHNICAL.md",
+    "path": "../../games/animal_stack/TECHNICAL.md",
+    "category": "Games (Animal Stack)",
+    "type": "md"
+  },
+  {
+    "name": "index.html",
+    "path": "../../games/animal_stack/index.html",
+    "category": "Games (Animal Stack)",
+    "type": "html"
+  },
+  {
+    "name": "AnimalStackScene.js",
+    "path": "../../games/animal_stack/js/AnimalStackScene.js",
+    "category": "Games (Animal Stack)",
+    "type": "js"
+  },
+  {
+    "name": "PhysicsEngine.js",
+    "path": "../../games/animal_stack/js/PhysicsEngine.js",
+    "category": "Games (Animal Stack)",
+    "type": "js"
+  },
+  {
+    "name": "main.js",
+    "path": "../../games/animal_stack/js/main.js",
+    "category": "Games (Animal Stack)",
+    "type": "js"
+  },
+  {
+    "name": "AGENT.md",
+    "path": "../../games/board/AGENT.md",
+    "category": "Games (Board)",
+    "type": "md"
+  },
+  {
+    "name": "MANUAL.md",
+    "path": "../../games/board/MANUAL.md",
+    "category": "Games (Board)",
+    "type": "md"
+  },
+  {
+    "name": "README.md",
+    "path": "../../games/board/README.md",
+    "category": "Games (Board)",
+    "type": "md"
+  },
+  {
+    "name": "TECHNICAL.md",
+    "path": "../../games/board/TECHNICAL.md",
+    "category": "Games (Board)",
+    "type": "md"
+  },
+  {
+    "name": "index.html",
+    "path": "../../games/board/index.html",
+    "category": "Games (Board)",
+    "type": "html"
+  },
+  {
+    "name": "style.css",
+    "path": "../../games/board/css/style.css",
+    "category": "Games (Board)",
+    "type": "css"
+  },
+  {
+    "name": "battleship.js",
+    "path": "../../games/board/js/battleship.js",
+    "category": "Games (Board)",
+    "type": "js"
+  },
+  {
+    "name": "checkers.js",
+    "path": "../../games/board/js/checkers.js",
+    "category": "Games (Board)",
+    "type": "js"
+  },
+  {
+    "name": "chess.js",
+    "path": "../../games/board/js/chess.js",
+    "category": "Games (Board)",
+    "type": "js"
+  },
+  {
+    "name": "connect4.js",
+    "path": "../../games/board/js/connect4.js",
+    "category": "Games (Board)",
+    "type": "js"
+  },
+  {
+    "name": "dots.js",
+    "path": "../../games/board/js/dots.js",
+    "category": "Games (Board)",
+    "type": "js"
+  },
+  {
+    "name": "engine.js",
+    "path": "../../games/board/js/engine.js",
+    "category": "Games (Board)",
+    "type": "js"
+  },
+  {
+    "name": "gomoku.js",
+    "path": "../../games/board/js/gomoku.js",
+    "category": "Games (Board)",
+    "type": "js"
+  },
+  {
+    "name": "main.js",
+    "path": "../../games/board/js/main.js",
+    "category": "Games (Board)",
+    "type": "js"
+  },
+  {
+    "name": "mancala.js",
+    "path": "../../games/board/js/mancala.js",
+    "category": "Games (Board)",
+    "type": "js"
+  },
+  {
+    "name": "othello.js",
+    "path": "../../games/board/js/othello.js",
+    "category": "Games (Board)",
+    "type": "js"
+  },
+  {
+    "name": "overlay.js",
+    "path": "../../games/board/js/overlay.js",
+    "category": "Games (Board)",
+    "type": "js"
+  },
+  {
+    "name": "settings.js",
+    "path": "../../games/board/js/settings.js",
+    "category": "Games (Board)",
+    "type": "js"
+  },
+  {
+    "name": "tictactoe.js",
+    "path": "../../games/board/js/tictactoe.js",
+    "category": "Games (Board)",
+    "type": "js"
+  },
+  {
+    "name": "xiangqi-ai.js",
+    "path": "../../games/board/js/xiangqi-ai.js",
+    "category": "Games (Board)",
+    "type": "js"
+  },
+  {
+    "name": "xiangqi-rules.js",
+    "path": "../../games/board/js/xiangqi-rules.js",
+    "category": "Games (Board)",
+    "type": "js"
+  },
+  {
+    "name": "xiangqi.js",
+    "path": "../../games/board/js/xiangqi.js",
+    "category": "Games (Board)",
+    "type": "js"
+  },
+  {
+    "name": "AGENT.md",
+    "path": "../../games/breakout/AGENT.md",
+    "category": "Games (Breakout)",
+    "type": "md"
+  },
+  {
+    "name": "MANUAL.md",
+    "path": "../../games/breakout/MANUAL.md",
+    "category": "Games (Breakout)",
+    "type": "md"
+  },
+  {
+    "name": "README.md",
+    "path": "../../games/breakout/README.md",
+    "category": "Games (Breakout)",
+    "type": "md"
+  },
+  {
+    "name": "TECHNICAL.md",
+    "path": "../../games/breakout/TECHNICAL.md",
+    "category": "Games (Breakout)",
+    "type": "md"
+  },
+  {
+    "name": "index.html",
+    "path": "../../games/breakout/index.html",
+    "category": "Games (Breakout)",
+    "type": "html"
+  },
+  {
+    "name": "BreakoutScene.js",
+    "path": "../../games/breakout/js/BreakoutScene.js",
+    "category": "Games (Breakout)",
+    "type": "js"
+  },
+  {
+    "name": "BuilderScene.js",
+    "path": "../../games/breakout/js/BuilderScene.js",
+    "category": "Games (Breakout)",
+    "type": "js"
+  },
+  {
+    "name": "LevelManager.js",
+    "path": "../../games/breakout/js/LevelManager.js",
+    "category": "Games (Breakout)",
+    "type": "js"
+  },
+  {
+    "name": "main.js",
+    "path": "../../games/breakout/js/main.js",
+    "category": "Games (Breakout)",
+    "type": "js"
+  },
+  {
+    "name": "card-assets.js",
+    "path": "../../games/cards/card-assets.js",
+    "category": "Games (Cards)",
+    "type": "js"
+  },
+  {
+    "name": "changelog.md",
+    "path": "../../games/cards/changelog.md",
+    "category": "Games (Cards)",
+    "type": "md"
+  },
+  {
+    "name": "index.html",
+    "path": "../../games/cards/index.html",
+    "category": "Games (Cards)",
+    "type": "html"
+  },
+  {
+    "name": "test-suite.html",
+    "path": "../../games/cards/test-suite.html",
+    "category": "Games (Cards)",
+    "type": "html"
+  },
+  {
+    "name": "test.html",
+    "path": "../../games/cards/test.html",
+    "category": "Games (Cards)",
+    "type": "html"
+  },
+  {
+    "name": "test_ruleset.html",
+    "path": "../../games/cards/test_ruleset.html",
+    "category": "Games (Cards)",
+    "type": "html"
+  },
+  {
+    "name": "big2.js",
+    "path": "../../games/cards/big2/big2.js",
+    "category": "Games (Cards)",
+    "type": "js"
+  },
+  {
+    "name": "index.html",
+    "path": "../../games/cards/big2/index.html",
+    "category": "Games (Cards)",
+    "type": "html"
+  },
+  {
+    "name": "ruleset.js",
+    "path": "../../games/cards/big2/ruleset.js",
+    "category": "Games (Cards)",
+    "type": "js"
+  },
+  {
+    "name": "AGENT.md",
+    "path": "../../games/cards/blackjack/AGENT.md",
+    "category": "Games (Cards)",
+    "type": "md"
+  },
+  {
+    "name": "ARCHITECTURE.md",
+    "path": "../../games/cards/blackjack/ARCHITECTURE.md",
+    "category": "Games (Cards)",
+    "type": "md"
+  },
+  {
+    "name": "CHANGELOG.md",
+    "path": "../../games/cards/blackjack/CHANGELOG.md",
+    "category": "Games (Cards)",
+    "type": "md"
+  },
+  {
+    "name": "INFO.md",
+    "path": "../../games/cards/blackjack/INFO.md",
+    "category": "Games (Cards)",
+    "type": "md"
+  },
+  {
+    "name": "MANUAL.md",
+    "path": "../../games/cards/blackjack/MANUAL.md",
+    "category": "Games (Cards)",
+    "type": "md"
+  },
+  {
+    "name": "README.md",
+    "path": "../../games/cards/blackjack/README.md",
+    "category": "Games (Cards)",
+    "type": "md"
+  },
+  {
+    "name": "TECHNICAL.md",
+    "path": "../../games/cards/blackjack/TECHNICAL.md",
+    "category": "Games (Cards)",
+    "type": "md"
+  },
+  {
+    "name": "TODO.md",
+    "path": "../../games/cards/blackjack/TODO.md",
+    "category": "Games (Cards)",
+    "type": "md"
+  },
+  {
+    "name": "index.html",
+    "path": "../../games/cards/blackjack/index.html",
+    "category": "Games (Cards)",
+    "type": "html"
+  },
+  {
+    "name": "ruleset.js",
+    "path": "../../games/cards/blackjack/ruleset.js",
+    "category": "Games (Cards)",
+    "type": "js"
+  },
+  {
+    "name": "todo_260113.md",
+    "path": "../../games/cards/blackjack/todo_260113.md",
+    "category": "Games (Cards)",
+    "type": "md"
+  },
+  {
+    "name": "ruleset.js",
+    "path": "../../games/cards/euchre/ruleset.js",
+    "category": "Games (Cards)",
+    "type": "js"
+  },
+  {
+    "name": "index.html",
+    "path": "../../games/cards/poker/index.html",
+    "category": "Games (Cards)",
+    "type": "html"
+  },
+  {
+    "name": "AGENT.md",
+    "path": "../../games/cards/poker/13card/AGENT.md",
+    "category": "Games (Cards)",
+    "type": "md"
+  },
+  {
+    "name": "MANUAL.md",
+    "path": "../../games/cards/poker/13card/MANUAL.md",
+    "category": "Games (Cards)",
+    "type": "md"
+  },
+  {
+    "name": "README.md",
+    "path": "../../games/cards/poker/13card/README.md",
+    "category": "Games (Cards)",
+    "type": "md"
+  },
+  {
+    "name": "TECHNICAL.md",
+    "path": "../../games/cards/poker/13card/TECHNICAL.md",
+    "category": "Games (Cards)",
+    "type": "md"
+  },
+  {
+    "name": "ThirteenCard.js",
+    "path": "../../games/cards/poker/13card/ThirteenCard.js",
+    "category": "Games (Cards)",
+    "type": "js"
+  },
+  {
+    "name": "index.html",
+    "path": "../../games/cards/poker/13card/index.html",
+    "category": "Games (Cards)",
+    "type": "html"
+  },
+  {
+    "name": "AGENT.md",
+    "path": "../../games/cards/poker/5card/AGENT.md",
+    "category": "Games (Cards)",
+    "type": "md"
+  },
+  {
+    "name": "MANUAL.md",
+    "path": "../../games/cards/poker/5card/MANUAL.md",
+    "category": "Games (Cards)",
+    "type": "md"
+  },
+  {
+    "name": "README.md",
+    "path": "../../games/cards/poker/5card/README.md",
+    "category": "Games (Cards)",
+    "type": "md"
+  },
+  {
+    "name": "TECHNICAL.md",
+    "path": "../../games/cards/poker/5card/TECHNICAL.md",
+    "category": "Games (Cards)",
+    "type": "md"
+  },
+  {
+    "name": "five_card_draw.js",
+    "path": "../../games/cards/poker/5card/five_card_draw.js",
+    "category": "Games (Cards)",
+    "type": "js"
+  },
+  {
+    "name": "index.html",
+    "path": "../../games/cards/poker/5card/index.html",
+    "category": "Games (Cards)",
+    "type": "html"
+  },
+  {
+    "name": "ruleset.js",
+    "path": "../../games/cards/poker/5card/ruleset.js",
+    "category": "Games (Cards)",
+    "type": "js"
+  },
+  {
+    "name": "AGENT.md",
+    "path": "../../games/cards/poker/holdem/AGENT.md",
+    "category": "Games (Cards)",
+    "type": "md"
+  },
+  {
+    "name": "MANUAL.md",
+    "path": "../../games/cards/poker/holdem/MANUAL.md",
+    "category": "Games (Cards)",
+    "type": "md"
+  },
+  {
+    "name": "README.md",
+    "path": "../../games/cards/poker/holdem/README.md",
+    "category": "Games (Cards)",
+    "type": "md"
+  },
+  {
+    "name": "TECHNICAL.md",
+    "path": "../../games/cards/poker/holdem/TECHNICAL.md",
+    "category": "Games (Cards)",
+    "type": "md"
+  },
+  {
+    "name": "TexasHoldem.js",
+    "path": "../../games/cards/poker/holdem/TexasHoldem.js",
+    "category": "Games (Cards)",
+    "type": "js"
+  },
+  {
+    "name": "index.html",
+    "path": "../../games/cards/poker/holdem/index.html",
+    "category": "Games (Cards)",
+    "type": "html"
+  },
+  {
+    "name": "BasePokerGame.js",
+    "path": "../../games/cards/poker/shared/BasePokerGame.js",
+    "category": "Games (Cards)",
+    "type": "js"
+  },
+  {
+    "name": "evaluator.js",
+    "path": "../../games/cards/poker/shared/evaluator.js",
+    "category": "Games (Cards)",
+    "type": "js"
+  },
+  {
+    "name": "CARD_ENGINE_GUIDE.md",
+    "path": "../../games/cards/shared/CARD_ENGINE_GUIDE.md",
+    "category": "Games (Cards)",
+    "type": "md"
+  },
+  {
+    "name": "INFO.md",
+    "path": "../../games/cards/shared/INFO.md",
+    "category": "Games (Cards)",
+    "type": "md"
+  },
+  {
+    "name": "TRACKING_PLAN.md",
+    "path": "../../games/cards/shared/TRACKING_PLAN.md",
+    "category": "Games (Cards)",
+    "type": "md"
+  },
+  {
+    "name": "card-assets.js",
+    "path": "../../games/cards/shared/card-assets.js",
+    "category": "Games (Cards)",
+    "type": "js"
+  },
+  {
+    "name": "card-utils.js",
+    "path": "../../games/cards/shared/card-utils.js",
+    "category": "Games (Cards)",
+    "type": "js"
+  },
+  {
+    "name": "card.js",
+    "path": "../../games/cards/shared/card.js",
+    "category": "Games (Cards)",
+    "type": "js"
+  },
+  {
+    "name": "deck-editor.js",
+    "path": "../../games/cards/shared/deck-editor.js",
+    "category": "Games (Cards)",
+    "type": "js"
+  },
+  {
+    "name": "deck.js",
+    "path": "../../games/cards/shared/deck.js",
+    "category": "Games (Cards)",
+    "type": "js"
+  },
+  {
+    "name": "engine.js",
+    "path": "../../games/cards/shared/engine.js",
+    "category": "Games (Cards)",
+    "type": "js"
+  },
+  {
+    "name": "enums.js",
+    "path": "../../games/cards/shared/enums.js",
+    "category": "Games (Cards)",
+    "type": "js"
+  },
+  {
+    "name": "game-config.js",
+    "path": "../../games/cards/shared/game-config.js",
+    "category": "Games (Cards)",
+    "type": "js"
+  },
+  {
+    "name": "pile.js",
+    "path": "../../games/cards/shared/pile.js",
+    "category": "Games (Cards)",
+    "type": "js"
+  },
+  {
+    "name": "player.js",
+    "path": "../../games/cards/shared/player.js",
+    "category": "Games (Cards)",
+    "type": "js"
+  },
+  {
+    "name": "poker-evaluator.js",
+    "path": "../../games/cards/shared/poker-evaluator.js",
+    "category": "Games (Cards)",
+    "type": "js"
+  },
+  {
+    "name": "AGENT.md",
+    "path": "../../games/cards/solitaire/AGENT.md",
+    "category": "Games (Cards)",
+    "type": "md"
+  },
+  {
+    "name": "README.md",
+    "path": "../../games/cards/solitaire/README.md",
+    "category": "Games (Cards)",
+    "type": "md"
+  },
+  {
+    "name": "index.html",
+    "path": "../../games/cards/solitaire/index.html",
+    "category": "Games (Cards)",
+    "type": "html"
+  },
+  {
+    "name": "style.css",
+    "path": "../../games/cards/solitaire/css/style.css",
+    "category": "Games (Cards)",
+    "type": "css"
+  },
+  {
+    "name": "game.js",
+    "path": "../../games/cards/solitaire/js/game.js",
+    "category": "Games (Cards)",
+    "type": "js"
+  },
+  {
+    "name": "klondike.js",
+    "path": "../../games/cards/solitaire/rules/klondike.js",
+    "category": "Games (Cards)",
+    "type": "js"
+  },
+  {
+    "name": "AGENT.md",
+    "path": "../../games/cards/war/AGENT.md",
+    "category": "Games (Cards)",
+    "type": "md"
+  },
+  {
+    "name": "INFO.md",
+    "path": "../../games/cards/war/INFO.md",
+    "category": "Games (Cards)",
+    "type": "md"
+  },
+  {
+    "name": "MANUAL.md",
+    "path": "../../games/cards/war/MANUAL.md",
+    "category": "Games (Cards)",
+    "type": "md"
+  },
+  {
+    "name": "README.md",
+    "path": "../../games/cards/war/README.md",
+    "category": "Games (Cards)",
+    "type": "md"
+  },
+  {
+    "name": "TECHNICAL.md",
+    "path": "../../games/cards/war/TECHNICAL.md",
+    "category": "Games (Cards)",
+    "type": "md"
+  },
+  {
+    "name": "index.html",
+    "path": "../../games/cards/war/index.html",
+    "category": "Games (Cards)",
+    "type": "html"
+  },
+  {
+    "name": "ruleset.js",
+    "path": "../../games/cards/war/ruleset.js",
+    "category": "Games (Cards)",
+    "type": "js"
+  },
+  {
+    "name": "AGENT.md",
+    "path": "../../games/falldown/AGENT.md",
+    "category": "Games (Falldown)",
+    "type": "md"
+  },
+  {
+    "name": "README.md",
+    "path": "../../games/falldown/README.md",
+    "category": "Games (Falldown)",
+    "type": "md"
+  },
+  {
+    "name": "index.html",
+    "path": "../../games/falldown/index.html",
+    "category": "Games (Falldown)",
+    "type": "html"
+  },
+  {
+    "name": "style.css",
+    "path": "../../games/falldown/css/style.css",
+    "category": "Games (Falldown)",
+    "type": "css"
+  },
+  {
+    "name": "game.js",
+    "path": "../../games/falldown/js/game.js",
+    "category": "Games (Falldown)",
+    "type": "js"
+  },
+  {
+    "name": "input.js",
+    "path": "../../games/falldown/js/input.js",
+    "category": "Games (Falldown)",
+    "type": "js"
+  },
+  {
+    "name": "storage.js",
+    "path": "../../games/falldown/js/storage.js",
+    "category": "Games (Falldown)",
+    "type": "js"
+  },
+  {
+    "name": "ui.js",
+    "path": "../../games/falldown/js/ui.js",
+    "category": "Games (Falldown)",
+    "type": "js"
+  },
+  {
+    "name": "AGENT.md",
+    "path": "../../games/flash_classics/AGENT.md",
+    "category": "Games (Flash Classics)",
+    "type": "md"
+  },
+  {
+    "name": "README.md",
+    "path": "../../games/flash_classics/README.md",
+    "category": "Games (Flash Classics)",
+    "type": "md"
+  },
+  {
+    "name": "chopper.html",
+    "path": "../../games/flash_classics/chopper.html",
+    "category": "Games (Flash Classics)",
+    "type": "html"
+  },
+  {
+    "name": "defender.html",
+    "path": "../../games/flash_classics/defender.html",
+    "category": "Games (Flash Classics)",
+    "type": "html"
+  },
+  {
+    "name": "index.html",
+    "path": "../../games/flash_classics/index.html",
+    "category": "Games (Flash Classics)",
+    "type": "html"
+  },
+  {
+    "name": "runner.html",
+    "path": "../../games/flash_classics/runner.html",
+    "category": "Games (Flash Classics)",
+    "type": "html"
+  },
+  {
+    "name": "style.css",
+    "path": "../../games/flash_classics/css/style.css",
+    "category": "Games (Flash Classics)",
+    "type": "css"
+  },
+  {
+    "name": "common.js",
+    "path": "../../games/flash_classics/js/common.js",
+    "category": "Games (Flash Classics)",
+    "type": "js"
+  },
+  {
+    "name": "AGENT.md",
+    "path": "../../games/flow/AGENT.md",
+    "category": "Games (Flow)",
+    "type": "md"
+  },
+  {
+    "name": "ARCHITECTURE.md",
+    "path": "../../games/flow/ARCHITECTURE.md",
+    "category": "Games (Flow)",
+    "type": "md"
+  },
+  {
+    "name": "CHANGELOG.md",
+    "path": "../../games/flow/CHANGELOG.md",
+    "category": "Games (Flow)",
+    "type": "md"
+  },
+  {
+    "name": "README.md",
+    "path": "../../games/flow/README.md",
+    "category": "Games (Flow)",
+    "type": "md"
+  },
+  {
+    "name": "TODO.md",
+    "path": "../../games/flow/TODO.md",
+    "category": "Games (Flow)",
+    "type": "md"
+  },
+  {
+    "name": "index.html",
+    "path": "../../games/flow/index.html",
+    "category": "Games (Flow)",
+    "type": "html"
+  },
+  {
+    "name": "style.css",
+    "path": "../../games/flow/css/style.css",
+    "category": "Games (Flow)",
+    "type": "css"
+  },
+  {
+    "name": "game.js",
+    "path": "../../games/flow/engine/game.js",
+    "category": "Games (Flow)",
+    "type": "js"
+  },
+  {
+    "name": "grid.js",
+    "path": "../../games/flow/engine/grid.js",
+    "category": "Games (Flow)",
+    "type": "js"
+  },
+  {
+    "name": "input.js",
+    "path": "../../games/flow/engine/input.js",
+    "category": "Games (Flow)",
+    "type": "js"
+  },
+  {
+    "name": "level_generator.js",
+    "path": "../../games/flow/engine/level_generator.js",
+    "category": "Games (Flow)",
+    "type": "js"
+  },
+  {
+    "name": "path.js",
+    "path": "../../games/flow/engine/path.js",
+    "category": "Games (Flow)",
+    "type": "js"
+  },
+  {
+    "name": "AGENT.md",
+    "path": "../../games/j/AGENT.md",
+    "category": "Games (J)",
+    "type": "md"
+  },
+  {
+    "name": "README.md",
+    "path": "../../games/j/README.md",
+    "category": "Games (J)",
+    "type": "md"
+  },
+  {
+    "name": "editor.html",
+    "path": "../../games/j/editor.html",
+    "category": "Games (J)",
+    "type": "html"
+  },
+  {
+    "name": "index.html",
+    "path": "../../games/j/index.html",
+    "category": "Games (J)",
+    "type": "html"
+  },
+  {
+    "name": "manifest.json",
+    "path": "../../games/j/manifest.json",
+    "category": "Games (J)",
+    "type": "json"
+  },
+  {
+    "name": "sw.js",
+    "path": "../../games/j/sw.js",
+    "category": "Games (J)",
+    "type": "js"
+  },
+  {
+    "name": "style.css",
+    "path": "../../games/j/css/style.css",
+    "category": "Games (J)",
+    "type": "css"
+  },
+  {
+    "name": "app.js",
+    "path": "../../games/j/js/app.js",
+    "category": "Games (J)",
+    "type": "js"
+  },
+  {
+    "name": "db_loader.js",
+    "path": "../../games/j/js/db_loader.js",
+    "category": "Games (J)",
+    "type": "js"
+  },
+  {
+    "name": "engine.js",
+    "path": "../../games/j/js/engine.js",
+    "category": "Games (J)",
+    "type": "js"
+  },
+  {
+    "name": "features.js",
+    "path": "../../games/j/js/features.js",
+    "category": "Games (J)",
+    "type": "js"
+  },
+  {
+    "name": "agile_scrum.json",
+    "path": "../../games/j/packs/agile_scrum.json",
+    "category": "Games (J)",
+    "type": "json"
+  },
+  {
+    "name": "american_muscle.json",
+    "path": "../../games/j/packs/american_muscle.json",
+    "category": "Games (J)",
+    "type": "json"
+  },
+  {
+    "name": "andrew_ramdayal.json",
+    "path": "../../games/j/packs/andrew_ramdayal.json",
+    "category": "Games (J)",
+    "type": "json"
+  },
+  {
+    "name": "animals_v1.json",
+    "path": "../../games/j/packs/animals_v1.json",
+    "category": "Games (J)",
+    "type": "json"
+  },
+  {
+    "name": "anime_manga.json",
+    "path": "../../games/j/packs/anime_manga.json",
+    "category": "Games (J)",
+    "type": "json"
+  },
+  {
+    "name": "automotive.json",
+    "path": "../../games/j/packs/automotive.json",
+    "category": "Games (J)",
+    "type": "json"
+  },
+  {
+    "name": "brands_logos.json",
+    "path": "../../games/j/packs/brands_logos.json",
+    "category": "Games (J)",
+    "type": "json"
+  },
+  {
+    "name": "candy_60s.json",
+    "path": "../../games/j/packs/candy_60s.json",
+    "category": "Games (J)",
+    "type": "json"
+  },
+  {
+    "name": "cartoons_60s.json",
+    "path": "../../games/j/packs/cartoons_60s.json",
+    "category": "Games (J)",
+    "type": "json"
+  },
+  {
+    "name": "classic_movies.json",
+    "path": "../../games/j/packs/classic_movies.json",
+    "category": "Games (J)",
+    "type": "json"
+  },
+  {
+    "name": "cost_of_living.json",
+    "path": "../../games/j/packs/cost_of_living.json",
+    "category": "Games (J)",
+    "type": "json"
+  },
+  {
+    "name": "cryptids.json",
+    "path": "../../games/j/packs/cryptids.json",
+    "category": "Games (J)",
+    "type": "json"
+  },
+  {
+    "name": "cybersecurity.json",
+    "path": "../../games/j/packs/cybersecurity.json",
+    "category": "Games (J)",
+    "type": "json"
+  },
+  {
+    "name": "flags_quiz.json",
+    "path": "../../games/j/packs/flags_quiz.json",
+    "category": "Games (J)",
+    "type": "json"
+  },
+  {
+    "name": "food_v1.json",
+    "path": "../../games/j/packs/food_v1.json",
+    "category": "Games (J)",
+    "type": "json"
+  },
+  {
+    "name": "geography_v1.json",
+    "path": "../../games/j/packs/geography_v1.json",
+    "category": "Games (J)",
+    "type": "json"
+  },
+  {
+    "name": "greek_mythology.json",
+    "path": "../../games/j/packs/greek_mythology.json",
+    "category": "Games (J)",
+    "type": "json"
+  },
+  {
+    "name": "hercules_tv.json",
+    "path": "../../games/j/packs/hercules_tv.json",
+    "category": "Games (J)",
+    "type": "json"
+  },
+  {
+    "name": "history_v1.json",
+    "path": "../../games/j/packs/history_v1.json",
+    "category": "Games (J)",
+    "type": "json"
+  },
+  {
+    "name": "human_body.json",
+    "path": "../../games/j/packs/human_body.json",
+    "category": "Games (J)",
+    "type": "json"
+  },
+  {
+    "name": "internet_culture.json",
+    "path": "../../games/j/packs/internet_culture.json",
+    "category": "Games (J)",
+    "type": "json"
+  },
+  {
+    "name": "language_v1.json",
+    "path": "../../games/j/packs/language_v1.json",
+    "category": "Games (J)",
+    "type": "json"
+  },
+  {
+    "name": "literature_v1.json",
+    "path": "../../games/j/packs/literature_v1.json",
+    "category": "Games (J)",
+    "type": "json"
+  },
+  {
+    "name": "logo_quiz.json",
+    "path": "../../games/j/packs/logo_quiz.json",
+    "category": "Games (J)",
+    "type": "json"
+  },
+  {
+    "name": "manifest.json",
+    "path": "../../games/j/packs/manifest.json",
+    "category": "Games (J)",
+    "type": "json"
+  },
+  {
+    "name": "math_v1.json",
+    "path": "../../games/j/packs/math_v1.json",
+    "category": "Games (J)",
+    "type": "json"
+  },
+  {
+    "name": "modern_history.json",
+    "path": "../../games/j/packs/modern_history.json",
+    "category": "Games (J)",
+    "type": "json"
+  },
+  {
+    "name": "movies_v1.json",
+    "path": "../../games/j/packs/movies_v1.json",
+    "category": "Games (J)",
+    "type": "json"
+  },
+  {
+    "name": "music_60s.json",
+    "path": "../../games/j/packs/music_60s.json",
+    "category": "Games (J)",
+    "type": "json"
+  },
+  {
+    "name": "music_70s.json",
+    "path": "../../games/j/packs/music_70s.json",
+    "category": "Games (J)",
+    "type": "json"
+  },
+  {
+    "name": "music_80s.json",
+    "path": "../../games/j/packs/music_80s.json",
+    "category": "Games (J)",
+    "type": "json"
+  },
+  {
+    "name": "music_90s.json",
+    "path": "../../games/j/packs/music_90s.json",
+    "category": "Games (J)",
+    "type": "json"
+  },
+  {
+    "name": "music_v1.json",
+    "path": "../../games/j/packs/music_v1.json",
+    "category": "Games (J)",
+    "type": "json"
+  },
+  {
+    "name": "mythology_v1.json",
+    "path": "../../games/j/packs/mythology_v1.json",
+    "category": "Games (J)",
+    "type": "json"
+  },
+  {
+    "name": "ohio_space.json",
+    "path": "../../games/j/packs/ohio_space.json",
+    "category": "Games (J)",
+    "type": "json"
+  },
+  {
+    "name": "ohio_sports.json",
+    "path": "../../games/j/packs/ohio_sports.json",
+    "category": "Games (J)",
+    "type": "json"
+  },
+  {
+    "name": "ops_logistics.json",
+    "path": "../../games/j/packs/ops_logistics.json",
+    "category": "Games (J)",
+    "type": "json"
+  },
+  {
+    "name": "pmi_pm.json",
+    "path": "../../games/j/packs/pmi_pm.json",
+    "category": "Games (J)",
+    "type": "json"
+  },
+  {
+    "name": "popculture_v1.json",
+    "path": "../../games/j/packs/popculture_v1.json",
+    "category": "Games (J)",
+    "type": "json"
+  },
+  {
+    "name": "public_domain.json",
+    "path": "../../games/j/packs/public_domain.json",
+    "category": "Games (J)",
+    "type": "json"
+  },
+  {
+    "name": "rust_belt_rock.json",
+    "path": "../../games/j/packs/rust_belt_rock.json",
+    "category": "Games (J)",
+    "type": "json"
+  },
+  {
+    "name": "science_v1.json",
+    "path": "../../games/j/packs/science_v1.json",
+    "category": "Games (J)",
+    "type": "json"
+  },
+  {
+    "name": "snake_trivia.json",
+    "path": "../../games/j/packs/snake_trivia.json",
+    "category": "Games (J)",
+    "type": "json"
+  },
+  {
+    "name": "space_v1.json",
+    "path": "../../games/j/packs/space_v1.json",
+    "category": "Games (J)",
+    "type": "json"
+  },
+  {
+    "name": "sports_v1.json",
+    "path": "../../games/j/packs/sports_v1.json",
+    "category": "Games (J)",
+    "type": "json"
+  },
+  {
+    "name": "sprunki_v1.json",
+    "path": "../../games/j/packs/sprunki_v1.json",
+    "category": "Games (J)",
+    "type": "json"
+  },
+  {
+    "name": "star_wars.json",
+    "path": "../../games/j/packs/star_wars.json",
+    "category": "Games (J)",
+    "type": "json"
+  },
+  {
+    "name": "technology_v1.json",
+    "path": "../../games/j/packs/technology_v1.json",
+    "category": "Games (J)",
+    "type": "json"
+  },
+  {
+    "name": "the_office.json",
+    "path": "../../games/j/packs/the_office.json",
+    "category": "Games (J)",
+    "type": "json"
+  },
+  {
+    "name": "true_crime.json",
+    "path": "../../games/j/packs/true_crime.json",
+    "category": "Games (J)",
+    "type": "json"
+  },
+  {
+    "name": "videogames_v1.json",
+    "path": "../../games/j/packs/videogames_v1.json",
+    "category": "Games (J)",
+    "type": "json"
+  },
+  {
+    "name": "vietnam_era.json",
+    "path": "../../games/j/packs/vietnam_era.json",
+    "category": "Games (J)",
+    "type": "json"
+  },
+  {
+    "name": "xanadu_v1.json",
+    "path": "../../games/j/packs/xanadu_v1.json",
+    "category": "Games (J)",
+    "type": "json"
+  },
+  {
+    "name": "xena_tv.json",
+    "path": "../../games/j/packs/xena_tv.json",
+    "category": "Games (J)",
+    "type": "json"
+  },
+  {
+    "name": "editor.html",
+    "path": "../../games/j_v1/editor.html",
+    "category": "Games (J V1)",
+    "type": "html"
+  },
+  {
+    "name": "index.html",
+    "path": "../../games/j_v1/index.html",
+    "category": "Games (J V1)",
+    "type": "html"
+  },
+  {
+    "name": "manifest.json",
+    "path": "../../games/j_v1/manifest.json",
+    "category": "Games (J V1)",
+    "type": "json"
+  },
+  {
+    "name": "sw.js",
+    "path": "../../games/j_v1/sw.js",
+    "category": "Games (J V1)",
+    "type": "js"
+  },
+  {
+    "name": "style.css",
+    "path": "../../games/j_v1/css/style.css",
+    "category": "Games (J V1)",
+    "type": "css"
+  },
+  {
+    "name": "app.js",
+    "path": "../../games/j_v1/js/app.js",
+    "category": "Games (J V1)",
+    "type": "js"
+  },
+  {
+    "name": "db_loader.js",
+    "path": "../../games/j_v1/js/db_loader.js",
+    "category": "Games (J V1)",
+    "type": "js"
+  },
+  {
+    "name": "engine.js",
+    "path": "../../games/j_v1/js/engine.js",
+    "category": "Games (J V1)",
+    "type": "js"
+  },
+  {
+    "name": "agile_scrum.json",
+    "path": "../../games/j_v1/packs/agile_scrum.json",
+    "category": "Games (J V1)",
+    "type": "json"
+  },
+  {
+    "name": "american_muscle.json",
+    "path": "../../games/j_v1/packs/american_muscle.json",
+    "category": "Games (J V1)",
+    "type": "json"
+  },
+  {
+    "name": "andrew_ramdayal.json",
+    "path": "../../games/j_v1/packs/andrew_ramdayal.json",
+    "category": "Games (J V1)",
+    "type": "json"
+  },
+  {
+    "name": "animals_v1.json",
+    "path": "../../games/j_v1/packs/animals_v1.json",
+    "category": "Games (J V1)",
+    "type": "json"
+  },
+  {
+    "name": "anime_manga.json",
+    "path": "../../games/j_v1/packs/anime_manga.json",
+    "category": "Games (J V1)",
+    "type": "json"
+  },
+  {
+    "name": "automotive.json",
+    "path": "../../games/j_v1/packs/automotive.json",
+    "category": "Games (J V1)",
+    "type": "json"
+  },
+  {
+    "name": "brands_logos.json",
+    "path": "../../games/j_v1/packs/brands_logos.json",
+    "category": "Games (J V1)",
+    "type": "json"
+  },
+  {
+    "name": "candy_60s.json",
+    "path": "../../games/j_v1/packs/candy_60s.json",
+    "category": "Games (J V1)",
+    "type": "json"
+  },
+  {
+    "name": "cartoons_60s.json",
+    "path": "../../games/j_v1/packs/cartoons_60s.json",
+    "category": "Games (J V1)",
+    "type": "json"
+  },
+  {
+    "name": "cost_of_living.json",
+    "path": "../../games/j_v1/packs/cost_of_living.json",
+    "category": "Games (J V1)",
+    "type": "json"
+  },
+  {
+    "name": "cryptids.json",
+    "path": "../../games/j_v1/packs/cryptids.json",
+    "category": "Games (J V1)",
+    "type": "json"
+  },
+  {
+    "name": "cybersecurity.json",
+    "path": "../../games/j_v1/packs/cybersecurity.json",
+    "category": "Games (J V1)",
+    "type": "json"
+  },
+  {
+    "name": "flags_quiz.json",
+    "path": "../../games/j_v1/packs/flags_quiz.json",
+    "category": "Games (J V1)",
+    "type": "json"
+  },
+  {
+    "name": "food_v1.json",
+    "path": "../../games/j_v1/packs/food_v1.json",
+    "category": "Games (J V1)",
+    "type": "json"
+  },
+  {
+    "name": "geography_v1.json",
+    "path": "../../games/j_v1/packs/geography_v1.json",
+    "category": "Games (J V1)",
+    "type": "json"
+  },
+  {
+    "name": "history_v1.json",
+    "path": "../../games/j_v1/packs/history_v1.json",
+    "category": "Games (J V1)",
+    "type": "json"
+  },
+  {
+    "name": "human_body.json",
+    "path": "../../games/j_v1/packs/human_body.json",
+    "category": "Games (J V1)",
+    "type": "json"
+  },
+  {
+    "name": "internet_culture.json",
+    "path": "../../games/j_v1/packs/internet_culture.json",
+    "category": "Games (J V1)",
+    "type": "json"
+  },
+  {
+    "name": "language_v1.json",
+    "path": "../../games/j_v1/packs/language_v1.json",
+    "category": "Games (J V1)",
+    "type": "json"
+  },
+  {
+    "name": "literature_v1.json",
+    "path": "../../games/j_v1/packs/literature_v1.json",
+    "category": "Games (J V1)",
+    "type": "json"
+  },
+  {
+    "name": "logo_quiz.json",
+    "path": "../../games/j_v1/packs/logo_quiz.json",
+    "category": "Games (J V1)",
+    "type": "json"
+  },
+  {
+    "name": "manifest.json",
+    "path": "../../games/j_v1/packs/manifest.json",
+    "category": "Games (J V1)",
+    "type": "json"
+  },
+  {
+    "name": "math_v1.json",
+    "path": "../../games/j_v1/packs/math_v1.json",
+    "category": "Games (J V1)",
+    "type": "json"
+  },
+  {
+    "name": "modern_history.json",
+    "path": "../../games/j_v1/packs/modern_history.json",
+    "category": "Games (J V1)",
+    "type": "json"
+  },
+  {
+    "name": "movies_v1.json",
+    "path": "../../games/j_v1/packs/movies_v1.json",
+    "category": "Games (J V1)",
+    "type": "json"
+  },
+  {
+    "name": "music_60s.json",
+    "path": "../../games/j_v1/packs/music_60s.json",
+    "category": "Games (J V1)",
+    "type": "json"
+  },
+  {
+    "name": "music_70s.json",
+    "path": "../../games/j_v1/packs/music_70s.json",
+    "category": "Games (J V1)",
+    "type": "json"
+  },
+  {
+    "name": "music_80s.json",
+    "path": "../../games/j_v1/packs/music_80s.json",
+    "category": "Games (J V1)",
+    "type": "json"
+  },
+  {
+    "name": "music_90s.json",
+    "path": "../../games/j_v1/packs/music_90s.json",
+    "category": "Games (J V1)",
+    "type": "json"
+  },
+  {
+    "name": "music_v1.json",
+    "path": "../../games/j_v1/packs/music_v1.json",
+    "category": "Games (J V1)",
+    "type": "json"
+  },
+  {
+    "name": "mythology_v1.json",
+    "path": "../../games/j_v1/packs/mythology_v1.json",
+    "category": "Games (J V1)",
+    "type": "json"
+  },
+  {
+    "name": "ohio_space.json",
+    "path": "../../games/j_v1/packs/ohio_space.json",
+    "category": "Games (J V1)",
+    "type": "json"
+  },
+  {
+    "name": "ohio_sports.json",
+    "path": "../../games/j_v1/packs/ohio_sports.json",
+    "category": "Games (J V1)",
+    "type": "json"
+  },
+  {
+    "name": "ops_logistics.json",
+    "path": "../../games/j_v1/packs/ops_logistics.json",
+    "category": "Games (J V1)",
+    "type": "json"
+  },
+  {
+    "name": "pmi_pm.json",
+    "path": "../../games/j_v1/packs/pmi_pm.json",
+    "category": "Games (J V1)",
+    "type": "json"
+  },
+  {
+    "name": "popculture_v1.json",
+    "path": "../../games/j_v1/packs/popculture_v1.json",
+    "category": "Games (J V1)",
+    "type": "json"
+  },
+  {
+    "name": "public_domain.json",
+    "path": "../../games/j_v1/packs/public_domain.json",
+    "category": "Games (J V1)",
+    "type": "json"
+  },
+  {
+    "name": "rust_belt_rock.json",
+    "path": "../../games/j_v1/packs/rust_belt_rock.json",
+    "category": "Games (J V1)",
+    "type": "json"
+  },
+  {
+    "name": "science_v1.json",
+    "path": "../../games/j_v1/packs/science_v1.json",
+    "category": "Games (J V1)",
+    "type": "json"
+  },
+  {
+    "name": "space_v1.json",
+    "path": "../../games/j_v1/packs/space_v1.json",
+    "category": "Games (J V1)",
+    "type": "json"
+  },
+  {
+    "name": "sports_v1.json",
+    "path": "../../games/j_v1/packs/sports_v1.json",
+    "category": "Games (J V1)",
+    "type": "json"
+  },
+  {
+    "name": "sprunki_v1.json",
+    "path": "../../games/j_v1/packs/sprunki_v1.json",
+    "category": "Games (J V1)",
+    "type": "json"
+  },
+  {
+    "name": "technology_v1.json",
+    "path": "../../games/j_v1/packs/technology_v1.json",
+    "category": "Games (J V1)",
+    "type": "json"
+  },
+  {
+    "name": "true_crime.json",
+    "path": "../../games/j_v1/packs/true_crime.json",
+    "category": "Games (J V1)",
+    "type": "json"
+  },
+  {
+    "name": "videogames_v1.json",
+    "path": "../../games/j_v1/packs/videogames_v1.json",
+    "category": "Games (J V1)",
+    "type": "json"
+  },
+  {
+    "name": "vietnam_era.json",
+    "path": "../../games/j_v1/packs/vietnam_era.json",
+    "category": "Games (J V1)",
+    "type": "json"
+  },
+  {
+    "name": "xanadu_v1.json",
+    "path": "../../games/j_v1/packs/xanadu_v1.json",
+    "category": "Games (J V1)",
+    "type": "json"
+  },
+  {
+    "name": "AGENT.md",
+    "path": "../../games/jigsaw/AGENT.md",
+    "category": "Games (Jigsaw)",
+    "type": "md"
+  },
+  {
+    "name": "README.md",
+    "path": "../../games/jigsaw/README.md",
+    "category": "Games (Jigsaw)",
+    "type": "md"
+  },
+  {
+    "name": "index.html",
+    "path": "../../games/jigsaw/index.html",
+    "category": "Games (Jigsaw)",
+    "type": "html"
+  },
+  {
+    "name": "style.css",
+    "path": "../../games/jigsaw/css/style.css",
+    "category": "Games (Jigsaw)",
+    "type": "css"
+  },
+  {
+    "name": "app.js",
+    "path": "../../games/jigsaw/js/app.js",
+    "category": "Games (Jigsaw)",
+    "type": "js"
+  },
+  {
+    "name": "input.js",
+    "path": "../../games/jigsaw/js/input.js",
+    "category": "Games (Jigsaw)",
+    "type": "js"
+  },
+  {
+    "name": "puzzle.js",
+    "path": "../../games/jigsaw/js/puzzle.js",
+    "category": "Games (Jigsaw)",
+    "type": "js"
+  },
+  {
+    "name": "renderer.js",
+    "path": "../../games/jigsaw/js/renderer.js",
+    "category": "Games (Jigsaw)",
+    "type": "js"
+  },
+  {
+    "name": "storage.js",
+    "path": "../../games/jigsaw/js/storage.js",
+    "category": "Games (Jigsaw)",
+    "type": "js"
+  },
+  {
+    "name": "ENGINES.md",
+    "path": "../../games/lib/ENGINES.md",
+    "category": "Games (Lib)",
+    "type": "md"
+  },
+  {
+    "name": "LICENSE.txt",
+    "path": "../../games/lib/LICENSE.txt",
+    "category": "Games (Lib)",
+    "type": "txt"
+  },
+  {
+    "name": "StorageManager.js",
+    "path": "../../games/lib/StorageManager.js",
+    "category": "Games (Lib)",
+    "type": "js"
+  },
+  {
+    "name": "StorageManager.md",
+    "path": "../../games/lib/StorageManager.md",
+    "category": "Games (Lib)",
+    "type": "md"
+  },
+  {
+    "name": "html5-qrcode.min.js",
+    "path": "../../games/lib/html5-qrcode.min.js",
+    "category": "Games (Lib)",
+    "type": "js"
+  },
+  {
+    "name": "qr-master.js",
+    "path": "../../games/lib/qr-master.js",
+    "category": "Games (Lib)",
+    "type": "js"
+  },
+  {
+    "name": "qrcode.min.js",
+    "path": "../../games/lib/qrcode.min.js",
+    "category": "Games (Lib)",
+    "type": "js"
+  },
+  {
+    "name": "AGENT.md",
+    "path": "../../games/mahjong/AGENT.md",
+    "category": "Games (Mahjong)",
+    "type": "md"
+  },
+  {
+    "name": "README.md",
+    "path": "../../games/mahjong/README.md",
+    "category": "Games (Mahjong)",
+    "type": "md"
+  },
+  {
+    "name": "index.html",
+    "path": "../../games/mahjong/index.html",
+    "category": "Games (Mahjong)",
+    "type": "html"
+  },
+  {
+    "name": "style.css",
+    "path": "../../games/mahjong/css/style.css",
+    "category": "Games (Mahjong)",
+    "type": "css"
+  },
+  {
+    "name": "board.js",
+    "path": "../../games/mahjong/js/board.js",
+    "category": "Games (Mahjong)",
+    "type": "js"
+  },
+  {
+    "name": "data.js",
+    "path": "../../games/mahjong/js/data.js",
+    "category": "Games (Mahjong)",
+    "type": "js"
+  },
+  {
+    "name": "game.js",
+    "path": "../../games/mahjong/js/game.js",
+    "category": "Games (Mahjong)",
+    "type": "js"
+  },
+  {
+    "name": "tile.js",
+    "path": "../../games/mahjong/js/tile.js",
+    "category": "Games (Mahjong)",
+    "type": "js"
+  },
+  {
+    "name": "index.html",
+    "path": "../../games/minesweeper/index.html",
+    "category": "Games (Minesweeper)",
+    "type": "html"
+  },
+  {
+    "name": "script.js",
+    "path": "../../games/minesweeper/script.js",
+    "category": "Games (Minesweeper)",
+    "type": "js"
+  },
+  {
+    "name": "style.css",
+    "path": "../../games/minesweeper/style.css",
+    "category": "Games (Minesweeper)",
+    "type": "css"
+  },
+  {
+    "name": "AGENT.md",
+    "path": "../../games/pong/AGENT.md",
+    "category": "Games (Pong)",
+    "type": "md"
+  },
+  {
+    "name": "MANUAL.md",
+    "path": "../../games/pong/MANUAL.md",
+    "category": "Games (Pong)",
+    "type": "md"
+  },
+  {
+    "name": "README.md",
+    "path": "../../games/pong/README.md",
+    "category": "Games (Pong)",
+    "type": "md"
+  },
+  {
+    "name": "TECHNICAL.md",
+    "path": "../../games/pong/TECHNICAL.md",
+    "category": "Games (Pong)",
+    "type": "md"
+  },
+  {
+    "name": "index.html",
+    "path": "../../games/pong/index.html",
+    "category": "Games (Pong)",
+    "type": "html"
+  },
+  {
+    "name": "PongScene.js",
+    "path": "../../games/pong/js/PongScene.js",
+    "category": "Games (Pong)",
+    "type": "js"
+  },
+  {
+    "name": "main.js",
+    "path": "../../games/pong/js/main.js",
+    "category": "Games (Pong)",
+    "type": "js"
+  },
+  {
+    "name": "AGENT.md",
+    "path": "../../games/puzzller/AGENT.md",
+    "category": "Games (Puzzller)",
+    "type": "md"
+  },
+  {
+    "name": "README.md",
+    "path": "../../games/puzzller/README.md",
+    "category": "Games (Puzzller)",
+    "type": "md"
+  },
+  {
+    "name": "index.html",
+    "path": "../../games/puzzller/index.html",
+    "category": "Games (Puzzller)",
+    "type": "html"
+  },
+  {
+    "name": "style.css",
+    "path": "../../games/puzzller/style.css",
+    "category": "Games (Puzzller)",
+    "type": "css"
+  },
+  {
+    "name": "game.js",
+    "path": "../../games/puzzller/js/game.js",
+    "category": "Games (Puzzller)",
+    "type": "js"
+  },
+  {
+    "name": "input.js",
+    "path": "../../games/puzzller/js/input.js",
+    "category": "Games (Puzzller)",
+    "type": "js"
+  },
+  {
+    "name": "levelLoader.js",
+    "path": "../../games/puzzller/js/levelLoader.js",
+    "category": "Games (Puzzller)",
+    "type": "js"
   },
   {
-    "name": "start_server.sh",
-    "path": "../../games/sprunki/start_server.sh",
-    "category": "Games (Sprunki)",
-    "type": "sh"
+    "name": "levels.js",
+    "path": "../../games/puzzller/js/levels.js",
+    "category": "Games (Puzzller)",
+    "type": "js"
   },
   {
-    "name": "index.html",
-    "path": "../../games/sprunki/assets/unassigned/index.html",
-    "category": "Games (Sprunki)",
-    "type": "html"
+    "name": "main.js",
+    "path": "../../games/puzzller/js/main.js",
+    "category": "Games (Puzzller)",
+    "type": "js"
   },
   {
-    "name": "sprunki_mixer.html",
-    "path": "../../games/sprunki/assets/unassigned/sprunki_mixer.html",
-    "category": "Games (Sprunki)",
-    "type": "html"
+    "name": "renderer.js",
+    "path": "../../games/puzzller/js/renderer.js",
+    "category": "Games (Puzzller)",
+    "type": "js"
   },
   {
-    "name": "project.json",
-    "path": "../../games/sprunki/assets/unassigned/project.json",
-    "category": "Games (Sprunki)",
-    "type": "json"
+    "name": "AGENT.md",
+    "path": "../../games/sky_breakers/AGENT.md",
+    "category": "Games (Sky Breakers)",
+    "type": "md"
   },
   {
-    "name": "data-manager.js",
-    "path": "../../games/sprunki/js/data-manager.js",
-    "category": "Games (Sprunki)",
-    "type": "js"
+    "name": "MANUAL.md",
+    "path": "../../games/sky_breakers/MANUAL.md",
+    "category": "Games (Sky Breakers)",
+    "type": "md"
   },
   {
-    "name": "qr-manager.js",
-    "path": "../../games/sprunki/js/qr-manager.js",
-    "category": "Games (Sprunki)",
-    "type": "js"
+    "name": "README.md",
+    "path": "../../games/sky_breakers/README.md",
+    "category": "Games (Sky Breakers)",
+    "type": "md"
   },
   {
-    "name": "app.js",
-    "path": "../../games/sprunki/js/app.js",
-    "category": "Games (Sprunki)",
+    "name": "SkyScene.js",
+    "path": "../../games/sky_breakers/SkyScene.js",
+    "category": "Games (Sky Breakers)",
     "type": "js"
   },
   {
-    "name": "editor.js",
-    "path": "../../games/sprunki/js/editor.js",
-    "category": "Games (Sprunki)",
+    "name": "TECHNICAL.md",
+    "path": "../../games/sky_breakers/TECHNICAL.md",
+    "category": "Games (Sky Breakers)",
+    "type": "md"
+  },
+  {
+    "name": "index.html",
+    "path": "../../games/sky_breakers/index.html",
+    "category": "Games (Sky Breakers)",
+    "type": "html"
+  },
+  {
+    "name": "main.js",
+    "path": "../../games/sky_breakers/main.js",
+    "category": "Games (Sky Breakers)",
     "type": "js"
   },
   {
-    "name": "style.css",
-    "path": "../../games/sprunki/css/style.css",
-    "category": "Games (Sprunki)",
-    "type": "css"
+    "name": "AGENT.md",
+    "path": "../../games/slots/AGENT.md",
+    "category": "Games (Slots)",
+    "type": "md"
+  },
+  {
+    "name": "README.md",
+    "path": "../../games/slots/README.md",
+    "category": "Games (Slots)",
+    "type": "md"
   },
   {
     "name": "index.html",
@@ -415,10 +2509,10 @@ var REPO_FILES = [
     "type": "html"
   },
   {
-    "name": "slots_audio.js",
-    "path": "../../games/slots/js/slots_audio.js",
+    "name": "slots.css",
+    "path": "../../games/slots/css/slots.css",
     "category": "Games (Slots)",
-    "type": "js"
+    "type": "css"
   },
   {
     "name": "slots.js",
@@ -427,22 +2521,22 @@ var REPO_FILES = [
     "type": "js"
   },
   {
-    "name": "themes.js",
-    "path": "../../games/slots/js/themes.js",
+    "name": "slots_audio.js",
+    "path": "../../games/slots/js/slots_audio.js",
     "category": "Games (Slots)",
     "type": "js"
   },
   {
-    "name": "slots.css",
-    "path": "../../games/slots/css/slots.css",
+    "name": "themes.js",
+    "path": "../../games/slots/js/themes.js",
     "category": "Games (Slots)",
-    "type": "css"
+    "type": "js"
   },
   {
-    "name": "index.html",
-    "path": "../../games/snake/index.html",
+    "name": "AGENT.md",
+    "path": "../../games/snake/AGENT.md",
     "category": "Games (Snake)",
-    "type": "html"
+    "type": "md"
   },
   {
     "name": "LL_v1_snake.md",
@@ -456,12 +2550,30 @@ var REPO_FILES = [
     "category": "Games (Snake)",
     "type": "md"
   },
+  {
+    "name": "README.md",
+    "path": "../../games/snake/README.md",
+    "category": "Games (Snake)",
+    "type": "md"
+  },
+  {
+    "name": "index.html",
+    "path": "../../games/snake/index.html",
+    "category": "Games (Snake)",
+    "type": "html"
+  },
   {
     "name": "index.html",
     "path": "../../games/snake/negen_version/index.html",
     "category": "Games (Snake)",
     "type": "html"
   },
+  {
+    "name": "BattleRoyaleScene.js",
+    "path": "../../games/snake/negen_version/js/BattleRoyaleScene.js",
+    "category": "Games (Snake)",
+    "type": "js"
+  },
   {
     "name": "SnakeScene.js",
     "path": "../../games/snake/negen_version/js/SnakeScene.js",
@@ -475,10 +2587,28 @@ var REPO_FILES = [
     "type": "js"
   },
   {
-    "name": "BattleRoyaleScene.js",
-    "path": "../../games/snake/negen_version/js/BattleRoyaleScene.js",
-    "category": "Games (Snake)",
-    "type": "js"
+    "name": "AGENT.md",
+    "path": "../../games/space_invaders/AGENT.md",
+    "category": "Games (Space Invaders)",
+    "type": "md"
+  },
+  {
+    "name": "MANUAL.md",
+    "path": "../../games/space_invaders/MANUAL.md",
+    "category": "Games (Space Invaders)",
+    "type": "md"
+  },
+  {
+    "name": "README.md",
+    "path": "../../games/space_invaders/README.md",
+    "category": "Games (Space Invaders)",
+    "type": "md"
+  },
+  {
+    "name": "TECHNICAL.md",
+    "path": "../../games/space_invaders/TECHNICAL.md",
+    "category": "Games (Space Invaders)",
+    "type": "md"
   },
   {
     "name": "index.html",
@@ -487,40 +2617,178 @@ var REPO_FILES = [
     "type": "html"
   },
   {
-    "name": "TECHNICAL.md",
-    "path": "../../games/space_invaders/TECHNICAL.md",
-    "category": "Games (Space Invaders)",
+    "name": "BuilderScene.js",
+    "path": "../../games/space_invaders/js/BuilderScene.js",
+    "category": "Games (Space Invaders)",
+    "type": "js"
+  },
+  {
+    "name": "InvadersScene.js",
+    "path": "../../games/space_invaders/js/InvadersScene.js",
+    "category": "Games (Space Invaders)",
+    "type": "js"
+  },
+  {
+    "name": "MenuScene.js",
+    "path": "../../games/space_invaders/js/MenuScene.js",
+    "category": "Games (Space Invaders)",
+    "type": "js"
+  },
+  {
+    "name": "main.js",
+    "path": "../../games/space_invaders/js/main.js",
+    "category": "Games (Space Invaders)",
+    "type": "js"
+  },
+  {
+    "name": "README.md",
+    "path": "../../games/sprunki/README.md",
+    "category": "Games (Sprunki)",
+    "type": "md"
+  },
+  {
+    "name": "config.json",
+    "path": "../../games/sprunki/config.json",
+    "category": "Games (Sprunki)",
+    "type": "json"
+  },
+  {
+    "name": "index.html",
+    "path": "../../games/sprunki/index.html",
+    "category": "Games (Sprunki)",
+    "type": "html"
+  },
+  {
+    "name": "start_server.bat",
+    "path": "../../games/sprunki/start_server.bat",
+    "category": "Games (Sprunki)",
+    "type": "bat"
+  },
+  {
+    "name": "start_server.sh",
+    "path": "../../games/sprunki/start_server.sh",
+    "category": "Games (Sprunki)",
+    "type": "sh"
+  },
+  {
+    "name": "index.html",
+    "path": "../../games/sprunki/assets/unassigned/index.html",
+    "category": "Games (Sprunki)",
+    "type": "html"
+  },
+  {
+    "name": "project.json",
+    "path": "../../games/sprunki/assets/unassigned/project.json",
+    "category": "Games (Sprunki)",
+    "type": "json"
+  },
+  {
+    "name": "sprunki_mixer.html",
+    "path": "../../games/sprunki/assets/unassigned/sprunki_mixer.html",
+    "category": "Games (Sprunki)",
+    "type": "html"
+  },
+  {
+    "name": "style.css",
+    "path": "../../games/sprunki/css/style.css",
+    "category": "Games (Sprunki)",
+    "type": "css"
+  },
+  {
+    "name": "app.js",
+    "path": "../../games/sprunki/js/app.js",
+    "category": "Games (Sprunki)",
+    "type": "js"
+  },
+  {
+    "name": "data-manager.js",
+    "path": "../../games/sprunki/js/data-manager.js",
+    "category": "Games (Sprunki)",
+    "type": "js"
+  },
+  {
+    "name": "editor.js",
+    "path": "../../games/sprunki/js/editor.js",
+    "category": "Games (Sprunki)",
+    "type": "js"
+  },
+  {
+    "name": "qr-manager.js",
+    "path": "../../games/sprunki/js/qr-manager.js",
+    "category": "Games (Sprunki)",
+    "type": "js"
+  },
+  {
+    "name": "AGENT.md",
+    "path": "../../games/sudoku/AGENT.md",
+    "category": "Games (Sudoku)",
+    "type": "md"
+  },
+  {
+    "name": "ARCHITECTURE.md",
+    "path": "../../games/sudoku/ARCHITECTURE.md",
+    "category": "Games (Sudoku)",
+    "type": "md"
+  },
+  {
+    "name": "CHANGELOG.md",
+    "path": "../../games/sudoku/CHANGELOG.md",
+    "category": "Games (Sudoku)",
+    "type": "md"
+  },
+  {
+    "name": "INFO.md",
+    "path": "../../games/sudoku/INFO.md",
+    "category": "Games (Sudoku)",
+    "type": "md"
+  },
+  {
+    "name": "README.md",
+    "path": "../../games/sudoku/README.md",
+    "category": "Games (Sudoku)",
     "type": "md"
   },
   {
-    "name": "MANUAL.md",
-    "path": "../../games/space_invaders/MANUAL.md",
-    "category": "Games (Space Invaders)",
+    "name": "TODO.md",
+    "path": "../../games/sudoku/TODO.md",
+    "category": "Games (Sudoku)",
     "type": "md"
   },
   {
-    "name": "InvadersScene.js",
-    "path": "../../games/space_invaders/js/InvadersScene.js",
-    "category": "Games (Space Invaders)",
-    "type": "js"
+    "name": "index.html",
+    "path": "../../games/sudoku/index.html",
+    "category": "Games (Sudoku)",
+    "type": "html"
   },
   {
-    "name": "BuilderScene.js",
-    "path": "../../games/space_invaders/js/BuilderScene.js",
-    "category": "Games (Space Invaders)",
+    "name": "script.js",
+    "path": "../../games/sudoku/script.js",
+    "category": "Games (Sudoku)",
     "type": "js"
   },
   {
-    "name": "main.js",
-    "path": "../../games/space_invaders/js/main.js",
-    "category": "Games (Space Invaders)",
-    "type": "js"
+    "name": "style.css",
+    "path": "../../games/sudoku/style.css",
+    "category": "Games (Sudoku)",
+    "type": "css"
   },
   {
-    "name": "index.html",
-    "path": "../../games/tracing/index.html",
+    "name": "AGENT.md",
+    "path": "../../games/tracing/AGENT.md",
     "category": "Games (Tracing)",
-    "type": "html"
+    "type": "md"
+  },
+  {
+    "name": "MANUAL.md",
+    "path": "../../games/tracing/MANUAL.md",
+    "category": "Games (Tracing)",
+    "type": "md"
+  },
+  {
+    "name": "README.md",
+    "path": "../../games/tracing/README.md",
+    "category": "Games (Tracing)",
+    "type": "md"
   },
   {
     "name": "TECHNICAL.md",
@@ -529,53 +2797,83 @@ var REPO_FILES = [
     "type": "md"
   },
   {
-    "name": "MANUAL.md",
-    "path": "../../games/tracing/MANUAL.md",
+    "name": "index.html",
+    "path": "../../games/tracing/index.html",
     "category": "Games (Tracing)",
-    "type": "md"
+    "type": "html"
   },
   {
     "name": "index.html",
-    "path": "../../games/tracing/words/index.html",
+    "path": "../../games/tracing/chinese/index.html",
     "category": "Games (Tracing)",
     "type": "html"
   },
   {
-    "name": "script.css",
-    "path": "../../games/tracing/words/script.css",
+    "name": "style.css",
+    "path": "../../games/tracing/chinese/css/style.css",
     "category": "Games (Tracing)",
     "type": "css"
   },
   {
-    "name": "word_list.json",
-    "path": "../../games/tracing/words/data/word_list.json",
+    "name": "characters.json",
+    "path": "../../games/tracing/chinese/data/characters.json",
     "category": "Games (Tracing)",
     "type": "json"
   },
   {
-    "name": "words.js",
-    "path": "../../games/tracing/words/js/words.js",
+    "name": "stroke-types.json",
+    "path": "../../games/tracing/chinese/data/stroke-types.json",
     "category": "Games (Tracing)",
-    "type": "js"
+    "type": "json"
   },
   {
     "name": "game.js",
-    "path": "../../games/tracing/words/js/game.js",
+    "path": "../../games/tracing/chinese/js/game.js",
     "category": "Games (Tracing)",
     "type": "js"
   },
+  {
+    "name": "LETTER_FIXES_CHANGELOG.md",
+    "path": "../../games/tracing/letters/LETTER_FIXES_CHANGELOG.md",
+    "category": "Games (Tracing)",
+    "type": "md"
+  },
+  {
+    "name": "index.html",
+    "path": "../../games/tracing/letters/index.html",
+    "category": "Games (Tracing)",
+    "type": "html"
+  },
+  {
+    "name": "README.md",
+    "path": "../../games/tracing/letters/assets/images/README.md",
+    "category": "Games (Tracing)",
+    "type": "md"
+  },
   {
     "name": "style.css",
-    "path": "../../games/tracing/words/css/style.css",
+    "path": "../../games/tracing/letters/css/style.css",
     "category": "Games (Tracing)",
     "type": "css"
   },
+  {
+    "name": "game.js",
+    "path": "../../games/tracing/letters/js/game.js",
+    "category": "Games (Tracing)",
+    "type": "js"
+  },
   {
     "name": "index.html",
     "path": "../../games/tracing/sentences/index.html",
     "category": "Games (Tracing)",
     "type": "html"
   },
+  {
+    "name": "style.css",
+    "path": "../../games/tracing/sentences/css/style.css",
+    "category": "Games (Tracing)",
+    "type": "css"
+  },
   {
     "name": "sentences.json",
     "path": "../../games/tracing/sentences/data/sentences.json",
@@ -589,1665 +2887,1755 @@ var REPO_FILES = [
     "type": "js"
   },
   {
-    "name": "style.css",
-    "path": "../../games/tracing/sentences/css/style.css",
+    "name": "index.html",
+    "path": "../../games/tracing/words/index.html",
     "category": "Games (Tracing)",
-    "type": "css"
+    "type": "html"
   },
   {
-    "name": "index.html",
-    "path": "../../games/tracing/chinese/index.html",
+    "name": "script.css",
+    "path": "../../games/tracing/words/script.css",
     "category": "Games (Tracing)",
-    "type": "html"
+    "type": "css"
   },
   {
-    "name": "stroke-types.json",
-    "path": "../../games/tracing/chinese/data/stroke-types.json",
+    "name": "style.css",
+    "path": "../../games/tracing/words/css/style.css",
     "category": "Games (Tracing)",
-    "type": "json"
+    "type": "css"
   },
   {
-    "name": "characters.json",
-    "path": "../../games/tracing/chinese/data/characters.json",
+    "name": "word_list.json",
+    "path": "../../games/tracing/words/data/word_list.json",
     "category": "Games (Tracing)",
     "type": "json"
   },
   {
     "name": "game.js",
-    "path": "../../games/tracing/chinese/js/game.js",
+    "path": "../../games/tracing/words/js/game.js",
     "category": "Games (Tracing)",
     "type": "js"
   },
   {
-    "name": "style.css",
-    "path": "../../games/tracing/chinese/css/style.css",
-    "category": "Games (Tracing)",
-    "type": "css"
-  },
-  {
-    "name": "index.html",
-    "path": "../../games/tracing/letters/index.html",
+    "name": "words.js",
+    "path": "../../games/tracing/words/js/words.js",
     "category": "Games (Tracing)",
-    "type": "html"
+    "type": "js"
   },
   {
-    "name": "LETTER_FIXES_CHANGELOG.md",
-    "path": "../../games/tracing/letters/LETTER_FIXES_CHANGELOG.md",
-    "category": "Games (Tracing)",
+    "name": "AGENT.md",
+    "path": "../../games/xtc_ball/AGENT.md",
+    "category": "Games (Xtc Ball)",
     "type": "md"
   },
   {
-    "name": "CLAUDE.md",
-    "path": "../../games/tracing/letters/CLAUDE.md",
-    "category": "Games (Tracing)",
+    "name": "LL_v5_XTCBALL.md",
+    "path": "../../games/xtc_ball/LL_v5_XTCBALL.md",
+    "category": "Games (Xtc Ball)",
     "type": "md"
   },
   {
     "name": "README.md",
-    "path": "../../games/tracing/letters/assets/images/README.md",
-    "category": "Games (Tracing)",
+    "path": "../../games/xtc_ball/README.md",
+    "category": "Games (Xtc Ball)",
     "type": "md"
   },
   {
-    "name": "game.js",
-    "path": "../../games/tracing/letters/js/game.js",
-    "category": "Games (Tracing)",
-    "type": "js"
+    "name": "index.html",
+    "path": "../../games/xtc_ball/index.html",
+    "category": "Games (Xtc Ball)",
+    "type": "html"
   },
   {
     "name": "style.css",
-    "path": "../../games/tracing/letters/css/style.css",
-    "category": "Games (Tracing)",
+    "path": "../../games/xtc_ball/css/style.css",
+    "category": "Games (Xtc Ball)",
     "type": "css"
   },
   {
-    "name": "index.html",
-    "path": "../../games/breakout/index.html",
-    "category": "Games (Breakout)",
-    "type": "html"
+    "name": "config.js",
+    "path": "../../games/xtc_ball/js/config.js",
+    "category": "Games (Xtc Ball)",
+    "type": "js"
   },
   {
-    "name": "TECHNICAL.md",
-    "path": "../../games/breakout/TECHNICAL.md",
-    "category": "Games (Breakout)",
-    "type": "md"
+    "name": "game.js",
+    "path": "../../games/xtc_ball/js/game.js",
+    "category": "Games (Xtc Ball)",
+    "type": "js"
   },
   {
-    "name": "MANUAL.md",
-    "path": "../../games/breakout/MANUAL.md",
-    "category": "Games (Breakout)",
-    "type": "md"
+    "name": "sound.js",
+    "path": "../../games/xtc_ball/js/sound.js",
+    "category": "Games (Xtc Ball)",
+    "type": "js"
   },
   {
-    "name": "BuilderScene.js",
-    "path": "../../games/breakout/js/BuilderScene.js",
-    "category": "Games (Breakout)",
+    "name": "about_data.js",
+    "path": "../../js/about_data.js",
+    "category": "Js",
     "type": "js"
   },
   {
-    "name": "LevelManager.js",
-    "path": "../../games/breakout/js/LevelManager.js",
-    "category": "Games (Breakout)",
+    "name": "about_logic.js",
+    "path": "../../js/about_logic.js",
+    "category": "Js",
     "type": "js"
   },
   {
-    "name": "main.js",
-    "path": "../../games/breakout/js/main.js",
-    "category": "Games (Breakout)",
+    "name": "catalog.js",
+    "path": "../../js/catalog.js",
+    "category": "Js",
     "type": "js"
   },
   {
-    "name": "BreakoutScene.js",
-    "path": "../../games/breakout/js/BreakoutScene.js",
-    "category": "Games (Breakout)",
+    "name": "daily-loader.js",
+    "path": "../../js/daily-loader.js",
+    "category": "Js",
     "type": "js"
   },
   {
-    "name": "index.html",
-    "path": "../../games/pong/index.html",
-    "category": "Games (Pong)",
-    "type": "html"
+    "name": "hub-data.js",
+    "path": "../../js/hub-data.js",
+    "category": "Js",
+    "type": "js"
   },
   {
-    "name": "TECHNICAL.md",
-    "path": "../../games/pong/TECHNICAL.md",
-    "category": "Games (Pong)",
+    "name": "hub-filters.js",
+    "path": "../../js/hub-filters.js",
+    "category": "Js",
+    "type": "js"
+  },
+  {
+    "name": "manifest.json",
+    "path": "../../js/manifest.json",
+    "category": "Js",
+    "type": "json"
+  },
+  {
+    "name": "play-counter.js",
+    "path": "../../js/play-counter.js",
+    "category": "Js",
+    "type": "js"
+  },
+  {
+    "name": "projects.js",
+    "path": "../../js/projects.js",
+    "category": "Projects",
+    "type": "js"
+  },
+  {
+    "name": "DATA_POLICY.md",
+    "path": "../../legal/DATA_POLICY.md",
+    "category": "Legal",
+    "type": "md"
+  },
+  {
+    "name": "MSA.md",
+    "path": "../../legal/MSA.md",
+    "category": "Legal",
+    "type": "md"
+  },
+  {
+    "name": "PRIVACY_POLICY.md",
+    "path": "../../legal/PRIVACY_POLICY.md",
+    "category": "Legal",
+    "type": "md"
+  },
+  {
+    "name": "README.md",
+    "path": "../../legal/README.md",
+    "category": "Legal",
+    "type": "md"
+  },
+  {
+    "name": "TERMS_OF_USE.md",
+    "path": "../../legal/TERMS_OF_USE.md",
+    "category": "Legal",
+    "type": "md"
+  },
+  {
+    "name": "README.md",
+    "path": "../../music/README.md",
+    "category": "Music",
+    "type": "md"
+  },
+  {
+    "name": "ARCADE_ROADMAP.md",
+    "path": "../../negen/ARCADE_ROADMAP.md",
+    "category": "Negen",
+    "type": "md"
+  },
+  {
+    "name": "NEGEN_PLAN.md",
+    "path": "../../negen/NEGEN_PLAN.md",
+    "category": "Negen",
     "type": "md"
   },
   {
-    "name": "MANUAL.md",
-    "path": "../../games/pong/MANUAL.md",
-    "category": "Games (Pong)",
+    "name": "OVERHAUL_PLAN.md",
+    "path": "../../negen/OVERHAUL_PLAN.md",
+    "category": "Negen",
     "type": "md"
   },
   {
-    "name": "PongScene.js",
-    "path": "../../games/pong/js/PongScene.js",
-    "category": "Games (Pong)",
-    "type": "js"
+    "name": "PHASE_2_SPECS.md",
+    "path": "../../negen/PHASE_2_SPECS.md",
+    "category": "Negen",
+    "type": "md"
   },
   {
-    "name": "main.js",
-    "path": "../../games/pong/js/main.js",
-    "category": "Games (Pong)",
-    "type": "js"
+    "name": "PHASE_3_PLAN.md",
+    "path": "../../negen/PHASE_3_PLAN.md",
+    "category": "Negen",
+    "type": "md"
   },
   {
-    "name": "index.html",
-    "path": "../../games/xtc_ball/index.html",
-    "category": "Games (Xtc Ball)",
-    "type": "html"
+    "name": "PHASE_4_PLAN.md",
+    "path": "../../negen/PHASE_4_PLAN.md",
+    "category": "Negen",
+    "type": "md"
   },
   {
-    "name": "LL_v5_XTCBALL.md",
-    "path": "../../games/xtc_ball/LL_v5_XTCBALL.md",
-    "category": "Games (Xtc Ball)",
+    "name": "PHASE_5_PLAN.md",
+    "path": "../../negen/PHASE_5_PLAN.md",
+    "category": "Negen",
     "type": "md"
   },
   {
-    "name": "config.js",
-    "path": "../../games/xtc_ball/js/config.js",
-    "category": "Games (Xtc Ball)",
-    "type": "js"
+    "name": "PROGRESS.md",
+    "path": "../../negen/PROGRESS.md",
+    "category": "Negen",
+    "type": "md"
   },
   {
-    "name": "game.js",
-    "path": "../../games/xtc_ball/js/game.js",
-    "category": "Games (Xtc Ball)",
-    "type": "js"
+    "name": "README.md",
+    "path": "../../negen/README.md",
+    "category": "Negen",
+    "type": "md"
   },
   {
-    "name": "sound.js",
-    "path": "../../games/xtc_ball/js/sound.js",
-    "category": "Games (Xtc Ball)",
+    "name": "index.js",
+    "path": "../../negen/index.js",
+    "category": "Negen",
     "type": "js"
   },
   {
     "name": "style.css",
-    "path": "../../games/xtc_ball/css/style.css",
-    "category": "Games (Xtc Ball)",
+    "path": "../../negen/style.css",
+    "category": "Negen",
     "type": "css"
   },
   {
-    "name": "test_ruleset.html",
-    "path": "../../games/cards/test_ruleset.html",
-    "category": "Games (Cards)",
-    "type": "html"
+    "name": "AssetLoader.js",
+    "path": "../../negen/assets/AssetLoader.js",
+    "category": "Negen",
+    "type": "js"
   },
   {
-    "name": "index.html",
-    "path": "../../games/cards/index.html",
-    "category": "Games (Cards)",
-    "type": "html"
+    "name": "AudioManager.js",
+    "path": "../../negen/audio/AudioManager.js",
+    "category": "Negen",
+    "type": "js"
   },
   {
-    "name": "card-assets.js",
-    "path": "../../games/cards/card-assets.js",
-    "category": "Games (Cards)",
+    "name": "Synthesizer.js",
+    "path": "../../negen/audio/Synthesizer.js",
+    "category": "Negen",
     "type": "js"
   },
   {
-    "name": "changelog.md",
-    "path": "../../games/cards/changelog.md",
-    "category": "Games (Cards)",
-    "type": "md"
+    "name": "Card.js",
+    "path": "../../negen/cards/Card.js",
+    "category": "Negen",
+    "type": "js"
   },
   {
-    "name": "test-suite.html",
-    "path": "../../games/cards/test-suite.html",
-    "category": "Games (Cards)",
-    "type": "html"
+    "name": "CardGame.js",
+    "path": "../../negen/cards/CardGame.js",
+    "category": "Negen",
+    "type": "js"
   },
   {
-    "name": "test.html",
-    "path": "../../games/cards/test.html",
-    "category": "Games (Cards)",
-    "type": "html"
+    "name": "Deck.js",
+    "path": "../../negen/cards/Deck.js",
+    "category": "Negen",
+    "type": "js"
   },
   {
-    "name": "index.html",
-    "path": "../../games/cards/poker/index.html",
-    "category": "Games (Cards)",
-    "type": "html"
+    "name": "Evaluator.js",
+    "path": "../../negen/cards/Evaluator.js",
+    "category": "Negen",
+    "type": "js"
   },
   {
-    "name": "index.html",
-    "path": "../../games/cards/poker/13card/index.html",
-    "category": "Games (Cards)",
-    "type": "html"
+    "name": "INFO.md",
+    "path": "../../negen/cards/INFO.md",
+    "category": "Negen",
+    "type": "md"
   },
   {
-    "name": "ThirteenCard.js",
-    "path": "../../games/cards/poker/13card/ThirteenCard.js",
-    "category": "Games (Cards)",
+    "name": "Pile.js",
+    "path": "../../negen/cards/Pile.js",
+    "category": "Negen",
     "type": "js"
   },
   {
-    "name": "TECHNICAL.md",
-    "path": "../../games/cards/poker/13card/TECHNICAL.md",
-    "category": "Games (Cards)",
-    "type": "md"
+    "name": "enums.js",
+    "path": "../../negen/cards/enums.js",
+    "category": "Negen",
+    "type": "js"
   },
   {
-    "name": "MANUAL.md",
-    "path": "../../games/cards/poker/13card/MANUAL.md",
-    "category": "Games (Cards)",
-    "type": "md"
+    "name": "Engine.js",
+    "path": "../../negen/core/Engine.js",
+    "category": "Negen",
+    "type": "js"
   },
   {
-    "name": "index.html",
-    "path": "../../games/cards/poker/5card/index.html",
-    "category": "Games (Cards)",
-    "type": "html"
+    "name": "Entity.js",
+    "path": "../../negen/core/Entity.js",
+    "category": "Negen",
+    "type": "js"
   },
   {
-    "name": "ruleset.js",
-    "path": "../../games/cards/poker/5card/ruleset.js",
-    "category": "Games (Cards)",
+    "name": "Scene.js",
+    "path": "../../negen/core/Scene.js",
+    "category": "Negen",
     "type": "js"
   },
   {
-    "name": "TECHNICAL.md",
-    "path": "../../games/cards/poker/5card/TECHNICAL.md",
-    "category": "Games (Cards)",
-    "type": "md"
+    "name": "Card.js",
+    "path": "../../negen/entities/Card.js",
+    "category": "Negen",
+    "type": "js"
   },
   {
-    "name": "MANUAL.md",
-    "path": "../../games/cards/poker/5card/MANUAL.md",
-    "category": "Games (Cards)",
-    "type": "md"
+    "name": "CanvasRenderer.js",
+    "path": "../../negen/graphics/CanvasRenderer.js",
+    "category": "Negen",
+    "type": "js"
   },
   {
-    "name": "five_card_draw.js",
-    "path": "../../games/cards/poker/5card/five_card_draw.js",
-    "category": "Games (Cards)",
+    "name": "ParticleSystem.js",
+    "path": "../../negen/graphics/ParticleSystem.js",
+    "category": "Negen",
     "type": "js"
   },
   {
-    "name": "index.html",
-    "path": "../../games/cards/poker/holdem/index.html",
-    "category": "Games (Cards)",
-    "type": "html"
+    "name": "Renderer.js",
+    "path": "../../negen/graphics/Renderer.js",
+    "category": "Negen",
+    "type": "js"
   },
   {
-    "name": "TexasHoldem.js",
-    "path": "../../games/cards/poker/holdem/TexasHoldem.js",
-    "category": "Games (Cards)",
+    "name": "InputManager.js",
+    "path": "../../negen/input/InputManager.js",
+    "category": "Negen",
     "type": "js"
   },
   {
-    "name": "TECHNICAL.md",
-    "path": "../../games/cards/poker/holdem/TECHNICAL.md",
-    "category": "Games (Cards)",
-    "type": "md"
+    "name": "ControlOverlay.js",
+    "path": "../../negen/ui/ControlOverlay.js",
+    "category": "Negen",
+    "type": "js"
   },
   {
-    "name": "MANUAL.md",
-    "path": "../../games/cards/poker/holdem/MANUAL.md",
-    "category": "Games (Cards)",
-    "type": "md"
+    "name": "MathUtils.js",
+    "path": "../../negen/utils/MathUtils.js",
+    "category": "Negen",
+    "type": "js"
   },
   {
-    "name": "BasePokerGame.js",
-    "path": "../../games/cards/poker/shared/BasePokerGame.js",
-    "category": "Games (Cards)",
+    "name": "Physics.js",
+    "path": "../../negen/utils/Physics.js",
+    "category": "Negen",
     "type": "js"
   },
   {
-    "name": "evaluator.js",
-    "path": "../../games/cards/poker/shared/evaluator.js",
-    "category": "Games (Cards)",
+    "name": "Timer.js",
+    "path": "../../negen/utils/Timer.js",
+    "category": "Negen",
     "type": "js"
   },
   {
-    "name": "index.html",
-    "path": "../../games/cards/blackjack/index.html",
-    "category": "Games (Cards)",
+    "name": "phase2_test.html",
+    "path": "../../negen/verification/phase2_test.html",
+    "category": "Negen",
     "type": "html"
   },
   {
-    "name": "INFO.md",
-    "path": "../../games/cards/blackjack/INFO.md",
-    "category": "Games (Cards)",
+    "name": "README.md",
+    "path": "../../network/README.md",
+    "category": "Network",
     "type": "md"
   },
   {
-    "name": "todo_260113.md",
-    "path": "../../games/cards/blackjack/todo_260113.md",
-    "category": "Games (Cards)",
-    "type": "md"
+    "name": "index.html",
+    "path": "../../profile/index.html",
+    "category": "Profile",
+    "type": "html"
   },
   {
-    "name": "ruleset.js",
-    "path": "../../games/cards/blackjack/ruleset.js",
-    "category": "Games (Cards)",
-    "type": "js"
+    "name": "index.html",
+    "path": "../../projects/index.html",
+    "category": "Projects",
+    "type": "html"
+  },
+  {
+    "name": "index.html",
+    "path": "../../projects/code/index.html",
+    "category": "Projects",
+    "type": "html"
   },
   {
-    "name": "TECHNICAL.md",
-    "path": "../../games/cards/blackjack/TECHNICAL.md",
-    "category": "Games (Cards)",
-    "type": "md"
+    "name": "style.css",
+    "path": "../../projects/code/css/style.css",
+    "category": "Projects",
+    "type": "css"
   },
   {
-    "name": "MANUAL.md",
-    "path": "../../games/cards/blackjack/MANUAL.md",
-    "category": "Games (Cards)",
-    "type": "md"
+    "name": "app.js",
+    "path": "../../projects/code/js/app.js",
+    "category": "Projects",
+    "type": "js"
   },
   {
-    "name": "ruleset.js",
-    "path": "../../games/cards/euchre/ruleset.js",
-    "category": "Games (Cards)",
+    "name": "cracker.js",
+    "path": "../../projects/code/js/cracker.js",
+    "category": "Projects",
     "type": "js"
   },
   {
-    "name": "CLAUDE.md",
-    "path": "../../games/cards/euchre/CLAUDE.md",
-    "category": "Games (Cards)",
-    "type": "md"
+    "name": "index.html",
+    "path": "../../projects/dev-utils/index.html",
+    "category": "Projects",
+    "type": "html"
   },
   {
-    "name": "engine.js",
-    "path": "../../games/cards/shared/engine.js",
-    "category": "Games (Cards)",
-    "type": "js"
+    "name": "index.html",
+    "path": "../../projects/encyclopedia/index.html",
+    "category": "Projects",
+    "type": "html"
   },
   {
-    "name": "card-utils.js",
-    "path": "../../games/cards/shared/card-utils.js",
-    "category": "Games (Cards)",
-    "type": "js"
+    "name": "manifest.json",
+    "path": "../../projects/encyclopedia/manifest.json",
+    "category": "Projects",
+    "type": "json"
   },
   {
-    "name": "enums.js",
-    "path": "../../games/cards/shared/enums.js",
-    "category": "Games (Cards)",
-    "type": "js"
+    "name": "precache.json",
+    "path": "../../projects/encyclopedia/precache.json",
+    "category": "Projects",
+    "type": "json"
   },
   {
-    "name": "deck-editor.js",
-    "path": "../../games/cards/shared/deck-editor.js",
-    "category": "Games (Cards)",
-    "type": "js"
+    "name": "revision-manifest.json",
+    "path": "../../projects/encyclopedia/revision-manifest.json",
+    "category": "Projects",
+    "type": "json"
   },
   {
-    "name": "pile.js",
-    "path": "../../games/cards/shared/pile.js",
-    "category": "Games (Cards)",
+    "name": "sw.js",
+    "path": "../../projects/encyclopedia/sw.js",
+    "category": "Projects",
     "type": "js"
   },
   {
-    "name": "card-assets.js",
-    "path": "../../games/cards/shared/card-assets.js",
-    "category": "Games (Cards)",
-    "type": "js"
+    "name": "style.css",
+    "path": "../../projects/encyclopedia/css/style.css",
+    "category": "Projects",
+    "type": "css"
   },
   {
-    "name": "TRACKING_PLAN.md",
-    "path": "../../games/cards/shared/TRACKING_PLAN.md",
-    "category": "Games (Cards)",
-    "type": "md"
+    "name": "content.json",
+    "path": "../../projects/encyclopedia/data/content.json",
+    "category": "Projects",
+    "type": "json"
   },
   {
-    "name": "player.js",
-    "path": "../../games/cards/shared/player.js",
-    "category": "Games (Cards)",
-    "type": "js"
+    "name": "search_index.json",
+    "path": "../../projects/encyclopedia/data/search_index.json",
+    "category": "Projects",
+    "type": "json"
   },
   {
-    "name": "game-config.js",
-    "path": "../../games/cards/shared/game-config.js",
-    "category": "Games (Cards)",
+    "name": "script.js",
+    "path": "../../projects/encyclopedia/js/script.js",
+    "category": "Projects",
     "type": "js"
   },
   {
-    "name": "deck.js",
-    "path": "../../games/cards/shared/deck.js",
-    "category": "Games (Cards)",
-    "type": "js"
+    "name": "bench_projects_parser.py",
+    "path": "../../projects/encyclopedia/scripts/bench_projects_parser.py",
+    "category": "Projects",
+    "type": "py"
   },
   {
-    "name": "poker-evaluator.js",
-    "path": "../../games/cards/shared/poker-evaluator.js",
-    "category": "Games (Cards)",
-    "type": "js"
+    "name": "generate_content.py",
+    "path": "../../projects/encyclopedia/scripts/generate_content.py",
+    "category": "Projects",
+    "type": "py"
   },
   {
-    "name": "INFO.md",
-    "path": "../../games/cards/shared/INFO.md",
-    "category": "Games (Cards)",
+    "name": "ARCHITECTURE.md",
+    "path": "../../projects/input-a11y/ARCHITECTURE.md",
+    "category": "Projects",
     "type": "md"
   },
   {
-    "name": "CARD_ENGINE_GUIDE.md",
-    "path": "../../games/cards/shared/CARD_ENGINE_GUIDE.md",
-    "category": "Games (Cards)",
+    "name": "DEPRECATED.md",
+    "path": "../../projects/input-a11y/DEPRECATED.md",
+    "category": "Projects",
     "type": "md"
   },
   {
-    "name": "card.js",
-    "path": "../../games/cards/shared/card.js",
-    "category": "Games (Cards)",
-    "type": "js"
-  },
-  {
-    "name": "index.html",
-    "path": "../../games/cards/war/index.html",
-    "category": "Games (Cards)",
-    "type": "html"
+    "name": "INFO.md",
+    "path": "../../projects/input-a11y/INFO.md",
+    "category": "Projects",
+    "type": "md"
   },
   {
-    "name": "INFO.md",
-    "path": "../../games/cards/war/INFO.md",
-    "category": "Games (Cards)",
+    "name": "OCR_SETUP.md",
+    "path": "../../projects/input-a11y/OCR_SETUP.md",
+    "category": "Projects",
     "type": "md"
   },
   {
-    "name": "ruleset.js",
-    "path": "../../games/cards/war/ruleset.js",
-    "category": "Games (Cards)",
-    "type": "js"
+    "name": "README.md",
+    "path": "../../projects/input-a11y/README.md",
+    "category": "Projects",
+    "type": "md"
   },
   {
-    "name": "TECHNICAL.md",
-    "path": "../../games/cards/war/TECHNICAL.md",
-    "category": "Games (Cards)",
+    "name": "TODO.md",
+    "path": "../../projects/input-a11y/TODO.md",
+    "category": "Projects",
     "type": "md"
   },
   {
-    "name": "MANUAL.md",
-    "path": "../../games/cards/war/MANUAL.md",
-    "category": "Games (Cards)",
+    "name": "USER_GUIDE.md",
+    "path": "../../projects/input-a11y/USER_GUIDE.md",
+    "category": "Projects",
     "type": "md"
   },
   {
-    "name": "CLAUDE.md",
-    "path": "../../games/cards/war/CLAUDE.md",
-    "category": "Games (Cards)",
+    "name": "V2_SUMMARY.md",
+    "path": "../../projects/input-a11y/V2_SUMMARY.md",
+    "category": "Projects",
     "type": "md"
   },
   {
     "name": "index.html",
-    "path": "../../games/puzzller/index.html",
-    "category": "Games (Puzzller)",
+    "path": "../../projects/input-a11y/index.html",
+    "category": "Projects",
     "type": "html"
   },
   {
-    "name": "README.md",
-    "path": "../../games/puzzller/README.md",
-    "category": "Games (Puzzller)",
-    "type": "md"
+    "name": "manifest.json",
+    "path": "../../projects/input-a11y/manifest.json",
+    "category": "Projects",
+    "type": "json"
   },
   {
-    "name": "style.css",
-    "path": "../../games/puzzller/style.css",
-    "category": "Games (Puzzller)",
-    "type": "css"
+    "name": "sw.js",
+    "path": "../../projects/input-a11y/sw.js",
+    "category": "Projects",
+    "type": "js"
   },
   {
-    "name": "main.js",
-    "path": "../../games/puzzller/js/main.js",
-    "category": "Games (Puzzller)",
+    "name": "tesseract.min.js",
+    "path": "../../projects/input-a11y/assets/tesseract.min.js",
+    "category": "Projects",
     "type": "js"
   },
   {
-    "name": "renderer.js",
-    "path": "../../games/puzzller/js/renderer.js",
-    "category": "Games (Puzzller)",
+    "name": "worker.min.js",
+    "path": "../../projects/input-a11y/assets/worker.min.js",
+    "category": "Projects",
     "type": "js"
   },
   {
-    "name": "game.js",
-    "path": "../../games/puzzller/js/game.js",
-    "category": "Games (Puzzller)",
-    "type": "js"
+    "name": "style.css",
+    "path": "../../projects/input-a11y/css/style.css",
+    "category": "Projects",
+    "type": "css"
   },
   {
-    "name": "levelLoader.js",
-    "path": "../../games/puzzller/js/levelLoader.js",
-    "category": "Games (Puzzller)",
+    "name": "app.js",
+    "path": "../../projects/input-a11y/js/app.js",
+    "category": "Projects",
     "type": "js"
   },
   {
-    "name": "input.js",
-    "path": "../../games/puzzller/js/input.js",
-    "category": "Games (Puzzller)",
+    "name": "generator.js",
+    "path": "../../projects/input-a11y/js/generator.js",
+    "category": "Projects",
     "type": "js"
   },
   {
-    "name": "levels.js",
-    "path": "../../games/puzzller/js/levels.js",
-    "category": "Games (Puzzller)",
+    "name": "ocr-manager.js",
+    "path": "../../projects/input-a11y/js/ocr-manager.js",
+    "category": "Projects",
     "type": "js"
   },
   {
-    "name": "index.html",
-    "path": "../../games/animal_stack/index.html",
-    "category": "Games (Animal Stack)",
-    "type": "html"
+    "name": "scanner.js",
+    "path": "../../projects/input-a11y/js/scanner.js",
+    "category": "Projects",
+    "type": "js"
   },
   {
-    "name": "TECHNICAL.md",
-    "path": "../../games/animal_stack/TECHNICAL.md",
-    "category": "Games (Animal Stack)",
-    "type": "md"
+    "name": "storage.js",
+    "path": "../../projects/input-a11y/js/storage.js",
+    "category": "Projects",
+    "type": "js"
   },
   {
-    "name": "MANUAL.md",
-    "path": "../../games/animal_stack/MANUAL.md",
-    "category": "Games (Animal Stack)",
+    "name": "ARCHITECTURE.md",
+    "path": "../../projects/input-a11y_v1/ARCHITECTURE.md",
+    "category": "Projects",
     "type": "md"
   },
   {
-    "name": "main.js",
-    "path": "../../games/animal_stack/js/main.js",
-    "category": "Games (Animal Stack)",
-    "type": "js"
+    "name": "DEPRECATED.md",
+    "path": "../../projects/input-a11y_v1/DEPRECATED.md",
+    "category": "Projects",
+    "type": "md"
   },
   {
-    "name": "AnimalStackScene.js",
-    "path": "../../games/animal_stack/js/AnimalStackScene.js",
-    "category": "Games (Animal Stack)",
-    "type": "js"
+    "name": "INFO.md",
+    "path": "../../projects/input-a11y_v1/INFO.md",
+    "category": "Projects",
+    "type": "md"
   },
   {
-    "name": "PhysicsEngine.js",
-    "path": "../../games/animal_stack/js/PhysicsEngine.js",
-    "category": "Games (Animal Stack)",
-    "type": "js"
+    "name": "OCR_SETUP.md",
+    "path": "../../projects/input-a11y_v1/OCR_SETUP.md",
+    "category": "Projects",
+    "type": "md"
   },
   {
-    "name": "index.html",
-    "path": "../../games/board/index.html",
-    "category": "Games (Board)",
-    "type": "html"
+    "name": "README.md",
+    "path": "../../projects/input-a11y_v1/README.md",
+    "category": "Projects",
+    "type": "md"
   },
   {
-    "name": "TECHNICAL.md",
-    "path": "../../games/board/TECHNICAL.md",
-    "category": "Games (Board)",
+    "name": "TODO.md",
+    "path": "../../projects/input-a11y_v1/TODO.md",
+    "category": "Projects",
     "type": "md"
   },
   {
-    "name": "MANUAL.md",
-    "path": "../../games/board/MANUAL.md",
-    "category": "Games (Board)",
-    "type": "md"
+    "name": "index.html",
+    "path": "../../projects/input-a11y_v1/index.html",
+    "category": "Projects",
+    "type": "html"
   },
   {
-    "name": "engine.js",
-    "path": "../../games/board/js/engine.js",
-    "category": "Games (Board)",
+    "name": "tesseract.min.js",
+    "path": "../../projects/input-a11y_v1/assets/tesseract.min.js",
+    "category": "Projects",
     "type": "js"
   },
   {
-    "name": "dots.js",
-    "path": "../../games/board/js/dots.js",
-    "category": "Games (Board)",
+    "name": "worker.min.js",
+    "path": "../../projects/input-a11y_v1/assets/worker.min.js",
+    "category": "Projects",
     "type": "js"
   },
   {
-    "name": "overlay.js",
-    "path": "../../games/board/js/overlay.js",
-    "category": "Games (Board)",
-    "type": "js"
+    "name": "style.css",
+    "path": "../../projects/input-a11y_v1/css/style.css",
+    "category": "Projects",
+    "type": "css"
   },
   {
-    "name": "xiangqi.js",
-    "path": "../../games/board/js/xiangqi.js",
-    "category": "Games (Board)",
+    "name": "app.js",
+    "path": "../../projects/input-a11y_v1/js/app.js",
+    "category": "Projects",
     "type": "js"
   },
   {
-    "name": "checkers.js",
-    "path": "../../games/board/js/checkers.js",
-    "category": "Games (Board)",
+    "name": "generator.js",
+    "path": "../../projects/input-a11y_v1/js/generator.js",
+    "category": "Projects",
     "type": "js"
   },
   {
-    "name": "tictactoe.js",
-    "path": "../../games/board/js/tictactoe.js",
-    "category": "Games (Board)",
+    "name": "ocr-manager.js",
+    "path": "../../projects/input-a11y_v1/js/ocr-manager.js",
+    "category": "Projects",
     "type": "js"
   },
   {
-    "name": "main.js",
-    "path": "../../games/board/js/main.js",
-    "category": "Games (Board)",
+    "name": "scanner.js",
+    "path": "../../projects/input-a11y_v1/js/scanner.js",
+    "category": "Projects",
     "type": "js"
   },
   {
-    "name": "chess.js",
-    "path": "../../games/board/js/chess.js",
-    "category": "Games (Board)",
+    "name": "storage.js",
+    "path": "../../projects/input-a11y_v1/js/storage.js",
+    "category": "Projects",
     "type": "js"
   },
   {
-    "name": "xiangqi-rules.js",
-    "path": "../../games/board/js/xiangqi-rules.js",
-    "category": "Games (Board)",
-    "type": "js"
+    "name": "ARCHITECTURE.md",
+    "path": "../../projects/input-a11y_v2/ARCHITECTURE.md",
+    "category": "Projects",
+    "type": "md"
   },
   {
-    "name": "connect4.js",
-    "path": "../../games/board/js/connect4.js",
-    "category": "Games (Board)",
-    "type": "js"
+    "name": "INFO.md",
+    "path": "../../projects/input-a11y_v2/INFO.md",
+    "category": "Projects",
+    "type": "md"
   },
   {
-    "name": "battleship.js",
-    "path": "../../games/board/js/battleship.js",
-    "category": "Games (Board)",
-    "type": "js"
+    "name": "OCR_SETUP.md",
+    "path": "../../projects/input-a11y_v2/OCR_SETUP.md",
+    "category": "Projects",
+    "type": "md"
   },
   {
-    "name": "mancala.js",
-    "path": "../../games/board/js/mancala.js",
-    "category": "Games (Board)",
-    "type": "js"
+    "name": "README.md",
+    "path": "../../projects/input-a11y_v2/README.md",
+    "category": "Projects",
+    "type": "md"
   },
   {
-    "name": "othello.js",
-    "path": "../../games/board/js/othello.js",
-    "category": "Games (Board)",
-    "type": "js"
+    "name": "TODO.md",
+    "path": "../../projects/input-a11y_v2/TODO.md",
+    "category": "Projects",
+    "type": "md"
   },
   {
-    "name": "settings.js",
-    "path": "../../games/board/js/settings.js",
-    "category": "Games (Board)",
+    "name": "index.html",
+    "path": "../../projects/input-a11y_v2/index.html",
+    "category": "Projects",
+    "type": "html"
+  },
+  {
+    "name": "manifest.json",
+    "path": "../../projects/input-a11y_v2/manifest.json",
+    "category": "Projects",
+    "type": "json"
+  },
+  {
+    "name": "sw.js",
+    "path": "../../projects/input-a11y_v2/sw.js",
+    "category": "Projects",
     "type": "js"
   },
   {
-    "name": "xiangqi-ai.js",
-    "path": "../../games/board/js/xiangqi-ai.js",
-    "category": "Games (Board)",
+    "name": "tesseract.min.js",
+    "path": "../../projects/input-a11y_v2/assets/tesseract.min.js",
+    "category": "Projects",
     "type": "js"
   },
   {
-    "name": "gomoku.js",
-    "path": "../../games/board/js/gomoku.js",
-    "category": "Games (Board)",
+    "name": "worker.min.js",
+    "path": "../../projects/input-a11y_v2/assets/worker.min.js",
+    "category": "Projects",
     "type": "js"
   },
   {
     "name": "style.css",
-    "path": "../../games/board/css/style.css",
-    "category": "Games (Board)",
+    "path": "../../projects/input-a11y_v2/css/style.css",
+    "category": "Projects",
     "type": "css"
   },
   {
-    "name": "qr-master.js",
-    "path": "../../games/lib/qr-master.js",
-    "category": "Games (Lib)",
+    "name": "app.js",
+    "path": "../../projects/input-a11y_v2/js/app.js",
+    "category": "Projects",
     "type": "js"
   },
   {
-    "name": "qrcode.min.js",
-    "path": "../../games/lib/qrcode.min.js",
-    "category": "Games (Lib)",
+    "name": "generator.js",
+    "path": "../../projects/input-a11y_v2/js/generator.js",
+    "category": "Projects",
     "type": "js"
   },
   {
-    "name": "html5-qrcode.min.js",
-    "path": "../../games/lib/html5-qrcode.min.js",
-    "category": "Games (Lib)",
+    "name": "ocr-manager.js",
+    "path": "../../projects/input-a11y_v2/js/ocr-manager.js",
+    "category": "Projects",
     "type": "js"
   },
   {
-    "name": "LICENSE.txt",
-    "path": "../../games/lib/LICENSE.txt",
-    "category": "Games (Lib)",
-    "type": "txt"
+    "name": "scanner.js",
+    "path": "../../projects/input-a11y_v2/js/scanner.js",
+    "category": "Projects",
+    "type": "js"
   },
   {
-    "name": "index.html",
-    "path": "../../games/flow/index.html",
-    "category": "Games (Flow)",
-    "type": "html"
+    "name": "storage.js",
+    "path": "../../projects/input-a11y_v2/js/storage.js",
+    "category": "Projects",
+    "type": "js"
   },
   {
-    "name": "TODO.md",
-    "path": "../../games/flow/TODO.md",
-    "category": "Games (Flow)",
+    "name": "README.md",
+    "path": "../../projects/internal-tests/README.md",
+    "category": "Projects",
     "type": "md"
   },
   {
-    "name": "README.md",
-    "path": "../../games/flow/README.md",
-    "category": "Games (Flow)",
-    "type": "md"
+    "name": "index.html",
+    "path": "../../projects/internal-tests/index.html",
+    "category": "Projects",
+    "type": "html"
   },
   {
-    "name": "CHANGELOG.md",
-    "path": "../../games/flow/CHANGELOG.md",
-    "category": "Games (Flow)",
+    "name": "test_db.html",
+    "path": "../../projects/internal-tests/test_db.html",
+    "category": "Projects",
+    "type": "html"
+  },
+  {
+    "name": "COOKBOOK.md",
+    "path": "../../projects/md-reader/COOKBOOK.md",
+    "category": "Projects",
     "type": "md"
   },
   {
-    "name": "ARCHITECTURE.md",
-    "path": "../../games/flow/ARCHITECTURE.md",
-    "category": "Games (Flow)",
+    "name": "README.md",
+    "path": "../../projects/md-reader/README.md",
+    "category": "Projects",
     "type": "md"
   },
   {
-    "name": "CLAUDE.md",
-    "path": "../../games/flow/CLAUDE.md",
-    "category": "Games (Flow)",
+    "name": "RECIPE_AGENT.md",
+    "path": "../../projects/md-reader/RECIPE_AGENT.md",
+    "category": "Projects",
     "type": "md"
   },
   {
-    "name": "level_generator.js",
-    "path": "../../games/flow/engine/level_generator.js",
-    "category": "Games (Flow)",
+    "name": "app.js",
+    "path": "../../projects/md-reader/app.js",
+    "category": "Projects",
     "type": "js"
   },
   {
-    "name": "game.js",
-    "path": "../../games/flow/engine/game.js",
-    "category": "Games (Flow)",
-    "type": "js"
+    "name": "bench_measures.py",
+    "path": "../../projects/md-reader/bench_measures.py",
+    "category": "Projects",
+    "type": "py"
   },
   {
-    "name": "input.js",
-    "path": "../../games/flow/engine/input.js",
-    "category": "Games (Flow)",
-    "type": "js"
+    "name": "bench_stream.py",
+    "path": "../../projects/md-reader/bench_stream.py",
+    "category": "Projects",
+    "type": "py"
   },
   {
-    "name": "grid.js",
-    "path": "../../games/flow/engine/grid.js",
-    "category": "Games (Flow)",
-    "type": "js"
+    "name": "build_index.py",
+    "path": "../../projects/md-reader/build_index.py",
+    "category": "Projects",
+    "type": "py"
   },
   {
-    "name": "path.js",
-    "path": "../../games/flow/engine/path.js",
-    "category": "Games (Flow)",
-    "type": "js"
+    "name": "build_recipe_index.py",
+    "path": "../../projects/md-reader/build_recipe_index.py",
+    "category": "Projects",
+    "type": "py"
   },
   {
-    "name": "style.css",
-    "path": "../../games/flow/css/style.css",
-    "category": "Games (Flow)",
-    "type": "css"
+    "name": "compare_index_formats.py",
+    "path": "../../projects/md-reader/compare_index_formats.py",
+    "category": "Projects",
+    "type": "py"
   },
   {
-    "name": "260206_041537_J_Prompt_1.md",
-    "path": "../../prompts/260206_041537_J_Prompt_1.md",
-    "category": "Prompts",
-    "type": "md"
+    "name": "dedup.py",
+    "path": "../../projects/md-reader/dedup.py",
+    "category": "Projects",
+    "type": "py"
   },
   {
-    "name": "260206_050000_G_Prompt_2.md",
-    "path": "../../prompts/260206_050000_G_Prompt_2.md",
-    "category": "Prompts",
-    "type": "md"
+    "name": "fetcher.py",
+    "path": "../../projects/md-reader/fetcher.py",
+    "category": "Projects",
+    "type": "py"
   },
   {
-    "name": "260206_183334_J_Prompt_3.md",
-    "path": "../../prompts/260206_183334_J_Prompt_3.md",
-    "category": "Prompts",
-    "type": "md"
+    "name": "fixture_server.py",
+    "path": "../../projects/md-reader/fixture_server.py",
+    "category": "Projects",
+    "type": "py"
   },
   {
-    "name": "PROGRESS.md",
-    "path": "../../negen/PROGRESS.md",
-    "category": "Negen",
-    "type": "md"
+    "name": "index.html",
+    "path": "../../projects/md-reader/index.html",
+    "category": "Projects",
+    "type": "html"
   },
   {
-    "name": "index.js",
-    "path": "../../negen/index.js",
-    "category": "Negen",
-    "type": "js"
+    "name": "jsonstream.py",
+    "path": "../../projects/md-reader/jsonstream.py",
+    "category": "Projects",
+    "type": "py"
   },
   {
-    "name": "NEGEN_PLAN.md",
-    "path": "../../negen/NEGEN_PLAN.md",
-    "category": "Negen",
-    "type": "md"
+    "name": "measures.py",
+    "path": "../../projects/md-reader/measures.py",
+    "category": "Projects",
+    "type": "py"
   },
   {
-    "name": "README.md",
-    "path": "../../negen/README.md",
-    "category": "Negen",
-    "type": "md"
+    "name": "recipe_index.json",
+    "path": "../../projects/md-reader/recipe_index.json",
+    "category": "Projects",
+    "type": "json"
+  },
+  {
+    "name": "repo_index.js",
+    "path": "../../projects/md-reader/repo_index.js",
+    "category": "Projects",
+    "type": "js"
   },
   {
-    "name": "PHASE_4_PLAN.md",
-    "path": "../../negen/PHASE_4_PLAN.md",
-    "category": "Negen",
-    "type": "md"
+    "name": "scraper.py",
+    "path": "../../projects/md-reader/scraper.py",
+    "category": "Projects",
+    "type": "py"
+  },
+  {
+    "name": "sources.py",
+    "path": "../../projects/md-reader/sources.py",
+    "category": "Projects",
+    "type": "py"
   },
   {
     "name": "style.css",
-    "path": "../../negen/style.css",
-    "category": "Negen",
+    "path": "../../projects/md-reader/style.css",
+    "category": "Projects",
     "type": "css"
   },
   {
-    "name": "PHASE_5_PLAN.md",
-    "path": "../../negen/PHASE_5_PLAN.md",
-    "category": "Negen",
-    "type": "md"
+    "name": "test_scraper.py",
+    "path": "../../projects/md-reader/test_scraper.py",
+    "category": "Projects",
+    "type": "py"
   },
   {
-    "name": "PHASE_3_PLAN.md",
-    "path": "../../negen/PHASE_3_PLAN.md",
-    "category": "Negen",
+    "name": "asado.md",
+    "path": "../../projects/md-reader/recipes/asado.md",
+    "category": "Projects",
     "type": "md"
   },
   {
-    "name": "ARCADE_ROADMAP.md",
-    "path": "../../negen/ARCADE_ROADMAP.md",
-    "category": "Negen",
+    "name": "cacik.md",
+    "path": "../../projects/md-reader/recipes/cacik.md",
+    "category": "Projects",
     "type": "md"
   },
   {
-    "name": "PHASE_2_SPECS.md",
-    "path": "../../negen/PHASE_2_SPECS.md",
-    "category": "Negen",
+    "name": "flan.md",
+    "path": "../../projects/md-reader/recipes/flan.md",
+    "category": "Projects",
     "type": "md"
   },
   {
-    "name": "OVERHAUL_PLAN.md",
-    "path": "../../negen/OVERHAUL_PLAN.md",
-    "category": "Negen",
+    "name": "kabse.md",
+    "path": "../../projects/md-reader/recipes/kabse.md",
+    "category": "Projects",
     "type": "md"
   },
   {
-    "name": "phase2_test.html",
-    "path": "../../negen/verification/phase2_test.html",
-    "category": "Negen",
-    "type": "html"
+    "name": "migas.md",
+    "path": "../../projects/md-reader/recipes/migas.md",
+    "category": "Projects",
+    "type": "md"
   },
   {
-    "name": "InputManager.js",
-    "path": "../../negen/input/InputManager.js",
-    "category": "Negen",
-    "type": "js"
+    "name": "index.html",
+    "path": "../../projects/name-that-tune/index.html",
+    "category": "Projects",
+    "type": "html"
   },
   {
-    "name": "MathUtils.js",
-    "path": "../../negen/utils/MathUtils.js",
-    "category": "Negen",
-    "type": "js"
+    "name": "style.css",
+    "path": "../../projects/name-that-tune/css/style.css",
+    "category": "Projects",
+    "type": "css"
   },
   {
-    "name": "Physics.js",
-    "path": "../../negen/utils/Physics.js",
-    "category": "Negen",
+    "name": "app.js",
+    "path": "../../projects/name-that-tune/js/app.js",
+    "category": "Projects",
     "type": "js"
   },
   {
-    "name": "Timer.js",
-    "path": "../../negen/utils/Timer.js",
-    "category": "Negen",
+    "name": "audio-engine.js",
+    "path": "../../projects/name-that-tune/js/audio-engine.js",
+    "category": "Projects",
     "type": "js"
   },
   {
-    "name": "AssetLoader.js",
-    "path": "../../negen/assets/AssetLoader.js",
-    "category": "Negen",
+    "name": "game-logic.js",
+    "path": "../../projects/name-that-tune/js/game-logic.js",
+    "category": "Projects",
     "type": "js"
   },
   {
-    "name": "CanvasRenderer.js",
-    "path": "../../negen/graphics/CanvasRenderer.js",
-    "category": "Negen",
-    "type": "js"
+    "name": "index.html",
+    "path": "../../projects/project-ti-tanium/index.html",
+    "category": "Projects",
+    "type": "html"
   },
   {
-    "name": "Renderer.js",
-    "path": "../../negen/graphics/Renderer.js",
-    "category": "Negen",
+    "name": "boot.js",
+    "path": "../../projects/project-ti-tanium/js/boot.js",
+    "category": "Projects",
     "type": "js"
   },
   {
-    "name": "ParticleSystem.js",
-    "path": "../../negen/graphics/ParticleSystem.js",
-    "category": "Negen",
+    "name": "emu_adapter.js",
+    "path": "../../projects/project-ti-tanium/js/emu_adapter.js",
+    "category": "Projects",
     "type": "js"
   },
   {
-    "name": "Card.js",
-    "path": "../../negen/cards/Card.js",
-    "category": "Negen",
+    "name": "sim_engine.js",
+    "path": "../../projects/project-ti-tanium/js/sim_engine.js",
+    "category": "Projects",
     "type": "js"
   },
   {
-    "name": "enums.js",
-    "path": "../../negen/cards/enums.js",
-    "category": "Negen",
+    "name": "ui_manager.js",
+    "path": "../../projects/project-ti-tanium/js/ui_manager.js",
+    "category": "Projects",
     "type": "js"
   },
   {
-    "name": "Evaluator.js",
-    "path": "../../negen/cards/Evaluator.js",
-    "category": "Negen",
-    "type": "js"
+    "name": "main.css",
+    "path": "../../projects/project-ti-tanium/styles/main.css",
+    "category": "Projects",
+    "type": "css"
   },
   {
-    "name": "Deck.js",
-    "path": "../../negen/cards/Deck.js",
-    "category": "Negen",
-    "type": "js"
+    "name": "theme.css",
+    "path": "../../projects/project-ti-tanium/styles/theme.css",
+    "category": "Projects",
+    "type": "css"
   },
   {
-    "name": "CardGame.js",
-    "path": "../../negen/cards/CardGame.js",
-    "category": "Negen",
-    "type": "js"
+    "name": "index.html",
+    "path": "../../projects/regex_builder/index.html",
+    "category": "Projects",
+    "type": "html"
   },
   {
-    "name": "INFO.md",
-    "path": "../../negen/cards/INFO.md",
-    "category": "Negen",
+    "name": "API_SETUP_GUIDE.md",
+    "path": "../../projects/shipment-tracker/API_SETUP_GUIDE.md",
+    "category": "Projects",
     "type": "md"
   },
   {
-    "name": "Pile.js",
-    "path": "../../negen/cards/Pile.js",
-    "category": "Negen",
-    "type": "js"
-  },
-  {
-    "name": "Synthesizer.js",
-    "path": "../../negen/audio/Synthesizer.js",
-    "category": "Negen",
-    "type": "js"
-  },
-  {
-    "name": "AudioManager.js",
-    "path": "../../negen/audio/AudioManager.js",
-    "category": "Negen",
-    "type": "js"
-  },
-  {
-    "name": "Card.js",
-    "path": "../../negen/entities/Card.js",
-    "category": "Negen",
-    "type": "js"
-  },
-  {
-    "name": "Entity.js",
-    "path": "../../negen/core/Entity.js",
-    "category": "Negen",
-    "type": "js"
+    "name": "ARCHITECTURE.md",
+    "path": "../../projects/shipment-tracker/ARCHITECTURE.md",
+    "category": "Projects",
+    "type": "md"
   },
   {
-    "name": "Scene.js",
-    "path": "../../negen/core/Scene.js",
-    "category": "Negen",
-    "type": "js"
+    "name": "CHANGELOG.md",
+    "path": "../../projects/shipment-tracker/CHANGELOG.md",
+    "category": "Projects",
+    "type": "md"
   },
   {
-    "name": "Engine.js",
-    "path": "../../negen/core/Engine.js",
-    "category": "Negen",
-    "type": "js"
+    "name": "CONFIG.md",
+    "path": "../../projects/shipment-tracker/CONFIG.md",
+    "category": "Projects",
+    "type": "md"
   },
   {
-    "name": "ControlOverlay.js",
-    "path": "../../negen/ui/ControlOverlay.js",
-    "category": "Negen",
-    "type": "js"
+    "name": "FORCE-REFRESH.md",
+    "path": "../../projects/shipment-tracker/FORCE-REFRESH.md",
+    "category": "Projects",
+    "type": "md"
   },
   {
-    "name": "UPGRADE_CHECKLIST.md",
-    "path": "../../admin/UPGRADE_CHECKLIST.md",
-    "category": "Admin",
+    "name": "G_to_C_26_01_23.md",
+    "path": "../../projects/shipment-tracker/G_to_C_26_01_23.md",
+    "category": "Projects",
     "type": "md"
   },
   {
-    "name": "DEPENDENCY_POLICY.md",
-    "path": "../../admin/DEPENDENCY_POLICY.md",
-    "category": "Admin",
+    "name": "G_to_C_26_01_26.md",
+    "path": "../../projects/shipment-tracker/G_to_C_26_01_26.md",
+    "category": "Projects",
     "type": "md"
   },
   {
-    "name": "shared-v2-sample.md",
-    "path": "../../admin/migrations/shared-v2-sample.md",
-    "category": "Admin",
+    "name": "INFO.md",
+    "path": "../../projects/shipment-tracker/INFO.md",
+    "category": "Projects",
     "type": "md"
   },
   {
-    "name": "GAME_INFO_TEMPLATE.md",
-    "path": "../../admin/templates/GAME_INFO_TEMPLATE.md",
-    "category": "Admin",
+    "name": "LLM_GUIDE.md",
+    "path": "../../projects/shipment-tracker/LLM_GUIDE.md",
+    "category": "Projects",
     "type": "md"
   },
   {
-    "name": "MIGRATION_PLAN_TEMPLATE.md",
-    "path": "../../admin/templates/MIGRATION_PLAN_TEMPLATE.md",
-    "category": "Admin",
+    "name": "PLAN-import-export.md",
+    "path": "../../projects/shipment-tracker/PLAN-import-export.md",
+    "category": "Projects",
     "type": "md"
   },
   {
-    "name": "LIBRARY_INFO_TEMPLATE.md",
-    "path": "../../admin/templates/LIBRARY_INFO_TEMPLATE.md",
-    "category": "Admin",
+    "name": "README.md",
+    "path": "../../projects/shipment-tracker/README.md",
+    "category": "Projects",
     "type": "md"
   },
   {
-    "name": "DATA_POLICY.md",
-    "path": "../../legal/DATA_POLICY.md",
-    "category": "Legal",
+    "name": "TESTING.md",
+    "path": "../../projects/shipment-tracker/TESTING.md",
+    "category": "Projects",
     "type": "md"
   },
   {
-    "name": "TERMS_OF_USE.md",
-    "path": "../../legal/TERMS_OF_USE.md",
-    "category": "Legal",
+    "name": "TEST_DATA.md",
+    "path": "../../projects/shipment-tracker/TEST_DATA.md",
+    "category": "Projects",
     "type": "md"
   },
   {
-    "name": "README.md",
-    "path": "../../legal/README.md",
-    "category": "Legal",
+    "name": "TODO.md",
+    "path": "../../projects/shipment-tracker/TODO.md",
+    "category": "Projects",
     "type": "md"
   },
   {
-    "name": "PRIVACY_POLICY.md",
-    "path": "../../legal/PRIVACY_POLICY.md",
-    "category": "Legal",
-    "type": "md"
+    "name": "index.html",
+    "path": "../../projects/shipment-tracker/index.html",
+    "category": "Projects",
+    "type": "html"
   },
   {
-    "name": "MSA.md",
-    "path": "../../legal/MSA.md",
-    "category": "Legal",
-    "type": "md"
+    "name": "test-tracking.html",
+    "path": "../../projects/shipment-tracker/test-tracking.html",
+    "category": "Projects",
+    "type": "html"
   },
   {
-    "name": "index.js",
-    "path": "../../storage/index.js",
-    "category": "Storage",
-    "type": "js"
+    "name": "test.html",
+    "path": "../../projects/shipment-tracker/test.html",
+    "category": "Projects",
+    "type": "html"
   },
   {
-    "name": "README.md",
-    "path": "../../storage/README.md",
-    "category": "Storage",
-    "type": "md"
+    "name": "style.css",
+    "path": "../../projects/shipment-tracker/css/style.css",
+    "category": "Projects",
+    "type": "css"
   },
   {
-    "name": "ls-adapter.js",
-    "path": "../../storage/adapters/ls-adapter.js",
-    "category": "Storage",
-    "type": "js"
+    "name": "theme.css",
+    "path": "../../projects/shipment-tracker/css/theme.css",
+    "category": "Projects",
+    "type": "css"
   },
   {
-    "name": "idb-adapter.js",
-    "path": "../../storage/adapters/idb-adapter.js",
-    "category": "Storage",
-    "type": "js"
+    "name": "API.md",
+    "path": "../../projects/shipment-tracker/docs/API.md",
+    "category": "Documentation",
+    "type": "md"
   },
   {
-    "name": "fong-db.js",
-    "path": "../../storage/core/fong-db.js",
-    "category": "Storage",
-    "type": "js"
+    "name": "ARCHITECTURE.md",
+    "path": "../../projects/shipment-tracker/docs/ARCHITECTURE.md",
+    "category": "Documentation",
+    "type": "md"
   },
   {
-    "name": "index.html",
-    "path": "../../projects/index.html",
-    "category": "Projects",
-    "type": "html"
+    "name": "DATA_SCHEMA.md",
+    "path": "../../projects/shipment-tracker/docs/DATA_SCHEMA.md",
+    "category": "Documentation",
+    "type": "md"
   },
   {
-    "name": "index.html",
-    "path": "../../projects/regex_builder/index.html",
-    "category": "Projects",
-    "type": "html"
+    "name": "DB_USAGE.md",
+    "path": "../../projects/shipment-tracker/docs/DB_USAGE.md",
+    "category": "Documentation",
+    "type": "md"
   },
   {
-    "name": "index.html",
-    "path": "../../projects/code/index.html",
-    "category": "Projects",
-    "type": "html"
+    "name": "EXPORT.md",
+    "path": "../../projects/shipment-tracker/docs/EXPORT.md",
+    "category": "Documentation",
+    "type": "md"
   },
   {
     "name": "app.js",
-    "path": "../../projects/code/js/app.js",
+    "path": "../../projects/shipment-tracker/js/app.js",
     "category": "Projects",
     "type": "js"
   },
   {
-    "name": "cracker.js",
-    "path": "../../projects/code/js/cracker.js",
+    "name": "db-test.js",
+    "path": "../../projects/shipment-tracker/js/db-test.js",
     "category": "Projects",
     "type": "js"
   },
   {
-    "name": "style.css",
-    "path": "../../projects/code/css/style.css",
+    "name": "db.js",
+    "path": "../../projects/shipment-tracker/js/db.js",
     "category": "Projects",
-    "type": "css"
+    "type": "js"
   },
   {
-    "name": "index.html",
-    "path": "../../projects/md-reader/index.html",
+    "name": "debug.js",
+    "path": "../../projects/shipment-tracker/js/debug.js",
     "category": "Projects",
-    "type": "html"
+    "type": "js"
   },
   {
-    "name": "app.js",
-    "path": "../../projects/md-reader/app.js",
+    "name": "document-manager.js",
+    "path": "../../projects/shipment-tracker/js/document-manager.js",
     "category": "Projects",
     "type": "js"
   },
   {
-    "name": "README.md",
-    "path": "../../projects/md-reader/README.md",
+    "name": "normalizer.js",
+    "path": "../../projects/shipment-tracker/js/normalizer.js",
     "category": "Projects",
-    "type": "md"
+    "type": "js"
   },
   {
-    "name": "repo_index.js",
-    "path": "../../projects/md-reader/repo_index.js",
+    "name": "utils.js",
+    "path": "../../projects/shipment-tracker/js/utils.js",
     "category": "Projects",
     "type": "js"
   },
   {
-    "name": "style.css",
-    "path": "../../projects/md-reader/style.css",
+    "name": "base.js",
+    "path": "../../projects/shipment-tracker/js/api/base.js",
     "category": "Projects",
-    "type": "css"
+    "type": "js"
   },
   {
-    "name": "RECIPE_AGENT.md",
-    "path": "../../projects/md-reader/RECIPE_AGENT.md",
+    "name": "dhl.js",
+    "path": "../../projects/shipment-tracker/js/api/dhl.js",
     "category": "Projects",
-    "type": "md"
+    "type": "js"
   },
   {
-    "name": "scraper.py",
-    "path": "../../projects/md-reader/scraper.py",
+    "name": "fedex.js",
+    "path": "../../projects/shipment-tracker/js/api/fedex.js",
     "category": "Projects",
-    "type": "py"
+    "type": "js"
   },
   {
-    "name": "build_index.py",
-    "path": "../../projects/md-reader/build_index.py",
+    "name": "ups.js",
+    "path": "../../projects/shipment-tracker/js/api/ups.js",
     "category": "Projects",
-    "type": "py"
+    "type": "js"
   },
   {
-    "name": "COOKBOOK.md",
-    "path": "../../projects/md-reader/COOKBOOK.md",
+    "name": "DEPLOY-CHECKLIST.md",
+    "path": "../../projects/shipment-tracker/proxy/DEPLOY-CHECKLIST.md",
     "category": "Projects",
     "type": "md"
   },
   {
-    "name": "cacik.md",
-    "path": "../../projects/md-reader/recipes/cacik.md",
+    "name": "DEPLOYMENT.md",
+    "path": "../../projects/shipment-tracker/proxy/DEPLOYMENT.md",
     "category": "Projects",
     "type": "md"
   },
   {
-    "name": "flan.md",
-    "path": "../../projects/md-reader/recipes/flan.md",
+    "name": "QUICKSTART.md",
+    "path": "../../projects/shipment-tracker/proxy/QUICKSTART.md",
     "category": "Projects",
     "type": "md"
   },
   {
-    "name": "asado.md",
-    "path": "../../projects/md-reader/recipes/asado.md",
+    "name": "README.md",
+    "path": "../../projects/shipment-tracker/proxy/README.md",
     "category": "Projects",
     "type": "md"
   },
   {
-    "name": "migas.md",
-    "path": "../../projects/md-reader/recipes/migas.md",
+    "name": "cloudflare-worker.js",
+    "path": "../../projects/shipment-tracker/proxy/cloudflare-worker.js",
     "category": "Projects",
-    "type": "md"
+    "type": "js"
   },
   {
-    "name": "kabse.md",
-    "path": "../../projects/md-reader/recipes/kabse.md",
+    "name": "ASSETS_GUIDE.md",
+    "path": "../../projects/sprunki-survival/ASSETS_GUIDE.md",
     "category": "Projects",
     "type": "md"
   },
   {
     "name": "index.html",
-    "path": "../../projects/shipment-tracker/index.html",
+    "path": "../../projects/sprunki-survival/index.html",
     "category": "Projects",
     "type": "html"
   },
   {
-    "name": "TODO.md",
-    "path": "../../projects/shipment-tracker/TODO.md",
+    "name": "style.css",
+    "path": "../../projects/sprunki-survival/css/style.css",
     "category": "Projects",
-    "type": "md"
+    "type": "css"
   },
   {
-    "name": "README.md",
-    "path": "../../projects/shipment-tracker/README.md",
+    "name": "app.js",
+    "path": "../../projects/sprunki-survival/js/app.js",
     "category": "Projects",
-    "type": "md"
+    "type": "js"
   },
   {
-    "name": "CONFIG.md",
-    "path": "../../projects/shipment-tracker/CONFIG.md",
+    "name": "data.js",
+    "path": "../../projects/sprunki-survival/js/data.js",
     "category": "Projects",
-    "type": "md"
+    "type": "js"
   },
   {
-    "name": "CHANGELOG.md",
-    "path": "../../projects/shipment-tracker/CHANGELOG.md",
+    "name": "app.js",
+    "path": "../../projects/survival-doc/app.js",
     "category": "Projects",
-    "type": "md"
+    "type": "js"
   },
   {
-    "name": "LLM_GUIDE.md",
-    "path": "../../projects/shipment-tracker/LLM_GUIDE.md",
+    "name": "data.js",
+    "path": "../../projects/survival-doc/data.js",
     "category": "Projects",
-    "type": "md"
+    "type": "js"
   },
   {
-    "name": "PLAN-import-export.md",
-    "path": "../../projects/shipment-tracker/PLAN-import-export.md",
+    "name": "example_structure.json",
+    "path": "../../projects/survival-doc/example_structure.json",
     "category": "Projects",
-    "type": "md"
+    "type": "json"
   },
   {
-    "name": "TEST_DATA.md",
-    "path": "../../projects/shipment-tracker/TEST_DATA.md",
+    "name": "index.html",
+    "path": "../../projects/survival-doc/index.html",
     "category": "Projects",
-    "type": "md"
+    "type": "html"
   },
   {
-    "name": "FORCE-REFRESH.md",
-    "path": "../../projects/shipment-tracker/FORCE-REFRESH.md",
+    "name": "theme.css",
+    "path": "../../projects/survival-doc/theme.css",
     "category": "Projects",
-    "type": "md"
+    "type": "css"
   },
   {
-    "name": "INFO.md",
-    "path": "../../projects/shipment-tracker/INFO.md",
+    "name": "artifact_corp.html",
+    "path": "../../projects/web-archive/artifact_corp.html",
     "category": "Projects",
-    "type": "md"
+    "type": "html"
   },
   {
-    "name": "G_to_C_26_01_23.md",
-    "path": "../../projects/shipment-tracker/G_to_C_26_01_23.md",
+    "name": "artifact_home.html",
+    "path": "../../projects/web-archive/artifact_home.html",
     "category": "Projects",
-    "type": "md"
+    "type": "html"
   },
   {
-    "name": "G_to_C_26_01_26.md",
-    "path": "../../projects/shipment-tracker/G_to_C_26_01_26.md",
+    "name": "artifact_index.html",
+    "path": "../../projects/web-archive/artifact_index.html",
     "category": "Projects",
-    "type": "md"
+    "type": "html"
   },
   {
-    "name": "TESTING.md",
-    "path": "../../projects/shipment-tracker/TESTING.md",
+    "name": "index.html",
+    "path": "../../projects/web-archive/index.html",
     "category": "Projects",
-    "type": "md"
+    "type": "html"
   },
   {
-    "name": "test-tracking.html",
-    "path": "../../projects/shipment-tracker/test-tracking.html",
+    "name": "script.js",
+    "path": "../../projects/web-archive/script.js",
     "category": "Projects",
-    "type": "html"
+    "type": "js"
   },
   {
-    "name": "test.html",
-    "path": "../../projects/shipment-tracker/test.html",
+    "name": "style.css",
+    "path": "../../projects/web-archive/style.css",
     "category": "Projects",
-    "type": "html"
+    "type": "css"
   },
   {
-    "name": "ARCHITECTURE.md",
-    "path": "../../projects/shipment-tracker/ARCHITECTURE.md",
-    "category": "Projects",
+    "name": "260206_041537_J_Prompt_1.md",
+    "path": "../../prompts/260206_041537_J_Prompt_1.md",
+    "category": "Prompts",
     "type": "md"
   },
   {
-    "name": "CLAUDE.md",
-    "path": "../../projects/shipment-tracker/CLAUDE.md",
-    "category": "Projects",
+    "name": "260206_050000_G_Prompt_2.md",
+    "path": "../../prompts/260206_050000_G_Prompt_2.md",
+    "category": "Prompts",
     "type": "md"
   },
   {
-    "name": "API_SETUP_GUIDE.md",
-    "path": "../../projects/shipment-tracker/API_SETUP_GUIDE.md",
-    "category": "Projects",
+    "name": "260206_183334_J_Prompt_3.md",
+    "path": "../../prompts/260206_183334_J_Prompt_3.md",
+    "category": "Prompts",
     "type": "md"
   },
   {
-    "name": "DB_USAGE.md",
-    "path": "../../projects/shipment-tracker/docs/DB_USAGE.md",
-    "category": "Documentation",
-    "type": "md"
+    "name": "index.html",
+    "path": "../../puzzle/index.html",
+    "category": "Puzzle",
+    "type": "html"
   },
   {
-    "name": "API.md",
-    "path": "../../projects/shipment-tracker/docs/API.md",
-    "category": "Documentation",
+    "name": "README.md",
+    "path": "../../scripts/README.md",
+    "category": "Scripts",
     "type": "md"
   },
   {
-    "name": "EXPORT.md",
-    "path": "../../projects/shipment-tracker/docs/EXPORT.md",
-    "category": "Documentation",
-    "type": "md"
+    "name": "__init__.py",
+    "path": "../../scripts/__init__.py",
+    "category": "Scripts",
+    "type": "py"
   },
   {
-    "name": "DATA_SCHEMA.md",
-    "path": "../../projects/shipment-tracker/docs/DATA_SCHEMA.md",
-    "category": "Documentation",
-    "type": "md"
+    "name": "bench_fswalk.py",
+    "path": "../../scripts/bench_fswalk.py",
+    "category": "Scripts",
+    "type": "py"
   },
   {
-    "name": "ARCHITECTURE.md",
-    "path": "../../projects/shipment-tracker/docs/ARCHITECTURE.md",
-    "category": "Documentation",
-    "type": "md"
+    "name": "fswalk.py",
+    "path": "../../scripts/fswalk.py",
+    "category": "Scripts",
+    "type": "py"
   },
   {
-    "name": "app.js",
-    "path": "../../projects/shipment-tracker/js/app.js",
-    "category": "Projects",
-    "type": "js"
+    "name": "revision_manifest.py",
+    "path": "../../scripts/revision_manifest.py",
+    "category": "Scripts",
+    "type": "py"
   },
   {
-    "name": "db.js",
-    "path": "../../projects/shipment-tracker/js/db.js",
-    "category": "Projects",
-    "type": "js"
+    "name": "serve.py",
+    "path": "../../scripts/serve.py",
+    "category": "Scripts",
+    "type": "py"
   },
   {
-    "name": "db-test.js",
-    "path": "../../projects/shipment-tracker/js/db-test.js",
-    "category": "Projects",
-    "type": "js"
+    "name": "watch.py",
+    "path": "../../scripts/watch.py",
+    "category": "Scripts",
+    "type": "py"
   },
   {
-    "name": "utils.js",
-    "path": "../../projects/shipment-tracker/js/utils.js",
-    "category": "Projects",
+    "name": "letters-data.js",
+    "path": "../../shared/js/letters-data.js",
+    "category": "Shared",
     "type": "js"
   },
   {
-    "name": "normalizer.js",
-    "path": "../../projects/shipment-tracker/js/normalizer.js",
-    "category": "Projects",
-    "type": "js"
+    "name": "README.md",
+    "path": "../../storage/README.md",
+    "category": "Storage",
+    "type": "md"
   },
   {
-    "name": "document-manager.js",
-    "path": "../../projects/shipment-tracker/js/document-manager.js",
-    "category": "Projects",
+    "name": "index.js",
+    "path": "../../storage/index.js",
+    "category": "Storage",
     "type": "js"
   },
   {
-    "name": "debug.js",
-    "path": "../../projects/shipment-tracker/js/debug.js",
-    "category": "Projects",
+    "name": "idb-adapter.js",
+    "path": "../../storage/adapters/idb-adapter.js",
+    "category": "Storage",
     "type": "js"
   },
   {
-    "name": "fedex.js",
-    "path": "../../projects/shipment-tracker/js/api/fedex.js",
-    "category": "Projects",
+    "name": "ls-adapter.js",
+    "path": "../../storage/adapters/ls-adapter.js",
+    "category": "Storage",
     "type": "js"
   },
   {
-    "name": "dhl.js",
-    "path": "../../projects/shipment-tracker/js/api/dhl.js",
-    "category": "Projects",
+    "name": "fong-db.js",
+    "path": "../../storage/core/fong-db.js",
+    "category": "Storage",
     "type": "js"
   },
   {
-    "name": "base.js",
-    "path": "../../projects/shipment-tracker/js/api/base.js",
-    "category": "Projects",
-    "type": "js"
+    "name": ".last-run.json",
+    "path": "../../test-results/.last-run.json",
+    "category": "Test-results",
+    "type": "json"
   },
   {
-    "name": "ups.js",
-    "path": "../../projects/shipment-tracker/js/api/ups.js",
-    "category": "Projects",
+    "name": "verification.spec.js",
+    "path": "../../tests/verification.spec.js",
+    "category": "Tests",
     "type": "js"
   },
   {
-    "name": "DEPLOY-CHECKLIST.md",
-    "path": "../../projects/shipment-tracker/proxy/DEPLOY-CHECKLIST.md",
-    "category": "Projects",
+    "name": "README.md",
+    "path": "../../verification/README.md",
+    "category": "Verification",
     "type": "md"
   },
   {
-    "name": "README.md",
-    "path": "../../projects/shipment-tracker/proxy/README.md",
-    "category": "Projects",
-    "type": "md"
+    "name": "bench_games.json",
+    "path": "../../verification/bench_games.json",
+    "category": "Games",
+    "type": "json"
   },
   {
-    "name": "cloudflare-worker.js",
-    "path": "../../projects/shipment-tracker/proxy/cloudflare-worker.js",
-    "category": "Projects",
-    "type": "js"
+    "name": "bench_games.py",
+    "path": "../../verification/bench_games.py",
+    "category": "Games",
+    "type": "py"
   },
   {
-    "name": "QUICKSTART.md",
-    "path": "../../projects/shipment-tracker/proxy/QUICKSTART.md",
-    "category": "Projects",
-    "type": "md"
+    "name": "page_budget.py",
+    "path": "../../verification/page_budget.py",
+    "category": "Verification",
+    "type": "py"
   },
   {
-    "name": "DEPLOYMENT.md",
-    "path": "../../projects/shipment-tracker/proxy/DEPLOYMENT.md",
-    "category": "Projects",
-    "type": "md"
+    "name": "page_budgets.json",
+    "path": "../../verification/page_budgets.json",
+    "category": "Verification",
+    "type": "json"
   },
   {
-    "name": "style.css",
-    "path": "../../projects/shipment-tracker/css/style.css",
-    "category": "Projects",
-    "type": "css"
+    "name": "targets.json",
+    "path": "../../verification/targets.json",
+    "category": "Verification",
+    "type": "json"
   },
   {
-    "name": "theme.css",
-    "path": "../../projects/shipment-tracker/css/theme.css",
-    "category": "Projects",
-    "type": "css"
+    "name": "verify.py",
+    "path": "../../verification/verify.py",
+    "category": "Verification",
+    "type": "py"
   },
   {
-    "name": "index.html",
-    "path": "../../projects/input-a11y/index.html",
-    "category": "Projects",
-    "type": "html"
+    "name": "visual.py",
+    "path": "../../verification/visual.py",
+    "category": "Verification",
+    "type": "py"
   },
   {
-    "name": "TODO.md",
-    "path": "../../projects/input-a11y/TODO.md",
-    "category": "Projects",
-    "type": "md"
+    "name": "LICENSE.txt",
+    "path": "../../wosky/LICENSE.txt",
+    "category": "Wosky",
+    "type": "txt"
   },
   {
-    "name": "README.md",
-    "path": "../../projects/input-a11y/README.md",
-    "category": "Projects",
+    "name": "TOOLKIT.md",
+    "path": "../../wosky/TOOLKIT.md",
+    "category": "Wosky",
     "type": "md"
   },
   {
-    "name": "OCR_SETUP.md",
-    "path": "../../projects/input-a11y/OCR_SETUP.md",
-    "category": "Projects",
-    "type": "md"
+    "name": "index.html",
+    "path": "../../wosky/index.html",
+    "category": "Wosky",
+    "type": "html"
   },
   {
-    "name": "INFO.md",
-    "path": "../../projects/input-a11y/INFO.md",
-    "category": "Projects",
-    "type": "md"
+    "name": "index.html",
+    "path": "../../wosky/building/index.html",
+    "category": "Wosky",
+    "type": "html"
   },
   {
-    "name": "ARCHITECTURE.md",
-    "path": "../../projects/input-a11y/ARCHITECTURE.md",
-    "category": "Projects",
+    "name": "TODO.md",
+    "path": "../../wosky/calc-v2/TODO.md",
+    "category": "Wosky",
     "type": "md"
   },
   {
-    "name": "worker.min.js",
-    "path": "../../projects/input-a11y/assets/worker.min.js",
-    "category": "Projects",
+    "name": "calc-nav.js",
+    "path": "../../wosky/calc-v2/calc-nav.js",
+    "category": "Wosky",
     "type": "js"
   },
   {
-    "name": "tesseract.min.js",
-    "path": "../../projects/input-a11y/assets/tesseract.min.js",
-    "category": "Projects",
-    "type": "js"
+    "name": "calc-v2.css",
+    "path": "../../wosky/calc-v2/calc-v2.css",
+    "category": "Wosky",
+    "type": "css"
   },
   {
-    "name": "tesseract-core-simd.wasm.js",
-    "path": "../../projects/input-a11y/assets/tesseract-core-simd.wasm.js",
-    "category": "Projects",
-    "type": "js"
+    "name": "charms.html",
+    "path": "../../wosky/calc-v2/charms.html",
+    "category": "Wosky",
+    "type": "html"
   },
   {
-    "name": "ocr-manager.js",
-    "path": "../../projects/input-a11y/js/ocr-manager.js",
-    "category": "Projects",
-    "type": "js"
+    "name": "gear.html",
+    "path": "../../wosky/calc-v2/gear.html",
+    "category": "Wosky",
+    "type": "html"
   },
   {
-    "name": "app.js",
-    "path": "../../projects/input-a11y/js/app.js",
-    "category": "Projects",
-    "type": "js"
+    "name": "hero-gear.html",
+    "path": "../../wosky/calc-v2/hero-gear.html",
+    "category": "Wosky",
+    "type": "html"
   },
   {
-    "name": "generator.js",
-    "path": "../../projects/input-a11y/js/generator.js",
-    "category": "Projects",
-    "type": "js"
+    "name": "index.html",
+    "path": "../../wosky/calc-v2/index.html",
+    "category": "Wosky",
+    "type": "html"
   },
   {
-    "name": "scanner.js",
-    "path": "../../projects/input-a11y/js/scanner.js",
-    "category": "Projects",
-    "type": "js"
+    "name": "plan.html",
+    "path": "../../wosky/calc-v2/plan.html",
+    "category": "Wosky",
+    "type": "html"
   },
   {
-    "name": "storage.js",
-    "path": "../../projects/input-a11y/js/storage.js",
-    "category": "Projects",
-    "type": "js"
+    "name": "reference.html",
+    "path": "../../wosky/calc-v2/reference.html",
+    "category": "Wosky",
+    "type": "html"
   },
   {
-    "name": "style.css",
-    "path": "../../projects/input-a11y/css/style.css",
-    "category": "Projects",
-    "type": "css"
+    "name": "config.js",
+    "path": "../../wosky/calc-v2/data/config.js",
+    "category": "Wosky",
+    "type": "js"
   },
   {
     "name": "index.html",
-    "path": "../../projects/internal-tests/index.html",
-    "category": "Projects",
+    "path": "../../wosky/charms/index.html",
+    "category": "Wosky",
     "type": "html"
   },
   {
-    "name": "README.md",
-    "path": "../../projects/internal-tests/README.md",
-    "category": "Projects",
-    "type": "md"
+    "name": "wosky.css",
+    "path": "../../wosky/css/wosky.css",
+    "category": "Wosky",
+    "type": "css"
   },
   {
-    "name": "CLAUDE.md",
-    "path": "../../projects/internal-tests/CLAUDE.md",
-    "category": "Projects",
+    "name": "lessons-learned-v2.md",
+    "path": "../../wosky/docs/lessons-learned-v2.md",
+    "category": "Documentation",
     "type": "md"
   },
   {
-    "name": "test_db.html",
-    "path": "../../projects/internal-tests/test_db.html",
-    "category": "Projects",
-    "type": "html"
+    "name": "tech-doc-v2.md",
+    "path": "../../wosky/docs/tech-doc-v2.md",
+    "category": "Documentation",
+    "type": "md"
   },
   {
-    "name": "README.md",
-    "path": "../../network/README.md",
-    "category": "Network",
+    "name": "user-manual-v2.md",
+    "path": "../../wosky/docs/user-manual-v2.md",
+    "category": "Documentation",
     "type": "md"
   },
   {
-    "name": "260204_KICKOFF.md",
-    "path": "../../archive/260204_KICKOFF.md",
-    "category": "Archive",
-    "type": "md"
+    "name": "index.html",
+    "path": "../../wosky/experts/index.html",
+    "category": "Wosky",
+    "type": "html"
   },
   {
-    "name": "index_v1.4.html",
-    "path": "../../archive/index_v1.4.html",
-    "category": "Archive",
+    "name": "index.html",
+    "path": "../../wosky/gear/index.html",
+    "category": "Wosky",
     "type": "html"
   },
   {
-    "name": "test-mobile.html",
-    "path": "../../archive/test-mobile.html",
-    "category": "Archive",
+    "name": "index.html",
+    "path": "../../wosky/hero-gear/index.html",
+    "category": "Wosky",
     "type": "html"
   },
   {
-    "name": "CLAUDE_OLD.md",
-    "path": "../../archive/CLAUDE_OLD.md",
-    "category": "Archive",
-    "type": "md"
+    "name": "char-bar.js",
+    "path": "../../wosky/js/char-bar.js",
+    "category": "Wosky",
+    "type": "js"
   },
   {
-    "name": "CLAUDE_OLD2.md",
-    "path": "../../archive/CLAUDE_OLD2.md",
-    "category": "Archive",
-    "type": "md"
+    "name": "character.js",
+    "path": "../../wosky/js/character.js",
+    "category": "Wosky",
+    "type": "js"
   },
   {
-    "name": "projects.js",
-    "path": "../../js/projects.js",
-    "category": "Projects",
+    "name": "charms-data.js",
+    "path": "../../wosky/js/data/charms-data.js",
+    "category": "Wosky",
     "type": "js"
   },
   {
-    "name": "letters-data.js",
-    "path": "../../shared/js/letters-data.js",
-    "category": "Shared",
+    "name": "gear-data.js",
+    "path": "../../wosky/js/data/gear-data.js",
+    "category": "Wosky",
     "type": "js"
   },
   {
-    "name": "README.md",
-    "path": "../../LL/README.md",
-    "category": "Ll",
-    "type": "md"
+    "name": "hero-gear-data.js",
+    "path": "../../wosky/js/data/hero-gear-data.js",
+    "category": "Wosky",
+    "type": "js"
   },
   {
-    "name": "LL_COLLABORATION.md",
-    "path": "../../LL/LL_COLLABORATION.md",
-    "category": "Ll",
-    "type": "md"
+    "name": "index.html",
+    "path": "../../wosky/pets/index.html",
+    "category": "Wosky",
+    "type": "html"
   },
   {
-    "name": "LL_CARD_ENGINE.md",
-    "path": "../../LL/LL_CARD_ENGINE.md",
-    "category": "Ll",
-    "type": "md"
+    "name": "index.html",
+    "path": "../../wosky/svs/index.html",
+    "category": "Wosky",
+    "type": "html"
   },
   {
-    "name": "LL_ES5_SAFARI.md",
-    "path": "../../LL/LL_ES5_SAFARI.md",
-    "category": "Ll",
-    "type": "md"
+    "name": "index.html",
+    "path": "../../wosky/troops/index.html",
+    "category": "Wosky",
+    "type": "html"
   },
   {
-    "name": "LL_PHASE_1_SUMMARY.md",
-    "path": "../../LL/LL_PHASE_1_SUMMARY.md",
-    "category": "Ll",
-    "type": "md"
+    "name": "index.html",
+    "path": "../../wosky/v3/index.html",
+    "category": "Wosky",
+    "type": "html"
+  },
+  {
+    "name": "style.css",
+    "path": "../../wosky/v3/css/style.css",
+    "category": "Wosky",
+    "type": "css"
+  },
+  {
+    "name": "app.js",
+    "path": "../../wosky/v3/js/app.js",
+    "category": "Wosky",
+    "type": "js"
+  },
+  {
+    "name": "data.js",
+    "path": "../../wosky/v3/js/data.js",
+    "category": "Wosky",
+    "type": "js"
+  },
+  {
+    "name": "index.html",
+    "path": "../../wosky/war-academy/index.html",
+    "category": "Wosky",
+    "type": "html"
   }
 ];
\ No newline at end of file
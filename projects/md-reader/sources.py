@@ -0,0 +1,263 @@
+import re
+import asyncio
+import contextlib
+
+from fetcher import FetchError
+from jsonstream import ArrayNotFound, iter_items
+from measures import normalize_ingredients
+
+# Recipe source plugins for scraper.py.
+#
+#   @register
+#   class MySource(Source):
+#       name = "mysource"
+#
+#       async def batches(self, run, cursor):
+#           ...
+#           yield recipes, next_cursor
+#
+# A source yields its recipes in batches, each paired with the cursor to
+# resume from once that batch is on disk. The scraper writes the batch,
+# records the cursor in its checkpoint and only then asks for the next one,
+# so after an interruption `batches` is called again with the last committed
+# cursor (None on a fresh run). Cursors must be JSON-serialisable.
+#
+# Batch items are recipe dicts or, for recipes derived from a response that
+# has not changed since the last run (run.reusable), their existing paths.
+# Sources fetch through run.engine and run concurrently with each other.
+
+THEMEALDB_URL = "https://www.themealdb.com/api/json/v1/1"
+FORKGASM_URL = "https://raw.githubusercontent.com/LeaVerou/forkgasm/master/recipes.json"
+# Known to 404; kept so the source is picked up if it ever comes back
+CULINARY_HERITAGE_URL = "https://raw.githubusercontent.com/dpapathanasiou/recipes/master/samples/food_recipes.json"
+LETTERS = "abcdefghijklmnopqrstuvwxyz"
+
+SOURCES = {}
+
+
+def register(cls):
+    SOURCES[cls.name] = cls
+    return cls
+
+
+class Source:
+    name = None
+
+    def __init__(self, args):
+        self.args = args
+
+    @staticmethod
+    def add_arguments(parser):
+        pass
+
+    async def batches(self, run, cursor):
+        return
+        yield
+
+
+def clean_html(text):
+    if not text: return ""
+    clean = re.compile('<.*?>')
+    return re.sub(clean, '', text).strip()
+
+
+def themealdb_recipe(meal):
+    title = meal.get('strMeal')
+    instructions = clean_html(meal.get('strInstructions', ''))
+    tags = meal.get('strTags', '').split(',') if meal.get('strTags') else []
+    tags = [t for t in tags if t]
+
+    ingredients = []
+    for i in range(1, 21):
+        ing_name = meal.get(f'strIngredient{i}')
+        if ing_name and ing_name.strip():
+            ingredients.append({"item": ing_name, "measure": meal.get(f'strMeasure{i}') or ""})
+
+    return {
+        "title": title,
+        "tags": tags,
+        "instructions": instructions,
+        "source": "TheMealDB",
+        "ingredients": normalize_ingredients(ingredients),
+        "servings": 4, # Default
+        "prep_time": 0,
+        "cook_time": 0,
+        "total_time": 0
+    }
+
+
+def forkgasm_title(r):
+    return r.get('name', 'Untitled')
+
+
+def forkgasm_recipe(r):
+    title = forkgasm_title(r)
+    desc = r.get('description', '')
+    # Forkgasm doesn't seem to have full instructions in 'description', usually just intro.
+    # But sometimes it has 'instructions' or 'method'.
+    instructions = r.get('instructions', r.get('method', desc))
+    if isinstance(instructions, list):
+        instructions = "\n".join(instructions)
+
+    tags = r.get('tag', [])
+
+    # Forkgasm might have nested ingredient groups
+    all_raw_ings = list(r.get('ingredient', []))
+    for g in r.get('ingredientGroup', []):
+        all_raw_ings.extend(g.get('ingredient', []))
+
+    # ing is dict {name, unit, quantity?}
+    ingredients = [
+        {"item": ing.get('name', ''), "qty": ing.get('quantity', ing.get('amount', 0)), "unit": ing.get('unit', '')}
+        for ing in all_raw_ings if isinstance(ing, dict)
+    ]
+
+    return {
+        "title": title,
+        "tags": tags,
+        "instructions": instructions,
+        "source": "Forkgasm",
+        "ingredients": normalize_ingredients(ingredients),
+        "servings": r.get('yield', 4),
+        "prep_time": 0,
+        "cook_time": 0, # Forkgasm typically has time strings like "1 hour", parsing is hard without deps
+        "total_time": 0
+    }
+
+
+def iter_forkgasm_records(response):
+    # A list of recipes or a dict with a 'recipe' list is streamed; any other
+    # shape (a dict keyed by id) is decoded whole
+    try:
+        yield from iter_items(response.iter_chunks(), key='recipe')
+    except ArrayNotFound:
+        data = response.json()
+        yield from (data.values() if isinstance(data, dict) else [])
+
+
+@register
+class TheMealDB(Source):
+    # One page per first letter (search.php?f=a..z), fetched concurrently.
+    # Cursor: the letters whose pages are already written, so a page that
+    # failed is fetched again on resume.
+    name = "themealdb"
+
+    @staticmethod
+    def add_arguments(parser):
+        parser.add_argument("--themealdb-url", default=THEMEALDB_URL, help="TheMealDB API base URL")
+        parser.add_argument("--letters", default=LETTERS, help="TheMealDB first-letter pages to fetch")
+
+    async def batches(self, run, cursor):
+        done = cursor or ""
+        letters = [letter for letter in dict.fromkeys(self.args.letters) if letter not in done]
+        print(f"Fetching from TheMealDB ({len(letters)} pages)...")
+        base_url = self.args.themealdb_url.rstrip('/')
+        urls = [f"{base_url}/search.php?f={letter}" for letter in letters]
+        # All pages are requested up front; batches are still handed over in
+        # letter order so the cursor only ever grows
+        tasks = [asyncio.ensure_future(run.engine.fetch(url)) for url in urls]
+        seen = set()
+        try:
+            for letter, url, task in zip(letters, urls, tasks):
+                try:
+                    page = await task
+                except FetchError as e:
+                    print(f"Error fetching TheMealDB: {e}")
+                    continue
+                reused = run.reusable(page)
+                if reused is not None:
+                    done += letter
+                    yield reused, done
+                    continue
+                try:
+                    # "meals" is null for letters with no dishes
+                    meals = page.json().get('meals') or []
+                except ValueError as e:
+                    print(f"Error decoding TheMealDB page {page.url}: {e}")
+                    continue
+                recipes = []
+                for meal in meals:
+                    if meal.get('idMeal') in seen or not meal.get('strMeal'):
+                        continue
+                    seen.add(meal.get('idMeal'))
+                    recipes.append(themealdb_recipe(meal))
+                run.remember(url, [r['title'] for r in recipes])
+                done += letter
+                yield recipes, done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+
+@register
+class Forkgasm(Source):
+    # The feed is spooled to disk and decoded one recipe at a time. Cursor:
+    # the number of feed records already written; on resume those are
+    # skipped without being mapped.
+    name = "forkgasm"
+
+    @staticmethod
+    def add_arguments(parser):
+        parser.add_argument("--forkgasm-url", default=FORKGASM_URL)
+
+    async def batches(self, run, cursor):
+        offset = cursor or 0
+        url = self.args.forkgasm_url
+        print("Fetching from Forkgasm...")
+        try:
+            response = await run.engine.fetch(url, spool=True)
+        except FetchError as e:
+            print(f"Error fetching Forkgasm: {e}")
+            return
+        with contextlib.closing(response):
+            reused = run.reusable(response, skip=offset)
+            if reused is not None:
+                yield reused, len(response.derived["titles"])
+                return
+
+            # The feed only counts as derived (and skippable next run) once it
+            # was read to the end; titles of skipped records are still collected
+            titles = []
+            batch = []
+            consumed = 0
+            try:
+                for r in iter_forkgasm_records(response):
+                    consumed += 1
+                    if not isinstance(r, dict):
+                        continue
+                    if consumed <= offset:
+                        titles.append(forkgasm_title(r))
+                        continue
+                    recipe = forkgasm_recipe(r)
+                    titles.append(recipe['title'])
+                    batch.append(recipe)
+                    if len(batch) >= run.batch_size:
+                        yield batch, consumed
+                        batch = []
+            except ValueError as e:
+                print(f"Error decoding Forkgasm: {e}")
+                if batch:
+                    yield batch, consumed
+                return
+            if batch:
+                yield batch, consumed
+            run.remember(url, titles)
+
+
+@register
+class CulinaryHeritage(Source):
+    name = "culinary-heritage"
+
+    @staticmethod
+    def add_arguments(parser):
+        parser.add_argument("--culinary-heritage-url", default=CULINARY_HERITAGE_URL)
+
+    async def batches(self, run, cursor):
+        print("Fetching from CulinaryHeritage...")
+        try:
+            await run.engine.fetch(self.args.culinary_heritage_url)
+            print("CulinaryHeritage found!")
+        except FetchError as e:
+            print(f"Skipping CulinaryHeritage (Source #3): {e}")
+        return
+        yield
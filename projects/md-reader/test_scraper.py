@@ -0,0 +1,77 @@
+import io
+import os
+import asyncio
+import tempfile
+import unittest
+import contextlib
+
+import scraper
+import fixture_server
+from fetcher import FetchEngine, FetchError
+
+# End-to-end scraper runs against fixture_server.py (no network).
+#
+#   python -m unittest discover -s projects/md-reader -p "test_*.py"
+
+
+class ScraperRunTest(unittest.TestCase):
+    def setUp(self):
+        self.server, self.base_url = fixture_server.start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp = tmp.name
+        self.output_dir = os.path.join(self.tmp, "recipes")
+
+    def scrape(self):
+        argv = [
+            "--themealdb-url", self.base_url + "/mealdb", "--letters", "abc",
+            "--forkgasm-url", self.base_url + "/recipes.json",
+            "--culinary-heritage-url", self.base_url + "/missing.json",
+            "--output-dir", self.output_dir,
+            "--checkpoint", os.path.join(self.tmp, "checkpoint"),
+            "--cache-dir", os.path.join(self.tmp, "cache"),
+            "--dedup-index", os.path.join(self.tmp, "dedup"),
+            "--max-recipes", "20", "--retries", "0"
+        ]
+        out = io.StringIO()
+        with contextlib.redirect_stdout(out):
+            self.assertEqual(scraper.main(argv), 0)
+        return out.getvalue()
+
+    def snapshot(self):
+        return {name: os.stat(os.path.join(self.output_dir, name)).st_mtime_ns
+                for name in os.listdir(self.output_dir)}
+
+    def test_second_run_is_not_modified(self):
+        first = self.scrape()
+        files = self.snapshot()
+        self.assertEqual(sorted(files), [
+            "apple-crumble.md", "arroz-con-pollo.md", "banana-bread.md", "garlic-bread.md", "lentil-soup.md"
+        ])
+        self.assertEqual(first.count("Generated: "), 5)
+        self.assertIn("0 cache hits, 0 not modified", first)
+        self.assertFalse(os.path.exists(os.path.join(self.tmp, "checkpoint")))
+
+        self.server.requests.clear()
+        second = self.scrape()
+        # Three search pages and the feed revalidate; the 404 was never cached
+        self.assertIn("0 cache hits, 4 not modified", second)
+        self.assertNotIn("Generated: ", second)
+        self.assertEqual(second.count("Unchanged: "), 5)
+        self.assertEqual(self.snapshot(), files)
+        self.assertEqual(len(self.server.requests), 5)
+
+    def test_oversized_headers_raise_fetch_error(self):
+        async def fetch():
+            async with FetchEngine(retries=0, timeout=5) as engine:
+                await engine.fetch(self.base_url + "/huge-header")
+
+        with self.assertRaises(FetchError) as caught:
+            asyncio.run(fetch())
+        self.assertIn("LimitOverrunError", str(caught.exception))
+
+
+if __name__ == "__main__":
+    unittest.main()
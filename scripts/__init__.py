@@ -0,0 +1,3 @@
+# Shared helpers for the repository's Python build scripts.
+# Run the tools in this package from the repository root, e.g.
+#   python -m scripts.bench_fswalk
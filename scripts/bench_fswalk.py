@@ -0,0 +1,120 @@
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+
+from scripts.fswalk import walk
+
+# Benchmark: serial os.walk vs. the thread-pool walker on a synthetic tree.
+#
+#   python -m scripts.bench_fswalk                  # 50k files, warm cache
+#   sudo python -m scripts.bench_fswalk --drop-caches
+#
+# A warm page cache hides most of the readdir latency the pool is meant to
+# overlap; --drop-caches (root only) flushes it before every timed run.
+
+SKIP_DIRS = {'node_modules', '.git'}
+
+
+def build_tree(root, files, fanout, depth):
+    # Spread `files` files evenly over a fanout**depth grid of leaf directories,
+    # with a pruned node_modules dir at the top to exercise SKIP_DIRS.
+    leaves = [root]
+    for _ in range(depth):
+        leaves = [os.path.join(p, f"d{i:03d}") for p in leaves for i in range(fanout)]
+    for leaf in leaves:
+        os.makedirs(leaf, exist_ok=True)
+    os.makedirs(os.path.join(root, "node_modules", "pkg"), exist_ok=True)
+    for n in range(files):
+        leaf = leaves[n % len(leaves)]
+        with open(os.path.join(leaf, f"file{n:06d}.md"), "w") as f:
+            f.write("x")
+    return len(leaves)
+
+
+def drop_caches():
+    os.sync()
+    try:
+        with open("/proc/sys/vm/drop_caches", "w") as f:
+            f.write("3\n")
+        return True
+    except OSError:
+        return False
+
+
+def run_os_walk(root, stat_files):
+    paths = []
+    for dirpath, dirs, files in os.walk(root):
+        dirs[:] = sorted(d for d in dirs if d not in SKIP_DIRS)
+        for name in sorted(files):
+            path = os.path.join(dirpath, name)
+            if stat_files:
+                os.stat(path)
+            paths.append(path)
+    return paths
+
+
+def run_fswalk(root, stat_files, workers):
+    paths = []
+    for dirpath, dirs, files in walk(root, skip_dirs=SKIP_DIRS, stat_files=stat_files, workers=workers):
+        for entry in files:
+            if stat_files:
+                entry.stat()  # cached on the DirEntry by the worker
+            paths.append(os.path.join(dirpath, entry.name))
+    return paths
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the parallel tree walker.")
+    parser.add_argument("--files", type=int, default=50000)
+    parser.add_argument("--fanout", type=int, default=20)
+    parser.add_argument("--depth", type=int, default=2)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 8, 16, 32])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--stat", action="store_true", help="also stat every file")
+    parser.add_argument("--drop-caches", action="store_true",
+                        help="flush the page cache before each run (needs root)")
+    parser.add_argument("--dir", help="build the tree here instead of a temp dir")
+    args = parser.parse_args(argv)
+
+    root = tempfile.mkdtemp(prefix="fswalk-bench-", dir=args.dir)
+    try:
+        t0 = time.perf_counter()
+        leaves = build_tree(root, args.files, args.fanout, args.depth)
+        print(f"Built {args.files} files in {leaves} leaf dirs ({time.perf_counter() - t0:.1f}s)")
+
+        if args.drop_caches and not drop_caches():
+            print("Could not drop caches (not root?); timings are warm-cache.")
+            args.drop_caches = False
+
+        cases = [("os.walk", lambda: run_os_walk(root, args.stat))]
+        for w in args.workers:
+            cases.append((f"fswalk x{w}", lambda w=w: run_fswalk(root, args.stat, w)))
+
+        expected = None
+        baseline = None
+        for label, fn in cases:
+            best = None
+            for _ in range(args.repeat):
+                if args.drop_caches:
+                    drop_caches()
+                t0 = time.perf_counter()
+                paths = fn()
+                elapsed = time.perf_counter() - t0
+                best = elapsed if best is None else min(best, elapsed)
+            if expected is None:
+                expected = paths
+                baseline = best
+            elif paths != expected:
+                print(f"{label}: output differs from os.walk!")
+                return 1
+            print(f"{label:<14} {best * 1000:8.1f} ms  {baseline / best:5.2f}x  ({len(paths)} files)")
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,201 @@
+import os
+import sys
+import json
+import fnmatch
+import hashlib
+import argparse
+
+from scripts.fswalk import walk
+
+# Content-hash revision manifest and service-worker precache generator.
+#
+#   python -m scripts.revision_manifest projects/encyclopedia
+#   python -m scripts.revision_manifest projects/encyclopedia --check
+#
+# Reads <project>/precache.json, hashes every matching asset and writes
+# <project>/revision-manifest.json. If the project's sw.js contains a
+# "// <precache-manifest>" ... "// </precache-manifest>" block, that block is
+# regenerated with the per-file revisions and a cache name derived from them.
+# The service worker keys cached responses by (url, revision), so a deploy only
+# refetches the files whose hash actually changed.
+#
+# precache.json:
+#   {
+#     "cachePrefix": "encyclopedia",           # cache name = prefix + "-" + revision
+#     "include": ["index.html", "js/*.js"],     # patterns relative to the project dir
+#     "exclude": ["js/*.test.js"],              # optional
+#     "extra": ["../../favicon.svg"],           # optional assets outside the project dir
+#     "aliases": {"./": "index.html"}           # optional URLs served by another asset
+#   }
+
+CONFIG_FILE = "precache.json"
+MANIFEST_FILE = "revision-manifest.json"
+SW_FILE = "sw.js"
+BLOCK_START = "// <precache-manifest>"
+BLOCK_END = "// </precache-manifest>"
+# Generated or build-only files never belong in a precache list
+ALWAYS_EXCLUDE = {CONFIG_FILE, MANIFEST_FILE, SW_FILE}
+SKIP_DIRS = {'.git', 'node_modules', '__pycache__'}
+HASH_LEN = 12
+
+
+def file_revision(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            h.update(chunk)
+    return h.hexdigest()[:HASH_LEN]
+
+
+def load_config(project_dir):
+    path = os.path.join(project_dir, CONFIG_FILE)
+    try:
+        with open(path, "r") as f:
+            config = json.load(f)
+    except FileNotFoundError:
+        raise SystemExit(f"No {CONFIG_FILE} in {project_dir}")
+    if not config.get("cachePrefix") or not config.get("include"):
+        raise SystemExit(f"{path}: 'cachePrefix' and 'include' are required")
+    return config
+
+
+def collect_assets(project_dir, config):
+    include = config["include"]
+    exclude = config.get("exclude", [])
+    assets = []
+    for root, dirs, files in walk(project_dir, skip_dirs=SKIP_DIRS):
+        for entry in files:
+            rel = os.path.relpath(os.path.join(root, entry.name), project_dir).replace("\\", "/")
+            if rel in ALWAYS_EXCLUDE:
+                continue
+            if any(fnmatch.fnmatch(rel, p) for p in include) and \
+                    not any(fnmatch.fnmatch(rel, p) for p in exclude):
+                assets.append(rel)
+    for rel in config.get("extra", []):
+        if not os.path.isfile(os.path.join(project_dir, rel)):
+            raise SystemExit(f"{project_dir}: extra asset not found: {rel}")
+        assets.append(rel)
+    return assets
+
+
+def build_manifest(project_dir, config):
+    entries = []
+    revisions = {}
+    for rel in collect_assets(project_dir, config):
+        revisions[rel] = file_revision(os.path.join(project_dir, rel))
+        entries.append({"url": url_for(rel), "revision": revisions[rel]})
+    for url, target in sorted(config.get("aliases", {}).items()):
+        if target not in revisions:
+            raise SystemExit(f"{project_dir}: alias {url} points at unknown asset {target}")
+        entries.append({"url": url, "revision": revisions[target]})
+    entries.sort(key=lambda e: e["url"])
+
+    combined = hashlib.sha256()
+    for e in entries:
+        combined.update(f"{e['url']}\0{e['revision']}\n".encode("utf-8"))
+    revision = combined.hexdigest()[:HASH_LEN]
+    return {
+        "revision": revision,
+        "cacheName": f"{config['cachePrefix']}-{revision}",
+        "entries": entries
+    }
+
+
+def url_for(rel):
+    return rel if rel.startswith("../") else "./" + rel
+
+
+def render_block(manifest):
+    lines = [
+        BLOCK_START,
+        "// Generated by scripts/revision_manifest.py from precache.json. Do not edit by hand.",
+        f"var CACHE_NAME = '{manifest['cacheName']}';",
+        "var PRECACHE_MANIFEST = ["
+    ]
+    for i, e in enumerate(manifest["entries"]):
+        comma = "," if i < len(manifest["entries"]) - 1 else ""
+        lines.append(f"    {{ url: '{e['url']}', revision: '{e['revision']}' }}{comma}")
+    lines.append("];")
+    lines.append(BLOCK_END)
+    return "\n".join(lines)
+
+
+def update_service_worker(sw_path, manifest):
+    # Returns (current source, regenerated source); the latter is None when
+    # sw.js has no generated block to replace.
+    with open(sw_path, "r") as f:
+        source = f.read()
+    start = source.find(BLOCK_START)
+    end = source.find(BLOCK_END)
+    if start == -1 or end == -1 or end < start:
+        return source, None
+    return source, source[:start] + render_block(manifest) + source[end + len(BLOCK_END):]
+
+
+def diff_entries(old, new):
+    old_map = {e["url"]: e["revision"] for e in (old or {}).get("entries", [])}
+    new_map = {e["url"]: e["revision"] for e in new["entries"]}
+    changed = sorted(u for u in new_map if u in old_map and old_map[u] != new_map[u])
+    added = sorted(u for u in new_map if u not in old_map)
+    removed = sorted(u for u in old_map if u not in new_map)
+    return changed, added, removed
+
+
+def process(project_dir, check=False):
+    config = load_config(project_dir)
+    manifest = build_manifest(project_dir, config)
+    manifest_path = os.path.join(project_dir, MANIFEST_FILE)
+    manifest_json = json.dumps(manifest, indent=2) + "\n"
+
+    try:
+        with open(manifest_path, "r") as f:
+            old_json = f.read()
+        old = json.loads(old_json)
+    except (OSError, ValueError):
+        old_json, old = None, None
+
+    sw_path = os.path.join(project_dir, SW_FILE)
+    sw_old, sw_new = (None, None)
+    if os.path.exists(sw_path):
+        sw_old, sw_new = update_service_worker(sw_path, manifest)
+
+    stale = old_json != manifest_json or (sw_new is not None and sw_new != sw_old)
+    changed, added, removed = diff_entries(old, manifest)
+    if check:
+        if stale:
+            print(f"{project_dir}: precache manifest is out of date "
+                  f"({len(changed)} changed, {len(added)} added, {len(removed)} removed)")
+        return not stale
+
+    if not stale:
+        print(f"{project_dir}: {len(manifest['entries'])} assets, revision {manifest['revision']} (unchanged)")
+        return True
+    with open(manifest_path, "w") as f:
+        f.write(manifest_json)
+    if sw_new is not None and sw_new != sw_old:
+        with open(sw_path, "w") as f:
+            f.write(sw_new)
+    print(f"{project_dir}: {len(manifest['entries'])} assets, cache {manifest['cacheName']}")
+    for label, urls in (("changed", changed), ("added", added), ("removed", removed)):
+        for url in urls:
+            print(f"  {label}: {url}")
+    if os.path.exists(sw_path) and sw_new is None:
+        print(f"  {SW_FILE} has no {BLOCK_START} block; only {MANIFEST_FILE} was written")
+    return True
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate content-hash precache manifests.")
+    parser.add_argument("projects", nargs="+", help="project directories containing precache.json")
+    parser.add_argument("--check", action="store_true",
+                        help="exit non-zero instead of writing when a manifest is stale")
+    args = parser.parse_args(argv)
+
+    ok = True
+    for project_dir in args.projects:
+        ok = process(project_dir.rstrip("/"), check=args.check) and ok
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
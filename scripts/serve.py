@@ -0,0 +1,357 @@
+import os
+import re
+import sys
+import gzip
+import json
+import time
+import hashlib
+import argparse
+import threading
+from email.utils import formatdate, parsedate_to_datetime
+from http import HTTPStatus
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+# Static server that behaves like the production host, for development and
+# benchmarks.
+#
+#   python -m scripts.serve                        # http://127.0.0.1:8000/
+#   python -m scripts.serve --port 8080 --log requests.jsonl
+#
+# Unlike `python -m http.server` it:
+#   - serves a `.br` / `.gz` sibling (style.css.br) when the client accepts
+#     that encoding, and otherwise gzips compressible files itself (cached in
+#     memory per file version), with Vary: Accept-Encoding
+#   - sends a strong ETag (content hash of the representation sent) and
+#     answers If-None-Match / If-Modified-Since with 304
+#   - sends Cache-Control "immutable" for a year for hashed assets (a hex
+#     hash in the name, "app.3f9a2c1b.js", or a ?v= / ?rev= query) and
+#     "no-cache" (always revalidate) for everything else
+#   - honours single byte ranges (206, If-Range, 416) on the representation
+#     it sends
+#   - logs every request (method, path, status, encoding, bytes, ms to the
+#     last byte) as a JSON line to --log, and keeps the log in memory for
+#     in-process users such as the verification runners
+#
+# Content hashes are cached per (path, mtime, size), so only changed files
+# are rehashed.
+
+PORT = 8000
+# Served gzipped when no sibling exists and the file is at least this big
+COMPRESS_MIN_BYTES = 1024
+COMPRESSIBLE = {".html", ".css", ".js", ".mjs", ".json", ".svg", ".txt", ".md", ".xml", ".webmanifest", ".map"}
+HASHED_NAME_RE = re.compile(r"[.-][0-9a-f]{8,}\.[a-z0-9]+$")
+HASHED_QUERY_RE = re.compile(r"(^|&)(v|rev|hash)=")
+IMMUTABLE = "public, max-age=31536000, immutable"
+REVALIDATE = "no-cache"
+RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+CHUNK = 64 * 1024
+
+
+class ContentCache:
+    # (path, mtime_ns, size) -> ETag / (gzipped bytes, ETag)
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.hashes = {}
+        self.gzipped = {}
+
+    def etag(self, path, st):
+        key = (path, st.st_mtime_ns, st.st_size)
+        with self.lock:
+            etag = self.hashes.get(key)
+        if etag is None:
+            h = hashlib.sha256()
+            with open(path, "rb") as f:
+                for block in iter(lambda: f.read(1 << 20), b""):
+                    h.update(block)
+            etag = '"%s"' % h.hexdigest()[:32]
+            with self.lock:
+                self.hashes[key] = etag
+        return etag
+
+    def gzip(self, path, st):
+        key = (path, st.st_mtime_ns, st.st_size)
+        with self.lock:
+            entry = self.gzipped.get(key)
+        if entry is None:
+            with open(path, "rb") as f:
+                data = gzip.compress(f.read(), compresslevel=6, mtime=0)
+            entry = (data, '"%s"' % hashlib.sha256(data).hexdigest()[:32])
+            with self.lock:
+                self.gzipped[key] = entry
+        return entry
+
+
+def accepted_encodings(header):
+    # "gzip, deflate, br;q=0.5" -> {"gzip", "deflate", "br"} (q=0 excluded)
+    encodings = set()
+    for part in (header or "").split(","):
+        name, _, params = part.strip().partition(";")
+        q = re.search(r"q=([\d.]+)", params)
+        if name and not (q and float(q.group(1)) == 0):
+            encodings.add(name.strip().lower())
+    return encodings
+
+
+def parse_range(header, size):
+    # -> (start, end) inclusive, None to serve the whole file, or "invalid"
+    # for an unsatisfiable range. Multiple ranges are answered with the whole
+    # file, which HTTP allows.
+    m = RANGE_RE.match((header or "").strip())
+    if not m or (not m.group(1) and not m.group(2)):
+        return None
+    if not m.group(1):
+        length = int(m.group(2))
+        if length == 0:
+            return "invalid"
+        return max(0, size - length), size - 1
+    start = int(m.group(1))
+    end = min(int(m.group(2)), size - 1) if m.group(2) else size - 1
+    if start >= size or end < start:
+        return "invalid"
+    return start, end
+
+
+class Handler(SimpleHTTPRequestHandler):
+    # Keep-alive, like the real host; every response sets Content-Length
+    protocol_version = "HTTP/1.1"
+    # Set per server by make_server
+    content_cache = None
+    compress = True
+    log_file = None
+    log_lock = None
+    request_log = None
+
+    extensions_map = dict(SimpleHTTPRequestHandler.extensions_map, **{
+        ".js": "text/javascript", ".mjs": "text/javascript", ".json": "application/json",
+        ".webmanifest": "application/manifest+json", ".wasm": "application/wasm", ".md": "text/markdown"
+    })
+
+    def do_GET(self):
+        self.serve(send_body=True)
+
+    def do_HEAD(self):
+        self.serve(send_body=False)
+
+    def serve(self, send_body):
+        start = time.perf_counter()
+        self.sent = 0
+        self.encoding = None
+        path = self.translate_path(self.path)
+        if os.path.isdir(path):
+            if not urlsplit(self.path).path.endswith("/"):
+                self.send_response(HTTPStatus.MOVED_PERMANENTLY)
+                parts = urlsplit(self.path)
+                self.send_header("Location", parts.path + "/" + ("?" + parts.query if parts.query else ""))
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                self.log_request_done(start, HTTPStatus.MOVED_PERMANENTLY)
+                return
+            index = os.path.join(path, "index.html")
+            if not os.path.isfile(index):
+                # Directory listing, as http.server does
+                f = self.list_directory(path)
+                if f:
+                    try:
+                        if send_body:
+                            self.copyfile(f, self.wfile)
+                    finally:
+                        f.close()
+                self.log_request_done(start, HTTPStatus.OK)
+                return
+            path = index
+        if not os.path.isfile(path):
+            self.send_error(HTTPStatus.NOT_FOUND, "File not found")
+            self.log_request_done(start, HTTPStatus.NOT_FOUND)
+            return
+        status = self.send_file(path, send_body)
+        self.log_request_done(start, status)
+
+    def representation(self, path):
+        # -> (file path, stat, encoding, None) or, when gzipped in memory,
+        # (None, stat, "gzip", (bytes, ETag))
+        accepted = accepted_encodings(self.headers.get("Accept-Encoding"))
+        st = os.stat(path)
+        for encoding, suffix in (("br", ".br"), ("gzip", ".gz")):
+            sibling = path + suffix
+            if encoding in accepted and os.path.isfile(sibling):
+                sibling_st = os.stat(sibling)
+                # A sibling older than its source is stale
+                if sibling_st.st_mtime_ns >= st.st_mtime_ns:
+                    return sibling, sibling_st, encoding, None
+        ext = os.path.splitext(path)[1].lower()
+        if self.compress and "gzip" in accepted and ext in COMPRESSIBLE and st.st_size >= COMPRESS_MIN_BYTES:
+            return None, st, "gzip", self.content_cache.gzip(path, st)
+        return path, st, None, None
+
+    def send_file(self, path, send_body):
+        file_path, st, encoding, in_memory = self.representation(path)
+        data = None
+        if in_memory:
+            data, etag = in_memory
+            size = len(data)
+        else:
+            etag = self.content_cache.etag(file_path, st)
+            size = st.st_size
+        last_modified = formatdate(st.st_mtime, usegmt=True)
+        parts = urlsplit(self.path)
+        hashed = HASHED_NAME_RE.search(parts.path) or HASHED_QUERY_RE.search(parts.query)
+
+        def common_headers():
+            self.send_header("ETag", etag)
+            self.send_header("Last-Modified", last_modified)
+            self.send_header("Cache-Control", IMMUTABLE if hashed else REVALIDATE)
+            self.send_header("Vary", "Accept-Encoding")
+            self.send_header("Accept-Ranges", "bytes")
+
+        if self.not_modified(etag, st):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            common_headers()
+            self.end_headers()
+            return HTTPStatus.NOT_MODIFIED
+
+        byte_range = None
+        if self.headers.get("Range") and self.if_range_ok(etag, last_modified):
+            byte_range = parse_range(self.headers["Range"], size)
+        if byte_range == "invalid":
+            self.send_response(HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE)
+            self.send_header("Content-Range", f"bytes */{size}")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE
+        start, end = byte_range or (0, size - 1)
+        status = HTTPStatus.PARTIAL_CONTENT if byte_range else HTTPStatus.OK
+
+        self.encoding = encoding
+        self.send_response(status)
+        self.send_header("Content-Type", self.guess_type(path))
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+        if byte_range:
+            self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+        self.send_header("Content-Length", str(max(0, end - start + 1)))
+        common_headers()
+        self.end_headers()
+        if not send_body or size == 0:
+            return status
+        if data is not None:
+            self.wfile.write(data[start:end + 1])
+            self.sent = end - start + 1
+            return status
+        with open(file_path, "rb") as f:
+            f.seek(start)
+            remaining = end - start + 1
+            while remaining > 0:
+                block = f.read(min(CHUNK, remaining))
+                if not block:
+                    break
+                self.wfile.write(block)
+                self.sent += len(block)
+                remaining -= len(block)
+        return status
+
+    def not_modified(self, etag, st):
+        if_none_match = self.headers.get("If-None-Match")
+        if if_none_match:
+            # Weak comparison, as HTTP requires for If-None-Match
+            tags = {t.strip().removeprefix("W/") for t in if_none_match.split(",")}
+            return "*" in tags or etag in tags
+        if_modified_since = self.headers.get("If-Modified-Since")
+        if if_modified_since:
+            try:
+                return int(st.st_mtime) <= parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                return False
+        return False
+
+    def if_range_ok(self, etag, last_modified):
+        # A Range with an outdated If-Range validator gets the whole file
+        if_range = self.headers.get("If-Range")
+        return not if_range or if_range.strip() in (etag, last_modified)
+
+    def log_request_done(self, start, status):
+        entry = {
+            "time": round(time.time(), 3), "method": self.command, "path": self.path, "status": int(status),
+            "encoding": self.encoding, "bytes": self.sent, "ms": round((time.perf_counter() - start) * 1000, 2)
+        }
+        with self.log_lock:
+            if self.request_log is not None:
+                self.request_log.append(entry)
+            if self.log_file:
+                self.log_file.write(json.dumps(entry) + "\n")
+                self.log_file.flush()
+
+    def log_message(self, format, *args):
+        # Requests go to the JSON log; http.server's stderr lines are noise
+        pass
+
+
+def make_server(root, host="127.0.0.1", port=PORT, log_path=None, compress=True):
+    # -> ThreadingHTTPServer; server.request_log holds the request entries
+    log_file = open(log_path, "a") if log_path else None
+    request_log = []
+    handler = type("BoundHandler", (Handler,), {
+        "content_cache": ContentCache(), "compress": compress, "log_file": log_file,
+        "log_lock": threading.Lock(), "request_log": request_log,
+        "__init__": lambda self, *a, **kw: Handler.__init__(self, *a, directory=root, **kw)
+    })
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    server.request_log = request_log
+    server.log_file = log_file
+    return server
+
+
+def start_server(root, **kwargs):
+    # -> (server, base URL) serving root from a daemon thread; port 0 by
+    # default picks a free one
+    kwargs.setdefault("port", 0)
+    server = make_server(root, **kwargs)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://{server.server_address[0]}:{server.server_address[1]}/"
+
+
+def stop_server(server):
+    server.shutdown()
+    server.server_close()
+    if server.log_file:
+        server.log_file.close()
+
+
+def summarize(request_log):
+    # Totals for the benchmark runners: requests, bytes, server ms
+    ms = sorted(e["ms"] for e in request_log)
+    return {
+        "requests": len(request_log),
+        "bytes": sum(e["bytes"] for e in request_log),
+        "notModified": sum(1 for e in request_log if e["status"] == 304),
+        "compressed": sum(1 for e in request_log if e["encoding"]),
+        "serverMsP95": ms[min(len(ms) - 1, int(len(ms) * 0.95))] if ms else None,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the repository like the production static host.")
+    parser.add_argument("--root", default=".")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=PORT)
+    parser.add_argument("--log", metavar="PATH", help="append one JSON line per request")
+    parser.add_argument("--no-compress", action="store_true",
+                        help="only serve existing .br/.gz siblings, never gzip on the fly")
+    args = parser.parse_args(argv)
+
+    server = make_server(os.path.abspath(args.root), args.host, args.port, args.log, not args.no_compress)
+    print(f"Serving {os.path.abspath(args.root)} at http://{args.host}:{server.server_address[1]}/")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if server.log_file:
+            server.log_file.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,330 @@
+import os
+import sys
+import time
+import errno
+import runpy
+import select
+import struct
+import ctypes
+import ctypes.util
+import fnmatch
+import argparse
+
+from scripts.fswalk import walk
+
+# Watch mode: regenerate indexes and manifests as files change.
+#
+#   python -m scripts.watch              # inotify, polling if unavailable
+#   python -m scripts.watch --poll       # force the polling backend
+#   python -m scripts.watch --run-all    # run every generator once at startup
+#
+# Changed paths are collected until the tree has been quiet for --debounce
+# seconds, then mapped through GENERATORS so only the generators that depend
+# on them run. Generators run in-process (no interpreter start-up per rebuild)
+# and in the order listed, so outputs of one (e.g. content.json) are picked up
+# by the next; each generator's own outputs never re-trigger it, and neither do
+# paths under its optional skip_dirs.
+
+GENERATORS = [
+    {
+        "name": "encyclopedia",
+        "script": "projects/encyclopedia/scripts/generate_content.py",
+        "args": [],
+        "inputs": [
+            "js/projects.js", "dev/TEAM_COORDINATION.md", "legal/README.md", "README.md", "PROJECTS.md",
+            "admin/DEPENDENCY_POLICY.md", "games/cards/shared/INFO.md", "URL_PARAMETERS.md", "LICENSE_AUDIT.md"
+        ],
+        "outputs": ["projects/encyclopedia/data/*", "projects/encyclopedia/scripts/.parser_cache.json*"]
+    },
+    {
+        "name": "j-manifest",
+        "script": "update_manifest.py",
+        "args": [],
+        "inputs": ["games/j/packs/*.json"],
+        "outputs": [
+            "games/j/packs/manifest.json*", "games/j/packs/.manifest_cache*", "games/j/packs/bundles/*"
+        ]
+    },
+    {
+        "name": "j-pack-index",
+        "script": "pack_index.py",
+        "args": [],
+        "inputs": ["games/j/packs/*.json"],
+        "outputs": ["games/j/search_index/*"]
+    },
+    {
+        "name": "encyclopedia-precache",
+        "script": "scripts/revision_manifest.py",
+        "args": ["projects/encyclopedia"],
+        "inputs": [
+            "projects/encyclopedia/precache.json", "projects/encyclopedia/index.html",
+            "projects/encyclopedia/css/*", "projects/encyclopedia/js/*",
+            "projects/encyclopedia/data/*", "favicon.svg"
+        ],
+        "outputs": ["projects/encyclopedia/sw.js", "projects/encyclopedia/revision-manifest.json"]
+    },
+    {
+        "name": "md-reader-recipes",
+        "script": "projects/md-reader/build_recipe_index.py",
+        "args": [],
+        "inputs": ["projects/md-reader/recipes/*.md"],
+        "outputs": ["projects/md-reader/recipe_index.json*"]
+    },
+    {
+        # Lists every file with an indexed extension and indexes their
+        # contents; inputs and skip_dirs follow ALLOWED_EXTENSIONS and
+        # SKIP_DIRS in build_index.py
+        "name": "md-reader-index",
+        "script": "projects/md-reader/build_index.py",
+        "args": ["--incremental"],
+        "inputs": [
+            "*.md", "*.markdown", "*.txt", "*.csv", "*.json", "*.xml", "*.js", "*.html", "*.css", "*.py",
+            "*.sh", "*.bat", "*.yaml", "*.yml"
+        ],
+        "skip_dirs": ["dist", "build", "coverage", "search_index", "bundles"],
+        "outputs": [
+            "projects/md-reader/repo_index.js",
+            "projects/md-reader/search_index/*",
+            "projects/md-reader/.repo_index.snapshot*",
+            "projects/md-reader/.search_index.cache*"
+        ]
+    }
+]
+
+SKIP_DIRS = {'.git', 'node_modules', '__pycache__', '.pytest_cache'}
+IGNORE_PATTERNS = ["*.pyc", "*.swp", "*~", "*/.#*", ".#*"]
+
+
+def generators_for(paths):
+    selected = []
+    for gen in GENERATORS:
+        skip_dirs = set(gen.get("skip_dirs", []))
+        for path in paths:
+            if any(fnmatch.fnmatch(path, p) for p in gen["outputs"]):
+                continue
+            if skip_dirs.intersection(path.split("/")[:-1]):
+                continue
+            if any(fnmatch.fnmatch(path, p) for p in gen["inputs"]):
+                selected.append(gen)
+                break
+    return selected
+
+
+def relevant(path):
+    parts = path.split("/")
+    if any(p in SKIP_DIRS for p in parts):
+        return False
+    return not any(fnmatch.fnmatch(path, p) for p in IGNORE_PATTERNS)
+
+
+def run_generator(gen):
+    # runpy executes the script as __main__ in this process; scripts end with
+    # sys.exit(main()), so a SystemExit carries their status. Scripts that put
+    # their own directory on sys.path would otherwise add it again every run.
+    saved_argv = sys.argv
+    saved_path = sys.path[:]
+    sys.argv = [gen["script"]] + gen["args"]
+    t0 = time.perf_counter()
+    status = 0
+    try:
+        runpy.run_path(gen["script"], run_name="__main__")
+    except SystemExit as e:
+        status = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    except Exception as e:
+        print(f"[watch] {gen['name']} crashed: {e!r}")
+        status = 1
+    finally:
+        sys.argv = saved_argv
+        sys.path[:] = saved_path
+    elapsed = (time.perf_counter() - t0) * 1000
+    outcome = "ok" if status == 0 else f"FAILED (exit {status})"
+    print(f"[watch] {gen['name']}: {outcome} in {elapsed:.0f} ms")
+    return status == 0
+
+
+# --- Backends ---
+# Both expose wait(timeout) -> set of repo-relative changed paths.
+
+class InotifyWatcher:
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_DELETE_SELF = 0x00000400
+    IN_ISDIR = 0x40000000
+    IN_Q_OVERFLOW = 0x00004000
+    IN_IGNORED = 0x00008000
+    IN_CLOEXEC = 0o2000000
+    MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF
+    EVENT = struct.Struct("iIII")
+
+    def __init__(self, root):
+        libc_name = ctypes.util.find_library("c")
+        if not libc_name:
+            raise OSError(errno.ENOSYS, "libc not found")
+        self.libc = ctypes.CDLL(libc_name, use_errno=True)
+        if not hasattr(self.libc, "inotify_init1"):
+            raise OSError(errno.ENOSYS, "inotify not supported")
+        self.fd = self.libc.inotify_init1(self.IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.root = root
+        self.wds = {}
+        self.add_tree(root)
+
+    def add_watch(self, path):
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(path), self.MASK)
+        if wd < 0:
+            err = ctypes.get_errno()
+            if err == errno.ENOSPC:
+                raise OSError(err, "inotify watch limit reached (fs.inotify.max_user_watches)")
+            return
+        self.wds[wd] = path
+
+    def add_tree(self, top):
+        # Returns the files found, so a directory moved or created in one
+        # piece still reports its contents as changed.
+        found = []
+        for root, dirs, files in walk(top, skip_dirs=SKIP_DIRS):
+            self.add_watch(root)
+            found.extend(os.path.join(root, e.name) for e in files)
+        return found
+
+    def rel(self, path):
+        return os.path.relpath(path, self.root).replace("\\", "/")
+
+    def wait(self, timeout):
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+        data = os.read(self.fd, 64 * 1024)
+        changed = set()
+        offset = 0
+        while offset < len(data):
+            wd, mask, _cookie, length = self.EVENT.unpack_from(data, offset)
+            offset += self.EVENT.size
+            name = data[offset:offset + length].rstrip(b"\0").decode("utf-8", "surrogateescape")
+            offset += length
+            if mask & self.IN_Q_OVERFLOW:
+                # Events were dropped; treat everything as changed
+                changed.add("*")
+                continue
+            if mask & self.IN_IGNORED:
+                self.wds.pop(wd, None)
+                continue
+            parent = self.wds.get(wd)
+            if parent is None:
+                continue
+            path = os.path.join(parent, name) if name else parent
+            if mask & self.IN_ISDIR and mask & (self.IN_CREATE | self.IN_MOVED_TO):
+                if os.path.basename(path) not in SKIP_DIRS:
+                    changed.update(self.rel(p) for p in self.add_tree(path))
+            changed.add(self.rel(path))
+        return changed
+
+    def close(self):
+        os.close(self.fd)
+
+
+class PollingWatcher:
+    def __init__(self, root, interval):
+        self.root = root
+        self.interval = interval
+        self.state = self.scan()
+
+    def scan(self):
+        state = {}
+        for root, dirs, files in walk(self.root, skip_dirs=SKIP_DIRS, stat_files=True):
+            for entry in files:
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                path = os.path.relpath(os.path.join(root, entry.name), self.root).replace("\\", "/")
+                state[path] = (st.st_mtime_ns, st.st_size, st.st_ino)
+        return state
+
+    def wait(self, timeout):
+        time.sleep(min(timeout, self.interval) if timeout is not None else self.interval)
+        new_state = self.scan()
+        changed = {p for p, s in new_state.items() if self.state.get(p) != s}
+        changed.update(p for p in self.state if p not in new_state)
+        self.state = new_state
+        return changed
+
+    def close(self):
+        pass
+
+
+def make_watcher(root, poll, interval):
+    if not poll:
+        try:
+            watcher = InotifyWatcher(root)
+            print(f"[watch] inotify: watching {len(watcher.wds)} directories")
+            return watcher
+        except OSError as e:
+            print(f"[watch] inotify unavailable ({e}), falling back to polling")
+    watcher = PollingWatcher(root, interval)
+    print(f"[watch] polling {len(watcher.state)} files every {interval}s")
+    return watcher
+
+
+def run_batch(paths, dry_run=False):
+    if "*" in paths:
+        selected = list(GENERATORS)
+    else:
+        selected = generators_for(paths)
+    if not selected:
+        return
+    shown = sorted(paths)[:5]
+    more = f" (+{len(paths) - len(shown)} more)" if len(paths) > len(shown) else ""
+    print(f"[watch] changed: {', '.join(shown)}{more}")
+    for gen in selected:
+        if dry_run:
+            print(f"[watch] would run {gen['name']}")
+        else:
+            run_generator(gen)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Regenerate build outputs when their inputs change.")
+    parser.add_argument("--poll", action="store_true", help="use the polling backend instead of inotify")
+    parser.add_argument("--interval", type=float, default=1.0, help="polling interval in seconds")
+    parser.add_argument("--debounce", type=float, default=0.3,
+                        help="quiet period before a burst of changes is processed")
+    parser.add_argument("--max-delay", type=float, default=2.0,
+                        help="process a continuous stream of changes at least this often")
+    parser.add_argument("--run-all", action="store_true", help="run every generator once at startup")
+    parser.add_argument("--dry-run", action="store_true", help="only print which generators would run")
+    args = parser.parse_args(argv)
+
+    root = "."
+    if args.run_all:
+        run_batch({"*"}, args.dry_run)
+    watcher = make_watcher(root, args.poll, args.interval)
+    pending = set()
+    first_change = None
+    try:
+        while True:
+            timeout = None if not pending else args.debounce
+            changed = {p for p in watcher.wait(timeout) if p == "*" or relevant(p)}
+            now = time.monotonic()
+            if changed:
+                if not pending:
+                    first_change = now
+                pending |= changed
+                if now - first_change < args.max_delay:
+                    continue
+            if pending:
+                batch, pending = pending, set()
+                run_batch(batch, args.dry_run)
+    except KeyboardInterrupt:
+        print("\n[watch] stopped")
+    finally:
+        watcher.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
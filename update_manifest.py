@@ -1,56 +1,452 @@
-import json
 import os
+import re
+import sys
+import json
+import random
+import shutil
+import hashlib
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+# Builds games/j/packs/manifest.json from the question packs next to it.
+#
+#   python update_manifest.py
+#   python update_manifest.py --check   # exit 1 if the manifest or a bundle is stale or a pack is invalid
+#
+# The manifest is {"groups": [...], "packs": [{id, groupId, title, path, icon,
+# count}, ...]}. Groups, pack order and the curated fields of existing entries
+# (groupId, title, icon) are kept; id and count always come from the pack, so
+# count is the number of questions it actually holds. A new pack takes its
+# title (and groupId / icon, if present) from its meta; without a groupId it
+# joins the group whose packs share most of its tags.
+#
+# Every pack is validated: meta.id present and unique across packs, question
+# ids unique within the pack, options an object and `correct` one of its keys.
+# Any error aborts without touching the manifest.
+#
+# Each pack is also split into packs/bundles/<pack>/: header.json (meta and
+# question ids) and fixed-size question chunks 0.json, 1.json, ... holding the
+# questions in a fixed shuffled order, so any chunk is a random sample and a
+# round downloads a few random chunks (twice the questions it needs) instead
+# of the whole pack. Every group gets
+# bundles/group_<id>.json with the headers of all its packs (one request for
+# a whole group). Chunk [offset, count, bytes] and header sizes are recorded
+# in the manifest entries, the group bundle path and size in the group.
+#
+# A cache keyed by (mtime, size), then by the SHA-256 of the file, holds each
+# pack's summary, header and validation result, so a no-op run reads no pack
+# at all and only new or changed packs are parsed (concurrently) and
+# re-split. The manifest and bundles are only rewritten when their content
+# changes. --check writes nothing, not even the cache, and re-splits every
+# pack in memory to compare the bundles on disk with what a build would
+# write, so it also works on a fresh checkout without the cache.
+
+PACKS_DIR = "games/j/packs"
+MANIFEST_FILE = "manifest.json"
+CACHE_FILE = "games/j/packs/.manifest_cache"
+CACHE_VERSION = 2
+# Files in PACKS_DIR that are not packs
+NOT_PACKS = {MANIFEST_FILE}
+BUNDLES_DIR = "bundles"
+# Questions per chunk: the default round of 10 questions draws from two
+CHUNK_QUESTIONS = 10
+
+
+def load_cache(path):
+    try:
+        with open(path, "r") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if data.get("version") != CACHE_VERSION:
+        return {}
+    return data.get("packs", {})
+
+
+def save_cache(path, packs):
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump({"version": CACHE_VERSION, "packs": packs}, f, separators=(",", ":"), ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def analyze(filename, data):
+    # -> (summary, errors, warnings) for one decoded pack
+    errors, warnings = [], []
+    meta = data.get("meta") if isinstance(data, dict) else None
+    if not isinstance(meta, dict):
+        return None, ["no 'meta' object"], warnings
+    if not meta.get("id"):
+        errors.append("meta.id is missing")
+    questions = data.get("questions")
+    if not isinstance(questions, list) or not questions:
+        errors.append("no 'questions' list")
+        questions = []
+
+    seen = set()
+    for n, q in enumerate(questions, 1):
+        where = f"question {n}"
+        if not isinstance(q, dict):
+            errors.append(f"{where}: not an object")
+            continue
+        qid = q.get("id")
+        if qid is None:
+            errors.append(f"{where}: no id")
+        else:
+            where = f"question {qid!r}"
+            if qid in seen:
+                errors.append(f"{where}: duplicate id")
+            seen.add(qid)
+        if not q.get("text"):
+            errors.append(f"{where}: no text")
+        options = q.get("options")
+        if not isinstance(options, dict) or len(options) < 2:
+            errors.append(f"{where}: options must be an object with at least two choices")
+        elif "correct" not in q:
+            errors.append(f"{where}: no 'correct' key")
+        elif q["correct"] not in options:
+            errors.append(f"{where}: correct answer {q['correct']!r} is not one of {sorted(options)}")
 
-packs_dir = 'games/j/packs'
-manifest_path = os.path.join(packs_dir, 'manifest.json')
+    declared = meta.get("questionCount")
+    if declared is not None and declared != len(questions):
+        warnings.append(f"meta.questionCount is {declared}, pack has {len(questions)} questions")
+    summary = {
+        "id": meta.get("id"),
+        "title": meta.get("title") or filename[:-len(".json")].replace("_", " ").title(),
+        "count": len(questions),
+        "tags": [str(t).lower() for t in meta.get("tags") or []],
+        "groupId": meta.get("groupId"),
+        "icon": meta.get("icon")
+    }
+    return summary, errors, warnings
 
-# Read existing manifest
-try:
-    with open(manifest_path, 'r') as f:
-        manifest = json.load(f)
-except FileNotFoundError:
-    manifest = []
 
-# Create a set of existing paths to avoid duplicates
-existing_paths = {item['path'] for item in manifest}
+def scan(packs_dir, cache, jobs, stats):
+    # -> ({filename: cache record} for every pack, {filename: pack data} for
+    # the packs that were reparsed)
+    records = {}
+    changed = {}
+    parsed = {}
+    for filename in sorted(os.listdir(packs_dir)):
+        if not filename.endswith(".json") or filename in NOT_PACKS:
+            continue
+        path = os.path.join(packs_dir, filename)
+        st = os.stat(path)
+        key = [st.st_mtime_ns, st.st_size]
+        record = cache.get(filename)
+        if record and record["stat"] == key:
+            records[filename] = record
+            stats["reused"] += 1
+            continue
+        with open(path, "rb") as f:
+            raw = f.read()
+        digest = hashlib.sha256(raw).hexdigest()
+        if record and record["sha256"] == digest:
+            # Touched but not modified
+            records[filename] = dict(record, stat=key)
+            stats["rehashed"] += 1
+            continue
+        changed[filename] = (key, digest, raw)
 
-# List all json files in the directory
-files = os.listdir(packs_dir)
+    def parse(filename):
+        key, digest, raw = changed[filename]
+        try:
+            data = json.loads(raw)
+            summary, errors, warnings = analyze(filename, data)
+        except ValueError as e:
+            data, summary, errors, warnings = None, None, [f"invalid JSON: {e}"], []
+        if errors:
+            data = None
+        return filename, data, {"stat": key, "sha256": digest, "summary": summary,
+                                "errors": errors, "warnings": warnings}
 
-new_entries = []
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        for filename, data, record in pool.map(parse, changed):
+            records[filename] = record
+            if data is not None:
+                parsed[filename] = data
+    stats["parsed"] += len(changed)
+    return records, parsed
 
-for filename in files:
-    if filename == 'manifest.json' or not filename.endswith('.json'):
-        continue
 
-    file_path = os.path.join(packs_dir, filename)
-    relative_path = f"packs/{filename}"
+def check_ids(records):
+    # Pack ids must be unique across the directory
+    owners = {}
+    errors = []
+    for filename, record in records.items():
+        pack_id = record["summary"] and record["summary"]["id"]
+        if not pack_id:
+            continue
+        if pack_id in owners:
+            errors.append(f"{filename}: pack id {pack_id!r} is also used by {owners[pack_id]}")
+        else:
+            owners[pack_id] = filename
+    return errors
 
-    if relative_path in existing_paths:
-        continue
 
+def guess_group(tags, groups, entries, records):
+    # The group whose packs share most tags with `tags`, or None
+    scores = {}
+    for entry in entries:
+        record = records.get(os.path.basename(entry["path"]))
+        if not record or not entry.get("groupId"):
+            continue
+        shared = len(set(tags) & set(record["summary"]["tags"]))
+        scores[entry["groupId"]] = scores.get(entry["groupId"], 0) + shared
+    known = {g["id"] for g in groups}
+    best = max((gid for gid in scores if gid in known and scores[gid]), key=lambda gid: scores[gid], default=None)
+    return best
+
+
+def write_if_changed(path, content):
     try:
-        with open(file_path, 'r') as f:
-            data = json.load(f)
-            if 'meta' in data:
-                meta = data['meta']
-                entry = {
-                    "id": meta.get('id', filename.replace('.json', '')),
-                    "title": meta.get('title', filename.replace('_', ' ').title()),
-                    "path": relative_path
-                }
-                new_entries.append(entry)
-                print(f"Added: {entry['title']} ({filename})")
-            else:
-                print(f"Skipping {filename}: No 'meta' key found.")
-    except Exception as e:
-        print(f"Error reading {filename}: {e}")
-
-# Add new entries to manifest
-manifest.extend(new_entries)
-
-# Write back to manifest.json
-with open(manifest_path, 'w') as f:
-    json.dump(manifest, f, indent=4)
-
-print("Manifest updated successfully.")
+        with open(path, "r", encoding="utf-8") as f:
+            if f.read() == content:
+                return False
+    except OSError:
+        pass
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+    return True
+
+
+def compact(value):
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+
+
+# Only arrays json.dumps spread over lines: a JSON string never holds a raw newline
+NUMBER_ARRAY_RE = re.compile(r"\[\n[\d,\s]*\]")
+
+
+def format_manifest(manifest):
+    # Indented like the hand-written file, but chunk [offset, count, bytes]
+    # triples stay on one line each
+    text = json.dumps(manifest, indent=4, ensure_ascii=False)
+    return NUMBER_ARRAY_RE.sub(lambda m: re.sub(r"\s+", "", m.group()).replace(",", ", "), text)
+
+
+def split_pack(data, chunk_size):
+    # -> (header, chunks). The order is shuffled once, seeded by the pack id,
+    # so chunks stay stable across builds while each is a random sample.
+    questions = list(data["questions"])
+    random.Random(str(data["meta"]["id"])).shuffle(questions)
+    header = {"meta": data["meta"], "ids": [q["id"] for q in questions]}
+    return header, [questions[i:i + chunk_size] for i in range(0, len(questions), chunk_size)]
+
+
+def pack_bundle(filename, data, chunk_size):
+    # -> (bundle record kept in the cache, {path under bundles/: content})
+    stem = filename[:-len(".json")]
+    header, chunks = split_pack(data, chunk_size)
+    content = compact(header)
+    files = {f"{stem}/header.json": content}
+    record = {"size": chunk_size, "header": header, "headerBytes": len(content.encode("utf-8")), "chunks": []}
+    for n, chunk in enumerate(chunks):
+        content = compact(chunk)
+        files[f"{stem}/{n}.json"] = content
+        record["chunks"].append([n * chunk_size, len(chunk), len(content.encode("utf-8"))])
+    return record, files
+
+
+def write_pack_bundle(bundles_dir, filename, data, chunk_size, stats):
+    # Writes bundles/<pack>/ and returns the bundle record
+    record, files = pack_bundle(filename, data, chunk_size)
+    pack_dir = os.path.join(bundles_dir, filename[:-len(".json")])
+    os.makedirs(pack_dir, exist_ok=True)
+    for name, content in files.items():
+        stats["written"] += write_if_changed(os.path.join(bundles_dir, name), content)
+    for name in os.listdir(pack_dir):
+        # Chunks beyond the current count are left over from a larger pack
+        stem = name[:-len(".json")]
+        if stem.isdigit() and int(stem) >= len(record["chunks"]):
+            os.remove(os.path.join(pack_dir, name))
+            stats["removed"] += 1
+    return record
+
+
+def load_pack(packs_dir, filename, parsed):
+    data = parsed.get(filename)
+    if data is None:
+        with open(os.path.join(packs_dir, filename), "rb") as f:
+            data = json.loads(f.read())
+    return data
+
+
+def update_bundles(packs_dir, records, parsed, chunk_size, stats):
+    # Re-splits reparsed packs, and any pack whose bundle is missing or was
+    # built with another chunk size
+    bundles_dir = os.path.join(packs_dir, BUNDLES_DIR)
+    for filename, record in records.items():
+        bundle = record.get("bundle")
+        header_path = os.path.join(bundles_dir, filename[:-len(".json")], "header.json")
+        if filename not in parsed and bundle and bundle["size"] == chunk_size and os.path.exists(header_path):
+            continue
+        data = load_pack(packs_dir, filename, parsed)
+        record["bundle"] = write_pack_bundle(bundles_dir, filename, data, chunk_size, stats)
+        stats["split"] += 1
+
+
+def group_bundles(manifest, records):
+    # -> {name: content} of bundles/group_<id>.json, {"packs": {pack path:
+    # header}} in manifest order; records each group's bundle path and size
+    files = {}
+    for group in manifest["groups"]:
+        headers = {entry["path"]: records[os.path.basename(entry["path"])]["bundle"]["header"]
+                   for entry in manifest["packs"] if entry["groupId"] == group["id"]}
+        name = f"group_{group['id']}.json"
+        files[name] = compact({"packs": headers})
+        group["bundle"] = {"path": f"packs/{BUNDLES_DIR}/{name}", "bytes": len(files[name].encode("utf-8"))}
+    return files
+
+
+def write_group_bundles(packs_dir, manifest, records, stats):
+    bundles_dir = os.path.join(packs_dir, BUNDLES_DIR)
+    keep = {f[:-len(".json")] for f in records}
+    for name, content in group_bundles(manifest, records).items():
+        stats["written"] += write_if_changed(os.path.join(bundles_dir, name), content)
+        keep.add(name)
+    for name in os.listdir(bundles_dir):
+        if name not in keep:
+            path = os.path.join(bundles_dir, name)
+            shutil.rmtree(path) if os.path.isdir(path) else os.remove(path)
+            stats["removed"] += 1
+
+
+def stale_files(directory, expected):
+    # -> sorted paths under `directory` that are missing, differ from
+    # `expected` ({relative path: content}) or are not expected at all
+    stale = []
+    for name, content in expected.items():
+        try:
+            with open(os.path.join(directory, name), "r", encoding="utf-8") as f:
+                if f.read() == content:
+                    continue
+        except OSError:
+            pass
+        stale.append(name)
+    for root, _, files in os.walk(directory):
+        for name in files:
+            path = os.path.relpath(os.path.join(root, name), directory).replace(os.sep, "/")
+            if path not in expected:
+                stale.append(path)
+    return sorted(stale)
+
+
+def build_manifest(manifest, records):
+    if isinstance(manifest, list):
+        # Legacy layout: a bare list of packs
+        manifest = {"groups": [], "packs": manifest}
+    groups = [dict(g) for g in manifest.get("groups", [])]
+    group_icons = {g["id"]: g.get("icon", "") for g in groups}
+    existing = {entry["path"]: entry for entry in manifest.get("packs", [])}
+    order = [p for p in existing if os.path.basename(p) in records]
+    order += [f"packs/{name}" for name in records if f"packs/{name}" not in existing]
+
+    packs = []
+    for path in order:
+        summary = records[os.path.basename(path)]["summary"]
+        old = existing.get(path, {})
+        group_id = old.get("groupId") or summary["groupId"]
+        if not group_id:
+            group_id = guess_group(summary["tags"], groups, manifest.get("packs", []), records)
+            print(f"{path}: no groupId, assigned to {group_id!r} by tags (set meta.groupId to choose)")
+        bundle = records[os.path.basename(path)]["bundle"]
+        packs.append({
+            "id": summary["id"],
+            "groupId": group_id,
+            "title": old.get("title") or summary["title"],
+            "path": path,
+            "icon": old.get("icon") or summary["icon"] or group_icons.get(group_id, ""),
+            "count": summary["count"],
+            "bundle": {
+                "dir": f"packs/{BUNDLES_DIR}/{path[len('packs/'):-len('.json')]}/",
+                "header": bundle["headerBytes"],
+                "chunks": bundle["chunks"]
+            }
+        })
+        if path not in existing:
+            print(f"Added: {summary['title']} ({path})")
+    for path in existing:
+        if os.path.basename(path) not in records:
+            print(f"Removed: {path} (file is gone)")
+    return dict(manifest, groups=groups, packs=packs)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Validate the J Quiz packs and rebuild packs/manifest.json.")
+    parser.add_argument("--packs-dir", default=PACKS_DIR)
+    parser.add_argument("--check", action="store_true", help="do not write; exit 1 if the manifest or a bundle is out of date")
+    parser.add_argument("--no-cache", action="store_true", help=f"ignore {CACHE_FILE} and reparse every pack")
+    parser.add_argument("--jobs", type=int, default=min(8, os.cpu_count() or 1))
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_QUESTIONS, help="questions per bundle chunk")
+    args = parser.parse_args(argv)
+
+    manifest_path = os.path.join(args.packs_dir, MANIFEST_FILE)
+    cache_path = os.path.join(args.packs_dir, os.path.basename(CACHE_FILE))
+    stats = {"reused": 0, "rehashed": 0, "parsed": 0, "split": 0, "written": 0, "removed": 0}
+    records, parsed = scan(args.packs_dir, {} if args.no_cache else load_cache(cache_path), args.jobs, stats)
+
+    errors = check_ids(records)
+    for filename, record in sorted(records.items()):
+        for warning in record["warnings"]:
+            print(f"Warning: {filename}: {warning}")
+        errors.extend(f"{filename}: {e}" for e in record["errors"])
+    print(f"Packs: {len(records)} ({stats['parsed']} parsed, {stats['rehashed']} rehashed, "
+          f"{stats['reused']} unchanged)")
+    if errors:
+        if not args.check:
+            save_cache(cache_path, records)
+        for error in errors:
+            print(f"Error: {error}")
+        print(f"Aborted: {len(errors)} validation error(s); {manifest_path} not updated.")
+        return 1
+
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            current = f.read()
+        manifest = json.loads(current)
+    except FileNotFoundError:
+        current, manifest = None, {"groups": [], "packs": []}
+    if args.check:
+        # Nothing is written: every pack is re-split in memory (the cache is
+        # gitignored, so it cannot vouch for the committed bundles) and the
+        # expected bundle files are compared with the ones on disk
+        expected = {}
+        for filename, record in records.items():
+            record["bundle"], files = pack_bundle(filename, load_pack(args.packs_dir, filename, parsed),
+                                                  args.chunk_size)
+            expected.update(files)
+        manifest = build_manifest(manifest, records)
+        expected.update(group_bundles(manifest, records))
+        stale = stale_files(os.path.join(args.packs_dir, BUNDLES_DIR), expected)
+        if stale:
+            for name in stale[:10]:
+                print(f"Stale bundle file: {name}")
+            if len(stale) > 10:
+                print(f"... and {len(stale) - 10} more")
+            print(f"Bundles in {os.path.join(args.packs_dir, BUNDLES_DIR)} are out of date; run update_manifest.py")
+            return 1
+    else:
+        update_bundles(args.packs_dir, records, parsed, args.chunk_size, stats)
+        save_cache(cache_path, records)
+        manifest = build_manifest(manifest, records)
+        write_group_bundles(args.packs_dir, manifest, records, stats)
+        print(f"Bundles: {stats['split']} pack(s) split, {stats['written']} file(s) written, "
+              f"{stats['removed']} removed")
+    content = format_manifest(manifest)
+    if content == current:
+        print("Manifest unchanged.")
+        return 0
+    if args.check:
+        print(f"{manifest_path} is out of date; run update_manifest.py")
+        return 1
+    tmp_path = manifest_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(content)
+    os.replace(tmp_path, manifest_path)
+    print("Manifest updated successfully.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
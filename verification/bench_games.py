@@ -0,0 +1,272 @@
+import os
+import sys
+import json
+import time
+import fnmatch
+import argparse
+import datetime
+import statistics
+import subprocess
+
+from playwright.sync_api import Error as PlaywrightError, sync_playwright
+
+from verify import MOBILE_USER_AGENT
+# scripts/ is importable once verify has put the repository root on sys.path
+from scripts.serve import start_server, stop_server
+
+# Frame-time and memory benchmark for the canvas games.
+#
+#   python verification/bench_games.py                     # every game, phone profile
+#   python verification/bench_games.py snake breakout --profile desktop
+#   python verification/bench_games.py --runs 3 --no-record
+#
+# verification/bench_games.json lists the games, each with a `ready`
+# selector, `start` steps that get past the menu and `loop` steps repeated
+# for the whole measured duration. Steps:
+#   {"click": "#btn-start"}   {"press": "Space"}   {"hold": "ArrowLeft", "ms": 500}   {"wait": 300}
+#
+# Games run one after another (concurrent pages would share the CPU and
+# skew each other) in one browser, each in a fresh context with the
+# profile's viewport and CPU throttling (DevTools CPU throttling rate 4
+# approximates a low-end phone). An init script runs its own
+# requestAnimationFrame loop, recording every frame timestamp, and a
+# PerformanceObserver collects long tasks (> 50 ms). The JS heap is
+# measured after a forced GC before and after the run.
+#
+# Per game: frame time p50/p95/p99 and max (ms), dropped frames (frames a
+# 60 Hz display had to repeat) and their ratio, long task count and total
+# time, heap growth (MB). With --runs N each metric is the median of N runs.
+#
+# Results are appended to verification/bench_history.json. A metric fails
+# when it exceeds the profile's "budget", or when it regresses against the
+# median of the last HISTORY_WINDOW recorded runs by more than both the
+# relative and the absolute margin in "thresholds". Any failure exits 1.
+
+CONFIG_FILE = "verification/bench_games.json"
+HISTORY_FILE = "verification/bench_history.json"
+HISTORY_WINDOW = 5
+HISTORY_LIMIT = 100
+FRAME_MS = 1000 / 60
+MB = 1024 * 1024
+
+INSTRUMENT_JS = """(() => {
+    const bench = window.__bench = { frames: [], longTasks: [], recording: false };
+    const tick = (t) => {
+        if (bench.recording) bench.frames.push(t);
+        requestAnimationFrame(tick);
+    };
+    requestAnimationFrame(tick);
+    try {
+        new PerformanceObserver((list) => {
+            if (bench.recording) for (const entry of list.getEntries()) bench.longTasks.push(entry.duration);
+        }).observe({ type: 'longtask' });
+    } catch (e) {}
+})();"""
+
+
+def percentile(values, p):
+    # Nearest-rank percentile of a sorted list
+    if not values:
+        return None
+    return values[min(len(values) - 1, max(0, int(round(p / 100 * len(values))) - 1))]
+
+
+def frame_metrics(frames, long_tasks, duration):
+    deltas = sorted(b - a for a, b in zip(frames, frames[1:]))
+    dropped = sum(max(0, round(d / FRAME_MS) - 1) for d in deltas)
+    return {
+        "frames": len(deltas),
+        "fps": round(len(deltas) / duration, 1),
+        "p50": round(percentile(deltas, 50) or 0, 2),
+        "p95": round(percentile(deltas, 95) or 0, 2),
+        "p99": round(percentile(deltas, 99) or 0, 2),
+        "max": round(deltas[-1] if deltas else 0, 2),
+        "dropped": dropped,
+        "droppedRatio": round(dropped / (dropped + len(deltas)), 4) if deltas else 1.0,
+        "longTasks": len(long_tasks),
+        "longTaskMs": round(sum(long_tasks), 1),
+    }
+
+
+def heap_used(cdp):
+    cdp.send("HeapProfiler.collectGarbage")
+    return cdp.send("Runtime.getHeapUsage")["usedSize"]
+
+
+def run_steps(page, steps):
+    for step in steps:
+        if "click" in step:
+            page.locator(step["click"]).first.click()
+        elif "press" in step:
+            page.keyboard.press(step["press"])
+        elif "hold" in step:
+            page.keyboard.down(step["hold"])
+            page.wait_for_timeout(step.get("ms", 200))
+            page.keyboard.up(step["hold"])
+        elif "wait" in step:
+            page.wait_for_timeout(step["wait"])
+
+
+def bench_game(browser, game, profile, base_url, duration):
+    # -> (metrics, [problems])
+    problems = []
+    width, height = profile.get("viewport", [1280, 800])
+    options = {"viewport": {"width": width, "height": height}}
+    if profile.get("mobile"):
+        options.update(is_mobile=True, has_touch=True, user_agent=MOBILE_USER_AGENT)
+    context = browser.new_context(**options)
+    context.add_init_script(INSTRUMENT_JS)
+    try:
+        page = context.new_page()
+        page.on("pageerror", lambda e: problems.append(f"page error: {e}"))
+        cdp = context.new_cdp_session(page)
+        cdp.send("Emulation.setCPUThrottlingRate", {"rate": profile.get("cpuThrottle", 1)})
+        page.goto(base_url + game["url"], wait_until="load")
+        if game.get("ready"):
+            page.locator(game["ready"]).first.wait_for(state="visible")
+        run_steps(page, game.get("start", []))
+
+        heap_start = heap_used(cdp)
+        page.evaluate("window.__bench.recording = true")
+        start = time.perf_counter()
+        while time.perf_counter() - start < duration:
+            run_steps(page, game.get("loop") or [{"wait": 250}])
+        page.evaluate("window.__bench.recording = false")
+        elapsed = time.perf_counter() - start
+        heap_end = heap_used(cdp)
+
+        data = page.evaluate("({ frames: window.__bench.frames, longTasks: window.__bench.longTasks })")
+        metrics = frame_metrics(data["frames"], data["longTasks"], elapsed)
+        metrics["heapStartMB"] = round(heap_start / MB, 2)
+        metrics["heapGrowthMB"] = round((heap_end - heap_start) / MB, 2)
+        return metrics, problems
+    except PlaywrightError as e:
+        return None, problems + [str(e).splitlines()[0]]
+    finally:
+        context.close()
+
+
+def median_metrics(runs):
+    return {key: round(statistics.median(r[key] for r in runs), 4) for key in runs[0]}
+
+
+def load_history(path):
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return []
+
+
+def baseline(history, profile_name, game_name, metric):
+    values = [entry["results"][game_name][metric] for entry in history
+              if entry.get("profile") == profile_name and game_name in entry.get("results", {})
+              and entry["results"][game_name].get(metric) is not None][-HISTORY_WINDOW:]
+    return statistics.median(values) if values else None
+
+
+def evaluate(metrics, game_name, profile_name, profile, thresholds, history):
+    # -> list of failure messages
+    failures = []
+    for metric, limit in profile.get("budget", {}).items():
+        if metrics.get(metric, 0) > limit:
+            failures.append(f"{metric} {metrics[metric]} over budget {limit}")
+    for metric, margin in thresholds.items():
+        previous = baseline(history, profile_name, game_name, metric)
+        value = metrics.get(metric)
+        if previous is None or value is None:
+            continue
+        if value > previous * (1 + margin.get("relative", 0)) and value - previous > margin.get("absolute", 0):
+            failures.append(f"{metric} regressed {previous} -> {value}")
+    return failures
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark frame times and heap growth of the canvas games.")
+    parser.add_argument("patterns", nargs="*", help="only games whose name matches one of these patterns")
+    parser.add_argument("--config", default=CONFIG_FILE)
+    parser.add_argument("--history", default=HISTORY_FILE)
+    parser.add_argument("--profile", default="phone", help="device profile from the config")
+    parser.add_argument("--duration", type=float, help="measured seconds per game (default from the config)")
+    parser.add_argument("--runs", type=int, default=1, help="runs per game; metrics are their median")
+    parser.add_argument("--no-record", action="store_true", help="do not append the results to the history")
+    parser.add_argument("--base-url", help="benchmark a running server instead of serving the repository")
+    parser.add_argument("--server-log", metavar="PATH", help="append the local server's request log (JSON lines)")
+    args = parser.parse_args(argv)
+
+    with open(args.config, "r") as f:
+        config = json.load(f)
+    profile = config["profiles"][args.profile]
+    duration = args.duration or config.get("duration", 10)
+    games = [g for g in config["games"]
+             if not args.patterns or any(fnmatch.fnmatch(g["name"], p) for p in args.patterns)]
+    if not games:
+        print("No games match")
+        return 1
+    history = load_history(args.history)
+
+    server = None
+    base_url = args.base_url
+    if not base_url:
+        server, base_url = start_server(os.getcwd(), log_path=args.server_log)
+    elif not base_url.endswith("/"):
+        base_url += "/"
+    results = {}
+    failed = []
+    try:
+        with sync_playwright() as p:
+            browser = p.chromium.launch(headless=True)
+            try:
+                for game in games:
+                    runs, problems = [], []
+                    for _ in range(max(1, args.runs)):
+                        metrics, run_problems = bench_game(browser, game, profile, base_url, duration)
+                        problems += run_problems
+                        if metrics:
+                            runs.append(metrics)
+                    if not runs:
+                        failed.append(game["name"])
+                        print(f"FAIL {game['name']}: {'; '.join(problems)}")
+                        continue
+                    metrics = median_metrics(runs)
+                    results[game["name"]] = metrics
+                    problems += evaluate(metrics, game["name"], args.profile, profile,
+                                         config.get("thresholds", {}), history)
+                    if problems:
+                        failed.append(game["name"])
+                    print(f"{'FAIL' if problems else 'ok  '} {game['name']}: {metrics['fps']} fps, "
+                          f"p50/p95/p99 {metrics['p50']}/{metrics['p95']}/{metrics['p99']} ms, "
+                          f"{metrics['dropped']:.0f} dropped ({metrics['droppedRatio']:.1%}), "
+                          f"{metrics['longTasks']:.0f} long tasks ({metrics['longTaskMs']} ms), "
+                          f"heap +{metrics['heapGrowthMB']} MB")
+                    for problem in problems:
+                        print(f"       {problem}")
+            finally:
+                browser.close()
+    finally:
+        if server:
+            stop_server(server)
+
+    if results and not args.no_record:
+        history.append({"date": datetime.datetime.now().isoformat(timespec="seconds"), "commit": git_commit(),
+                        "profile": args.profile, "duration": duration, "runs": max(1, args.runs),
+                        "results": results})
+        tmp_path = args.history + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(history[-HISTORY_LIMIT:], f, indent=1)
+            f.write("\n")
+        os.replace(tmp_path, args.history)
+    print(f"{len(games) - len(failed)}/{len(games)} games ok" + (f"; failed: {', '.join(failed)}" if failed else ""))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,234 @@
+import os
+import sys
+import json
+import fnmatch
+import argparse
+import datetime
+import statistics
+
+from playwright.sync_api import Error as PlaywrightError, sync_playwright
+
+from verify import MOBILE_USER_AGENT, SETTLE_JS
+# scripts/ is importable once verify has put the repository root on sys.path
+from scripts.serve import start_server, stop_server, summarize
+
+# Page-load performance budgets for the hub and the projects.
+#
+#   python verification/page_budget.py                      # every page, every profile
+#   python verification/page_budget.py md-reader --profile mobile --runs 5
+#
+# verification/page_budgets.json lists the pages (a URL and the `ready`
+# selector that marks the page as usable), the throttling profiles and each
+# page's budget per profile. Every page is loaded cold (cache disabled)
+# --runs times under the profile's CPU throttling and network conditions
+# (latency, down/up bandwidth via DevTools), and the median of each metric
+# is kept:
+#   ttfb, domContentLoaded, load   Navigation Timing (ms from navigation start)
+#   fcp, lcp                       first contentful / largest contentful paint
+#   ready                          until the `ready` selector was visible
+#   cls                            cumulative layout shift
+#   requests, transferKB           requests made and bytes over the wire
+#   serverMsP95                    p95 time the local server took per request
+#                                  (scripts/serve.py; not with --base-url)
+#
+# A metric over its budget fails the run (exit 1). Requests and bytes do not
+# depend on timing, so they also fail when they grow by more than GROWTH over
+# the last passing run (a new request or a fatter bundle, even within
+# budget). The report (every value, budget and failure, plus the last
+# passing run's values as the baseline) is written to
+# verification/page_budget_report.json.
+
+CONFIG_FILE = "verification/page_budgets.json"
+REPORT_FILE = "verification/page_budget_report.json"
+RUNS = 3
+TIMEOUT_MS = 60000
+# Deterministic metrics: allowed growth over the last passing run
+GROWTH = {"requests": 0, "transferKB": 5}
+
+OBSERVE_JS = """(() => {
+    const metrics = window.__pageMetrics = { lcp: null, cls: 0 };
+    try {
+        new PerformanceObserver((list) => {
+            const entries = list.getEntries();
+            metrics.lcp = entries[entries.length - 1].startTime;
+        }).observe({ type: 'largest-contentful-paint', buffered: true });
+        new PerformanceObserver((list) => {
+            for (const entry of list.getEntries()) if (!entry.hadRecentInput) metrics.cls += entry.value;
+        }).observe({ type: 'layout-shift', buffered: true });
+    } catch (e) {}
+})();"""
+
+COLLECT_JS = """() => {
+    const nav = performance.getEntriesByType('navigation')[0];
+    const paint = name => {
+        const entry = performance.getEntriesByName(name)[0];
+        return entry ? entry.startTime : null;
+    };
+    return {
+        ttfb: nav.responseStart - nav.startTime,
+        domContentLoaded: nav.domContentLoadedEventEnd - nav.startTime,
+        load: nav.loadEventEnd - nav.startTime,
+        fcp: paint('first-contentful-paint'),
+        lcp: window.__pageMetrics.lcp,
+        cls: window.__pageMetrics.cls
+    };
+}"""
+
+
+def load_page(browser, server, base_url, page_config, profile):
+    # -> (metrics, [problems]) for one cold load
+    problems = []
+    width, height = profile.get("viewport", [1280, 800])
+    options = {"viewport": {"width": width, "height": height}}
+    if profile.get("mobile"):
+        options.update(is_mobile=True, has_touch=True, user_agent=MOBILE_USER_AGENT)
+    context = browser.new_context(**options)
+    context.set_default_timeout(TIMEOUT_MS)
+    context.add_init_script(OBSERVE_JS)
+    try:
+        page = context.new_page()
+        page.on("pageerror", lambda e: problems.append(f"page error: {e}"))
+        cdp = context.new_cdp_session(page)
+        transferred = []
+        cdp.on("Network.loadingFinished", lambda e: transferred.append(e["encodedDataLength"]))
+        cdp.send("Network.enable")
+        cdp.send("Network.setCacheDisabled", {"cacheDisabled": True})
+        cdp.send("Network.emulateNetworkConditions", {
+            "offline": False,
+            "latency": profile.get("latencyMs", 0),
+            # kbit/s -> bytes/s; -1 disables throttling
+            "downloadThroughput": profile["downloadKbps"] * 1000 / 8 if profile.get("downloadKbps") else -1,
+            "uploadThroughput": profile["uploadKbps"] * 1000 / 8 if profile.get("uploadKbps") else -1,
+        })
+        cdp.send("Emulation.setCPUThrottlingRate", {"rate": profile.get("cpuThrottle", 1)})
+        requests = []
+        page.on("request", requests.append)
+        logged = len(server.request_log) if server else 0
+
+        page.goto(base_url + page_config["url"], wait_until="load")
+        ready = None
+        if page_config.get("ready"):
+            page.locator(page_config["ready"]).first.wait_for(state="visible")
+            ready = page.evaluate("performance.now()")
+        page.evaluate(SETTLE_JS)
+        metrics = page.evaluate(COLLECT_JS)
+        metrics["ready"] = ready
+        metrics["requests"] = len(requests)
+        metrics["transferKB"] = sum(transferred) / 1024
+        if server:
+            metrics["serverMsP95"] = summarize(server.request_log[logged:])["serverMsP95"]
+        return metrics, problems
+    except PlaywrightError as e:
+        return None, problems + [str(e).splitlines()[0]]
+    finally:
+        context.close()
+
+
+def median_metrics(runs):
+    merged = {}
+    for key in runs[0]:
+        values = [r[key] for r in runs if r.get(key) is not None]
+        merged[key] = round(statistics.median(values), 3) if values else None
+    return merged
+
+
+def check(metrics, budgets, baseline):
+    # -> list of failure messages
+    failures = []
+    for metric, limit in budgets.items():
+        value = metrics.get(metric)
+        if value is None:
+            failures.append(f"{metric} not measured")
+        elif value > limit:
+            failures.append(f"{metric} {value:g} over budget {limit:g}")
+    for metric, allowed in GROWTH.items():
+        before = (baseline or {}).get(metric)
+        if before is not None and metrics.get(metric) is not None and metrics[metric] > before + allowed:
+            failures.append(f"{metric} grew {before:g} -> {metrics[metric]:g}")
+    return failures
+
+
+def load_report(path):
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check page-load metrics against per-page budgets.")
+    parser.add_argument("patterns", nargs="*", help="only pages whose name matches one of these patterns")
+    parser.add_argument("--config", default=CONFIG_FILE)
+    parser.add_argument("--report", default=REPORT_FILE)
+    parser.add_argument("--profile", action="append", help="profile(s) to run (default: all)")
+    parser.add_argument("--runs", type=int, default=RUNS, help="cold loads per page; metrics are their median")
+    parser.add_argument("--base-url", help="measure a running server instead of serving the repository")
+    parser.add_argument("--server-log", metavar="PATH", help="append the local server's request log (JSON lines)")
+    args = parser.parse_args(argv)
+
+    with open(args.config, "r") as f:
+        config = json.load(f)
+    profiles = args.profile or list(config["profiles"])
+    pages = [p for p in config["pages"]
+             if not args.patterns or any(fnmatch.fnmatch(p["name"], pattern) for pattern in args.patterns)]
+    if not pages:
+        print("No pages match")
+        return 1
+    previous = load_report(args.report).get("results", {})
+
+    server = None
+    base_url = args.base_url
+    if not base_url:
+        server, base_url = start_server(os.getcwd(), log_path=args.server_log)
+    elif not base_url.endswith("/"):
+        base_url += "/"
+    results = {}
+    failed = []
+    try:
+        with sync_playwright() as p:
+            browser = p.chromium.launch(headless=True)
+            try:
+                for profile_name in profiles:
+                    profile = config["profiles"][profile_name]
+                    for page_config in pages:
+                        key = f"{page_config['name']}@{profile_name}"
+                        runs, problems = [], []
+                        for _ in range(max(1, args.runs)):
+                            metrics, run_problems = load_page(browser, server, base_url, page_config, profile)
+                            problems += run_problems
+                            if metrics:
+                                runs.append(metrics)
+                        metrics = median_metrics(runs) if runs else {}
+                        budgets = page_config.get("budgets", {}).get(profile_name, {})
+                        baseline = previous.get(key, {}).get("baseline")
+                        if runs:
+                            problems += check(metrics, budgets, baseline)
+                        results[key] = {"metrics": metrics, "budgets": budgets, "failures": problems,
+                                        "baseline": baseline if problems else metrics}
+                        if problems:
+                            failed.append(key)
+                        print(f"{'FAIL' if problems else 'ok  '} {key}: " + ", ".join(
+                            f"{m} {metrics[m]:g}" for m in ("fcp", "lcp", "ready", "load", "requests", "transferKB")
+                            if metrics.get(m) is not None))
+                        for problem in problems:
+                            print(f"       {problem}")
+            finally:
+                browser.close()
+    finally:
+        if server:
+            stop_server(server)
+
+    tmp_path = args.report + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump({"date": datetime.datetime.now().isoformat(timespec="seconds"), "runs": max(1, args.runs),
+                   "results": dict(previous, **results)}, f, indent=2)
+        f.write("\n")
+    os.replace(tmp_path, args.report)
+    print(f"{len(results) - len(failed)}/{len(results)} page loads within budget"
+          + (f"; failed: {', '.join(failed)}" if failed else "") + f". Report: {args.report}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
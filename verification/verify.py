@@ -0,0 +1,232 @@
+import os
+import sys
+import json
+import glob
+import time
+import asyncio
+import fnmatch
+import argparse
+
+from playwright.async_api import Error as PlaywrightError, async_playwright
+
+# The repository root, for scripts.serve
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from scripts.serve import start_server, stop_server
+from visual import TOLERANCE, Store
+
+# Screenshots every page target with one shared browser.
+#
+#   python verification/verify.py                  # every target
+#   python verification/verify.py hub_* game_j     # targets matching the patterns
+#   python verification/verify.py --list
+#   python verification/verify.py --compare        # diff against the baselines
+#   python verification/verify.py --compare --strict  # ...and fail targets without one
+#   python verification/verify.py --update         # accept the captures as baselines
+#
+# Targets come from verification/targets.json:
+#   {"name": "hub_mobile", "url": "index.html", "viewport": [375, 812],
+#    "mobile": true, "fullPage": true}
+#   {"name": "falldown_menu", "url": "games/falldown/index.html", "ready": "#main-menu"}
+#   {"name": "hub_grid", "url": "index.html", "element": "#nav-grid"}
+#   {"name": "game_{dir}", "glob": "games/*/index.html"}   # one target per match
+# A glob skips URLs an explicit target already covers. "defaults" applies to
+# every target.
+#
+# The repository is served by scripts/serve.py (compression, ETags, caching
+# headers like the real host; pages also fetch() JSON, which file:// URLs
+# refuse) unless --base-url points elsewhere.
+# Chromium is launched once; each target gets its own context (viewport,
+# mobile emulation) and up to --workers targets are captured at a time.
+# Instead of fixed sleeps a page counts as ready once it has loaded, its
+# `ready` selector (if any) is visible, fonts and images are done and two
+# animation frames have painted. A target fails on a timeout, an uncaught
+# page error, a console error or a failed request; the exit status is 1 if
+# any target failed.
+#
+# With --compare or --update, targets whose input files are unchanged since
+# their baseline are not captured at all, and captures are compared with
+# their baselines (visual.py): byte-identical ones by hash, the rest pixel
+# by pixel. A capture that differs beyond the noise tolerance fails. One
+# without a baseline is only a warning (none are committed yet), unless
+# --strict is given; only --update creates baselines.
+
+TARGETS_FILE = "verification/targets.json"
+OUTPUT_DIR = "verification"
+WORKERS = 6
+TIMEOUT_MS = 15000
+MOBILE_USER_AGENT = ("Mozilla/5.0 (iPhone; CPU iPhone OS 14_0 like Mac OS X) AppleWebKit/605.1.15 "
+                     "(KHTML, like Gecko) Version/14.0 Mobile/15E148 Safari/604.1")
+
+# Fonts, pending images, then two frames so the first layout has painted
+SETTLE_JS = """async () => {
+    await document.fonts.ready;
+    await Promise.all(Array.from(document.images).filter(img => !img.complete).map(img =>
+        new Promise(resolve => { img.addEventListener('load', resolve); img.addEventListener('error', resolve); })));
+    await new Promise(resolve => requestAnimationFrame(() => requestAnimationFrame(resolve)));
+}"""
+
+
+def load_targets(path):
+    with open(path, "r") as f:
+        config = json.load(f)
+    defaults = config.get("defaults", {})
+    covered = {t["url"] for t in config["targets"] if "glob" not in t}
+    targets = []
+    for entry in config["targets"]:
+        if "glob" not in entry:
+            targets.append(dict(defaults, **entry))
+            continue
+        for url in sorted(glob.glob(entry["glob"])):
+            url = url.replace("\\", "/")
+            if url in covered:
+                continue
+            covered.add(url)
+            target = dict(defaults, **{k: v for k, v in entry.items() if k != "glob"})
+            target["url"] = url
+            target["name"] = entry["name"].format(dir=os.path.basename(os.path.dirname(url)))
+            targets.append(target)
+    return targets
+
+
+def select(targets, patterns):
+    if not patterns:
+        return targets
+    return [t for t in targets if any(fnmatch.fnmatch(t["name"], p) for p in patterns)]
+
+
+async def capture(browser, target, base_url, output_dir, timeout):
+    # -> (name, seconds, [problems])
+    start = time.perf_counter()
+    problems = []
+    width, height = target.get("viewport", [1280, 800])
+    options = {"viewport": {"width": width, "height": height}}
+    if target.get("mobile"):
+        options.update(is_mobile=True, has_touch=True, user_agent=MOBILE_USER_AGENT)
+    context = await browser.new_context(**options)
+    context.set_default_timeout(timeout)
+    try:
+        page = await context.new_page()
+        page.on("pageerror", lambda e: problems.append(f"page error: {e}"))
+        page.on("console", lambda m: m.type == "error" and problems.append(f"console: {m.text}"))
+        page.on("requestfailed", lambda r: problems.append(f"request failed: {r.url}"))
+        page.on("response", lambda r: r.status >= 400 and problems.append(f"HTTP {r.status}: {r.url}"))
+
+        await page.goto(base_url + target["url"], wait_until="load")
+        if target.get("ready"):
+            await page.locator(target["ready"]).first.wait_for(state="visible")
+        await page.evaluate(SETTLE_JS)
+
+        path = os.path.join(output_dir, target["name"] + ".png")
+        if target.get("element"):
+            await page.locator(target["element"]).first.screenshot(path=path)
+        else:
+            await page.screenshot(path=path, full_page=bool(target.get("fullPage")))
+    except PlaywrightError as e:
+        problems.append(str(e).splitlines()[0])
+    finally:
+        await context.close()
+    return target["name"], time.perf_counter() - start, problems
+
+
+async def run(targets, base_url, output_dir, workers, timeout):
+    pool = asyncio.Semaphore(workers)
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        try:
+            async def limited(target):
+                async with pool:
+                    result = await capture(browser, target, base_url, output_dir, timeout)
+                name, seconds, problems = result
+                print(f"{'FAIL' if problems else 'ok  '} {name} ({seconds:.2f}s)")
+                for problem in problems:
+                    print(f"       {problem}")
+                return result
+
+            return await asyncio.gather(*(limited(t) for t in targets))
+        finally:
+            await browser.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Screenshot page targets concurrently with one browser.")
+    parser.add_argument("patterns", nargs="*", help="only targets whose name matches one of these patterns")
+    parser.add_argument("--targets", default=TARGETS_FILE)
+    parser.add_argument("--output-dir", default=OUTPUT_DIR)
+    parser.add_argument("--workers", type=int, default=WORKERS, help="targets captured at the same time")
+    parser.add_argument("--timeout", type=int, default=TIMEOUT_MS, help="per-step timeout in milliseconds")
+    parser.add_argument("--base-url", help="verify a running server instead of serving the repository")
+    parser.add_argument("--server-log", metavar="PATH", help="append the local server's request log (JSON lines)")
+    parser.add_argument("--list", action="store_true", help="print the selected targets and exit")
+    parser.add_argument("--compare", action="store_true", help="compare captures with their baselines")
+    parser.add_argument("--update", action="store_true", help="store captures as the new baselines")
+    parser.add_argument("--strict", action="store_true",
+                        help="with --compare: fail targets that have no baseline instead of warning")
+    parser.add_argument("--force", action="store_true",
+                        help="with --compare/--update: capture targets whose inputs are unchanged too")
+    parser.add_argument("--tolerance", type=int, default=TOLERANCE,
+                        help="per-channel difference (0-255) still counted as equal")
+    args = parser.parse_args(argv)
+
+    targets = select(load_targets(args.targets), args.patterns)
+    if args.list:
+        for t in targets:
+            print(f"{t['name']}  {t['url']}")
+        return 0
+    if not targets:
+        print("No targets match")
+        return 1
+    store = None
+    if args.compare or args.update:
+        store = Store(tolerance=args.tolerance)
+        if not args.force:
+            unchanged = {t["name"] for t in targets if store.unchanged(t)}
+            for name in sorted(unchanged):
+                print(f"skip {name} (inputs unchanged since baseline)")
+            targets = [t for t in targets if t["name"] not in unchanged]
+        if not targets:
+            store.save()
+            print("Nothing to capture")
+            return 0
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    server = None
+    base_url = args.base_url
+    if not base_url:
+        server, base_url = start_server(os.getcwd(), log_path=args.server_log)
+    elif not base_url.endswith("/"):
+        base_url += "/"
+    start = time.perf_counter()
+    try:
+        results = asyncio.run(run(targets, base_url, args.output_dir, max(1, args.workers), args.timeout))
+    finally:
+        if server:
+            stop_server(server)
+    missing = []
+    if store:
+        by_name = {t["name"]: t for t in targets}
+        for name, _, problems in results:
+            if problems:
+                continue
+            png_path = os.path.join(args.output_dir, name + ".png")
+            if args.update:
+                store.accept(by_name[name], png_path)
+                print(f"baseline {name}")
+                continue
+            status, detail = store.check(by_name[name], png_path)
+            if status == "missing":
+                missing.append(name)
+            if status == "differs" or (status == "missing" and args.strict):
+                problems.append(detail)
+            print(f"{status} {name}" + (f": {detail}" if detail else ""))
+        store.save()
+    if missing and not args.strict:
+        print(f"warning: {len(missing)} targets have no baseline and were not compared; create them with "
+              f"--update and commit verification/baselines/ (--strict fails them)")
+    failed = [name for name, _, problems in results if problems]
+    print(f"{len(results) - len(failed)}/{len(results)} targets ok in {time.perf_counter() - start:.1f}s"
+          + (f"; failed: {', '.join(failed)}" if failed else ""))
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
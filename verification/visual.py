@@ -0,0 +1,334 @@
+import os
+import re
+import json
+import zlib
+import glob
+import struct
+import hashlib
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Baseline store and perceptual diff for verify.py screenshots.
+#
+#   store = Store()
+#   if store.unchanged(target):        # no input file changed since the baseline
+#       ...skip the capture...
+#   result = store.check(target, png_path)   # after capturing
+#   store.save()
+#
+# A check is gated twice before any pixel is compared:
+#   1. inputs: every target records a hash of the files it is built from (the
+#      page, its directory, the local files its HTML references and any
+#      "inputs" globs of the target). If none changed, the page is not even
+#      captured.
+#   2. bytes: a capture whose SHA-256 equals the baseline's is identical.
+# Only then are both PNGs decoded and compared with NumPy. A pixel differs
+# when any channel is off by more than TOLERANCE; a BLOCK x BLOCK block
+# differs when more than BLOCK_RATIO of its pixels do, so anti-aliasing and
+# subpixel text noise pass while a moved button does not. Differing captures
+# get a diff image in DIFF_DIR: the baseline in grey, differing pixels red,
+# differing blocks tinted. Without NumPy any byte difference counts.
+#
+# check() reports a capture without a baseline as "missing"; verify.py only
+# warns about those unless run with --strict, since no baselines are committed
+# yet and a fresh clone would otherwise fail every target. Generate them with
+# `python verification/verify.py --update` (needs Playwright) and commit
+# verification/baselines/; only --update creates baselines. The stat cache
+# that spares rehashing unchanged input files is never committed.
+
+BASELINE_DIR = "verification/baselines"
+STORE_FILE = "baselines.json"
+DIFF_DIR = "verification/diffs"
+CACHE_FILE = "verification/.input_cache"
+VERSION = 1
+TOLERANCE = 24
+BLOCK = 16
+BLOCK_RATIO = 0.05
+
+SKIP_DIRS = {'.git', 'node_modules', '__pycache__'}
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+# src="..." / href="..." of local files
+REFERENCE_RE = re.compile(r"""(?:src|href)\s*=\s*["']([^"'#?]+)""", re.IGNORECASE)
+
+
+def sha256_file(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+# --- Inputs ---
+
+def referenced_files(page):
+    try:
+        with open(page, "r", encoding="utf-8", errors="replace") as f:
+            html = f.read()
+    except OSError:
+        return []
+    found = []
+    for ref in REFERENCE_RE.findall(html):
+        if re.match(r"^[a-z][a-z0-9+.-]*:|^//", ref, re.IGNORECASE):
+            continue
+        if ref.startswith("/"):
+            path = os.path.normpath(ref.lstrip("/"))
+        else:
+            path = os.path.normpath(os.path.join(os.path.dirname(page), ref))
+        if os.path.isfile(path):
+            found.append(path)
+    return found
+
+
+def input_files(target):
+    # Files a target's capture depends on, relative to the repository root
+    page = os.path.normpath(target["url"])
+    files = {page}
+    page_dir = os.path.dirname(page)
+    if page_dir:
+        for root, dirs, names in os.walk(page_dir):
+            dirs[:] = sorted(d for d in dirs if d not in SKIP_DIRS and not d.startswith("."))
+            files.update(os.path.join(root, n) for n in names if not n.startswith("."))
+    files.update(referenced_files(page))
+    for pattern in target.get("inputs", []):
+        files.update(p for p in glob.glob(pattern, recursive=True) if os.path.isfile(p))
+    return sorted(p.replace("\\", "/") for p in files)
+
+
+class InputCache:
+    # path -> [size, mtime_ns, sha256]; a file is only rehashed when its
+    # size or mtime changed
+    def __init__(self, path=CACHE_FILE):
+        self.path = path
+        self.files = {}
+        self.dirty = False
+        try:
+            with open(path, "r") as f:
+                data = json.load(f)
+            if data.get("version") == VERSION:
+                self.files = data.get("files", {})
+        except (OSError, ValueError):
+            pass
+
+    def digest(self, path):
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        entry = self.files.get(path)
+        if entry and entry[0] == st.st_size and entry[1] == st.st_mtime_ns:
+            return entry[2]
+        digest = sha256_file(path)
+        self.files[path] = [st.st_size, st.st_mtime_ns, digest]
+        self.dirty = True
+        return digest
+
+    def save(self):
+        if not self.dirty:
+            return
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"version": VERSION, "files": self.files}, f, separators=(",", ":"))
+        os.replace(tmp_path, self.path)
+        self.dirty = False
+
+
+def inputs_hash(target, cache):
+    # Covers the target's own settings too: a new viewport needs a new capture
+    h = hashlib.sha256(json.dumps(target, sort_keys=True).encode("utf-8"))
+    for path in input_files(target):
+        h.update(f"\0{path}\0{cache.digest(path)}".encode("utf-8"))
+    return h.hexdigest()
+
+
+# --- PNG ---
+
+def paeth(a, b, c):
+    p = a + b - c
+    pa, pb, pc = abs(p - a), abs(p - b), abs(p - c)
+    if pa <= pb and pa <= pc:
+        return a
+    return b if pb <= pc else c
+
+
+def read_png(data):
+    # -> uint8 array (height, width, channels) for the 8-bit, non-interlaced
+    # greyscale / RGB / RGBA images browsers write
+    if not data.startswith(PNG_SIGNATURE):
+        raise ValueError("not a PNG")
+    pos, idat = len(PNG_SIGNATURE), []
+    width = height = channels = None
+    while pos < len(data):
+        length, kind = struct.unpack(">I4s", data[pos:pos + 8])
+        body = data[pos + 8:pos + 8 + length]
+        pos += 12 + length
+        if kind == b"IHDR":
+            width, height, depth, color, _, _, interlace = struct.unpack(">IIBBBBB", body)
+            channels = {0: 1, 2: 3, 4: 2, 6: 4}.get(color)
+            if depth != 8 or channels is None or interlace:
+                raise ValueError(f"unsupported PNG (depth {depth}, color type {color}, interlace {interlace})")
+        elif kind == b"IDAT":
+            idat.append(body)
+        elif kind == b"IEND":
+            break
+    raw = np.frombuffer(zlib.decompress(b"".join(idat)), dtype=np.uint8)
+    stride = width * channels
+    rows = raw.reshape(height, stride + 1)
+    filters, rows = rows[:, 0], rows[:, 1:]
+    out = np.zeros((height, stride), dtype=np.uint8)
+    previous = np.zeros(stride, dtype=np.uint8)
+    for y in range(height):
+        line, kind = rows[y], filters[y]
+        if kind == 0:
+            current = line.copy()
+        elif kind == 1:
+            # Sub: a running sum per channel, wrapping at 256
+            current = np.cumsum(line.reshape(width, channels), axis=0, dtype=np.uint8).reshape(stride)
+        elif kind == 2:
+            current = line + previous
+        else:
+            # Average and Paeth depend on the pixel just decoded: byte loop
+            current = bytearray(line.tobytes())
+            up = previous.tobytes()
+            for i in range(stride):
+                left = current[i - channels] if i >= channels else 0
+                if kind == 3:
+                    current[i] = (current[i] + ((left + up[i]) >> 1)) & 0xFF
+                else:
+                    upper_left = up[i - channels] if i >= channels else 0
+                    current[i] = (current[i] + paeth(left, up[i], upper_left)) & 0xFF
+            current = np.frombuffer(bytes(current), dtype=np.uint8)
+        out[y] = current
+        previous = out[y]
+    return out.reshape(height, width, channels)
+
+
+def write_png(path, image):
+    # RGB uint8 array -> PNG, unfiltered
+    height, width, _ = image.shape
+    raw = np.hstack([np.zeros((height, 1), dtype=np.uint8), image.reshape(height, width * 3)]).tobytes()
+
+    def chunk(kind, body):
+        return struct.pack(">I", len(body)) + kind + body + struct.pack(">I", zlib.crc32(kind + body))
+
+    with open(path, "wb") as f:
+        f.write(PNG_SIGNATURE + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+                + chunk(b"IDAT", zlib.compress(raw, 6)) + chunk(b"IEND", b""))
+
+
+def rgb(image):
+    if image.shape[2] >= 3:
+        return image[:, :, :3]
+    return np.repeat(image[:, :, :1], 3, axis=2)
+
+
+# --- Diff ---
+
+def compare(baseline, current, tolerance=TOLERANCE, block=BLOCK, block_ratio=BLOCK_RATIO):
+    # -> (pixel mask, block mask, differing pixels, differing blocks)
+    # for two decoded images of the same size
+    delta = np.abs(rgb(baseline).astype(np.int16) - rgb(current).astype(np.int16)).max(axis=2)
+    mask = delta > tolerance
+    height, width = mask.shape
+    # Pad to whole blocks, then count differing pixels per block
+    padded = np.zeros((-(-height // block) * block, -(-width // block) * block), dtype=np.int32)
+    padded[:height, :width] = mask
+    counts = padded.reshape(padded.shape[0] // block, block, padded.shape[1] // block, block).sum(axis=(1, 3))
+    blocks = counts > block_ratio * block * block
+    return mask, blocks, int(mask.sum()), int(blocks.sum())
+
+
+def diff_image(baseline, mask, blocks, block=BLOCK):
+    grey = rgb(baseline).mean(axis=2).astype(np.uint8) // 2 + 64
+    image = np.repeat(grey[:, :, None], 3, axis=2)
+    height, width = mask.shape
+    tint = np.kron(blocks, np.ones((block, block), dtype=bool))[:height, :width]
+    image[tint, 0] = np.maximum(image[tint, 0], 160)
+    image[mask] = [255, 0, 0]
+    return image
+
+
+# --- Store ---
+
+class Store:
+    def __init__(self, baseline_dir=BASELINE_DIR, diff_dir=DIFF_DIR, cache_path=CACHE_FILE,
+                 tolerance=TOLERANCE, block_ratio=BLOCK_RATIO):
+        self.baseline_dir = baseline_dir
+        self.diff_dir = diff_dir
+        self.path = os.path.join(baseline_dir, STORE_FILE)
+        self.tolerance = tolerance
+        self.block_ratio = block_ratio
+        self.cache = InputCache(cache_path)
+        self.targets = {}  # name -> {"png": sha256, "inputs": inputs hash}
+        self.inputs = {}  # name -> inputs hash computed this run
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+            if data.get("version") == VERSION:
+                self.targets = data.get("targets", {})
+        except (OSError, ValueError):
+            pass
+
+    def baseline_path(self, name):
+        return os.path.join(self.baseline_dir, name + ".png")
+
+    def current_inputs(self, target):
+        if target["name"] not in self.inputs:
+            self.inputs[target["name"]] = inputs_hash(target, self.cache)
+        return self.inputs[target["name"]]
+
+    def unchanged(self, target):
+        entry = self.targets.get(target["name"])
+        return bool(entry) and entry["inputs"] == self.current_inputs(target) \
+            and os.path.exists(self.baseline_path(target["name"]))
+
+    def accept(self, target, png_path):
+        os.makedirs(self.baseline_dir, exist_ok=True)
+        with open(png_path, "rb") as f:
+            data = f.read()
+        tmp_path = self.baseline_path(target["name"]) + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, self.baseline_path(target["name"]))
+        self.targets[target["name"]] = {"png": hashlib.sha256(data).hexdigest(),
+                                        "inputs": self.current_inputs(target)}
+
+    def check(self, target, png_path):
+        # -> (status, detail); status is "missing", "identical", "match" or "differs"
+        name = target["name"]
+        entry = self.targets.get(name)
+        if not entry or not os.path.exists(self.baseline_path(name)):
+            return "missing", "no baseline (create it with --update)"
+        with open(png_path, "rb") as f:
+            data = f.read()
+        if hashlib.sha256(data).hexdigest() == entry["png"]:
+            # Same bytes, so the baseline holds for the current inputs too
+            entry["inputs"] = self.current_inputs(target)
+            return "identical", ""
+        if np is None:
+            return "differs", "bytes differ (install numpy for a pixel diff)"
+        with open(self.baseline_path(name), "rb") as f:
+            baseline = read_png(f.read())
+        current = read_png(data)
+        if baseline.shape[:2] != current.shape[:2]:
+            return "differs", f"size {baseline.shape[1]}x{baseline.shape[0]} -> {current.shape[1]}x{current.shape[0]}"
+        mask, blocks, pixels, bad_blocks = compare(baseline, current, self.tolerance, BLOCK, self.block_ratio)
+        if not bad_blocks:
+            entry["inputs"] = self.current_inputs(target)
+            return "match", f"{pixels} pixels within noise"
+        os.makedirs(self.diff_dir, exist_ok=True)
+        diff_path = os.path.join(self.diff_dir, name + ".png")
+        write_png(diff_path, diff_image(baseline, mask, blocks))
+        return "differs", f"{pixels} pixels, {bad_blocks} blocks differ; see {diff_path}"
+
+    def save(self):
+        os.makedirs(self.baseline_dir, exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"version": VERSION, "targets": dict(sorted(self.targets.items()))}, f, indent=2)
+            f.write("\n")
+        os.replace(tmp_path, self.path)
+        self.cache.save()